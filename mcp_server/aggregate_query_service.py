@@ -0,0 +1,384 @@
+"""
+Shared Aggregate Query Service
+
+The analytics and betting layers (ShotZoneAnalytics, FeatureExtractor and
+its feature extractors) issue many overlapping GROUP BY queries over the same
+large tables, e.g. per-team recent game stats for both sides of every game
+on a slate. This service sits in front of a database connection and:
+
+- Caches result rows keyed by normalized SQL + parameters + a version
+  watermark of the tables the query reads
+- Coalesces identical in-flight queries (single-flight): concurrent callers
+  of the same query wait for one execution instead of each running it
+- Invalidates implicitly when a table's watermark moves, or explicitly via
+  ``invalidate(tables)`` for writers in this process
+
+A table's watermark is its insert/update/delete counters from
+``pg_stat_user_tables`` plus a local version bumped by ``invalidate``.
+Watermarks are re-read at most once per ``watermark_ttl`` seconds, so a warm
+cache costs no database round trip.
+
+The counters are statistics, not commit records: they can trail a commit by
+about 10 seconds on PostgreSQL 15+, where backends flush statistics in
+batches. Writes made in this process should be followed by ``invalidate``.
+Readers that must see another process's writes sooner should have that
+writer bump a shared version table and pass its current value as a query
+parameter, which moves the cache key on the next read.
+
+Both sync (``fetch``) and async (``afetch``) callers share the same cache and
+in-flight queries.
+
+Usage:
+    from mcp_server.aggregate_query_service import AggregateQueryService
+
+    service = AggregateQueryService(db_conn)
+    rows = service.fetch(
+        "SELECT team_id, AVG(team_score) AS ppg FROM hoopr_team_box "
+        "WHERE season = %s GROUP BY team_id",
+        (2024,),
+    )
+
+    # After writing to a table in this process
+    service.invalidate(["hoopr_team_box"])
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_WATERMARK_TTL = 1.0  # seconds
+
+_TABLE_PATTERN = re.compile(r"\b(FROM|JOIN)\s+([A-Za-z_][\w.]*)(?![\w.]|\s*\()", re.I)
+
+# Functions whose arguments use FROM as a keyword, e.g. EXTRACT(YEAR FROM d)
+_FROM_ARGUMENT_FUNCTIONS = {"extract", "substring", "trim", "overlay"}
+_FUNCTION_NAME = re.compile(r"([A-Za-z_]\w*)\s*$")
+_DISTINCT_FROM = re.compile(r"\bIS\s+(?:NOT\s+)?DISTINCT\s+$", re.I)
+
+_WATERMARK_QUERY = """
+    SELECT schemaname, relname, n_tup_ins + n_tup_upd + n_tup_del AS changes
+    FROM pg_stat_user_tables
+    WHERE relname = ANY(%s)
+"""
+
+
+def normalize_sql(query: str) -> str:
+    """Collapse whitespace so formatting differences share a cache entry"""
+    return " ".join(query.split()).rstrip(";").strip()
+
+
+@functools.lru_cache(maxsize=1024)
+def referenced_tables(query: str) -> Tuple[str, ...]:
+    """
+    Tables a query reads, taken from its FROM and JOIN clauses.
+
+    CTE names are included harmlessly (they have no watermark of their own).
+    FROM inside EXTRACT/SUBSTRING/TRIM/OVERLAY arguments and in
+    ``IS [NOT] DISTINCT FROM`` does not name a table and is skipped.
+
+    Args:
+        query: SQL text
+
+    Returns:
+        Sorted, lower-cased table names (schema-qualified where written so)
+    """
+    tables = set()
+    for match in _TABLE_PATTERN.finditer(query):
+        if match.group(1).upper() == "FROM" and _is_keyword_from(query, match.start()):
+            continue
+        tables.add(match.group(2).lower())
+    return tuple(sorted(tables))
+
+
+def _is_keyword_from(query: str, pos: int) -> bool:
+    """Whether the FROM at pos is a function argument or DISTINCT FROM"""
+    if _DISTINCT_FROM.search(query, 0, pos):
+        return True
+
+    # Walk back to the parenthesis enclosing pos, if any
+    depth = 0
+    for i in range(pos - 1, -1, -1):
+        char = query[i]
+        if char == ")":
+            depth += 1
+        elif char == "(":
+            if depth == 0:
+                name = _FUNCTION_NAME.search(query, 0, i)
+                return bool(name) and name.group(1).lower() in _FROM_ARGUMENT_FUNCTIONS
+            depth -= 1
+    return False
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of query parameters"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    if isinstance(value, (datetime, date)):
+        return (type(value).__name__, value.isoformat())
+    return value
+
+
+class AggregateQueryService:
+    """
+    Cached, single-flight execution of read queries.
+
+    Returned rows are dicts shared between callers; treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        conn=None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        watermark_ttl: float = DEFAULT_WATERMARK_TTL,
+    ):
+        """
+        Initialize aggregate query service.
+
+        Args:
+            conn: DB-API connection (default: connect lazily with the
+                configured database credentials, in autocommit mode)
+            max_entries: Maximum cached results (least recently used evicted)
+            watermark_ttl: Seconds a table watermark is trusted before re-read
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._conn = conn
+        self.max_entries = max_entries
+        self.watermark_ttl = watermark_ttl
+
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[Tuple, List[Dict]]" = OrderedDict()
+        self._in_flight: Dict[Tuple, Future] = {}
+        # table -> (checked_at, server change count)
+        self._watermarks: Dict[str, Tuple[float, Any]] = {}
+        self._local_versions: Dict[str, int] = {}
+        self._counts = dict.fromkeys(
+            ("hits", "misses", "coalesced", "evictions", "watermark_reads"), 0
+        )
+
+    @property
+    def conn(self):
+        """Database connection, opened on first use"""
+        if self._conn is None:
+            import psycopg2
+
+            from mcp_server.unified_secrets_manager import (
+                load_secrets_hierarchical,
+                get_database_config,
+            )
+
+            load_secrets_hierarchical()
+            self._conn = psycopg2.connect(**get_database_config())
+            self._conn.autocommit = True
+        return self._conn
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def fetch(
+        self,
+        query: str,
+        params: Optional[Sequence] = None,
+        tables: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """
+        Run a read query through the cache.
+
+        Args:
+            query: SQL text
+            params: Query parameters (sequence or mapping)
+            tables: Tables the query depends on (default: parsed from SQL)
+
+        Returns:
+            Result rows as dicts
+        """
+        tables = (
+            tuple(sorted(t.lower() for t in tables))
+            if tables is not None
+            else referenced_tables(query)
+        )
+        key = (normalize_sql(query), _freeze(params), self._watermark(tables))
+
+        with self._lock:
+            rows = self._results.get(key)
+            if rows is not None:
+                self._results.move_to_end(key)
+                self._counts["hits"] += 1
+                return rows
+
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self._counts["misses"] += 1
+            else:
+                self._counts["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            rows = self._execute(query, params)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            self._results[key] = rows
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+                self._counts["evictions"] += 1
+        future.set_result(rows)
+        return rows
+
+    async def afetch(
+        self,
+        query: str,
+        params: Optional[Sequence] = None,
+        tables: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """Async ``fetch``; the query runs in a worker thread"""
+        return await asyncio.to_thread(self.fetch, query, params, tables)
+
+    def _execute(self, query: str, params) -> List[Dict]:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            if rows and not isinstance(rows[0], dict):
+                columns = [col[0] for col in cursor.description]
+                rows = [dict(zip(columns, row)) for row in rows]
+            return list(rows)
+        finally:
+            cursor.close()
+
+    # =========================================================================
+    # Invalidation
+    # =========================================================================
+
+    def _watermark(self, tables: Tuple[str, ...]) -> Tuple:
+        if not tables:
+            return ()
+
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                t
+                for t in tables
+                if t not in self._watermarks
+                or now - self._watermarks[t][0] >= self.watermark_ttl
+            ]
+        if stale:
+            self._read_watermarks(stale, now)
+
+        with self._lock:
+            return tuple(
+                (t, self._watermarks[t][1], self._local_versions.get(t, 0))
+                for t in tables
+            )
+
+    def _read_watermarks(self, tables: List[str], now: float) -> None:
+        changes = dict.fromkeys(tables)
+        names = sorted({t.rsplit(".", 1)[-1] for t in tables})
+        try:
+            cursor = self.conn.cursor()
+            try:
+                # Stats are snapshotted per transaction; drop the snapshot
+                cursor.execute("SELECT pg_stat_clear_snapshot()")
+                cursor.execute(_WATERMARK_QUERY, (names,))
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as e:
+            # Fall back to local versions only
+            logger.warning(f"Could not read table watermarks: {e}")
+            rows = []
+
+        for row in rows:
+            schema, name, count = (
+                (row["schemaname"], row["relname"], row["changes"])
+                if isinstance(row, dict)
+                else row
+            )
+            for table in (f"{schema}.{name}".lower(), name.lower()):
+                if table in changes:
+                    changes[table] = count
+
+        with self._lock:
+            self._counts["watermark_reads"] += 1
+            for table, count in changes.items():
+                self._watermarks[table] = (now, count)
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None) -> None:
+        """
+        Invalidate cached results.
+
+        Args:
+            tables: Tables written to (default: drop every cached result)
+        """
+        with self._lock:
+            if tables is None:
+                self._results.clear()
+                self._watermarks.clear()
+                return
+            for table in tables:
+                table = table.lower()
+                self._local_versions[table] = self._local_versions.get(table, 0) + 1
+                # Dropping the old entries now frees memory sooner
+                for key in [
+                    k for k in self._results if any(w[0] == table for w in k[2])
+                ]:
+                    del self._results[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dict with size, hits, misses, coalesced waits, evictions and hit rate
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            size = len(self._results)
+        lookups = counts["hits"] + counts["misses"] + counts["coalesced"]
+        return {
+            "size": size,
+            "max_entries": self.max_entries,
+            **counts,
+            "hit_rate": (
+                (counts["hits"] + counts["coalesced"]) / lookups if lookups else 0.0
+            ),
+        }
+
+
+# Default service shared by callers that do not bring their own connection
+_default_service: Optional[AggregateQueryService] = None
+_default_lock = threading.Lock()
+
+
+def get_query_service() -> AggregateQueryService:
+    """Get the process-wide aggregate query service"""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = AggregateQueryService()
+        return _default_service
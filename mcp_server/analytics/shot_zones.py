@@ -16,18 +16,139 @@ Usage:
 
     # Player shot profile
     profile = analytics.player_shot_profile(player_id=2544)
+
+    # After loading new games
+    analytics.refresh_rollups()
+
+Queries read precomputed rollups (sql/create_shot_zone_rollups.sql) rather
+than aggregating hoopr_play_by_play. League baselines are additionally
+cached in-process.
 """
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+from mcp_server.aggregate_query_service import AggregateQueryService
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached league baseline is served before it is re-read
+BASELINE_TTL_SECONDS = 300.0
 
-from mcp_server.unified_secrets_manager import (
-    load_secrets_hierarchical,
-    get_database_config,
+ROLLUP_TABLES = (
+    "shot_zone_game_rollup",
+    "shot_zone_season_rollup",
+    "shot_zone_defense_rollup",
 )
 
+# Games rolled up per transaction
+REFRESH_BATCH_GAMES = 500
+
+# Shared by all ShotZoneAnalytics instances in the process:
+# season (None = all seasons) -> (loaded_at, {zone: stats})
+_baseline_cache: Dict[Optional[int], Tuple[float, Dict[str, Dict]]] = {}
+_baseline_lock = threading.Lock()
+
+
+def clear_baseline_cache() -> None:
+    """Drop cached league baselines (e.g. after rollups change)"""
+    with _baseline_lock:
+        _baseline_cache.clear()
+
+
+_PENDING_GAMES_QUERY = """
+    SELECT p.game_id, COUNT(*) AS classified_shots
+    FROM hoopr_play_by_play p
+    LEFT JOIN shot_zone_rollup_games g ON g.game_id = p.game_id
+    WHERE p.shooting_play = 1
+      AND p.shot_zone IS NOT NULL
+      {game_filter}
+    GROUP BY p.game_id, g.classified_shots
+    {pending_filter}
+"""
+
+_PENDING_FILTER = "HAVING g.classified_shots IS DISTINCT FROM COUNT(*)"
+
+_DELETE_GAME_ROWS = """
+    DELETE FROM shot_zone_game_rollup
+    WHERE game_id = ANY(%(games)s)
+    RETURNING season, team_id, player_id, defense_team_id
+"""
+
+_INSERT_GAME_ROWS = """
+    INSERT INTO shot_zone_game_rollup (
+        game_id, season, team_id, defense_team_id, player_id, shot_zone,
+        attempts, made, points, score_value_total
+    )
+    SELECT
+        p.game_id,
+        EXTRACT(YEAR FROM s.date)::int,
+        p.team_id,
+        CASE WHEN p.team_id = s.home_team_id THEN s.away_team_id
+             ELSE s.home_team_id END,
+        COALESCE(p.athlete_id_1, 0),
+        p.shot_zone,
+        COUNT(*),
+        SUM(CASE WHEN p.scoring_play = 1 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN p.scoring_play = 1 THEN p.score_value ELSE 0 END),
+        SUM(p.score_value)
+    FROM hoopr_play_by_play p
+    JOIN hoopr_schedule s ON p.game_id = s.game_id
+    WHERE p.shooting_play = 1
+      AND p.shot_zone IS NOT NULL
+      AND p.team_id IS NOT NULL
+      AND p.game_id = ANY(%(games)s)
+    GROUP BY 1, 2, 3, 4, 5, 6
+    RETURNING season, team_id, player_id, defense_team_id
+"""
+
+_REBUILD_SEASON_ROWS = """
+    DELETE FROM shot_zone_season_rollup r
+    USING unnest(%(seasons)s::int[], %(teams)s::int[], %(players)s::int[])
+        AS k(season, team_id, player_id)
+    WHERE r.season = k.season AND r.team_id = k.team_id AND r.player_id = k.player_id;
+
+    INSERT INTO shot_zone_season_rollup (
+        season, team_id, player_id, shot_zone,
+        attempts, made, points, score_value_total
+    )
+    SELECT g.season, g.team_id, g.player_id, g.shot_zone,
+           SUM(g.attempts), SUM(g.made), SUM(g.points), SUM(g.score_value_total)
+    FROM shot_zone_game_rollup g
+    JOIN unnest(%(seasons)s::int[], %(teams)s::int[], %(players)s::int[])
+        AS k(season, team_id, player_id)
+      ON g.season = k.season AND g.team_id = k.team_id AND g.player_id = k.player_id
+    GROUP BY 1, 2, 3, 4
+"""
+
+_REBUILD_DEFENSE_ROWS = """
+    DELETE FROM shot_zone_defense_rollup r
+    USING unnest(%(seasons)s::int[], %(teams)s::int[]) AS k(season, team_id)
+    WHERE r.season = k.season AND r.defense_team_id = k.team_id;
+
+    INSERT INTO shot_zone_defense_rollup (
+        season, defense_team_id, shot_zone, attempts, made, points
+    )
+    SELECT g.season, g.defense_team_id, g.shot_zone,
+           SUM(g.attempts), SUM(g.made), SUM(g.points)
+    FROM shot_zone_game_rollup g
+    JOIN unnest(%(seasons)s::int[], %(teams)s::int[]) AS k(season, team_id)
+      ON g.season = k.season AND g.defense_team_id = k.team_id
+    GROUP BY 1, 2, 3
+"""
+
+_MARK_GAMES = """
+    INSERT INTO shot_zone_rollup_games (game_id, classified_shots, rolled_up_at)
+    SELECT g.game_id, g.classified_shots, CURRENT_TIMESTAMP
+    FROM unnest(%(games)s::text[], %(counts)s::int[]) AS g(game_id, classified_shots)
+    ON CONFLICT (game_id) DO UPDATE SET
+        classified_shots = EXCLUDED.classified_shots,
+        rolled_up_at = EXCLUDED.rolled_up_at
+"""
+
 
 @dataclass
 class ZoneEfficiency:
@@ -50,16 +171,145 @@ class PlayerShotProfile:
     zone_efficiency: Dict[str, float]
     favorite_zones: List[str]
     weak_zones: List[str]
+    zone_vs_league: Dict[str, float] = field(default_factory=dict)  # FG% diff
 
 
 class ShotZoneAnalytics:
     """Calculate shot zone analytics and expected values"""
 
-    def __init__(self):
-        """Initialize analytics with database connection"""
-        load_secrets_hierarchical()
-        config = get_database_config()
-        self.conn = psycopg2.connect(**config, cursor_factory=RealDictCursor)
+    def __init__(
+        self, conn=None, query_service: Optional[AggregateQueryService] = None
+    ):
+        """
+        Initialize analytics with database connection.
+
+        Args:
+            conn: Existing connection using RealDictCursor (default: connect
+                with the configured database credentials)
+            query_service: Shared aggregate query cache for reads (default:
+                one over conn)
+        """
+        if conn is None:
+            import psycopg2
+            from psycopg2.extras import RealDictCursor
+
+            from mcp_server.unified_secrets_manager import (
+                load_secrets_hierarchical,
+                get_database_config,
+            )
+
+            load_secrets_hierarchical()
+            config = get_database_config()
+            conn = psycopg2.connect(**config, cursor_factory=RealDictCursor)
+        self.conn = conn
+        self.queries = query_service or AggregateQueryService(conn)
+
+    def _fetch(self, query: str, params=None) -> List[Dict]:
+        """Run a query directly, bypassing the query cache"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    # =========================================================================
+    # Rollup Maintenance
+    # =========================================================================
+
+    def refresh_rollups(
+        self, game_ids: Optional[Sequence[str]] = None, force: bool = False
+    ) -> int:
+        """
+        Incrementally bring the shot zone rollups up to date.
+
+        A game is (re)rolled up when it has classified shots and is new or its
+        classified shot count changed since its last rollup (e.g. zones were
+        backfilled after the game loaded). Its per-game rows are replaced and
+        the affected season and defense rows are rebuilt from per-game rows.
+
+        Games are rolled up in transactions of REFRESH_BATCH_GAMES; if one
+        fails it is rolled back and the error raised, with earlier batches
+        left committed.
+
+        Args:
+            game_ids: Only consider these games (e.g. the games just loaded)
+            force: Roll up game_ids even if their classified shot count is
+                unchanged (e.g. after play-by-play corrections)
+
+        Returns:
+            Number of games rolled up
+        """
+        if force and game_ids is None:
+            raise ValueError("force=True requires explicit game_ids")
+
+        game_filter = "AND p.game_id = ANY(%(games)s)" if game_ids is not None else ""
+        pending = self._fetch(
+            _PENDING_GAMES_QUERY.format(
+                game_filter=game_filter,
+                pending_filter="" if force else _PENDING_FILTER,
+            ),
+            {"games": list(game_ids or [])},
+        )
+
+        rolled_up = 0
+        try:
+            for start in range(0, len(pending), REFRESH_BATCH_GAMES):
+                batch = pending[start : start + REFRESH_BATCH_GAMES]
+                try:
+                    self._roll_up_games(batch)
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+                rolled_up += len(batch)
+        finally:
+            # Committed batches are visible even if a later one failed
+            if rolled_up:
+                self.queries.invalidate(ROLLUP_TABLES)
+                clear_baseline_cache()
+                logger.info(f"Rolled up shot zones for {rolled_up} games")
+        return rolled_up
+
+    def _roll_up_games(self, batch: List[Dict]) -> None:
+        games = [row["game_id"] for row in batch]
+        cursor = self.conn.cursor()
+        try:
+            keys = set()
+            for query in (_DELETE_GAME_ROWS, _INSERT_GAME_ROWS):
+                cursor.execute(query, {"games": games})
+                keys.update(
+                    (r["season"], r["team_id"], r["player_id"], r["defense_team_id"])
+                    for r in cursor.fetchall()
+                )
+
+            players = sorted({key[:3] for key in keys})
+            defenses = sorted({(key[0], key[3]) for key in keys if key[3] is not None})
+            cursor.execute(
+                _REBUILD_SEASON_ROWS,
+                {
+                    "seasons": [key[0] for key in players],
+                    "teams": [key[1] for key in players],
+                    "players": [key[2] for key in players],
+                },
+            )
+            cursor.execute(
+                _REBUILD_DEFENSE_ROWS,
+                {
+                    "seasons": [key[0] for key in defenses],
+                    "teams": [key[1] for key in defenses],
+                },
+            )
+            cursor.execute(
+                _MARK_GAMES,
+                {"games": games, "counts": [row["classified_shots"] for row in batch]},
+            )
+        finally:
+            cursor.close()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
 
     def calculate_zone_efficiency(
         self, season: Optional[int] = None
@@ -73,30 +323,23 @@ class ShotZoneAnalytics:
         Returns:
             List of ZoneEfficiency objects
         """
-        cursor = self.conn.cursor()
-
-        season_filter = f"AND EXTRACT(YEAR FROM s.date) = {season}" if season else ""
+        season_filter = "WHERE season = %(season)s" if season else ""
 
         query = f"""
-            SELECT 
+            SELECT
                 shot_zone,
-                COUNT(*) as attempts,
-                SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) as made,
-                ROUND(100.0 * SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as fg_pct,
-                ROUND(AVG(score_value)::numeric, 3) as points_per_shot,
-                ROUND((SUM(CASE WHEN scoring_play = 1 THEN score_value ELSE 0 END)::float / COUNT(*)), 3) as expected_value
-            FROM hoopr_play_by_play p
-            LEFT JOIN hoopr_schedule s ON p.game_id = s.game_id
-            WHERE shooting_play = 1
-              AND shot_zone IS NOT NULL
-              {season_filter}
+                SUM(attempts) as attempts,
+                SUM(made) as made,
+                ROUND(100.0 * SUM(made) / SUM(attempts), 2) as fg_pct,
+                ROUND(SUM(score_value_total)::numeric / SUM(attempts), 3) as points_per_shot,
+                ROUND(SUM(points)::numeric / SUM(attempts), 3) as expected_value
+            FROM shot_zone_season_rollup
+            {season_filter}
             GROUP BY shot_zone
             ORDER BY expected_value DESC
         """
 
-        cursor.execute(query)
-        results = cursor.fetchall()
-        cursor.close()
+        results = self.queries.fetch(query, {"season": season})
 
         return [
             ZoneEfficiency(
@@ -110,77 +353,75 @@ class ShotZoneAnalytics:
             for row in results
         ]
 
-    def expected_value_by_zone(self) -> Dict[str, float]:
+    def expected_value_by_zone(self, season: Optional[int] = None) -> Dict[str, float]:
         """
         Calculate expected value (points per shot) for each zone.
 
+        Args:
+            season: Optional season filter
+
         Returns:
             Dict mapping zone names to expected values
         """
-        efficiencies = self.calculate_zone_efficiency()
-        return {eff.zone: eff.expected_value for eff in efficiencies}
+        baseline = self.league_average_by_zone(season)
+        return {zone: stats["expected_value"] for zone, stats in baseline.items()}
 
-    def league_average_by_zone(self) -> Dict[str, Dict]:
+    def league_average_by_zone(self, season: Optional[int] = None) -> Dict[str, Dict]:
         """
         Get league average FG% and expected value by zone.
 
+        Served from an in-process cache for BASELINE_TTL_SECONDS; refreshing
+        the rollups clears it.
+
+        Args:
+            season: Optional season filter
+
         Returns:
             Dict with zone stats
         """
-        cursor = self.conn.cursor()
-
-        query = """
-            SELECT 
-                shot_zone,
-                ROUND(100.0 * SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as league_avg_fg_pct,
-                ROUND((SUM(CASE WHEN scoring_play = 1 THEN score_value ELSE 0 END)::float / COUNT(*)), 3) as league_avg_ev
-            FROM hoopr_play_by_play
-            WHERE shooting_play = 1
-              AND shot_zone IS NOT NULL
-            GROUP BY shot_zone
-        """
-
-        cursor.execute(query)
-        results = cursor.fetchall()
-        cursor.close()
-
-        return {
-            row["shot_zone"]: {
-                "fg_pct": row["league_avg_fg_pct"],
-                "expected_value": row["league_avg_ev"],
-            }
-            for row in results
+        now = time.monotonic()
+        with _baseline_lock:
+            cached = _baseline_cache.get(season)
+        if cached is not None and now - cached[0] < BASELINE_TTL_SECONDS:
+            return cached[1]
+
+        baseline = {
+            eff.zone: {"fg_pct": eff.fg_pct, "expected_value": eff.expected_value}
+            for eff in self.calculate_zone_efficiency(season)
         }
+        with _baseline_lock:
+            _baseline_cache[season] = (now, baseline)
+        return baseline
 
-    def player_shot_profile(self, player_id: int) -> Optional[PlayerShotProfile]:
+    def player_shot_profile(
+        self, player_id: int, season: Optional[int] = None
+    ) -> Optional[PlayerShotProfile]:
         """
         Generate shot profile for a specific player.
 
         Args:
             player_id: Athlete ID
+            season: Optional season filter
 
         Returns:
             PlayerShotProfile object or None if player not found
         """
-        cursor = self.conn.cursor()
+        season_filter = "AND season = %(season)s" if season else ""
 
         # Get zone distribution
-        query = """
-            SELECT 
+        query = f"""
+            SELECT
                 shot_zone,
-                COUNT(*) as attempts,
-                ROUND(100.0 * SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as fg_pct
-            FROM hoopr_play_by_play
-            WHERE shooting_play = 1
-              AND shot_zone IS NOT NULL
-              AND athlete_id = %s
+                SUM(attempts) as attempts,
+                ROUND(100.0 * SUM(made) / SUM(attempts), 2) as fg_pct
+            FROM shot_zone_season_rollup
+            WHERE player_id = %(player_id)s
+              {season_filter}
             GROUP BY shot_zone
             ORDER BY attempts DESC
         """
 
-        cursor.execute(query, (player_id,))
-        results = cursor.fetchall()
-        cursor.close()
+        results = self.queries.fetch(query, {"player_id": player_id, "season": season})
 
         if not results:
             return None
@@ -203,12 +444,21 @@ class ShotZoneAnalytics:
         weak_zones = sorted(weak_zones, key=lambda x: x[1])[:3]
         weak_zones = [zone for zone, _ in weak_zones]
 
+        # Compare with the (cached) league baseline
+        baseline = self.league_average_by_zone(season)
+        zone_vs_league = {
+            zone: round(float(eff) - float(baseline[zone]["fg_pct"]), 2)
+            for zone, eff in zone_efficiency.items()
+            if zone in baseline
+        }
+
         return PlayerShotProfile(
             player_id=player_id,
             zone_distribution=zone_distribution,
             zone_efficiency=zone_efficiency,
             favorite_zones=favorite_zones,
             weak_zones=weak_zones,
+            zone_vs_league=zone_vs_league,
         )
 
     def team_defensive_zones(
@@ -224,30 +474,22 @@ class ShotZoneAnalytics:
         Returns:
             Dict with zone defensive stats
         """
-        cursor = self.conn.cursor()
-
-        season_filter = f"AND EXTRACT(YEAR FROM s.date) = {season}" if season else ""
+        season_filter = "AND season = %(season)s" if season else ""
 
         query = f"""
-            SELECT 
+            SELECT
                 shot_zone,
-                COUNT(*) as opponent_attempts,
-                SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) as opponent_made,
-                ROUND(100.0 * SUM(CASE WHEN scoring_play = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) as opponent_fg_pct
-            FROM hoopr_play_by_play p
-            LEFT JOIN hoopr_schedule s ON p.game_id = s.game_id
-            WHERE shooting_play = 1
-              AND shot_zone IS NOT NULL
-              AND p.team_id != %s  -- Opponent shots
-              AND (s.home_team_id = %s OR s.away_team_id = %s)  -- Team's games
+                SUM(attempts) as opponent_attempts,
+                SUM(made) as opponent_made,
+                ROUND(100.0 * SUM(made) / SUM(attempts), 2) as opponent_fg_pct
+            FROM shot_zone_defense_rollup
+            WHERE defense_team_id = %(team_id)s
               {season_filter}
             GROUP BY shot_zone
             ORDER BY opponent_attempts DESC
         """
 
-        cursor.execute(query, (team_id, team_id, team_id))
-        results = cursor.fetchall()
-        cursor.close()
+        results = self.queries.fetch(query, {"team_id": team_id, "season": season})
 
         return {
             row["shot_zone"]: {
@@ -7,6 +7,7 @@ This module provides comprehensive Bayesian inference capabilities including:
 - Variational inference (ADVI)
 - Posterior analysis and credible intervals
 - Bayesian model comparison (WAIC, LOO)
+- Persistent posterior trace cache with memoized diagnostics
 
 Designed for probabilistic modeling of NBA data with full uncertainty quantification,
 especially useful for hierarchical structures (players nested within teams) and
@@ -30,10 +31,16 @@ Author: Agent 8 Module 3
 Date: October 2025
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Tuple, Union, Literal
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple, Union, Literal, Callable
 from enum import Enum
 
 import numpy as np
@@ -126,6 +133,7 @@ class BayesianModelResult:
     loo: Optional[float] = None
     convergence_ok: bool = True
     diagnostics: Optional[Dict[str, Any]] = None
+    cache_key: Optional[str] = None  # PosteriorTraceCache key, if persisted
 
     def __post_init__(self):
         """Validate that model converged."""
@@ -209,6 +217,272 @@ class HierarchicalModelSpec:
     individual_level_priors: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
+# ==============================================================================
+# Posterior Trace Cache
+# ==============================================================================
+
+
+def hash_dataframe(data: pd.DataFrame, columns: Optional[List[str]] = None) -> str:
+    """
+    Compute a stable content hash of (a subset of) a DataFrame.
+
+    Args:
+        data: DataFrame to hash
+        columns: Columns to include (default: all)
+
+    Returns:
+        SHA-256 hex digest of the column names and row values
+    """
+    subset = data[columns] if columns else data
+    row_hashes = pd.util.hash_pandas_object(subset, index=True).values
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in subset.columns]).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+class PosteriorTraceCache:
+    """
+    Persistent store for posterior traces and quantities derived from them.
+
+    Traces are written once as compressed NetCDF (or Zarr) files keyed by
+    model specification, data hash and sampler settings. Derived quantities
+    (summary, WAIC, LOO, ESS, R-hat, credible intervals, posterior predictive
+    draws) are memoized next to the trace, so follow-up questions on the same
+    posterior never trigger another sampling run.
+
+    Examples:
+        >>> cache = PosteriorTraceCache("cache/bayesian_traces")
+        >>> analyzer = BayesianAnalyzer(data, target='points', trace_cache=cache)
+        >>> result = analyzer.sample_posterior(draws=2000)  # samples and stores
+        >>> result = analyzer.sample_posterior(draws=2000)  # loads from disk
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = "cache/bayesian_traces",
+        storage_format: Literal["netcdf", "zarr"] = "netcdf",
+        max_in_memory: int = 8,
+    ):
+        """
+        Initialize trace cache.
+
+        Args:
+            cache_dir: Directory for trace and derived-quantity files
+            storage_format: 'netcdf' (single compressed file) or 'zarr'
+            max_in_memory: Number of loaded traces kept in memory (LRU)
+        """
+        if storage_format not in ("netcdf", "zarr"):
+            raise InvalidParameterError(
+                f"Unknown storage format: {storage_format}",
+                parameter="storage_format",
+                value=storage_format,
+                valid_values=["netcdf", "zarr"],
+            )
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.storage_format = storage_format
+        self.max_in_memory = max_in_memory
+
+        self._traces: OrderedDict = OrderedDict()
+        self._derived: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        self.stats = {
+            "trace_hits": 0,
+            "trace_misses": 0,
+            "derived_hits": 0,
+            "derived_misses": 0,
+        }
+
+    @staticmethod
+    def make_key(
+        model_spec: Dict[str, Any],
+        data_hash: str,
+        sampler_params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build a cache key from model spec, data hash and sampler settings.
+
+        Args:
+            model_spec: JSON-serializable model specification
+            data_hash: Hash of the data the model is conditioned on
+            sampler_params: Sampler settings (draws, tune, chains, ...)
+
+        Returns:
+            Hex cache key
+        """
+        payload = json.dumps(
+            {
+                "model_spec": model_spec,
+                "data_hash": data_hash,
+                "sampler_params": sampler_params or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _trace_path(self, key: str) -> Path:
+        suffix = ".nc" if self.storage_format == "netcdf" else ".zarr"
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _derived_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.derived.json"
+
+    def _remember(self, key: str, trace: Any):
+        self._traces[key] = trace
+        self._traces.move_to_end(key)
+        while len(self._traces) > self.max_in_memory:
+            self._traces.popitem(last=False)
+
+    def has(self, key: str) -> bool:
+        """Check whether a trace is stored under key."""
+        with self._lock:
+            return key in self._traces or self._trace_path(key).exists()
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load a stored trace.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            ArviZ InferenceData, or None if not cached
+        """
+        with self._lock:
+            if key in self._traces:
+                self._traces.move_to_end(key)
+                self.stats["trace_hits"] += 1
+                return self._traces[key]
+
+            path = self._trace_path(key)
+            if not path.exists():
+                self.stats["trace_misses"] += 1
+                return None
+
+            try:
+                if self.storage_format == "netcdf":
+                    trace = az.from_netcdf(str(path))
+                else:
+                    trace = az.from_zarr(str(path))
+            except Exception as e:
+                logger.warning(f"Failed to load cached trace {key}: {e}")
+                self.stats["trace_misses"] += 1
+                return None
+
+            self._remember(key, trace)
+            self.stats["trace_hits"] += 1
+            return trace
+
+    def save(self, key: str, trace: Any):
+        """
+        Persist a trace under key.
+
+        Args:
+            key: Cache key
+            trace: ArviZ InferenceData
+        """
+        with self._lock:
+            path = self._trace_path(key)
+            try:
+                if self.storage_format == "netcdf":
+                    trace.to_netcdf(str(path))
+                else:
+                    trace.to_zarr(str(path))
+            except Exception as e:
+                logger.warning(f"Failed to persist trace {key}: {e}")
+            self._remember(key, trace)
+
+    def _load_derived(self, key: str) -> Dict[str, Any]:
+        if key not in self._derived:
+            path = self._derived_path(key)
+            if path.exists():
+                try:
+                    self._derived[key] = json.loads(path.read_text())
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable derived cache {path}: {e}")
+                    self._derived[key] = {}
+            else:
+                self._derived[key] = {}
+        return self._derived[key]
+
+    def memoize(self, key: str, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a derived quantity for a stored trace, computing it once.
+
+        Args:
+            key: Trace cache key
+            name: Name of the derived quantity (e.g., 'waic')
+            compute: Zero-argument function producing a JSON-serializable value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            derived = self._load_derived(key)
+            if name in derived:
+                self.stats["derived_hits"] += 1
+                return derived[name]
+
+        value = compute()
+
+        with self._lock:
+            self.stats["derived_misses"] += 1
+            derived = self._load_derived(key)
+            derived[name] = value
+            try:
+                self._derived_path(key).write_text(json.dumps(derived, default=float))
+            except (OSError, TypeError) as e:
+                logger.warning(f"Failed to persist derived quantity {name}: {e}")
+        return value
+
+    def memoize_array(
+        self, key: str, name: str, compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Array variant of memoize, stored as a separate .npy file.
+
+        Args:
+            key: Trace cache key
+            name: Name of the derived array
+            compute: Zero-argument function producing an ndarray
+
+        Returns:
+            Cached or freshly computed array
+        """
+        path = self.cache_dir / f"{key}.{name}.npy"
+        with self._lock:
+            if path.exists():
+                self.stats["derived_hits"] += 1
+                return np.load(path)
+
+        value = np.asarray(compute())
+
+        with self._lock:
+            self.stats["derived_misses"] += 1
+            try:
+                np.save(path, value)
+            except OSError as e:
+                logger.warning(f"Failed to persist derived array {name}: {e}")
+        return value
+
+    def clear(self):
+        """Remove all stored traces and derived quantities."""
+        import shutil
+
+        with self._lock:
+            self._traces.clear()
+            self._derived.clear()
+            for path in self.cache_dir.iterdir():
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+
+
 # ==============================================================================
 # BayesianAnalyzer Class
 # ==============================================================================
@@ -238,6 +512,7 @@ class BayesianAnalyzer:
         features: Optional[List[str]] = None,
         backend: str = "pymc",
         mlflow_experiment: Optional[str] = None,
+        trace_cache: Optional[PosteriorTraceCache] = None,
     ):
         """
         Initialize Bayesian analyzer.
@@ -248,6 +523,8 @@ class BayesianAnalyzer:
             features: List of feature column names
             backend: Inference backend ('pymc' only for now)
             mlflow_experiment: MLflow experiment name for tracking
+            trace_cache: Optional persistent cache for posterior traces and
+                derived quantities (WAIC, LOO, ESS, R-hat, intervals)
         """
         if not PYMC_AVAILABLE:
             raise ImportError(
@@ -262,6 +539,12 @@ class BayesianAnalyzer:
         self.model = None
         self.trace = None
         self.mlflow_experiment = mlflow_experiment
+        self.trace_cache = trace_cache
+
+        # Model specification + data columns, used to key the trace cache
+        self.model_spec: Optional[Dict[str, Any]] = None
+        self._model_columns: Optional[List[str]] = None
+        self._model_data_hash: Optional[str] = None
 
         # MLflow tracking
         self.mlflow_tracker = None
@@ -384,10 +667,84 @@ class BayesianAnalyzer:
                 y = self.data[self.target].values
                 y_obs = pm.Normal("y_obs", mu=mu, sigma=sigma, observed=y)
 
-        self.model = model
+        self.use_model(
+            model,
+            model_spec={
+                "kind": "simple_regression",
+                "target": self.target,
+                "features": self.features,
+                "priors": priors,
+            },
+            columns=self.features + ([self.target] if self.target else []),
+        )
         logger.info(f"Built simple Bayesian model with {len(self.features)} features")
         return model
 
+    def use_model(
+        self,
+        model: Any,
+        model_spec: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        data: Optional[pd.DataFrame] = None,
+        data_hash: Optional[str] = None,
+    ) -> Any:
+        """
+        Register a PyMC model for sampling.
+
+        Models built elsewhere (e.g., NBABayesianModels templates) can be
+        registered with their specification so their traces are cached. Such
+        models are conditioned on their own data, so pass it (or its hash)
+        to key the trace on it rather than on the analyzer's data.
+
+        Args:
+            model: PyMC model object
+            model_spec: JSON-serializable description of the model; required
+                for trace caching
+            columns: Data columns the model is conditioned on (default: all)
+            data: Data the model was built on (default: the analyzer's data)
+            data_hash: Precomputed hash_dataframe() of that data; overrides data
+
+        Returns:
+            The registered model
+        """
+        self.model = model
+        self.model_spec = model_spec
+        self._model_columns = columns
+        if data_hash is None and model_spec is not None:
+            source = self.data if data is None else data
+            data_hash = hash_dataframe(source, columns or None)
+        self._model_data_hash = data_hash
+        return model
+
+    def _trace_cache_key(self, sampler_params: Dict[str, Any]) -> Optional[str]:
+        """Cache key for the current model, or None if caching is disabled."""
+        if self.trace_cache is None or self.model_spec is None:
+            return None
+        return self.trace_cache.make_key(
+            self.model_spec, self._model_data_hash, sampler_params
+        )
+
+    def _memoize(
+        self, result: BayesianModelResult, name: str, compute: Callable[[], Any]
+    ) -> Any:
+        """Memoize a derived quantity on the result's stored trace."""
+        if self.trace_cache is None or result.cache_key is None:
+            return compute()
+        return self.trace_cache.memoize(result.cache_key, name, compute)
+
+    def _summary(self, trace: Any, cache_key: Optional[str]) -> pd.DataFrame:
+        """ArviZ summary, memoized on the stored trace when cached."""
+        if self.trace_cache is None or cache_key is None:
+            return az.summary(trace, hdi_prob=0.95)
+        table = self.trace_cache.memoize(
+            cache_key,
+            "summary",
+            lambda: az.summary(trace, hdi_prob=0.95).to_dict(orient="split"),
+        )
+        return pd.DataFrame(
+            table["data"], index=table["index"], columns=table["columns"]
+        )
+
     def sample_posterior(
         self,
         formula: Optional[str] = None,
@@ -396,11 +753,17 @@ class BayesianAnalyzer:
         chains: int = 4,
         target_accept: float = 0.95,
         random_seed: Optional[int] = None,
+        cores: Optional[int] = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> BayesianModelResult:
         """
         Sample from posterior using MCMC (NUTS sampler).
 
+        Chains run in parallel worker processes. When a trace cache is
+        configured, a posterior already sampled for the same model spec, data
+        and sampler settings is loaded from disk instead of resampled.
+
         Args:
             formula: Optional formula string (e.g., "y ~ x1 + x2"). If provided and
                     no model exists, automatically builds a simple linear model.
@@ -409,6 +772,8 @@ class BayesianAnalyzer:
             chains: Number of MCMC chains
             target_accept: Target acceptance rate for NUTS
             random_seed: Random seed for reproducibility
+            cores: Number of processes for chains (default: min(chains, CPUs))
+            use_cache: Load/store the trace via the trace cache if configured
             **kwargs: Additional arguments for pm.sample()
 
         Returns:
@@ -426,24 +791,53 @@ class BayesianAnalyzer:
                     reason="No model has been built. Either call build_simple_model() or build_hierarchical_model() first, or provide a formula parameter.",
                 )
 
-        logger.info(f"Sampling posterior: {draws} draws, {tune} tune, {chains} chains")
-
-        with self.model:
-            trace = pm.sample(
-                draws=draws,
-                tune=tune,
-                chains=chains,
-                target_accept=target_accept,
-                random_seed=random_seed,
-                return_inferencedata=True,
-                idata_kwargs={"log_likelihood": True},
-                **kwargs,
+        if cores is None:
+            cores = max(1, min(chains, os.cpu_count() or 1))
+
+        cache_key = None
+        trace = None
+        if use_cache:
+            cache_key = self._trace_cache_key(
+                {
+                    "draws": draws,
+                    "tune": tune,
+                    "chains": chains,
+                    "target_accept": target_accept,
+                    "random_seed": random_seed,
+                    "kwargs": kwargs,
+                }
             )
+            if cache_key is not None:
+                trace = self.trace_cache.load(cache_key)
+                if trace is not None:
+                    logger.info(f"Loaded cached posterior trace {cache_key}")
+
+        if trace is None:
+            logger.info(
+                f"Sampling posterior: {draws} draws, {tune} tune, "
+                f"{chains} chains on {cores} cores"
+            )
+
+            with self.model:
+                trace = pm.sample(
+                    draws=draws,
+                    tune=tune,
+                    chains=chains,
+                    cores=cores,
+                    target_accept=target_accept,
+                    random_seed=random_seed,
+                    return_inferencedata=True,
+                    idata_kwargs={"log_likelihood": True},
+                    **kwargs,
+                )
+
+            if cache_key is not None:
+                self.trace_cache.save(cache_key, trace)
 
         self.trace = trace
 
         # Get summary
-        summary = az.summary(trace, hdi_prob=0.95)
+        summary = self._summary(trace, cache_key)
 
         # Check convergence
         rhat_values = summary["r_hat"].values
@@ -464,31 +858,35 @@ class BayesianAnalyzer:
             "n_divergences": int(trace.sample_stats.diverging.sum().values),
         }
 
+        result = BayesianModelResult(
+            trace=trace,
+            model=self.model,
+            inference_method=InferenceMethod.MCMC,
+            summary=summary,
+            convergence_ok=convergence_ok,
+            diagnostics=diagnostics,
+            cache_key=cache_key,
+        )
+
         # Model comparison metrics
         try:
-            waic_result = az.waic(trace)
-            waic_value = float(waic_result.waic)
+            waic_value = self._memoize(
+                result, "waic_raw", lambda: float(az.waic(trace).waic)
+            )
         except Exception as e:
             logger.warning(f"WAIC calculation failed: {e}")
             waic_value = None
 
         try:
-            loo_result = az.loo(trace)
-            loo_value = float(loo_result.loo)
+            loo_value = self._memoize(
+                result, "loo_raw", lambda: float(az.loo(trace).loo)
+            )
         except Exception as e:
             logger.warning(f"LOO calculation failed: {e}")
             loo_value = None
 
-        result = BayesianModelResult(
-            trace=trace,
-            model=self.model,
-            inference_method=InferenceMethod.MCMC,
-            summary=summary,
-            waic=waic_value,
-            loo=loo_value,
-            convergence_ok=convergence_ok,
-            diagnostics=diagnostics,
-        )
+        result.waic = waic_value
+        result.loo = loo_value
 
         # MLflow logging
         if self.mlflow_tracker:
@@ -647,7 +1045,16 @@ class BayesianAnalyzer:
                 y = self.data[self.target].values
                 y_obs = pm.Normal("y_obs", mu=mu, sigma=sigma_obs, observed=y)
 
-        self.model = model
+        self.use_model(
+            model,
+            model_spec={
+                "kind": "hierarchical",
+                "target": self.target,
+                "group_variable": group_col,
+                "nested_variable": nested_col,
+            },
+            columns=[c for c in (group_col, nested_col, self.target) if c],
+        )
         logger.info(
             f"Built hierarchical model: {n_groups} groups"
             + (f", {n_nested} nested items" if nested_col else "")
@@ -780,8 +1187,24 @@ class BayesianAnalyzer:
         Returns:
             CredibleInterval object
         """
-        trace = result.trace
+        lower, upper = self._memoize(
+            result,
+            f"credible_interval:{parameter}:{prob}:{method}",
+            lambda: self._credible_bounds(result.trace, parameter, prob, method),
+        )
+
+        return CredibleInterval(
+            parameter=parameter,
+            lower=lower,
+            upper=upper,
+            probability=prob,
+            method=method,
+        )
 
+    def _credible_bounds(
+        self, trace: Any, parameter: str, prob: float, method: str
+    ) -> List[float]:
+        """Compute [lower, upper] credible bounds from a trace."""
         if method == "hdi":
             hdi_vals = az.hdi(trace, var_names=[parameter], hdi_prob=prob)
             if parameter in hdi_vals:
@@ -822,13 +1245,7 @@ class BayesianAnalyzer:
                 valid_values=valid_methods,
             )
 
-        return CredibleInterval(
-            parameter=parameter,
-            lower=lower,
-            upper=upper,
-            probability=prob,
-            method=method,
-        )
+        return [lower, upper]
 
     def posterior_predictive_check(
         self,
@@ -847,33 +1264,14 @@ class BayesianAnalyzer:
         Returns:
             PPCResult with observed vs predicted comparison
         """
-        trace = result.trace
-        model = result.model
-
-        with model:
-            # Sample posterior predictive using extend
-            ppc = pm.sample_posterior_predictive(
-                trace, extend_inferencedata=False, random_seed=42
-            )
-
-        # Extract observed and predicted
-        if "y_obs" in ppc.posterior_predictive:
-            predicted_samples = ppc.posterior_predictive["y_obs"].values
-            # Shape: (chains, draws, observations)
-            predicted_samples = predicted_samples.reshape(
-                -1, predicted_samples.shape[-1]
+        if self.trace_cache is not None and result.cache_key is not None:
+            predicted_samples = self.trace_cache.memoize_array(
+                result.cache_key,
+                "ppc_y_obs",
+                lambda: self._posterior_predictive_samples(result),
             )
         else:
-            available_vars = (
-                list(ppc.posterior_predictive.keys())
-                if hasattr(ppc, "posterior_predictive")
-                else []
-            )
-            raise ModelFitError(
-                "No 'y_obs' variable found in posterior predictive samples",
-                model_type="Bayesian",
-                reason=f"Available variables: {available_vars}",
-            )
+            predicted_samples = self._posterior_predictive_samples(result)
 
         observed = self.data[self.target].values
 
@@ -918,6 +1316,31 @@ class BayesianAnalyzer:
             test_statistic=test_statistic,
         )
 
+    def _posterior_predictive_samples(self, result: BayesianModelResult) -> np.ndarray:
+        """Draw posterior predictive samples of y_obs as (n_draws, n_obs)."""
+        with result.model:
+            # Sample posterior predictive using extend
+            ppc = pm.sample_posterior_predictive(
+                result.trace, extend_inferencedata=False, random_seed=42
+            )
+
+        # Extract observed and predicted
+        if "y_obs" in ppc.posterior_predictive:
+            predicted_samples = ppc.posterior_predictive["y_obs"].values
+            # Shape: (chains, draws, observations)
+            return predicted_samples.reshape(-1, predicted_samples.shape[-1])
+
+        available_vars = (
+            list(ppc.posterior_predictive.keys())
+            if hasattr(ppc, "posterior_predictive")
+            else []
+        )
+        raise ModelFitError(
+            "No 'y_obs' variable found in posterior predictive samples",
+            model_type="Bayesian",
+            reason=f"Available variables: {available_vars}",
+        )
+
     def waic(self, result: BayesianModelResult) -> float:
         """
         Calculate Widely Applicable Information Criterion.
@@ -928,13 +1351,17 @@ class BayesianAnalyzer:
         Returns:
             WAIC value (lower is better)
         """
-        waic_result = az.waic(result.trace)
-        # ELPDData uses elpd_waic, not waic
-        return float(
-            waic_result.elpd_waic
-            if hasattr(waic_result, "elpd_waic")
-            else waic_result.waic
-        )
+
+        def compute() -> float:
+            waic_result = az.waic(result.trace)
+            # ELPDData uses elpd_waic, not waic
+            return float(
+                waic_result.elpd_waic
+                if hasattr(waic_result, "elpd_waic")
+                else waic_result.waic
+            )
+
+        return self._memoize(result, "waic", compute)
 
     def loo(self, result: BayesianModelResult) -> float:
         """
@@ -946,11 +1373,17 @@ class BayesianAnalyzer:
         Returns:
             LOO value (lower is better)
         """
-        loo_result = az.loo(result.trace)
-        # ELPDData uses elpd_loo, not loo
-        return float(
-            loo_result.elpd_loo if hasattr(loo_result, "elpd_loo") else loo_result.loo
-        )
+
+        def compute() -> float:
+            loo_result = az.loo(result.trace)
+            # ELPDData uses elpd_loo, not loo
+            return float(
+                loo_result.elpd_loo
+                if hasattr(loo_result, "elpd_loo")
+                else loo_result.loo
+            )
+
+        return self._memoize(result, "loo", compute)
 
     def compare_models(
         self, results: Dict[str, BayesianModelResult]
@@ -1077,9 +1510,11 @@ class BayesianAnalyzer:
         summary = result.summary
         param_names = [v for v in summary.index if v != "y_obs"]
 
-        ess_dict = {p: float(summary.loc[p, "ess_bulk"]) for p in param_names}
-
-        return ess_dict
+        return self._memoize(
+            result,
+            "ess_bulk",
+            lambda: {p: float(summary.loc[p, "ess_bulk"]) for p in param_names},
+        )
 
     def rhat_statistic(self, result: BayesianModelResult) -> Dict[str, float]:
         """
@@ -1094,9 +1529,11 @@ class BayesianAnalyzer:
         summary = result.summary
         param_names = [v for v in summary.index if v != "y_obs"]
 
-        rhat_dict = {p: float(summary.loc[p, "r_hat"]) for p in param_names}
-
-        return rhat_dict
+        return self._memoize(
+            result,
+            "r_hat",
+            lambda: {p: float(summary.loc[p, "r_hat"]) for p in param_names},
+        )
 
 
 # ==============================================================================
@@ -1105,7 +1542,19 @@ class BayesianAnalyzer:
 
 
 class NBABayesianModels:
-    """NBA-specific Bayesian model templates."""
+    """
+    NBA-specific Bayesian model templates.
+
+    The returned encoded_data carries 'model_spec', 'columns' and 'data_hash',
+    so a template can be registered with BayesianAnalyzer.use_model() and its
+    trace cached under the data it was built on:
+
+        >>> model, enc = NBABayesianModels.player_scoring_model(data)
+        >>> analyzer.use_model(
+        ...     model, enc['model_spec'], enc['columns'], data_hash=enc['data_hash']
+        ... )
+        >>> result = analyzer.sample_posterior()
+    """
 
     @staticmethod
     def player_scoring_model(
@@ -1169,7 +1618,15 @@ class NBABayesianModels:
             "teams": teams,
             "player_idx": player_idx,
             "players": players,
+            "model_spec": {
+                "kind": "player_scoring",
+                "team_col": team_col,
+                "player_col": player_col,
+                "target_col": target_col,
+            },
+            "columns": [team_col, player_col, target_col],
         }
+        encoded_data["data_hash"] = hash_dataframe(data, encoded_data["columns"])
 
         logger.info(
             f"Built player scoring model: {len(teams)} teams, {len(players)} players"
@@ -1242,7 +1699,23 @@ class NBABayesianModels:
             # Likelihood
             won = pm.Bernoulli("won", logit_p=logit_p, observed=y)
 
-        encoded_data = {"team_idx": team_idx, "teams": teams, "opp_idx": opp_idx}
+        encoded_data = {
+            "team_idx": team_idx,
+            "teams": teams,
+            "opp_idx": opp_idx,
+            "model_spec": {
+                "kind": "win_probability",
+                "team_col": team_col,
+                "opponent_col": opponent_col,
+                "target_col": target_col,
+                "features": features or [],
+                "home_effect": "is_home" in data.columns,
+            },
+            "columns": [team_col, opponent_col, target_col]
+            + (features or [])
+            + (["is_home"] if "is_home" in data.columns else []),
+        }
+        encoded_data["data_hash"] = hash_dataframe(data, encoded_data["columns"])
 
         logger.info(f"Built win probability model: {len(teams)} teams")
         return model, encoded_data
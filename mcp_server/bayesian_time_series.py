@@ -5,6 +5,7 @@ This module implements advanced Bayesian time series methods:
 - Bayesian VAR (BVAR) with Minnesota prior
 - Bayesian Structural Time Series (BSTS)
 - Hierarchical Bayesian Time Series
+- Sequential (incremental) updating for in-season models
 
 These methods complement the frequentist time series methods in time_series.py
 by providing full posterior distributions, uncertainty quantification, and
@@ -2026,7 +2027,63 @@ class HierarchicalBayesianTS:
         # Summary
         summary = az.summary(trace, hdi_prob=0.95)
 
-        # Extract player effects
+        player_effects, team_effects, league_effects, shrinkage = self._extract_effects(
+            trace, include_trend
+        )
+
+        # Model diagnostics
+        try:
+            waic = az.waic(trace)
+            waic_value = float(waic.waic)
+        except Exception as e:
+            logger.warning(f"WAIC computation failed: {e}")
+            waic_value = None
+
+        try:
+            loo = az.loo(trace)
+            loo_value = float(loo.loo)
+        except Exception as e:
+            logger.warning(f"LOO computation failed: {e}")
+            loo_value = None
+
+        # Convergence
+        diagnostics = self._check_convergence(trace)
+        diagnostics["update_method"] = "full_fit"
+        # Model structure, reused by update() when it has to refit
+        diagnostics["ar_order"] = ar_order
+        diagnostics["include_trend"] = include_trend
+        convergence_ok = diagnostics["overall_ok"]
+
+        if not convergence_ok:
+            warnings.warn(
+                f"Convergence issues. Rhat_max: {diagnostics['rhat_max']:.4f}",
+                UserWarning,
+            )
+
+        waic_str = f"{waic_value:.2f}" if waic_value is not None else "N/A"
+        logger.info(
+            f"Hierarchical fit complete. WAIC: {waic_str}, "
+            f"Convergence: {convergence_ok}"
+        )
+
+        return HierarchicalTSResult(
+            trace=trace,
+            model=model,
+            summary=summary,
+            player_effects=player_effects,
+            team_effects=team_effects,
+            league_effects=league_effects,
+            shrinkage_factors=shrinkage,
+            waic=waic_value,
+            loo=loo_value,
+            convergence_ok=convergence_ok,
+            diagnostics=diagnostics,
+        )
+
+    def _extract_effects(
+        self, trace, include_trend: bool
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, float], pd.DataFrame]:
+        """Extract player, team and league effects plus shrinkage from a trace."""
         alpha_mean = trace.posterior["alpha_player"].mean(dim=["chain", "draw"]).values
         sigma_mean = trace.posterior["sigma_player"].mean(dim=["chain", "draw"]).values
 
@@ -2066,50 +2123,209 @@ class HierarchicalBayesianTS:
         # Compute shrinkage factors
         shrinkage = self._compute_shrinkage(trace)
 
-        # Model diagnostics
-        try:
-            waic = az.waic(trace)
-            waic_value = float(waic.waic)
-        except Exception as e:
-            logger.warning(f"WAIC computation failed: {e}")
-            waic_value = None
+        return player_effects, team_effects, league_effects, shrinkage
 
-        try:
-            loo = az.loo(trace)
-            loo_value = float(loo.loo)
-        except Exception as e:
-            logger.warning(f"LOO computation failed: {e}")
-            loo_value = None
+    def update(
+        self,
+        result: HierarchicalTSResult,
+        new_data: pd.DataFrame,
+        ess_threshold: float = 0.5,
+        random_seed: Optional[int] = None,
+        min_unique_fraction: float = 0.25,
+        **refit_kwargs,
+    ) -> HierarchicalTSResult:
+        """
+        Sequentially update a fitted model with newly played games.
 
-        # Convergence
-        diagnostics = self._check_convergence(trace)
-        convergence_ok = diagnostics["overall_ok"]
+        The previous posterior draws are importance-reweighted by the
+        likelihood of the new observations and resampled, which costs one
+        vectorized likelihood evaluation instead of a new MCMC run. When the
+        effective sample size of the reweighted draws collapses below
+        ``ess_threshold`` (as a fraction of the draws), or new players/teams
+        appear, the model is refit from scratch on all data.
 
-        if not convergence_ok:
-            warnings.warn(
-                f"Convergence issues. Rhat_max: {diagnostics['rhat_max']:.4f}",
-                UserWarning,
+        Resampling duplicates draws and nothing rejuvenates them, so the
+        per-update ESS alone misses a posterior that has degenerated over
+        many small updates. The model is also refit once the distinct draws
+        left after resampling fall below ``min_unique_fraction``.
+
+        Parameters
+        ----------
+        result : HierarchicalTSResult
+            Current posterior (from fit() or a previous update())
+        new_data : pd.DataFrame
+            New observations with the same columns as the training data
+        ess_threshold : float, default=0.5
+            Minimum ESS fraction to accept the reweighted posterior
+        random_seed : Optional[int]
+            Seed for resampling
+        min_unique_fraction : float, default=0.25
+            Minimum fraction of distinct draws to accept the resampled
+            posterior (cumulative across updates)
+        **refit_kwargs
+            Arguments for fit() when a full refit is needed (ar_order and
+            include_trend default to those of the original fit)
+
+        Returns
+        -------
+        result : HierarchicalTSResult
+            Updated results; diagnostics['update_method'] is
+            'importance_resampling' or 'full_fit'
+
+        Examples
+        --------
+        >>> result = analyzer.fit(draws=1000)
+        >>> # After tonight's games
+        >>> result = analyzer.update(result, tonights_games)
+        >>> print(result.diagnostics["ess_fraction"])
+        """
+        required_cols = [self.player_col, self.team_col, self.time_col, self.target_col]
+        missing = [col for col in required_cols if col not in new_data.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        combined = pd.concat(
+            [self.data.assign(_is_new=False), new_data.assign(_is_new=True)],
+            ignore_index=True,
+        )
+        combined = combined.sort_values([self.player_col, self.time_col]).reset_index(
+            drop=True
+        )
+        is_new = combined.pop("_is_new").values
+
+        unknown_players = ~new_data[self.player_col].isin(self.players)
+        unknown_teams = ~new_data[self.team_col].isin(self.teams)
+        if unknown_players.any() or unknown_teams.any():
+            logger.info("New players/teams in update data; refitting full model")
+            return self._refit(combined, result, ess=None, **refit_kwargs)
+
+        posterior = result.trace.posterior
+        n_draws = posterior.sizes["chain"] * posterior.sizes["draw"]
+
+        def draws(name: str) -> np.ndarray:
+            return posterior[name].values.reshape(n_draws, -1)
+
+        new_rows = combined[is_new]
+        p_idx = self.players.get_indexer(new_rows[self.player_col])
+        t_new = combined.groupby(self.player_col).cumcount().values[is_new]
+        y_new = new_rows[self.target_col].values
+
+        mu = draws("alpha_player")[:, p_idx]
+        if "beta_player" in posterior:
+            mu = mu + draws("beta_player")[:, p_idx] * t_new
+        if "phi_player" in posterior:
+            lag = (
+                combined.groupby(self.player_col)[self.target_col]
+                .shift(1)
+                .fillna(0)
+                .values[is_new]
             )
+            mu = mu + draws("phi_player")[:, p_idx] * lag
+        sigma = draws("sigma_player")[:, p_idx]
+
+        log_lik = np.sum(
+            -0.5 * ((y_new - mu) / sigma) ** 2
+            - np.log(sigma)
+            - 0.5 * np.log(2 * np.pi),
+            axis=1,
+        )
+        log_w = log_lik - log_lik.max()
+        weights = np.exp(log_w)
+        weights /= weights.sum()
+        ess = float(1.0 / np.sum(weights**2))
+
+        if ess < ess_threshold * n_draws:
+            logger.info(f"ESS collapsed ({ess:.0f}/{n_draws}); refitting full model")
+            return self._refit(combined, result, ess=ess, **refit_kwargs)
+
+        rng = np.random.default_rng(random_seed)
+        positions = (np.arange(n_draws) + rng.uniform()) / n_draws
+        idx = np.minimum(np.searchsorted(np.cumsum(weights), positions), n_draws - 1)
+
+        # Distinct draws, not indices: earlier updates already duplicated some
+        n_unique = len(np.unique(draws("alpha_player")[idx], axis=0))
+        if n_unique < min_unique_fraction * n_draws:
+            logger.info(
+                f"Posterior degenerated to {n_unique}/{n_draws} distinct draws; "
+                "refitting full model"
+            )
+            refit = self._refit(combined, result, ess=ess, **refit_kwargs)
+            refit.diagnostics["unique_fraction_before_refit"] = n_unique / n_draws
+            return refit
+
+        resampled = {}
+        for name, var in posterior.data_vars.items():
+            values = var.values.reshape((n_draws,) + var.shape[2:])
+            resampled[name] = values[idx][None, ...]
+        trace = az.from_dict(posterior=resampled)
+
+        self.data = combined
+        self.player_idx = self.players.get_indexer(combined[self.player_col])
+        self.team_idx = self.teams.get_indexer(combined[self.team_col])
+
+        player_effects, team_effects, league_effects, shrinkage = self._extract_effects(
+            trace, "beta_player" in posterior
+        )
+
+        diagnostics = dict(result.diagnostics or {})
+        diagnostics.update(
+            {
+                "update_method": "importance_resampling",
+                "ess": ess,
+                "ess_fraction": ess / n_draws,
+                "n_new_obs": int(len(y_new)),
+                "n_unique_draws": int(n_unique),
+                "unique_fraction": n_unique / n_draws,
+            }
+        )
 
         logger.info(
-            f"Hierarchical fit complete. WAIC: {waic_value:.2f if waic_value else 'N/A'}, "
-            f"Convergence: {convergence_ok}"
+            f"Sequential update with {len(y_new)} observations: "
+            f"ESS {ess:.0f}/{n_draws}"
         )
 
         return HierarchicalTSResult(
             trace=trace,
-            model=model,
-            summary=summary,
+            model=result.model,
+            summary=az.summary(trace, hdi_prob=0.95, kind="stats"),
             player_effects=player_effects,
             team_effects=team_effects,
             league_effects=league_effects,
             shrinkage_factors=shrinkage,
-            waic=waic_value,
-            loo=loo_value,
-            convergence_ok=convergence_ok,
+            convergence_ok=result.convergence_ok,
             diagnostics=diagnostics,
         )
 
+    def _refit(
+        self,
+        combined: pd.DataFrame,
+        result: HierarchicalTSResult,
+        ess: Optional[float],
+        **fit_kwargs,
+    ) -> HierarchicalTSResult:
+        """
+        Re-encode on the combined data and run a full fit.
+
+        ar_order and include_trend default to the values the current
+        posterior was fit with.
+        """
+        previous = result.diagnostics or {}
+        for name in ("ar_order", "include_trend"):
+            if name in previous:
+                fit_kwargs.setdefault(name, previous[name])
+
+        self.__init__(
+            data=combined,
+            player_col=self.player_col,
+            team_col=self.team_col,
+            time_col=self.time_col,
+            target_col=self.target_col,
+        )
+        refit = self.fit(**fit_kwargs)
+        if ess is not None:
+            refit.diagnostics["ess_before_refit"] = ess
+        return refit
+
     def _compute_shrinkage(self, trace) -> pd.DataFrame:
         """
         Compute shrinkage factors for each player.
@@ -2327,6 +2543,214 @@ class HierarchicalBayesianTS:
         }
 
 
+# ==============================================================================
+# Sequential Conjugate Updating
+# ==============================================================================
+
+
+class SequentialConjugateUpdater:
+    """
+    O(1) sequential Bayesian updating for per-player conjugate models.
+
+    Keeps sufficient statistics for every entity (player, team) in flat
+    arrays, so adding a night of games updates each player's posterior in
+    constant time without revisiting earlier games.
+
+    Families
+    --------
+    - 'normal': y ~ N(mu, sigma^2) with Normal-Inverse-Gamma prior
+      (mu0, kappa0, alpha0, beta0) on (mu, sigma^2)
+    - 'poisson': y ~ Poisson(lambda) with Gamma(alpha0, beta0) prior
+
+    Parameters
+    ----------
+    family : str, default='normal'
+        'normal' or 'poisson'
+    mu0 : float, default=0.0
+        Prior mean (normal family)
+    kappa0 : float, default=1.0
+        Prior pseudo-observations for the mean (normal family)
+    alpha0 : float, default=2.0
+        Prior shape (inverse-gamma for normal, gamma for poisson)
+    beta0 : float, default=1.0
+        Prior scale (inverse-gamma) or rate (gamma)
+
+    Examples
+    --------
+    >>> updater = SequentialConjugateUpdater("normal", mu0=15, kappa0=2)
+    >>> updater.update(games["player_id"], games["points"])
+    >>> updater.posterior().head()
+    """
+
+    def __init__(
+        self,
+        family: str = "normal",
+        mu0: float = 0.0,
+        kappa0: float = 1.0,
+        alpha0: float = 2.0,
+        beta0: float = 1.0,
+    ):
+        if family not in ("normal", "poisson"):
+            raise ValueError(f"Unknown family: {family}. Use 'normal' or 'poisson'")
+        if kappa0 <= 0 or alpha0 <= 0 or beta0 <= 0:
+            raise ValueError("kappa0, alpha0 and beta0 must be positive")
+
+        self.family = family
+        self.prior = {"mu0": mu0, "kappa0": kappa0, "alpha0": alpha0, "beta0": beta0}
+
+        self.entities: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        self.n = np.zeros(0)
+        self.mu = np.zeros(0)
+        self.kappa = np.zeros(0)
+        self.alpha = np.zeros(0)
+        self.beta = np.zeros(0)
+
+    def _ensure_entities(self, entity_ids: np.ndarray) -> np.ndarray:
+        """Map entity ids to positions, appending prior state for new ones."""
+        new = [e for e in pd.unique(entity_ids) if e not in self._index]
+        if new:
+            for e in new:
+                self._index[e] = len(self.entities)
+                self.entities.append(e)
+            k = len(new)
+            self.n = np.concatenate([self.n, np.zeros(k)])
+            self.mu = np.concatenate([self.mu, np.full(k, self.prior["mu0"])])
+            self.kappa = np.concatenate([self.kappa, np.full(k, self.prior["kappa0"])])
+            self.alpha = np.concatenate([self.alpha, np.full(k, self.prior["alpha0"])])
+            self.beta = np.concatenate([self.beta, np.full(k, self.prior["beta0"])])
+        return np.array([self._index[e] for e in entity_ids], dtype=int)
+
+    def update(self, entity_ids, values) -> "SequentialConjugateUpdater":
+        """
+        Fold new observations into each entity's posterior.
+
+        Parameters
+        ----------
+        entity_ids : array-like
+            Entity id for each new observation
+        values : array-like
+            Observed values (same length as entity_ids)
+
+        Returns
+        -------
+        self : SequentialConjugateUpdater
+        """
+        entity_ids = np.asarray(entity_ids)
+        values = np.asarray(values, dtype=float)
+        if entity_ids.shape != values.shape:
+            raise ValueError("entity_ids and values must have the same length")
+        if len(values) == 0:
+            return self
+
+        pos = self._ensure_entities(entity_ids)
+        size = len(self.entities)
+        m = np.bincount(pos, minlength=size).astype(float)
+        total = np.bincount(pos, weights=values, minlength=size)
+        touched = m > 0
+
+        if self.family == "poisson":
+            self.alpha[touched] += total[touched]
+            self.beta[touched] += m[touched]
+        else:
+            xbar = np.divide(total, m, out=np.zeros(size), where=touched)
+            ss = np.bincount(pos, weights=(values - xbar[pos]) ** 2, minlength=size)
+            kappa_n = self.kappa + m
+            self.beta = np.where(
+                touched,
+                self.beta
+                + 0.5 * ss
+                + self.kappa * m * (xbar - self.mu) ** 2 / (2 * kappa_n),
+                self.beta,
+            )
+            self.mu = np.where(
+                touched, (self.kappa * self.mu + m * xbar) / kappa_n, self.mu
+            )
+            self.alpha = self.alpha + 0.5 * m
+            self.kappa = kappa_n
+
+        self.n += m
+        return self
+
+    def posterior(self, entity_id: Optional[Any] = None, prob: float = 0.95):
+        """
+        Posterior summary of the mean parameter.
+
+        Parameters
+        ----------
+        entity_id : Optional[Any]
+            Single entity to summarize (default: all entities)
+        prob : float, default=0.95
+            Credible interval probability
+
+        Returns
+        -------
+        pd.DataFrame or Dict[str, float]
+            Columns entity, n_obs, mean, std, lower, upper (plus sigma for
+            the normal family); a dict when entity_id is given
+        """
+        from scipy import stats
+
+        q = (1 + prob) / 2
+        if self.family == "poisson":
+            mean = self.alpha / self.beta
+            std = np.sqrt(self.alpha) / self.beta
+            lower = stats.gamma.ppf(1 - q, self.alpha, scale=1 / self.beta)
+            upper = stats.gamma.ppf(q, self.alpha, scale=1 / self.beta)
+            extra = {}
+        else:
+            mean = self.mu
+            # Marginal posterior of mu is Student-t with 2*alpha dof
+            scale = np.sqrt(self.beta / (self.alpha * self.kappa))
+            dof = 2 * self.alpha
+            with np.errstate(divide="ignore", invalid="ignore"):
+                std = np.where(dof > 2, scale * np.sqrt(dof / (dof - 2)), np.nan)
+            half = stats.t.ppf(q, dof) * scale
+            lower, upper = mean - half, mean + half
+            extra = {"sigma": np.sqrt(self.beta / np.maximum(self.alpha - 1, 1e-12))}
+
+        frame = pd.DataFrame(
+            {
+                "entity": self.entities,
+                "n_obs": self.n.astype(int),
+                "mean": mean,
+                "std": std,
+                "lower": lower,
+                "upper": upper,
+                **extra,
+            }
+        )
+
+        if entity_id is None:
+            return frame
+        if entity_id not in self._index:
+            raise ValueError(f"Entity {entity_id} has no observations")
+        return frame.iloc[self._index[entity_id]].to_dict()
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Serializable state for persisting between nightly updates."""
+        return {
+            "family": self.family,
+            "prior": dict(self.prior),
+            "entities": list(self.entities),
+            "n": self.n.tolist(),
+            "mu": self.mu.tolist(),
+            "kappa": self.kappa.tolist(),
+            "alpha": self.alpha.tolist(),
+            "beta": self.beta.tolist(),
+        }
+
+    @classmethod
+    def from_state_dict(cls, state: Dict[str, Any]) -> "SequentialConjugateUpdater":
+        """Restore an updater saved with state_dict()."""
+        updater = cls(family=state["family"], **state["prior"])
+        updater.entities = list(state["entities"])
+        updater._index = {e: i for i, e in enumerate(updater.entities)}
+        for name in ("n", "mu", "kappa", "alpha", "beta"):
+            setattr(updater, name, np.asarray(state[name], dtype=float))
+        return updater
+
+
 @dataclass
 class BayesianModelAveragingResult:
     """Results from Bayesian Model Averaging."""
@@ -76,6 +76,8 @@ from datetime import datetime, timedelta
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from mcp_server.aggregate_query_service import AggregateQueryService
+
 # Import specialized feature extractors
 from mcp_server.betting.feature_extractors.rest_fatigue import RestFatigueExtractor
 from mcp_server.betting.feature_extractors.player_features import PlayerFeatureExtractor
@@ -89,18 +91,27 @@ class FeatureExtractor:
     the format expected by the trained ensemble model.
     """
 
-    def __init__(self, db_conn: psycopg2.extensions.connection):
+    def __init__(
+        self,
+        db_conn: psycopg2.extensions.connection,
+        query_service: Optional[AggregateQueryService] = None,
+    ):
         """
         Initialize feature extractor
 
         Args:
             db_conn: PostgreSQL database connection
+            query_service: Shared aggregate query cache (default: one over
+                db_conn, shared with the specialized extractors)
         """
         self.db_conn = db_conn
+        self.queries = query_service or AggregateQueryService(db_conn)
 
         # Initialize specialized extractors
         self.rest_fatigue_extractor = RestFatigueExtractor(db_conn)
-        self.player_feature_extractor = PlayerFeatureExtractor(db_conn)
+        self.player_feature_extractor = PlayerFeatureExtractor(
+            db_conn, query_service=self.queries
+        )
 
     def extract_game_features(
         self,
@@ -255,8 +266,6 @@ class FeatureExtractor:
         Returns:
             Dictionary of team statistics
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         # Get recent games for this team from hoopr_team_box (before the target date)
         query = """
             SELECT
@@ -287,8 +296,9 @@ class FeatureExtractor:
             LIMIT %s
         """
 
-        cursor.execute(query, (team_id, team_id, team_id, as_of_date, n_games))
-        games = cursor.fetchall()
+        games = self.queries.fetch(
+            query, (team_id, team_id, team_id, as_of_date, n_games)
+        )
 
         if not games or len(games) == 0:
             # No recent games - return default stats
@@ -440,8 +450,6 @@ class FeatureExtractor:
         Returns:
             Dictionary of head-to-head stats
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         # Get recent matchups
         cutoff_date = (
             datetime.strptime(as_of_date, "%Y-%m-%d")
@@ -464,7 +472,7 @@ class FeatureExtractor:
             LIMIT 10
         """
 
-        cursor.execute(
+        games = self.queries.fetch(
             query,
             (
                 home_team_id,
@@ -476,8 +484,6 @@ class FeatureExtractor:
             ),
         )
 
-        games = cursor.fetchall()
-
         if not games or len(games) == 0:
             # No H2H history - return neutral stats
             return {
@@ -526,8 +532,6 @@ class FeatureExtractor:
         Returns:
             Number of days of rest
         """
-        cursor = self.db_conn.cursor()
-
         query = """
             SELECT MAX(game_date) as last_game
             FROM games
@@ -536,11 +540,10 @@ class FeatureExtractor:
             AND home_score IS NOT NULL
         """
 
-        cursor.execute(query, (int(team_id), int(team_id), game_date))
-        result = cursor.fetchone()
+        rows = self.queries.fetch(query, (int(team_id), int(team_id), game_date))
 
-        if result and result[0]:
-            last_game_date = result[0]
+        if rows and rows[0]["last_game"]:
+            last_game_date = rows[0]["last_game"]
             current_date = datetime.strptime(game_date, "%Y-%m-%d").date()
             if isinstance(last_game_date, str):
                 last_game_date = datetime.strptime(last_game_date, "%Y-%m-%d").date()
@@ -588,8 +591,6 @@ class FeatureExtractor:
         Returns:
             Dictionary with ppg_{location}_l{window} and {location}_games
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         # Query for location-specific games using hoopr_team_box
         query = """
             SELECT
@@ -604,8 +605,7 @@ class FeatureExtractor:
             LIMIT %s
         """
 
-        cursor.execute(query, (team_id, location, as_of_date, window))
-        games = cursor.fetchall()
+        games = self.queries.fetch(query, (team_id, location, as_of_date, window))
 
         if not games or len(games) == 0:
             return {
@@ -633,8 +633,6 @@ class FeatureExtractor:
         Returns:
             Win percentage in last {window} games
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         query = """
             SELECT
                 home_team_id,
@@ -649,8 +647,7 @@ class FeatureExtractor:
             LIMIT %s
         """
 
-        cursor.execute(query, (team_id, team_id, as_of_date, window))
-        games = cursor.fetchall()
+        games = self.queries.fetch(query, (team_id, team_id, as_of_date, window))
 
         if not games or len(games) == 0:
             return 0.5  # Default 50%
@@ -680,8 +677,6 @@ class FeatureExtractor:
         Returns:
             Percentage of season completed (games_played / 82)
         """
-        cursor = self.db_conn.cursor()
-
         # Get season from as_of_date
         # NBA season: Oct-Apr (crosses calendar year)
         # If month >= 10, season is current_year to next_year
@@ -704,10 +699,11 @@ class FeatureExtractor:
             AND home_score IS NOT NULL
         """
 
-        cursor.execute(query, (team_id, team_id, season, as_of_date.date()))
-        result = cursor.fetchone()
+        rows = self.queries.fetch(query, (team_id, team_id, season, as_of_date.date()))
 
-        games_played = result[0] if result and result[0] else 0
+        games_played = (
+            rows[0]["games_played"] if rows and rows[0]["games_played"] else 0
+        )
 
         # NBA regular season is 82 games
         return min(games_played / 82.0, 1.0)
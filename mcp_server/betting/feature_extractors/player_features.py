@@ -35,7 +35,8 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import psycopg2
-from psycopg2.extras import RealDictCursor
+
+from mcp_server.aggregate_query_service import AggregateQueryService
 
 
 class PlayerFeatureExtractor:
@@ -43,14 +44,20 @@ class PlayerFeatureExtractor:
     Extract player-level features from hoopr_player_box for betting predictions
     """
 
-    def __init__(self, db_conn: psycopg2.extensions.connection):
+    def __init__(
+        self,
+        db_conn: psycopg2.extensions.connection,
+        query_service: Optional[AggregateQueryService] = None,
+    ):
         """
         Initialize player feature extractor
 
         Args:
             db_conn: PostgreSQL database connection
+            query_service: Shared aggregate query cache (default: one over db_conn)
         """
         self.db_conn = db_conn
+        self.queries = query_service or AggregateQueryService(db_conn)
 
         # Position mappings (for matchup analysis)
         self.positions = ["PG", "SG", "SF", "PF", "C"]
@@ -151,8 +158,6 @@ class PlayerFeatureExtractor:
         Returns:
             List of dicts with player stats (ppg, minutes, usage_pct)
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         # Query to get player stats for recent games
         query = """
         WITH player_games AS (
@@ -203,8 +208,7 @@ class PlayerFeatureExtractor:
         LIMIT %s
         """
 
-        cursor.execute(query, (team_id, as_of_date.date(), lookback, n))
-        results = cursor.fetchall()
+        results = self.queries.fetch(query, (team_id, as_of_date.date(), lookback, n))
 
         # Convert to list of dicts
         top_scorers = []
@@ -251,8 +255,6 @@ class PlayerFeatureExtractor:
         Returns:
             Sum of PER for top N players
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         query = """
         WITH player_games AS (
             SELECT
@@ -298,8 +300,7 @@ class PlayerFeatureExtractor:
         LIMIT %s
         """
 
-        cursor.execute(query, (team_id, as_of_date.date(), n))
-        results = cursor.fetchall()
+        results = self.queries.fetch(query, (team_id, as_of_date.date(), n))
 
         # Sum PER for top N players
         total_per = sum(row["per"] for row in results if row["per"])
@@ -392,8 +393,6 @@ class PlayerFeatureExtractor:
         Returns:
             Average PPG from bench players (6th-10th best scorers)
         """
-        cursor = self.db_conn.cursor(cursor_factory=RealDictCursor)
-
         query = """
         WITH player_games AS (
             SELECT
@@ -432,8 +431,8 @@ class PlayerFeatureExtractor:
         WHERE rank BETWEEN 6 AND 10  -- 6th to 10th best scorers
         """
 
-        cursor.execute(query, (team_id, as_of_date.date()))
-        result = cursor.fetchone()
+        rows = self.queries.fetch(query, (team_id, as_of_date.date()))
+        result = rows[0] if rows else None
 
         bench_ppg = result["bench_ppg"] if result and result["bench_ppg"] else 0.0
 
@@ -30,7 +30,10 @@ Date: October 2025
 """
 
 import logging
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple, Union, Literal
 from enum import Enum
@@ -43,6 +46,8 @@ from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.neighbors import NearestNeighbors
 from sklearn.preprocessing import StandardScaler
 
+from mcp_server.econometric_completion.matching import NeighborIndex
+
 # Custom exceptions
 from mcp_server.exceptions import (
     InvalidDataError,
@@ -211,6 +216,157 @@ class SensitivityResult:
         return f"SensitivityResult(method={self.method}, effect={self.original_effect:.4f})"
 
 
+# ==============================================================================
+# Synthetic Control Solver
+# ==============================================================================
+
+# Below this many placebo fits the process pool costs more than it saves
+_PARALLEL_PLACEBO_THRESHOLD = 8
+
+
+def _simplex_qp(
+    gram: np.ndarray,
+    linear: np.ndarray,
+    tol: float = 1e-10,
+    max_iter: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Minimize ``w'Gw - 2c'w`` subject to ``w >= 0`` and ``sum(w) == 1``.
+
+    This is the synthetic control weight problem ``||x1 - X0 w||^2`` written
+    in terms of the Gram matrix ``G = X0'X0`` and ``c = X0'x1``, so a solve
+    never touches the raw period-by-donor matrix. Uses a Lawson-Hanson style
+    active-set method: donors enter the support while they would lower the
+    objective, and each support is solved exactly via its KKT system.
+
+    Parameters
+    ----------
+    gram : np.ndarray
+        Donor Gram matrix (n_donors x n_donors)
+    linear : np.ndarray
+        Cross-product of donors with the treated series (n_donors,)
+    tol : float, default=1e-10
+        Optimality tolerance, relative to the scale of ``gram``
+    max_iter : int, optional
+        Cap on support changes (default ``3 * n_donors + 10``)
+
+    Returns
+    -------
+    np.ndarray
+        Optimal simplex weights
+    """
+    n = len(linear)
+    if n == 1:
+        return np.ones(1)
+
+    scale = max(float(np.abs(np.diag(gram)).max()), 1.0)
+    max_iter = max_iter or 3 * n + 10
+
+    # Start from the best single donor (simplex vertex)
+    k = int(np.argmin(np.diag(gram) - 2.0 * linear))
+    support = np.zeros(n, dtype=bool)
+    support[k] = True
+    w = np.zeros(n)
+    w[k] = 1.0
+
+    for _ in range(max_iter):
+        grad = gram @ w - linear
+        # Reduced costs of off-support donors relative to the support
+        reduced = grad - grad[support].mean()
+        reduced[support] = np.inf
+        j = int(np.argmin(reduced))
+        if reduced[j] >= -tol * scale:
+            break
+        support[j] = True
+
+        for _ in range(max_iter):
+            idx = np.flatnonzero(support)
+            m = len(idx)
+            kkt = np.zeros((m + 1, m + 1))
+            kkt[:m, :m] = gram[np.ix_(idx, idx)]
+            kkt[:m, m] = 1.0
+            kkt[m, :m] = 1.0
+            rhs = np.append(linear[idx], 1.0)
+            z = np.linalg.lstsq(kkt, rhs, rcond=None)[0][:m]
+            if np.all(z > 0):
+                w = np.zeros(n)
+                w[idx] = z
+                break
+
+            # Move toward z until the first weight hits zero, then drop it
+            current = w[idx]
+            blocked = z <= 0
+            alpha = np.min(current[blocked] / (current[blocked] - z[blocked]))
+            current = current + alpha * (z - current)
+            dropped = current <= tol
+            w = np.zeros(n)
+            w[idx] = np.where(dropped, 0.0, current)
+            support[idx[dropped]] = False
+            if not support.any():
+                support[k] = True
+                w[k] = 1.0
+                break
+
+    return w / w.sum()
+
+
+def _placebo_effects(
+    gram: np.ndarray,
+    donors_full: np.ndarray,
+    n_pre: int,
+    placebo_indices: List[int],
+) -> List[float]:
+    """
+    Average post-treatment gaps for placebo units drawn from the donor pool.
+
+    Each placebo treats donor ``j`` as the treated unit and the remaining
+    donors as its pool; its QP is a sub-block of the shared donor Gram
+    matrix. Module-level so it can run in a worker process.
+    """
+    effects = []
+    all_idx = np.arange(gram.shape[0])
+    for j in placebo_indices:
+        others = all_idx[all_idx != j]
+        weights = _simplex_qp(gram[np.ix_(others, others)], gram[others, j])
+        gap = donors_full[:, j] - donors_full[:, others] @ weights
+        effects.append(float(gap[n_pre:].mean()))
+    return effects
+
+
+def _run_placebos(
+    gram: np.ndarray,
+    donors_full: np.ndarray,
+    n_pre: int,
+    placebo_indices: List[int],
+    n_jobs: Optional[int],
+) -> np.ndarray:
+    """Fit placebo units, spreading them across processes when worthwhile."""
+    if n_jobs is None:
+        n_jobs = (
+            os.cpu_count() or 1
+            if len(placebo_indices) >= _PARALLEL_PLACEBO_THRESHOLD
+            else 1
+        )
+    n_jobs = max(1, min(n_jobs, len(placebo_indices)))
+
+    if n_jobs == 1:
+        return np.array(_placebo_effects(gram, donors_full, n_pre, placebo_indices))
+
+    chunks = [list(c) for c in np.array_split(placebo_indices, n_jobs) if len(c)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(_placebo_effects, gram, donors_full, n_pre, chunk)
+                for chunk in chunks
+            ]
+            results = [f.result() for f in futures]
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"Parallel placebo fits failed ({e}); running serially")
+        return np.array(_placebo_effects(gram, donors_full, n_pre, placebo_indices))
+
+    return np.array([effect for chunk in results for effect in chunk])
+
+
 class CausalInferenceAnalyzer:
     """
     Comprehensive causal inference toolkit for NBA analytics.
@@ -256,6 +412,9 @@ class CausalInferenceAnalyzer:
         self.entity_col = entity_col
         self.time_col = time_col
 
+        # Synthetic control results keyed by panel fingerprint and design
+        self._sc_cache: Dict[Tuple, SyntheticControlResult] = {}
+
         # MLflow tracking
         self.mlflow_experiment = mlflow_experiment
         self.tracker = None
@@ -834,6 +993,8 @@ class CausalInferenceAnalyzer:
         donor_pool: Optional[List[Any]] = None,
         covariates_for_matching: Optional[List[str]] = None,
         n_placebo: int = 0,
+        n_jobs: Optional[int] = None,
+        use_cache: bool = True,
     ) -> SyntheticControlResult:
         """
         Estimate treatment effect using Synthetic Control Method.
@@ -854,7 +1015,12 @@ class CausalInferenceAnalyzer:
         covariates_for_matching : List[str], optional
             Additional covariates to match on
         n_placebo : int, default=0
-            Number of placebo tests to run
+            Number of placebo tests to run (capped at the donor pool size)
+        n_jobs : int, optional
+            Worker processes for placebo fits. If None, uses all cores once
+            there are enough placebos to pay for the pool; 1 runs serially.
+        use_cache : bool, default=True
+            Reuse the result of an identical earlier call on the same panel
 
         Returns
         -------
@@ -891,46 +1057,44 @@ class CausalInferenceAnalyzer:
         if donor_pool is None:
             donor_pool = [u for u in panel.columns if u != treated_unit]
 
+        cache_key = None
+        if use_cache:
+            cache_key = (
+                self._panel_fingerprint(),
+                treated_unit,
+                tuple(outcome_periods),
+                treatment_period,
+                tuple(donor_pool),
+                n_placebo,
+            )
+            cached = self._sc_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Synthetic control cache hit: {cached}")
+                return cached
+
         # Pre and post periods
         pre_periods = [p for p in outcome_periods if p < treatment_period]
-        post_periods = [p for p in outcome_periods if p >= treatment_period]
+        n_pre = len(pre_periods)
 
         # Actual treated trajectory
         actual_trajectory = panel.loc[outcome_periods, treated_unit].values
 
-        # Donor matrix (pre-treatment)
-        donor_matrix = panel.loc[pre_periods, donor_pool].values
-        treated_pre = panel.loc[pre_periods, treated_unit].values
-
-        # Optimize weights to match pre-treatment trajectory
-        def objective(w):
-            synthetic = donor_matrix @ w
-            return np.sum((treated_pre - synthetic) ** 2)
-
-        # Constraints: weights sum to 1, non-negative
-        from scipy.optimize import minimize
-
-        n_donors = len(donor_pool)
-        constraints = {"type": "eq", "fun": lambda w: np.sum(w) - 1}
-        bounds = [(0, 1) for _ in range(n_donors)]
-
-        result_opt = minimize(
-            objective,
-            x0=np.ones(n_donors) / n_donors,
-            method="SLSQP",
-            bounds=bounds,
-            constraints=constraints,
-        )
+        # Donor matrix (full window; pre-treatment rows come first)
+        donor_matrix_full = panel.loc[outcome_periods, donor_pool].values
+        pre_mask = np.asarray(outcome_periods) < treatment_period
+        donor_matrix = donor_matrix_full[pre_mask]
+        treated_pre = actual_trajectory[pre_mask]
 
-        weights = result_opt.x
+        # Gram matrix shared by the main fit and every placebo
+        gram = donor_matrix.T @ donor_matrix
+        weights = _simplex_qp(gram, donor_matrix.T @ treated_pre)
 
         # Synthetic trajectory (full period)
-        donor_matrix_full = panel.loc[outcome_periods, donor_pool].values
         synthetic_trajectory = donor_matrix_full @ weights
 
         # Treatment effects
         treatment_effect = actual_trajectory - synthetic_trajectory
-        average_effect = treatment_effect[len(pre_periods) :].mean()
+        average_effect = treatment_effect[~pre_mask].mean()
 
         # Pre-treatment fit
         pre_treatment_fit = np.sqrt(
@@ -940,36 +1104,14 @@ class CausalInferenceAnalyzer:
         # Placebo tests for inference
         placebo_distribution = None
         if n_placebo > 0:
-            placebo_effects = []
-            for placebo_unit in np.random.choice(
-                donor_pool, size=min(n_placebo, len(donor_pool)), replace=False
-            ):
-                placebo_treated = panel.loc[pre_periods, placebo_unit].values
-                placebo_donors = [u for u in donor_pool if u != placebo_unit]
-                placebo_donor_matrix = panel.loc[pre_periods, placebo_donors].values
-
-                # Optimize placebo weights
-                def placebo_obj(w):
-                    return np.sum((placebo_treated - placebo_donor_matrix @ w) ** 2)
-
-                placebo_result = minimize(
-                    placebo_obj,
-                    x0=np.ones(len(placebo_donors)) / len(placebo_donors),
-                    method="SLSQP",
-                    bounds=[(0, 1) for _ in range(len(placebo_donors))],
-                    constraints={"type": "eq", "fun": lambda w: np.sum(w) - 1},
-                )
-
-                placebo_weights = placebo_result.x
-                placebo_donor_full = panel.loc[outcome_periods, placebo_donors].values
-                placebo_synthetic = placebo_donor_full @ placebo_weights
-                placebo_actual = panel.loc[outcome_periods, placebo_unit].values
-                placebo_effect = (placebo_actual - placebo_synthetic)[
-                    len(pre_periods) :
-                ].mean()
-                placebo_effects.append(placebo_effect)
-
-            placebo_distribution = np.array(placebo_effects)
+            placebo_indices = np.random.choice(
+                len(donor_pool), size=min(n_placebo, len(donor_pool)), replace=False
+            ).tolist()
+            # Placebo gaps are averaged over rows after the pre-period block
+            ordered = np.concatenate([donor_matrix, donor_matrix_full[~pre_mask]])
+            placebo_distribution = _run_placebos(
+                gram, ordered, n_pre, placebo_indices, n_jobs
+            )
             # P-value: proportion of placebo effects >= observed effect
             p_value = np.mean(np.abs(placebo_distribution) >= np.abs(average_effect))
         else:
@@ -1002,9 +1144,17 @@ class CausalInferenceAnalyzer:
                 }
             )
 
+        if cache_key is not None:
+            self._sc_cache[cache_key] = result_sc
+
         logger.info(f"Synthetic control complete: {result_sc}")
         return result_sc
 
+    def _panel_fingerprint(self) -> int:
+        """Hash of the entity/time/outcome columns used to key cached results."""
+        cols = [self.entity_col, self.time_col, self.outcome_col]
+        return int(pd.util.hash_pandas_object(self.data[cols], index=False).sum())
+
     def sensitivity_analysis(
         self,
         method: str,
@@ -1261,38 +1411,31 @@ class CausalInferenceAnalyzer:
         matched_control_idx: np.ndarray,
     ) -> pd.DataFrame:
         """Compute covariate balance statistics before/after matching."""
-        balance = []
-
-        for j, cov_name in enumerate(self.covariates):
-            # Before matching
-            mean_treated = X[treatment == 1, j].mean()
-            mean_control = X[treatment == 0, j].mean()
-            std_pooled = np.sqrt(
-                (X[treatment == 1, j].var() + X[treatment == 0, j].var()) / 2
-            )
-            smd_before = (
-                (mean_treated - mean_control) / std_pooled if std_pooled > 0 else 0
-            )
-
-            # After matching
-            mean_treated_matched = X[treated_idx, j].mean()
-            mean_control_matched = X[matched_control_idx, j].mean()
-            smd_after = (
-                (mean_treated_matched - mean_control_matched) / std_pooled
-                if std_pooled > 0
-                else 0
-            )
+        X_treated = X[treatment == 1]
+        X_control = X[treatment == 0]
+        std_pooled = np.sqrt((X_treated.var(axis=0) + X_control.var(axis=0)) / 2)
+        has_spread = std_pooled > 0
+
+        # Before matching
+        diff_before = X_treated.mean(axis=0) - X_control.mean(axis=0)
+        smd_before = np.divide(
+            diff_before, std_pooled, out=np.zeros_like(diff_before), where=has_spread
+        )
 
-            balance.append(
-                {
-                    "covariate": cov_name,
-                    "smd_before": smd_before,
-                    "smd_after": smd_after,
-                    "improvement": smd_before - smd_after,
-                }
-            )
+        # After matching
+        diff_after = X[treated_idx].mean(axis=0) - X[matched_control_idx].mean(axis=0)
+        smd_after = np.divide(
+            diff_after, std_pooled, out=np.zeros_like(diff_after), where=has_spread
+        )
 
-        return pd.DataFrame(balance)
+        return pd.DataFrame(
+            {
+                "covariate": list(self.covariates),
+                "smd_before": smd_before,
+                "smd_after": smd_after,
+                "improvement": smd_before - smd_after,
+            }
+        )
 
     def kernel_matching(
         self,
@@ -1484,20 +1627,13 @@ class CausalInferenceAnalyzer:
         outcome_control = outcome[control_idx]
         outcome_treated = outcome[treated_idx]
 
-        matched_effects = []
-        n_matched_total = 0
-
-        for i, ps_t in enumerate(ps_treated):
-            # Find controls within radius
-            distances = np.abs(ps_control - ps_t)
-            within_radius = distances <= radius
-
-            if np.any(within_radius):
-                # Average outcome of matched controls
-                matched_outcome = outcome_control[within_radius].mean()
-                effect = outcome_treated[i] - matched_outcome
-                matched_effects.append(effect)
-                n_matched_total += np.sum(within_radius)
+        # Batched radius query over a KD-tree of control propensity scores
+        matched_outcome, n_within = NeighborIndex(ps_control).radius_means(
+            ps_treated, radius, outcome_control
+        )
+        has_match = n_within > 0
+        matched_effects = outcome_treated[has_match] - matched_outcome[has_match]
+        n_matched_total = int(n_within.sum())
 
         if len(matched_effects) == 0:
             raise InsufficientDataError(
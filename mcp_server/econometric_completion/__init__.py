@@ -39,6 +39,7 @@ from mcp_server.econometric_completion.matching import (
     KernelType,
     MatchingConfig,
     MatchingResult,
+    NeighborIndex,
     PropensityScoreMatcher,
     MahalanobisDistanceMatcher,
     estimate_treatment_effect,
@@ -80,6 +81,7 @@ __all__ = [
     "KernelType",
     "MatchingConfig",
     "MatchingResult",
+    "NeighborIndex",
     "PropensityScoreMatcher",
     "MahalanobisDistanceMatcher",
     "estimate_treatment_effect",
@@ -29,7 +29,8 @@ from enum import Enum
 
 import numpy as np
 from scipy import stats
-from scipy.spatial.distance import cdist, mahalanobis
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +135,243 @@ class MatchingResult:
         }
 
 
+def _standardized_mean_differences(
+    X_treated: np.ndarray,
+    X_control: np.ndarray,
+    w_treated: Optional[np.ndarray] = None,
+    w_control: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Absolute standardized mean differences for all features at once."""
+    mean_treated = np.average(X_treated, axis=0, weights=w_treated)
+    mean_control = np.average(X_control, axis=0, weights=w_control)
+    var_treated = np.average((X_treated - mean_treated) ** 2, axis=0, weights=w_treated)
+    var_control = np.average((X_control - mean_control) ** 2, axis=0, weights=w_control)
+
+    pooled_std = np.sqrt((var_treated + var_control) / 2)
+    diff = mean_treated - mean_control
+    smd = np.divide(diff, pooled_std, out=np.zeros_like(diff), where=pooled_std > 0)
+    return np.abs(smd)
+
+
+class NeighborIndex:
+    """
+    KD-tree index over control units for batched matching queries.
+
+    Built once per matching call over propensity scores (1-D) or whitened
+    covariates, so each treated unit costs a tree lookup instead of a full
+    scan of the control pool. Distances are Euclidean; in 1-D they are the
+    absolute score difference used by the loop-based matchers.
+
+    Calipers and radii are inclusive (``distance <= bound``), matching the
+    original implementations.
+    """
+
+    def __init__(self, points: np.ndarray, leafsize: int = 32):
+        """
+        Build index.
+
+        Args:
+            points: Control coordinates, (n_controls,) or (n_controls, n_dims)
+            leafsize: KD-tree leaf size
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim == 1:
+            points = points.reshape(-1, 1)
+        self.points = points
+        self.n_points = len(points)
+        # p=1 keeps 1-D distances exactly |a - b|
+        self._p = 1 if points.shape[1] == 1 else 2
+        self._tree = cKDTree(points, leafsize=leafsize)
+
+    @staticmethod
+    def whiten(X: np.ndarray, cov_inv: np.ndarray) -> np.ndarray:
+        """
+        Map covariates so Euclidean distance equals Mahalanobis distance.
+
+        Args:
+            X: Covariates (n_samples, n_features)
+            cov_inv: Inverse (or pseudo-inverse) covariance matrix
+
+        Returns:
+            Whitened covariates
+        """
+        eigvals, eigvecs = np.linalg.eigh(cov_inv)
+        return X @ (eigvecs * np.sqrt(np.clip(eigvals, 0.0, None)))
+
+    def _as_queries(self, queries: np.ndarray) -> np.ndarray:
+        queries = np.asarray(queries, dtype=float)
+        if queries.ndim == 1:
+            queries = queries.reshape(-1, self.points.shape[1])
+        return queries
+
+    def knn(
+        self,
+        queries: np.ndarray,
+        k: int = 1,
+        max_distance: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest controls for every query, optionally within a caliper.
+
+        Args:
+            queries: Query coordinates
+            k: Number of neighbors
+            max_distance: Inclusive caliper
+
+        Returns:
+            (distances, indices), each (n_queries, k). Missing neighbors have
+            distance inf and index -1.
+        """
+        queries = self._as_queries(queries)
+        if len(queries) == 0 or self.n_points == 0:
+            shape = (len(queries), k)
+            return np.full(shape, np.inf), np.full(shape, -1, dtype=int)
+
+        bound = np.inf if max_distance is None else np.nextafter(max_distance, np.inf)
+        distances, indices = self._tree.query(
+            queries, k=k, p=self._p, distance_upper_bound=bound, workers=-1
+        )
+        distances = np.asarray(distances, dtype=float).reshape(len(queries), k)
+        indices = np.asarray(indices).reshape(len(queries), k)
+        indices = np.where(indices >= self.n_points, -1, indices)
+        return distances, indices
+
+    def radius(self, queries: np.ndarray, r: float) -> List[np.ndarray]:
+        """
+        All controls within an inclusive radius of each query.
+
+        Args:
+            queries: Query coordinates
+            r: Radius
+
+        Returns:
+            List of sorted control index arrays, one per query
+        """
+        queries = self._as_queries(queries)
+        if len(queries) == 0 or self.n_points == 0:
+            return [np.array([], dtype=int) for _ in range(len(queries))]
+        hits = self._tree.query_ball_point(
+            queries, r=r, p=self._p, workers=-1, return_sorted=True
+        )
+        return [np.asarray(h, dtype=int) for h in hits]
+
+    def radius_means(
+        self,
+        queries: np.ndarray,
+        r: float,
+        values: np.ndarray,
+        chunk_size: int = 1024,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean of ``values`` over controls within radius of each query.
+
+        In 1-D this uses sorted prefix sums, so memory stays linear even
+        when the radius covers most of the pool; otherwise ball queries run
+        in chunks of ``chunk_size`` queries.
+
+        Args:
+            queries: Query coordinates
+            r: Radius
+            values: Per-control values (n_controls,)
+            chunk_size: Queries per ball-query batch (multi-dimensional only)
+
+        Returns:
+            (means, counts); means are NaN where no control is in range
+        """
+        queries = self._as_queries(queries)
+        values = np.asarray(values, dtype=float)
+        if self.points.shape[1] == 1:
+            sums, counts = self._interval_sums(queries[:, 0], r, values)
+        else:
+            sums = np.zeros(len(queries))
+            counts = np.zeros(len(queries), dtype=int)
+            for start in range(0, len(queries), chunk_size):
+                hits = self.radius(queries[start : start + chunk_size], r)
+                for offset, h in enumerate(hits):
+                    counts[start + offset] = len(h)
+                    sums[start + offset] = values[h].sum()
+
+        means = np.full(len(queries), np.nan)
+        has_match = counts > 0
+        means[has_match] = sums[has_match] / counts[has_match]
+        return means, counts
+
+    def _interval_sums(
+        self, queries: np.ndarray, r: float, values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sums and counts of values with ``|point - q| <= r`` (1-D only)."""
+        order = np.argsort(self.points[:, 0], kind="stable")
+        sorted_points = self.points[order, 0]
+        prefix = np.concatenate([[0.0], np.cumsum(values[order])])
+        n = len(sorted_points)
+
+        lo = np.searchsorted(sorted_points, queries - r, side="left")
+        hi = np.searchsorted(sorted_points, queries + r, side="right")
+
+        # q - r and q + r round; settle the edges on |point - q| <= r exactly
+        def within(pos):
+            inside = (pos >= 0) & (pos < n)
+            point = sorted_points[np.clip(pos, 0, n - 1)]
+            return inside & (np.abs(point - queries) <= r)
+
+        while True:
+            grow_lo = within(lo - 1)
+            grow_hi = within(hi)
+            shrink_lo = (lo < hi) & ~within(lo)
+            shrink_hi = (lo < hi) & ~within(hi - 1)
+            if not (grow_lo | grow_hi | shrink_lo | shrink_hi).any():
+                break
+            lo = lo - grow_lo + shrink_lo
+            hi = hi + grow_hi - shrink_hi
+
+        counts = np.maximum(hi - lo, 0)
+        return prefix[lo + counts] - prefix[lo], counts
+
+    def greedy_match(
+        self,
+        queries: np.ndarray,
+        k: int = 1,
+        max_distance: Optional[float] = None,
+    ) -> List[np.ndarray]:
+        """
+        Greedy k-NN matching without replacement, in query order.
+
+        Each query takes its k closest still-unused controls within the
+        caliper, as the sequential loop did. Candidates come from one
+        batched query; a unit re-queries with a wider k only when its
+        candidates were all taken.
+
+        Args:
+            queries: Query coordinates, in matching order
+            k: Controls per query
+            max_distance: Inclusive caliper
+
+        Returns:
+            List of matched control index arrays (possibly empty), per query
+        """
+        queries = self._as_queries(queries)
+        used = np.zeros(self.n_points, dtype=bool)
+        batch_k = min(self.n_points, 2 * k)
+        if batch_k == 0:
+            return [np.array([], dtype=int) for _ in range(len(queries))]
+        _, candidates = self.knn(queries, batch_k, max_distance)
+
+        matches = []
+        for i in range(len(queries)):
+            row, width = candidates[i], batch_k
+            while True:
+                valid = row[row >= 0]
+                free = valid[~used[valid]][:k]
+                exhausted = len(valid) < width or width == self.n_points
+                if len(free) == k or exhausted:
+                    break
+                width = min(self.n_points, 2 * width)
+                row = self.knn(queries[i : i + 1], width, max_distance)[1][0]
+            used[free] = True
+            matches.append(free)
+        return matches
+
+
 class PropensityScoreMatcher:
     """
     Propensity Score Matching (PSM).
@@ -245,41 +483,19 @@ class PropensityScoreMatcher:
         ps_control = ps[control_idx]
 
         # Find matches
-        matched_indices = {}
-        used_controls = set()
-
-        for i, t_idx in enumerate(treated_idx):
-            # Calculate distances
-            distances = np.abs(ps_control - ps_treated[i])
-
-            # Apply caliper if specified
-            if self.config.ps_caliper is not None:
-                valid = distances <= self.config.ps_caliper
-                if not np.any(valid):
-                    continue  # No valid matches within caliper
-                distances = np.where(valid, distances, np.inf)
-
-            # Find k nearest neighbors
-            k = self.config.n_neighbors
-            sorted_idx = np.argsort(distances)
-
-            matches = []
-            for idx in sorted_idx:
-                if len(matches) >= k:
-                    break
-
-                c_idx = control_idx[idx]
-
-                # Check if already used (if without replacement)
-                if not self.config.replace and c_idx in used_controls:
-                    continue
-
-                if distances[idx] < np.inf:
-                    matches.append(c_idx)
-                    used_controls.add(c_idx)
+        index = NeighborIndex(ps_control)
+        k = self.config.n_neighbors
+        if self.config.replace:
+            _, neighbors = index.knn(ps_treated, k, self.config.ps_caliper)
+            per_treated = [row[row >= 0] for row in neighbors]
+        else:
+            per_treated = index.greedy_match(ps_treated, k, self.config.ps_caliper)
 
-            if matches:
-                matched_indices[t_idx] = matches
+        matched_indices = {
+            t_idx: control_idx[matches].tolist()
+            for t_idx, matches in zip(treated_idx, per_treated)
+            if len(matches)
+        }
 
         # Calculate ATT
         att_values = []
@@ -305,7 +521,7 @@ class PropensityScoreMatcher:
             propensity_scores=ps,
         )
 
-        logger.info(f"NN Matching: ATT={att:.4f}, SE={se_att:.4f if se_att else 0:.4f}")
+        logger.info(f"NN Matching: ATT={att:.4f}, SE={se_att or 0:.4f}")
         logger.info(f"Matched {len(matched_indices)}/{len(treated_idx)} treated units")
 
         return result
@@ -365,9 +581,7 @@ class PropensityScoreMatcher:
             propensity_scores=ps,
         )
 
-        logger.info(
-            f"Kernel Matching: ATT={att:.4f}, SE={se_att:.4f if se_att else 0:.4f}"
-        )
+        logger.info(f"Kernel Matching: ATT={att:.4f}, SE={se_att or 0:.4f}")
 
         return result
 
@@ -448,36 +662,13 @@ class PropensityScoreMatcher:
         treated_mask = treatment == 1
         control_mask = treatment == 0
 
-        balance = {}
-
-        for j in range(X.shape[1]):
-            if weights is not None:
-                mean_treated = np.average(
-                    X[treated_mask, j], weights=weights[treated_mask]
-                )
-                mean_control = np.average(
-                    X[control_mask, j], weights=weights[control_mask]
-                )
-                var_treated = np.average(
-                    (X[treated_mask, j] - mean_treated) ** 2,
-                    weights=weights[treated_mask],
-                )
-                var_control = np.average(
-                    (X[control_mask, j] - mean_control) ** 2,
-                    weights=weights[control_mask],
-                )
-            else:
-                mean_treated = np.mean(X[treated_mask, j])
-                mean_control = np.mean(X[control_mask, j])
-                var_treated = np.var(X[treated_mask, j])
-                var_control = np.var(X[control_mask, j])
-
-            pooled_std = np.sqrt((var_treated + var_control) / 2)
-            smd = (mean_treated - mean_control) / pooled_std if pooled_std > 0 else 0.0
-
-            balance[f"feature_{j}"] = abs(smd)
-
-        return balance
+        w_treated = None if weights is None else weights[treated_mask]
+        w_control = None if weights is None else weights[control_mask]
+        smd = _standardized_mean_differences(
+            X[treated_mask], X[control_mask], w_treated, w_control
+        )
+
+        return {f"feature_{j}": float(v) for j, v in enumerate(smd)}
 
     def calculate_balance_after_matching(
         self,
@@ -490,23 +681,9 @@ class PropensityScoreMatcher:
         treated_idx = list(matched_indices.keys())
         control_idx = [idx for indices in matched_indices.values() for idx in indices]
 
-        X_matched_treated = X[treated_idx]
-        X_matched_control = X[control_idx]
-
-        balance = {}
+        smd = _standardized_mean_differences(X[treated_idx], X[control_idx])
 
-        for j in range(X.shape[1]):
-            mean_treated = np.mean(X_matched_treated[:, j])
-            mean_control = np.mean(X_matched_control[:, j])
-            var_treated = np.var(X_matched_treated[:, j])
-            var_control = np.var(X_matched_control[:, j])
-
-            pooled_std = np.sqrt((var_treated + var_control) / 2)
-            smd = (mean_treated - mean_control) / pooled_std if pooled_std > 0 else 0.0
-
-            balance[f"feature_{j}"] = abs(smd)
-
-        return balance
+        return {f"feature_{j}": float(v) for j, v in enumerate(smd)}
 
 
 class MahalanobisDistanceMatcher:
@@ -543,42 +720,23 @@ class MahalanobisDistanceMatcher:
         control_idx = np.where(treatment == 0)[0]
 
         # Compute covariance matrix
-        cov = np.cov(X.T)
+        cov = np.atleast_2d(np.cov(X.T))
         try:
             self.cov_inv_ = np.linalg.inv(cov)
         except np.linalg.LinAlgError:
             # Singular matrix, use pseudo-inverse
             self.cov_inv_ = np.linalg.pinv(cov)
 
-        # Find matches
-        matched_indices = {}
-
-        for t_idx in treated_idx:
-            # Calculate Mahalanobis distances to all controls
-            distances = np.array(
-                [
-                    mahalanobis(X[t_idx], X[c_idx], self.cov_inv_)
-                    for c_idx in control_idx
-                ]
-            )
-
-            # Apply caliper if specified
-            if self.caliper is not None:
-                valid = distances <= self.caliper
-                if not np.any(valid):
-                    continue
-                distances = np.where(valid, distances, np.inf)
-
-            # Find nearest neighbors
-            sorted_idx = np.argsort(distances)
-            matches = [
-                control_idx[idx]
-                for idx in sorted_idx[: self.n_neighbors]
-                if distances[idx] < np.inf
-            ]
+        # Find matches in whitened space, where Euclidean == Mahalanobis
+        X_white = NeighborIndex.whiten(X, self.cov_inv_)
+        index = NeighborIndex(X_white[control_idx])
+        _, neighbors = index.knn(X_white[treated_idx], self.n_neighbors, self.caliper)
 
-            if matches:
-                matched_indices[t_idx] = matches
+        matched_indices = {
+            t_idx: control_idx[row[row >= 0]].tolist()
+            for t_idx, row in zip(treated_idx, neighbors)
+            if np.any(row >= 0)
+        }
 
         # Calculate ATT
         att_values = []
@@ -603,9 +761,7 @@ class MahalanobisDistanceMatcher:
             matched_indices=matched_indices,
         )
 
-        logger.info(
-            f"Mahalanobis Matching: ATT={att:.4f}, SE={se_att:.4f if se_att else 0:.4f}"
-        )
+        logger.info(f"Mahalanobis Matching: ATT={att:.4f}, SE={se_att or 0:.4f}")
         logger.info(f"Matched {len(matched_indices)}/{len(treated_idx)} treated units")
 
         return result
@@ -659,6 +815,7 @@ __all__ = [
     "KernelType",
     "MatchingConfig",
     "MatchingResult",
+    "NeighborIndex",
     "PropensityScoreMatcher",
     "MahalanobisDistanceMatcher",
     "estimate_treatment_effect",
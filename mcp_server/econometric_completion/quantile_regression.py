@@ -22,12 +22,14 @@ Integrates with:
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 
 import numpy as np
 from scipy import stats
-from scipy.optimize import minimize
 
 logger = logging.getLogger(__name__)
 
@@ -161,6 +163,324 @@ class QuantileProcessResult:
         }
 
 
+# ==============================================================================
+# Interior-Point Solver
+# ==============================================================================
+
+
+def _step_length(v: np.ndarray, dv: np.ndarray, scale: float) -> float:
+    """Largest step in [0, 1] keeping ``v + step * dv`` positive, damped."""
+    decreasing = dv < 0
+    if not np.any(decreasing):
+        return 1.0
+    return min(1.0, scale * np.min(-v[decreasing] / dv[decreasing]))
+
+
+def _psd_solver(A: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Solver for ``A x = r`` with A symmetric positive semi-definite.
+
+    Uses a Cholesky factorization, or the pseudo-inverse when A is singular
+    (rank-deficient designs, e.g. team dummies plus an intercept), which
+    gives the minimum-norm solution as statsmodels' QuantReg does.
+    """
+    try:
+        chol = np.linalg.cholesky(A)
+    except np.linalg.LinAlgError:
+        pinv = np.linalg.pinv(A, hermitian=True)
+        return lambda rhs: pinv @ rhs
+    return lambda rhs: np.linalg.solve(chol.T, np.linalg.solve(chol, rhs))
+
+
+def _frisch_newton(
+    X: np.ndarray,
+    y: np.ndarray,
+    quantile: float,
+    beta_start: Optional[np.ndarray] = None,
+    tol: float = 1e-9,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Quantile regression by the Frisch-Newton interior-point method.
+
+    Solves the dual linear program
+    ``max y'a  s.t.  X'a = (1 - τ) X'1,  0 <= a <= 1``
+    with Mehrotra predictor-corrector steps (Portnoy & Koenker 1997). Each
+    iteration costs one p x p Cholesky factorization, so the solve is
+    linear in the number of observations.
+
+    Args:
+        X: Features (n_samples, n_features)
+        y: Target (n_samples,)
+        quantile: Quantile τ
+        beta_start: Optional starting coefficients (default: OLS)
+        tol: Relative duality-gap tolerance
+        max_iter: Iteration cap
+
+    Returns:
+        Coefficients
+    """
+    n = len(y)
+    b = (1 - quantile) * X.sum(axis=0)
+    c = -y
+
+    # Primal point a = (1 - τ) is feasible; the dual is seeded from beta
+    a = np.full(n, 1 - quantile)
+    if beta_start is None:
+        beta_start = np.linalg.lstsq(X, y, rcond=None)[0]
+    dual = -np.asarray(beta_start, dtype=float)
+    slack = c - X @ dual
+    shift = max(np.mean(np.abs(slack)), 1e-8)
+    z = np.maximum(slack, 0) + shift
+    w = np.maximum(-slack, 0) + shift
+
+    for _ in range(max_iter):
+        s = 1 - a
+        r_primal = b - X.T @ a
+        r_dual = c - X @ dual - z + w
+        gap = a @ z + s @ w
+        if gap <= tol * (1 + abs(c @ a)) and np.max(np.abs(r_dual)) <= tol * (
+            1 + np.max(np.abs(c))
+        ):
+            break
+
+        q = 1.0 / (z / a + w / s)
+        normal_solve = _psd_solver((X * q[:, None]).T @ X)
+
+        def newton(r_az, r_sw):
+            r_tilde = r_dual - r_az / a + r_sw / s
+            rhs = r_primal + X.T @ (q * r_tilde)
+            d_dual = normal_solve(rhs)
+            d_a = q * (X @ d_dual - r_tilde)
+            return d_a, d_dual, (r_az - z * d_a) / a, (r_sw + w * d_a) / s
+
+        # Predictor (affine scaling) step
+        d_a, d_dual, d_z, d_w = newton(-a * z, -s * w)
+        step_p = min(_step_length(a, d_a, 1.0), _step_length(s, -d_a, 1.0))
+        step_d = min(_step_length(z, d_z, 1.0), _step_length(w, d_w, 1.0))
+        mu = gap / (2 * n)
+        mu_affine = (
+            (a + step_p * d_a) @ (z + step_d * d_z)
+            + (s - step_p * d_a) @ (w + step_d * d_w)
+        ) / (2 * n)
+        sigma = (mu_affine / mu) ** 3
+
+        # Corrector step towards the central path
+        d_a, d_dual, d_z, d_w = newton(
+            sigma * mu - a * z - d_a * d_z, sigma * mu - s * w + d_a * d_w
+        )
+        step_p = min(_step_length(a, d_a, 0.99995), _step_length(s, -d_a, 0.99995))
+        step_d = min(_step_length(z, d_z, 0.99995), _step_length(w, d_w, 0.99995))
+
+        a = a + step_p * d_a
+        dual = dual + step_d * d_dual
+        z = z + step_d * d_z
+        w = w + step_d * d_w
+
+    return -dual
+
+
+class _QuantileSolver:
+    """
+    Quantile regression solver for one dataset, reused across quantiles.
+
+    Large problems use Portnoy-Koenker preprocessing: observations whose
+    residual sign is already clear from a starting fit are collapsed into
+    two pseudo-observations, and the interior-point method runs on the
+    remaining ~((p + 1) n)^(2/3) rows. Fixed signs are verified against the
+    full sample and the reduced fit is repeated if any were wrong.
+
+    The starting fit for each quantile is the solution at the neighbouring
+    quantile, and the residual bands are computed once per dataset.
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        tol: float = 1e-9,
+        random_state: Optional[Union[int, np.random.Generator]] = None,
+    ):
+        self.X = np.asarray(X, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.tol = tol
+        self.rng = np.random.default_rng(random_state)
+
+        n, p = self.X.shape
+        self.subsample_size = int(round(((p + 1) * n) ** (2 / 3)))
+        self._band: Optional[np.ndarray] = None
+        self._subsample: Optional[np.ndarray] = None
+
+    @property
+    def uses_preprocessing(self) -> bool:
+        return len(self.y) > 4 * self.subsample_size
+
+    def _draw_subsample(self) -> None:
+        n = len(self.y)
+        self._subsample = self.rng.choice(
+            n, size=min(self.subsample_size, n), replace=False
+        )
+        X_sub = self.X[self._subsample]
+        # band_i = sqrt(x_i' (X_sub' X_sub)^-1 x_i)
+        leverage = np.sum(self.X * _psd_solver(X_sub.T @ X_sub)(self.X.T).T, axis=1)
+        self._band = np.sqrt(np.maximum(leverage, 0.0))
+
+    def solve(
+        self, quantile: float, beta_start: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Fit one quantile.
+
+        Args:
+            quantile: Quantile τ
+            beta_start: Coefficients at a nearby quantile, if known
+
+        Returns:
+            Coefficients
+        """
+        if not self.uses_preprocessing:
+            return _frisch_newton(self.X, self.y, quantile, beta_start, self.tol)
+
+        X, y = self.X, self.y
+        n = len(y)
+        if self._band is None:
+            self._draw_subsample()
+        if beta_start is None:
+            sub = self._subsample
+            beta_start = _frisch_newton(X[sub], y[sub], quantile, tol=self.tol)
+        beta = np.asarray(beta_start, dtype=float)
+
+        while True:
+            residuals = y - X @ beta
+            width = 0.8 * self.subsample_size
+            lower_q = max(1 / n, quantile - width / (2 * n))
+            upper_q = min(quantile + width / (2 * n), (n - 1) / n)
+            lower, upper = np.quantile(residuals / self._band, [lower_q, upper_q])
+            below = residuals < self._band * lower
+            above = residuals > self._band * upper
+
+            while True:
+                keep = ~(below | above)
+                X_red, y_red = [X[keep]], [y[keep]]
+                for globbed in (below, above):
+                    if globbed.any():
+                        X_red.append(X[globbed].sum(axis=0)[None, :])
+                        y_red.append([y[globbed].sum()])
+                beta = _frisch_newton(
+                    np.concatenate(X_red),
+                    np.concatenate(y_red),
+                    quantile,
+                    beta,
+                    self.tol,
+                )
+
+                residuals = y - X @ beta
+                wrong_below = below & (residuals > 0)
+                wrong_above = above & (residuals < 0)
+                n_wrong = int(wrong_below.sum() + wrong_above.sum())
+                if n_wrong == 0:
+                    return beta
+                if n_wrong > 0.1 * width:
+                    # Bands too tight: widen the reduced problem and retry
+                    self.subsample_size = min(2 * self.subsample_size, n)
+                    self._draw_subsample()
+                    break
+                below &= ~wrong_below
+                above &= ~wrong_above
+
+    def solve_path(self, quantiles: List[float]) -> Dict[float, np.ndarray]:
+        """Fit several quantiles in sorted order, warm-starting each."""
+        coefficients = {}
+        beta = None
+        for q in sorted(set(quantiles)):
+            beta = self.solve(q, beta)
+            coefficients[q] = beta
+        return coefficients
+
+
+def _kernel_covariance(
+    X: np.ndarray, y: np.ndarray, residuals: np.ndarray, quantile: float
+) -> np.ndarray:
+    """
+    Huber sandwich covariance with a kernel sparsity estimate.
+
+    Same estimator as statsmodels' QuantReg defaults (robust covariance,
+    Epanechnikov kernel, Hall-Sheather bandwidth).
+    """
+    n = len(y)
+    z = stats.norm.ppf(quantile)
+    h = (
+        n ** (-1.0 / 3)
+        * stats.norm.ppf(0.975) ** (2.0 / 3)
+        * (1.5 * stats.norm.pdf(z) ** 2 / (2 * z**2 + 1)) ** (1.0 / 3)
+    )
+    h = min(h, quantile, 1 - quantile) * (1 - 1e-9)
+    iqr = np.subtract(*np.percentile(residuals, [75, 25]))
+    h = min(np.std(y), iqr / 1.34) * (
+        stats.norm.ppf(quantile + h) - stats.norm.ppf(quantile - h)
+    )
+
+    u = residuals / h
+    fhat0 = np.sum(np.where(np.abs(u) <= 1, 0.75 * (1 - u**2), 0.0)) / (n * h)
+    d = np.where(residuals > 0, (quantile / fhat0) ** 2, ((1 - quantile) / fhat0) ** 2)
+    xtxi = np.linalg.pinv(X.T @ X)
+    return xtxi @ ((X.T * d) @ X) @ xtxi
+
+
+def _bootstrap_worker(
+    X: np.ndarray,
+    y: np.ndarray,
+    quantiles: List[float],
+    seeds: List[np.random.SeedSequence],
+    tol: float,
+) -> np.ndarray:
+    """Refit the quantile process on pairs-bootstrap resamples."""
+    draws = []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        idx = rng.integers(0, len(y), size=len(y))
+        solver = _QuantileSolver(X[idx], y[idx], tol=tol, random_state=rng)
+        path = solver.solve_path(quantiles)
+        draws.append([path[q] for q in quantiles])
+    return np.array(draws)
+
+
+def _bootstrap_coefficients(
+    X: np.ndarray,
+    y: np.ndarray,
+    quantiles: List[float],
+    n_bootstrap: int,
+    n_jobs: Optional[int] = None,
+    random_state: Optional[int] = None,
+    tol: float = 1e-9,
+) -> np.ndarray:
+    """
+    Bootstrap draws of the coefficient process, fitted across processes.
+
+    Each replicate has its own seed, so draws do not depend on n_jobs.
+
+    Returns:
+        Array (n_bootstrap, n_quantiles, n_features)
+    """
+    seeds = np.random.SeedSequence(random_state).spawn(n_bootstrap)
+    n_jobs = max(1, min(n_jobs or os.cpu_count() or 1, n_bootstrap))
+    if n_jobs == 1:
+        return _bootstrap_worker(X, y, quantiles, seeds, tol)
+
+    chunks = [list(c) for c in np.array_split(np.array(seeds, dtype=object), n_jobs)]
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(_bootstrap_worker, X, y, quantiles, chunk, tol)
+                for chunk in chunks
+                if chunk
+            ]
+            return np.concatenate([f.result() for f in futures])
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"Parallel bootstrap failed ({e}); running serially")
+        return _bootstrap_worker(X, y, quantiles, seeds, tol)
+
+
 class QuantileRegression:
     """
     Quantile regression estimator.
@@ -171,18 +491,24 @@ class QuantileRegression:
     Estimates conditional quantiles Q_τ(Y|X) = X'β_τ
     """
 
-    def __init__(self, quantile: float = 0.5):
+    def __init__(self, quantile: float = 0.5, solver: str = "interior_point"):
         """
         Initialize quantile regression.
 
         Args:
             quantile: Quantile to estimate (0-1)
+            solver: 'interior_point' (Frisch-Newton) or 'statsmodels'
         """
         if not 0 < quantile < 1:
             raise ValueError("Quantile must be between 0 and 1")
+        if solver not in ("interior_point", "statsmodels"):
+            raise ValueError(f"Unknown solver: {solver}")
 
         self.quantile = quantile
+        self.solver = solver
         self.coefficients_: Optional[np.ndarray] = None
+        self.covariance_: Optional[np.ndarray] = None
+        self.bootstrap_std_errors_: Optional[np.ndarray] = None
         self.is_fitted = False
 
         logger.info(f"QuantileRegression initialized for quantile {quantile}")
@@ -206,7 +532,11 @@ class QuantileRegression:
         )
 
     def fit(
-        self, X: np.ndarray, y: np.ndarray, feature_names: Optional[List[str]] = None
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        feature_names: Optional[List[str]] = None,
+        beta_start: Optional[np.ndarray] = None,
     ) -> "QuantileRegression":
         """
         Fit quantile regression.
@@ -215,11 +545,12 @@ class QuantileRegression:
             X: Feature matrix (n_samples, n_features)
             y: Target variable (n_samples,)
             feature_names: Optional feature names
+            beta_start: Optional warm start, e.g. the fit at a nearby quantile
 
         Returns:
             Self for chaining
         """
-        if STATSMODELS_AVAILABLE:
+        if self.solver == "statsmodels" and STATSMODELS_AVAILABLE:
             # Use statsmodels implementation
             model = QuantReg(y, X)
             result = model.fit(q=self.quantile)
@@ -230,39 +561,63 @@ class QuantileRegression:
             logger.info(f"Quantile regression fitted (τ={self.quantile:.2f})")
 
         else:
-            # Manual implementation using scipy optimize
-            self.coefficients_ = self._manual_fit(X, y)
-            self.feature_names_ = feature_names
-
-            logger.info(f"Quantile regression fitted manually (τ={self.quantile:.2f})")
+            self._fit_with_solver(_QuantileSolver(X, y), feature_names, beta_start)
 
         self.is_fitted = True
         return self
 
-    def _manual_fit(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
-        """
-        Manual quantile regression using scipy.optimize.
+    def _fit_with_solver(
+        self,
+        solver: _QuantileSolver,
+        feature_names: Optional[List[str]] = None,
+        beta_start: Optional[np.ndarray] = None,
+        coefficients: Optional[np.ndarray] = None,
+    ) -> None:
+        """Fit (or adopt ``coefficients``) via a shared interior-point solver."""
+        if coefficients is None:
+            coefficients = solver.solve(self.quantile, beta_start)
+        self.coefficients_ = coefficients
+        self.covariance_ = _kernel_covariance(
+            solver.X, solver.y, solver.y - solver.X @ coefficients, self.quantile
+        )
+        self.feature_names_ = feature_names
+        self.is_fitted = True
 
-        Args:
-            X: Features
-            y: Target
+        logger.info(f"Quantile regression fitted (τ={self.quantile:.2f})")
 
-        Returns:
-            Coefficients
+    def bootstrap(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        n_bootstrap: int = 200,
+        n_jobs: Optional[int] = None,
+        random_state: Optional[int] = None,
+    ) -> np.ndarray:
         """
+        Pairs-bootstrap standard errors, fitted in parallel.
 
-        # Objective function
-        def objective(beta):
-            residuals = y - X @ beta
-            return self._check_function(residuals)
-
-        # Initial guess (OLS)
-        beta_init = np.linalg.lstsq(X, y, rcond=None)[0]
+        Once computed they take precedence in get_result.
 
-        # Optimize
-        result = minimize(objective, beta_init, method="SLSQP", options={"disp": False})
+        Args:
+            X: Training features
+            y: Training target
+            n_bootstrap: Number of resamples
+            n_jobs: Worker processes (default: all cores)
+            random_state: Seed for reproducible draws
 
-        return result.x
+        Returns:
+            Bootstrap standard errors
+        """
+        draws = _bootstrap_coefficients(
+            np.asarray(X, dtype=float),
+            np.asarray(y, dtype=float),
+            [self.quantile],
+            n_bootstrap,
+            n_jobs,
+            random_state,
+        )
+        self.bootstrap_std_errors_ = draws[:, 0, :].std(axis=0, ddof=1)
+        return self.bootstrap_std_errors_
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -310,8 +665,17 @@ class QuantileRegression:
         else:
             pseudo_r2 = 0.0
 
-        # Standard errors (if statsmodels available)
-        if STATSMODELS_AVAILABLE and hasattr(self, "statsmodels_result_"):
+        # Standard errors: bootstrap if run, else statsmodels or kernel
+        if self.bootstrap_std_errors_ is not None or self.covariance_ is not None:
+            std_errors = (
+                self.bootstrap_std_errors_
+                if self.bootstrap_std_errors_ is not None
+                else np.sqrt(np.diag(self.covariance_))
+            )
+            t_stats = self.coefficients_ / std_errors
+            df_resid = max(len(y) - len(self.coefficients_), 1) if y is not None else 1
+            p_values = 2 * stats.t.sf(np.abs(t_stats), df_resid)
+        elif STATSMODELS_AVAILABLE and hasattr(self, "statsmodels_result_"):
             std_errors = self.statsmodels_result_.bse
             t_stats = self.statsmodels_result_.tvalues
             p_values = self.statsmodels_result_.pvalues
@@ -348,40 +712,80 @@ class QuantileProcess:
     - Inter-quantile range
     """
 
-    def __init__(self, quantiles: Optional[List[float]] = None):
+    def __init__(
+        self, quantiles: Optional[List[float]] = None, solver: str = "interior_point"
+    ):
         """
         Initialize quantile process.
 
         Args:
             quantiles: List of quantiles to estimate (default: deciles)
+            solver: 'interior_point' (warm-started along the grid) or
+                'statsmodels' (independent fits)
         """
         if quantiles is None:
             quantiles = np.arange(0.1, 1.0, 0.1).tolist()
 
         self.quantiles = quantiles
+        self.solver = solver
         self.models: Dict[float, QuantileRegression] = {}
         self.is_fitted = False
 
         logger.info(f"QuantileProcess initialized with {len(quantiles)} quantiles")
 
     def fit(
-        self, X: np.ndarray, y: np.ndarray, feature_names: Optional[List[str]] = None
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        feature_names: Optional[List[str]] = None,
+        n_bootstrap: int = 0,
+        n_jobs: Optional[int] = None,
+        random_state: Optional[int] = None,
     ) -> "QuantileProcess":
         """
         Fit quantile regressions at all quantiles.
 
+        With the interior-point solver, quantiles are fitted in sorted order
+        on one shared solver, each warm-started from its neighbour.
+
         Args:
             X: Features
             y: Target
             feature_names: Optional feature names
+            n_bootstrap: Resamples for bootstrap standard errors (0 = none).
+                Each resample refits the whole process.
+            n_jobs: Worker processes for the bootstrap (default: all cores)
+            random_state: Seed for the bootstrap
 
         Returns:
             Self for chaining
         """
-        for q in self.quantiles:
-            model = QuantileRegression(quantile=q)
-            model.fit(X, y, feature_names)
-            self.models[q] = model
+        if self.solver == "interior_point":
+            solver = _QuantileSolver(X, y)
+            path = solver.solve_path(self.quantiles)
+            for q in self.quantiles:
+                model = QuantileRegression(quantile=q)
+                model._fit_with_solver(solver, feature_names, coefficients=path[q])
+                self.models[q] = model
+        else:
+            for q in self.quantiles:
+                model = QuantileRegression(quantile=q, solver=self.solver)
+                model.fit(X, y, feature_names)
+                self.models[q] = model
+
+        if n_bootstrap > 0:
+            draws = _bootstrap_coefficients(
+                np.asarray(X, dtype=float),
+                np.asarray(y, dtype=float),
+                list(self.quantiles),
+                n_bootstrap,
+                n_jobs,
+                random_state,
+            )
+            for i, q in enumerate(self.quantiles):
+                self.models[q].bootstrap_std_errors_ = draws[:, i, :].std(
+                    axis=0, ddof=1
+                )
 
         self.is_fitted = True
         logger.info(f"Quantile process fitted at {len(self.quantiles)} quantiles")
@@ -495,15 +899,14 @@ class QuantileTreatmentEffect:
         # Include treatment in X
         X_with_treatment = np.column_stack([X, treatment])
 
-        for q in self.quantiles:
-            # Fit quantile regression including treatment
-            qr = QuantileRegression(quantile=q)
-            qr.fit(X_with_treatment, outcome)
+        # Fit quantile regressions including treatment, warm-started
+        process = QuantileProcess(quantiles=self.quantiles).fit(
+            X_with_treatment, outcome
+        )
 
+        for q in self.quantiles:
             # Treatment effect is coefficient on treatment
-            treatment_effect = qr.coefficients_[-1]  # Last coefficient
-
-            self.qte_[q] = treatment_effect
+            self.qte_[q] = process.models[q].coefficients_[-1]  # Last coefficient
 
         self.is_fitted = True
 
@@ -86,6 +86,87 @@ class StructuralBreakResult:
         }
 
 
+# ==============================================================================
+# Segment OLS from cumulative cross-products
+# ==============================================================================
+
+
+def _prefix_cross_products(
+    X: np.ndarray, y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cumulative X'X, X'y and y'y, with a leading zero row.
+
+    Any segment [i, j) then has cross-products ``P[j] - P[i]``, so its OLS
+    fit never needs to revisit the raw observations.
+    """
+    k = X.shape[1]
+    xx = np.cumsum(X[:, :, None] * X[:, None, :], axis=0)
+    xy = np.cumsum(X * y[:, None], axis=0)
+    yy = np.cumsum(y**2)
+    return (
+        np.concatenate([np.zeros((1, k, k)), xx]),
+        np.concatenate([np.zeros((1, k)), xy]),
+        np.concatenate([[0.0], yy]),
+    )
+
+
+def _solve_normal_equations(xx: np.ndarray, xy: np.ndarray) -> np.ndarray:
+    """Batched OLS coefficients; falls back to pseudo-inverse if singular."""
+    try:
+        return np.linalg.solve(xx, xy[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return (np.linalg.pinv(xx) @ xy[..., None])[..., 0]
+
+
+def _batched_ssr(xx: np.ndarray, xy: np.ndarray, yy: np.ndarray) -> np.ndarray:
+    """Residual sums of squares for stacked segment cross-products."""
+    beta = _solve_normal_equations(xx, xy)
+    return np.maximum(yy - np.einsum("...k,...k->...", beta, xy), 0.0)
+
+
+def _segment_ssr_table(
+    X: np.ndarray, y: np.ndarray, min_size: int, block_size: int = 200_000
+) -> np.ndarray:
+    """
+    SSR of the OLS fit on every segment [i, j) with ``j - i >= min_size``.
+
+    Returns an (n + 1, n + 1) matrix indexed by (start, end); segments that
+    are too short are ``inf``. Segments are solved in blocks of roughly
+    ``block_size`` to bound memory on long series.
+    """
+    n = len(y)
+    p_xx, p_xy, p_yy = _prefix_cross_products(X, y)
+    ssr = np.full((n + 1, n + 1), np.inf)
+
+    rows_per_block = max(1, block_size // max(n, 1))
+    for first in range(0, n - min_size + 1, rows_per_block):
+        starts, ends = [], []
+        for i in range(first, min(first + rows_per_block, n - min_size + 1)):
+            j = np.arange(i + min_size, n + 1)
+            starts.append(np.full(len(j), i))
+            ends.append(j)
+        starts = np.concatenate(starts)
+        ends = np.concatenate(ends)
+        ssr[starts, ends] = _batched_ssr(
+            p_xx[ends] - p_xx[starts],
+            p_xy[ends] - p_xy[starts],
+            p_yy[ends] - p_yy[starts],
+        )
+    return ssr
+
+
+def _chow_f(
+    rss_restricted: float, rss_unrestricted: float, n_obs: int, k: int
+) -> Tuple[float, float]:
+    """Chow F-statistic and p-value, following ChowTest's conventions."""
+    denominator = rss_unrestricted / (n_obs - 2 * k) if n_obs > 2 * k else 0.0
+    if denominator <= 0:
+        return 0.0, 1.0
+    f_stat = ((rss_restricted - rss_unrestricted) / k) / denominator
+    return float(f_stat), float(1 - stats.f.cdf(f_stat, k, n_obs - 2 * k))
+
+
 class ChowTest:
     """
     Chow test for structural break at known point.
@@ -210,15 +291,20 @@ class SupFTest:
         trim_start = int(n * self.trim)
         trim_end = n - trim_start
 
-        # Search over possible break points
-        f_stats = []
+        # Chow F at every candidate, with both sides solved from
+        # cumulative cross-products
         candidate_points = range(trim_start, trim_end)
-
-        for break_point in candidate_points:
-            # Chow test at this point
-            chow = ChowTest()
-            result = chow.test(X, y, break_point)
-            f_stats.append(result.test_statistic)
+        p_xx, p_xy, p_yy = _prefix_cross_products(X, y)
+        split = np.asarray(candidate_points)
+        rss_before = _batched_ssr(p_xx[split], p_xy[split], p_yy[split])
+        rss_after = _batched_ssr(
+            p_xx[n] - p_xx[split], p_xy[n] - p_xy[split], p_yy[n] - p_yy[split]
+        )
+        rss_pooled = _batched_ssr(p_xx[n], p_xy[n], p_yy[n])
+        f_stats = [
+            _chow_f(rss_pooled, rss_u, n, X.shape[1])[0]
+            for rss_u in rss_before + rss_after
+        ]
 
         # Maximum F-statistic
         sup_f = max(f_stats)
@@ -297,23 +383,12 @@ class CUSUMTest:
         # Need at least k+1 observations to start
         min_obs = k + 1
 
-        # Recursive residuals
-        recursive_residuals = []
-
-        for t in range(min_obs, n):
-            # Fit on data up to t-1
-            X_t = X[:t]
-            y_t = y[:t]
-
-            beta_t = np.linalg.lstsq(X_t, y_t, rcond=None)[0]
-
-            # One-step ahead prediction error at t
-            y_pred_t = X[t] @ beta_t
-            residual_t = y[t] - y_pred_t
-
-            recursive_residuals.append(residual_t)
-
-        recursive_residuals = np.array(recursive_residuals)
+        # One-step-ahead prediction errors, with each expanding-window fit
+        # solved from cumulative cross-products
+        p_xx, p_xy, _ = _prefix_cross_products(X, y)
+        steps = np.arange(min_obs, n)
+        betas = _solve_normal_equations(p_xx[steps], p_xy[steps])
+        recursive_residuals = y[steps] - np.einsum("tk,tk->t", X[steps], betas)
 
         # Standardize
         sigma = np.std(recursive_residuals)
@@ -368,22 +443,76 @@ class BaiPerronTest:
     """
     Bai-Perron test for multiple structural breaks.
 
-    Tests for multiple breaks using sequential F-tests and information criteria.
+    Finds the globally optimal partition for every number of breaks by
+    dynamic programming over a table of segment SSRs (Bai & Perron 2003),
+    then selects the number of breaks with sequential F(l+1|l) tests or
+    an information criterion.
     """
 
-    def __init__(self, max_breaks: int = 5, trim: float = 0.15):
+    def __init__(
+        self,
+        max_breaks: int = 5,
+        trim: float = 0.15,
+        selection: str = "sequential",
+        critical_value: float = 10.0,
+    ):
         """
         Initialize Bai-Perron test.
 
         Args:
             max_breaks: Maximum number of breaks to test
-            trim: Trim fraction
+            trim: Trim fraction (minimum segment length as share of sample)
+            selection: 'sequential' (F(l+1|l) tests) or 'bic'
+            critical_value: F threshold for the sequential procedure
         """
+        if selection not in ("sequential", "bic"):
+            raise ValueError(f"Unknown selection: {selection}")
+
         self.max_breaks = max_breaks
         self.trim = trim
+        self.selection = selection
+        self.critical_value = critical_value
 
         logger.info(f"BaiPerronTest initialized (max_breaks={max_breaks})")
 
+    def optimal_partitions(
+        self, X: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, Dict[int, Tuple[float, List[int]]]]:
+        """
+        Globally optimal break dates for each number of breaks.
+
+        Args:
+            X: Features
+            y: Target
+
+        Returns:
+            (segment SSR table, {n_breaks: (total SSR, break indices)})
+        """
+        n, k = X.shape
+        min_size = max(int(n * self.trim), k + 1)
+        ssr = _segment_ssr_table(X, y, min_size)
+
+        # cost[m][j]: least SSR splitting [0, j) into m + 1 segments
+        cost = [ssr[0]]
+        backpointers = []
+        for _ in range(self.max_breaks):
+            total = cost[-1][:, None] + ssr
+            best_start = np.argmin(total, axis=0)
+            cost.append(total[best_start, np.arange(n + 1)])
+            backpointers.append(best_start)
+
+        partitions = {}
+        for m, level_cost in enumerate(cost):
+            if not np.isfinite(level_cost[n]):
+                break
+            breaks, end = [], n
+            for level in range(m, 0, -1):
+                end = int(backpointers[level - 1][end])
+                breaks.append(end)
+            partitions[m] = (float(level_cost[n]), sorted(breaks))
+
+        return ssr, partitions
+
     def test(self, X: np.ndarray, y: np.ndarray) -> StructuralBreakResult:
         """
         Perform Bai-Perron test.
@@ -395,70 +524,31 @@ class BaiPerronTest:
         Returns:
             StructuralBreakResult with multiple breaks
         """
-        n = len(y)
-        trim_points = int(n * self.trim)
+        n, k = X.shape
+        ssr, partitions = self.optimal_partitions(X, y)
+        min_size = max(int(n * self.trim), k + 1)
+
+        if self.selection == "bic":
+            n_breaks = self._select_bic(partitions, n, k)
+        else:
+            n_breaks = self._select_sequential(ssr, partitions, k, min_size)
 
-        # Sequential testing for breaks
+        # Per-break Chow statistics against the neighbouring breaks
+        breaks = partitions.get(n_breaks, (0.0, []))[1]
+        edges = [0] + breaks + [n]
         detected_breaks = []
-        remaining_segments = [(0, n)]
-
-        for m in range(self.max_breaks):
-            best_break = None
-            best_f_stat = 0
-
-            # Test each remaining segment
-            for seg_start, seg_end in remaining_segments:
-                if seg_end - seg_start < 2 * trim_points:
-                    continue  # Segment too small
-
-                # Search for break in this segment
-                for break_point in range(
-                    seg_start + trim_points, seg_end - trim_points
-                ):
-                    # Test this break
-                    X_seg = X[seg_start:seg_end]
-                    y_seg = y[seg_start:seg_end]
-
-                    # Relative break point within segment
-                    rel_break = break_point - seg_start
-
-                    try:
-                        chow = ChowTest()
-                        result = chow.test(X_seg, y_seg, rel_break)
-
-                        if result.test_statistic > best_f_stat:
-                            best_f_stat = result.test_statistic
-                            best_break = (
-                                break_point,
-                                result.p_value,
-                                seg_start,
-                                seg_end,
-                            )
-                    except:
-                        continue
-
-            # Check if best break is significant
-            if best_break and best_f_stat > 10:  # Threshold
-                break_pt, p_val, seg_start, seg_end = best_break
-
-                detected_breaks.append(
-                    BreakPoint(
-                        index=break_pt,
-                        test_statistic=best_f_stat,
-                        p_value=p_val,
-                        confidence=1 - p_val if p_val < 1 else 0.5,
-                    )
+        for left, brk, right in zip(edges[:-2], edges[1:-1], edges[2:]):
+            f_stat, p_val = _chow_f(
+                ssr[left, right], ssr[left, brk] + ssr[brk, right], right - left, k
+            )
+            detected_breaks.append(
+                BreakPoint(
+                    index=brk,
+                    test_statistic=f_stat,
+                    p_value=p_val,
+                    confidence=1 - p_val if p_val < 1 else 0.5,
                 )
-
-                # Split segment
-                remaining_segments.remove((seg_start, seg_end))
-                remaining_segments.append((seg_start, break_pt))
-                remaining_segments.append((break_pt, seg_end))
-            else:
-                break  # No more significant breaks
-
-        # Sort breaks by index
-        detected_breaks.sort(key=lambda bp: bp.index)
+            )
 
         result = StructuralBreakResult(
             has_breaks=len(detected_breaks) > 0,
@@ -468,13 +558,75 @@ class BaiPerronTest:
                 if detected_breaks
                 else 0.0
             ),
-            critical_value=10.0,  # Threshold used
+            critical_value=self.critical_value,
         )
 
         logger.info(f"Bai-Perron test: detected {len(detected_breaks)} break(s)")
 
         return result
 
+    def test_many(
+        self,
+        series: Dict[Any, Any],
+        X: Optional[np.ndarray] = None,
+    ) -> Dict[Any, StructuralBreakResult]:
+        """
+        Run the test over many series, e.g. every player's game log.
+
+        Args:
+            series: Mapping of key -> y array, or key -> (X, y) tuple
+            X: Shared design for series given as bare y arrays. Defaults to
+                an intercept only (mean-shift breaks).
+
+        Returns:
+            Mapping of key -> StructuralBreakResult
+        """
+        results = {}
+        for key, data in series.items():
+            if isinstance(data, tuple):
+                X_i, y_i = data
+            else:
+                y_i = np.asarray(data, dtype=float)
+                X_i = X if X is not None else np.ones((len(y_i), 1))
+            results[key] = self.test(np.asarray(X_i, dtype=float), y_i)
+        return results
+
+    def _select_sequential(
+        self,
+        ssr: np.ndarray,
+        partitions: Dict[int, Tuple[float, List[int]]],
+        k: int,
+        min_size: int,
+    ) -> int:
+        """Add breaks while the best extra split clears the F threshold."""
+        n_breaks = 0
+        while n_breaks + 1 in partitions:
+            edges = [0] + partitions[n_breaks][1] + [ssr.shape[0] - 1]
+            best_f = 0.0
+            for start, end in zip(edges[:-1], edges[1:]):
+                splits = np.arange(start + min_size, end - min_size + 1)
+                if len(splits) == 0:
+                    continue
+                rss_split = np.min(ssr[start, splits] + ssr[splits, end])
+                f_stat, _ = _chow_f(ssr[start, end], rss_split, end - start, k)
+                best_f = max(best_f, f_stat)
+
+            if best_f <= self.critical_value:
+                break
+            n_breaks += 1
+        return n_breaks
+
+    @staticmethod
+    def _select_bic(
+        partitions: Dict[int, Tuple[float, List[int]]], n: int, k: int
+    ) -> int:
+        """Number of breaks minimizing BIC."""
+        bic = {
+            m: n * np.log(max(total, 1e-300) / n) + ((m + 1) * k + m) * np.log(n)
+            for m, (total, _) in partitions.items()
+        }
+        return min(bic, key=bic.get)
+
 
 def detect_structural_breaks(
     X: np.ndarray, y: np.ndarray, method: str = "sup_f", **kwargs
@@ -510,7 +662,8 @@ def detect_structural_breaks(
     elif method == "bai_perron":
         max_breaks = kwargs.get("max_breaks", 5)
         trim = kwargs.get("trim", 0.15)
-        test = BaiPerronTest(max_breaks=max_breaks, trim=trim)
+        selection = kwargs.get("selection", "sequential")
+        test = BaiPerronTest(max_breaks=max_breaks, trim=trim, selection=selection)
         return test.test(X, y)
 
     else:
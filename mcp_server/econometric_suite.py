@@ -24,11 +24,15 @@ Date: October 2025
 """
 
 import logging
+import multiprocessing
+import os
+import time
 import warnings
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -380,7 +384,7 @@ class ModelAverager:
             raise ValueError("No predictions provided")
 
         # Convert to arrays
-        pred_arrays = list(predictions.values())
+        pred_arrays = [np.asarray(p) for p in predictions.values()]
         n_models = len(pred_arrays)
 
         # Ensure all predictions have same shape
@@ -420,12 +424,40 @@ class ModelAverager:
         # Normalize weights
         weight_arr = weight_arr / weight_arr.sum()
 
-        # Compute weighted average
-        averaged = sum(w * p for w, p in zip(weight_arr, pred_arrays))
+        # Compute weighted average in one pass over the stacked predictions
+        averaged = np.tensordot(weight_arr, np.stack(pred_arrays), axes=1)
 
         logger.info(f"Averaged {n_models} models with weights: {weight_arr}")
         return averaged
 
+    @staticmethod
+    def metrics_from_comparison(
+        comparison: pd.DataFrame,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Convert a compare_methods DataFrame into model_metrics for average().
+
+        Rows whose status is not 'ok' (parallel failures/timeouts) are dropped.
+
+        Args:
+            comparison: DataFrame returned by EconometricSuite.compare_methods
+
+        Returns:
+            Dict mapping method name to its aic/bic/r_squared/log_likelihood
+        """
+        if "status" in comparison.columns:
+            comparison = comparison[comparison["status"] == "ok"]
+
+        metric_cols = [
+            c
+            for c in ["aic", "bic", "r_squared", "log_likelihood"]
+            if c in comparison.columns
+        ]
+        return {
+            row["method"]: {c: row[c] for c in metric_cols}
+            for _, row in comparison.iterrows()
+        }
+
 
 # ==============================================================================
 # Econometric Suite
@@ -524,6 +556,10 @@ class EconometricSuite:
             self.characteristics
         )
 
+        # Analyzers (and the design matrices / group indexes they derive from
+        # self.data) are built once and shared across method calls
+        self._analyzers: Dict[Hashable, Any] = {}
+
         # MLflow setup
         if mlflow_experiment and MLFLOW_AVAILABLE:
             mlflow.set_experiment(mlflow_experiment)
@@ -857,8 +893,6 @@ class EconometricSuite:
             ...     test_type='both'
             ... )
         """
-        from mcp_server.time_series import TimeSeriesAnalyzer
-
         # Validate inputs
         if self.target is None:
             raise MissingParameterError(
@@ -902,13 +936,7 @@ class EconometricSuite:
         validate_data_shape(self.data, min_rows=30)
 
         try:
-            # Pass time_col to analyzer so it can set DatetimeIndex if needed
-            time_column_param = (
-                self.time_col if hasattr(self, "time_col") and self.time_col else None
-            )
-            analyzer = TimeSeriesAnalyzer(
-                data=self.data, target_column=self.target, time_column=time_column_param
-            )
+            analyzer = self._time_series_analyzer()
         except Exception as e:
             raise ModelFitError(
                 "Failed to create TimeSeriesAnalyzer",
@@ -1202,8 +1230,6 @@ class EconometricSuite:
             - Use System GMM (Blundell-Bond) for highly persistent series
             - Check AR(2) and Hansen tests to validate GMM specification
         """
-        from mcp_server.panel_data import PanelDataAnalyzer
-
         # Validate method parameter
         valid_methods = [
             "fixed_effects",
@@ -1268,12 +1294,7 @@ class EconometricSuite:
 
         # Create analyzer with error handling
         try:
-            analyzer = PanelDataAnalyzer(
-                data=self.data,
-                entity_col=self.entity_col,
-                time_col=self.time_col,
-                target_col=self.target,
-            )
+            analyzer = self._panel_analyzer()
         except Exception as e:
             raise ModelFitError(
                 "Failed to create PanelDataAnalyzer", model_type="panel", reason=str(e)
@@ -1565,11 +1586,14 @@ class EconometricSuite:
             and pd.api.types.is_numeric_dtype(self.data[col])
         ]
 
-        analyzer = CausalInferenceAnalyzer(
-            data=self.data,
-            treatment_col=treatment,
-            outcome_col=outcome,
-            covariates=covariates[:10],  # Limit covariates
+        analyzer = self._shared_analyzer(
+            ("causal", treatment, outcome, tuple(covariates[:10])),
+            lambda: CausalInferenceAnalyzer(
+                data=self.data,
+                treatment_col=treatment,
+                outcome_col=outcome,
+                covariates=covariates[:10],  # Limit covariates
+            ),
         )
 
         if method == "psm":
@@ -1757,8 +1781,6 @@ class EconometricSuite:
             ...     id_col='player_id'
             ... )
         """
-        from mcp_server.survival_analysis import SurvivalAnalyzer
-
         # Validate method parameter
         valid_methods = [
             "cox",
@@ -1808,24 +1830,9 @@ class EconometricSuite:
         # Validate minimum data for survival analysis
         validate_data_shape(self.data, min_rows=10)
 
-        # Filter out datetime columns and non-numeric columns
-        exclude_cols = [duration, event, self.entity_col, self.time_col]
-        covariates = [
-            col
-            for col in self.data.columns
-            if col not in exclude_cols
-            and not pd.api.types.is_datetime64_any_dtype(self.data[col])
-            and pd.api.types.is_numeric_dtype(self.data[col])
-        ]
-
         # Create analyzer with error handling
         try:
-            analyzer = SurvivalAnalyzer(
-                data=self.data,
-                duration_col=duration,
-                event_col=event,
-                covariates=covariates[:10],  # Limit covariates
-            )
+            analyzer = self._survival_analyzer(duration, event)
         except Exception as e:
             raise ModelFitError(
                 "Failed to create SurvivalAnalyzer",
@@ -2409,8 +2416,6 @@ class EconometricSuite:
             ...     n_factors=2
             ... )
         """
-        from mcp_server.advanced_time_series import AdvancedTimeSeriesAnalyzer
-
         # Validate method parameter
         valid_methods = [
             "kalman",
@@ -2440,7 +2445,7 @@ class EconometricSuite:
 
         # Create analyzer with error handling
         try:
-            analyzer = AdvancedTimeSeriesAnalyzer(self.data[self.target])
+            analyzer = self._advanced_time_series_analyzer()
         except Exception as e:
             raise ModelFitError(
                 "Failed to create AdvancedTimeSeriesAnalyzer",
@@ -2545,7 +2550,13 @@ class EconometricSuite:
     # ==========================================================================
 
     def compare_methods(
-        self, methods: List[Dict[str, Any]], metric: str = "aic"
+        self,
+        methods: List[Dict[str, Any]],
+        metric: str = "aic",
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> pd.DataFrame:
         """
         Compare multiple methods.
@@ -2555,10 +2566,21 @@ class EconometricSuite:
                 - 'category': Method category (e.g., 'time_series')
                 - 'method': Specific method (e.g., 'arima')
                 - 'params': Method parameters
+                - 'timeout': Optional per-method timeout in seconds (parallel only)
             metric: Comparison metric ('aic', 'bic', 'r_squared')
+            parallel: Fit specs concurrently in worker processes. Analyzers are
+                built once in the parent and inherited by the workers.
+            max_workers: Maximum concurrent fits (default: CPU count)
+            timeout: Default per-method timeout in seconds (parallel only).
+                A method that exceeds it is terminated and reported with
+                status 'timeout' instead of blocking the comparison.
+            on_result: Callback invoked with each comparison row as soon as
+                its method finishes
 
         Returns:
-            DataFrame with comparison results
+            DataFrame with comparison results. In parallel mode rows also carry
+            'category', 'status', 'error' and 'fit_time_s'; failed or timed-out
+            methods are kept with status set accordingly.
 
         Examples:
             >>> comparison = suite.compare_methods(
@@ -2568,43 +2590,38 @@ class EconometricSuite:
             ...     ],
             ...     metric='bic'
             ... )
+            >>> comparison = suite.compare_methods(
+            ...     methods=specs, parallel=True, timeout=120
+            ... )
         """
         results = []
 
-        for spec in methods:
-            category = spec["category"]
-            method = spec["method"]
-            params = spec.get("params", {})
-
-            try:
-                if category == "time_series":
-                    result = self.time_series_analysis(method=method, **params)
-                elif category == "panel":
-                    result = self.panel_analysis(method=method, **params)
-                elif category == "causal":
-                    result = self.causal_analysis(method=method, **params)
-                elif category == "survival":
-                    result = self.survival_analysis(method=method, **params)
-                elif category == "bayesian":
-                    result = self.bayesian_analysis(method=method, **params)
-                elif category == "advanced_time_series":
-                    result = self.advanced_time_series_analysis(method=method, **params)
-                else:
-                    logger.warning(f"Unknown category: {category}")
+        if parallel:
+            for row in self.iter_compare_methods(
+                methods, max_workers=max_workers, timeout=timeout
+            ):
+                results.append(row)
+                if on_result is not None:
+                    on_result(row)
+        else:
+            for spec in methods:
+                category = spec["category"]
+                method = spec["method"]
+
+                try:
+                    result = self._run_method_spec(spec)
+                    if result is None:
+                        logger.warning(f"Unknown category: {category}")
+                        continue
+
+                    row = self._comparison_row(result)
+                except Exception as e:
+                    logger.error(f"Failed to run {category}/{method}: {e}")
                     continue
 
-                results.append(
-                    {
-                        "method": result.method_used,
-                        "aic": result.aic,
-                        "bic": result.bic,
-                        "r_squared": result.r_squared,
-                        "log_likelihood": result.log_likelihood,
-                    }
-                )
-            except Exception as e:
-                logger.error(f"Failed to run {category}/{method}: {e}")
-                continue
+                results.append(row)
+                if on_result is not None:
+                    on_result(row)
 
         comparison_df = pd.DataFrame(results)
 
@@ -2617,6 +2634,241 @@ class EconometricSuite:
 
         return comparison_df
 
+    def iter_compare_methods(
+        self,
+        methods: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fit method specs concurrently and yield comparison rows as they finish.
+
+        Each spec runs in its own worker process so a slow or hung fit can be
+        terminated at its deadline without affecting the others. Shared
+        analyzers are prepared before the workers start; with the 'fork' start
+        method they are inherited copy-on-write instead of being re-derived
+        (or pickled) per method.
+
+        Args:
+            methods: Method specifications (see compare_methods)
+            max_workers: Maximum concurrent fits (default: CPU count)
+            timeout: Default per-method timeout in seconds (None = no limit)
+
+        Yields:
+            Comparison row dicts in completion order
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(methods) or 1))
+
+        self.prepare_shared_state({spec["category"] for spec in methods})
+
+        start_methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in start_methods else None)
+
+        pending = list(enumerate(methods))
+        running: Dict[Any, tuple] = {}
+
+        try:
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    index, spec = pending.pop(0)
+                    parent_conn, child_conn = ctx.Pipe(duplex=False)
+                    process = ctx.Process(
+                        target=_compare_worker,
+                        args=(child_conn, self, spec),
+                        daemon=True,
+                    )
+                    process.start()
+                    child_conn.close()
+
+                    spec_timeout = spec.get("timeout", timeout)
+                    deadline = (
+                        time.monotonic() + spec_timeout
+                        if spec_timeout is not None
+                        else None
+                    )
+                    running[parent_conn] = (spec, process, time.monotonic(), deadline)
+
+                deadlines = [d for (_, _, _, d) in running.values() if d is not None]
+                wait_for = (
+                    max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                )
+
+                for conn in wait_connections(list(running), timeout=wait_for):
+                    spec, process, started, _ = running.pop(conn)
+                    try:
+                        row = conn.recv()
+                    except EOFError:
+                        row = _failed_row(
+                            spec, "error", f"Worker exited with code {process.exitcode}"
+                        )
+                    conn.close()
+                    process.join()
+                    row["fit_time_s"] = time.monotonic() - started
+                    yield row
+
+                now = time.monotonic()
+                for conn in [
+                    c
+                    for c, (_, _, _, d) in running.items()
+                    if d is not None and d <= now
+                ]:
+                    spec, process, started, _ = running.pop(conn)
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    logger.warning(
+                        f"{spec['category']}/{spec['method']} timed out after "
+                        f"{now - started:.1f}s"
+                    )
+                    row = _failed_row(spec, "timeout", "Exceeded per-method timeout")
+                    row["fit_time_s"] = now - started
+                    yield row
+        finally:
+            # Generator closed early: don't leave workers behind
+            for conn, (_, process, _, _) in running.items():
+                process.terminate()
+                process.join()
+                conn.close()
+
+    def prepare_shared_state(self, categories: Optional[set] = None) -> None:
+        """
+        Build shared analyzers up front for the given method categories.
+
+        Called before parallel comparison so that data copies, panel indexes
+        and covariate selection happen once in the parent process. Failures
+        are deferred: the method that needs the analyzer will raise them.
+
+        Args:
+            categories: Method categories to prepare (default: all)
+        """
+        builders = {
+            "time_series": self._time_series_analyzer,
+            "panel": self._panel_analyzer,
+            "survival": self._survival_analyzer,
+            "advanced_time_series": self._advanced_time_series_analyzer,
+        }
+        for category, build in builders.items():
+            if categories is not None and category not in categories:
+                continue
+            try:
+                build()
+            except Exception as e:
+                logger.debug(f"Could not prepare {category} analyzer: {e}")
+
+    def _run_method_spec(self, spec: Dict[str, Any]) -> Optional[SuiteResult]:
+        """Run a single compare_methods spec (None for unknown categories)."""
+        category = spec["category"]
+        method = spec["method"]
+        params = dict(spec.get("params", {}))
+
+        if category == "time_series":
+            return self.time_series_analysis(method=method, **params)
+        elif category == "panel":
+            return self.panel_analysis(method=method, **params)
+        elif category == "causal":
+            return self.causal_analysis(method=method, **params)
+        elif category == "survival":
+            return self.survival_analysis(method=method, **params)
+        elif category == "bayesian":
+            return self.bayesian_analysis(method=method, **params)
+        elif category == "advanced_time_series":
+            return self.advanced_time_series_analysis(method=method, **params)
+        return None
+
+    @staticmethod
+    def _comparison_row(result: SuiteResult) -> Dict[str, Any]:
+        """Extract the comparison metrics from a SuiteResult."""
+        return {
+            "method": result.method_used,
+            "aic": result.aic,
+            "bic": result.bic,
+            "r_squared": result.r_squared,
+            "log_likelihood": result.log_likelihood,
+        }
+
+    # ==========================================================================
+    # Shared Analyzers
+    # ==========================================================================
+
+    def _shared_analyzer(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached analyzer for key, building it on first use."""
+        # Invalidate if self.data has been replaced since the analyzer was built
+        key = (id(self.data),) + tuple(key)
+        if key not in self._analyzers:
+            self._analyzers[key] = factory()
+        return self._analyzers[key]
+
+    def _time_series_analyzer(self) -> Any:
+        from mcp_server.time_series import TimeSeriesAnalyzer
+
+        # Pass time_col to analyzer so it can set DatetimeIndex if needed
+        time_column = self.time_col or None
+        return self._shared_analyzer(
+            ("time_series", self.target, time_column),
+            lambda: TimeSeriesAnalyzer(
+                data=self.data, target_column=self.target, time_column=time_column
+            ),
+        )
+
+    def _panel_analyzer(self) -> Any:
+        from mcp_server.panel_data import PanelDataAnalyzer
+
+        return self._shared_analyzer(
+            ("panel", self.entity_col, self.time_col, self.target),
+            lambda: PanelDataAnalyzer(
+                data=self.data,
+                entity_col=self.entity_col,
+                time_col=self.time_col,
+                target_col=self.target,
+            ),
+        )
+
+    def _survival_analyzer(
+        self, duration: Optional[str] = None, event: Optional[str] = None
+    ) -> Any:
+        from mcp_server.survival_analysis import SurvivalAnalyzer
+
+        duration = duration or self.duration_col
+        event = event or self.event_col
+        if duration is None or event is None:
+            raise MissingParameterError(
+                "duration_col and event_col must be specified for survival analysis",
+                parameter="duration_col" if duration is None else "event_col",
+                context="survival_analysis",
+            )
+
+        # Filter out datetime columns and non-numeric columns
+        exclude_cols = [duration, event, self.entity_col, self.time_col]
+        covariates = [
+            col
+            for col in self.data.columns
+            if col not in exclude_cols
+            and not pd.api.types.is_datetime64_any_dtype(self.data[col])
+            and pd.api.types.is_numeric_dtype(self.data[col])
+        ][
+            :10
+        ]  # Limit covariates
+
+        return self._shared_analyzer(
+            ("survival", duration, event, tuple(covariates)),
+            lambda: SurvivalAnalyzer(
+                data=self.data,
+                duration_col=duration,
+                event_col=event,
+                covariates=covariates,
+            ),
+        )
+
+    def _advanced_time_series_analyzer(self) -> Any:
+        from mcp_server.advanced_time_series import AdvancedTimeSeriesAnalyzer
+
+        return self._shared_analyzer(
+            ("advanced_time_series", self.target),
+            lambda: AdvancedTimeSeriesAnalyzer(self.data[self.target]),
+        )
+
     # ==========================================================================
     # Utility Methods
     # ==========================================================================
@@ -2680,3 +2932,39 @@ class EconometricSuite:
             f"  recommended_methods={[m.value for m in self.recommended_methods]}\n"
             f")"
         )
+
+
+# ==============================================================================
+# Parallel Comparison Workers
+# ==============================================================================
+
+
+def _failed_row(spec: Dict[str, Any], status: str, error: str) -> Dict[str, Any]:
+    """Comparison row for a method that did not produce a result."""
+    return {
+        "method": spec["method"],
+        "category": spec["category"],
+        "aic": None,
+        "bic": None,
+        "r_squared": None,
+        "log_likelihood": None,
+        "status": status,
+        "error": error,
+    }
+
+
+def _compare_worker(conn, suite: "EconometricSuite", spec: Dict[str, Any]) -> None:
+    """Worker-process entry point for parallel compare_methods."""
+    try:
+        result = suite._run_method_spec(spec)
+        if result is None:
+            row = _failed_row(spec, "error", f"Unknown category: {spec['category']}")
+        else:
+            row = suite._comparison_row(result)
+            row.update({"category": spec["category"], "status": "ok", "error": None})
+    except BaseException as e:
+        row = _failed_row(spec, "error", f"{type(e).__name__}: {e}")
+    try:
+        conn.send(row)
+    finally:
+        conn.close()
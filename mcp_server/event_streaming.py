@@ -16,6 +16,7 @@ Features:
 - Consumer groups
 - Dead letter queue
 - Rate limiting
+- Per-subscriber queues with backpressure (drop, block, coalesce)
 
 Use Cases:
 - Real-time stats updates
@@ -29,12 +30,13 @@ import time
 import uuid
 import logging
 import threading
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
+from itertools import chain, islice
 from queue import Queue, Empty
-from collections import defaultdict
+from collections import defaultdict, deque
 import json
 
 logger = logging.getLogger(__name__)
@@ -107,6 +109,134 @@ class EventFilter:
         return True
 
 
+class BackpressurePolicy(Enum):
+    """What a publisher does when a subscriber's queue is full"""
+
+    DROP = "drop"  # Discard the new event
+    BLOCK = "block"  # Wait for space (up to the subscription's block_timeout)
+    COALESCE = "coalesce"  # Replace a pending event with the same key
+
+
+def _default_coalesce_key(event: Event) -> Hashable:
+    return (event.event_type, event.topic)
+
+
+class SubscriptionQueue:
+    """
+    Bounded FIFO between publishers and one subscriber's dispatch worker.
+
+    Under COALESCE a pending event is replaced in place by a newer event
+    with the same key, so the subscriber only sees the latest state per key;
+    if the queue is full of distinct keys the oldest pending event is
+    dropped instead of the new one.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP,
+        coalesce_key: Optional[Callable[[Event], Hashable]] = None,
+        block_timeout: Optional[float] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.coalesce_key = coalesce_key or _default_coalesce_key
+        self.block_timeout = block_timeout
+
+        self._items: Deque[List[Any]] = deque()  # [key, event] entries
+        self._pending: Dict[Hashable, List[Any]] = {}
+        self._cond = threading.Condition()
+        self._unfinished = 0
+        self.closed = False
+
+        # Statistics
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _forget(self, entry: List[Any]) -> None:
+        if self._pending.get(entry[0]) is entry:
+            del self._pending[entry[0]]
+
+    def put(self, event: Event) -> bool:
+        """Enqueue an event; False if it was dropped"""
+        coalescing = self.policy is BackpressurePolicy.COALESCE
+        with self._cond:
+            if self.closed:
+                return False
+
+            key = self.coalesce_key(event) if coalescing else None
+            if coalescing and key in self._pending:
+                self._pending[key][1] = event
+                self.coalesced += 1
+                return True
+
+            if len(self._items) >= self.maxsize:
+                if self.policy is BackpressurePolicy.BLOCK:
+                    has_space = self._cond.wait_for(
+                        lambda: self.closed or len(self._items) < self.maxsize,
+                        timeout=self.block_timeout,
+                    )
+                    if self.closed:
+                        return False
+                    if not has_space:
+                        self.dropped += 1
+                        return False
+                elif coalescing:
+                    self._forget(self._items.popleft())
+                    self._unfinished -= 1
+                    self.dropped += 1
+                else:
+                    self.dropped += 1
+                    return False
+
+            entry = [key, event]
+            self._items.append(entry)
+            if coalescing:
+                self._pending[key] = entry
+            self._unfinished += 1
+            self._cond.notify_all()
+            return True
+
+    def get(self) -> Optional[Event]:
+        """Block until an event is available; None once closed"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._items or self.closed)
+            if self.closed:
+                return None
+            entry = self._items.popleft()
+            self._forget(entry)
+            self._cond.notify_all()
+            return entry[1]
+
+    def task_done(self) -> None:
+        with self._cond:
+            self._unfinished = max(self._unfinished - 1, 0)
+            if self._unfinished == 0:
+                self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been processed"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self.closed or self._unfinished == 0, timeout=timeout
+            )
+
+    def close(self) -> None:
+        """Discard pending events and release the worker and any publishers"""
+        with self._cond:
+            self.closed = True
+            self._items.clear()
+            self._pending.clear()
+            self._unfinished = 0
+            self._cond.notify_all()
+
+
 @dataclass
 class Subscription:
     """Event subscription"""
@@ -118,16 +248,38 @@ class Subscription:
     active: bool = True
     event_count: int = 0
     last_event_time: Optional[datetime] = None
+    queue: Optional[SubscriptionQueue] = field(default=None, repr=False)
+    worker: Optional[threading.Thread] = field(default=None, repr=False)
+
+
+# (by event type, by topic, unindexed) subscription buckets
+_SubscriptionIndex = Tuple[
+    Dict[str, Tuple[Subscription, ...]],
+    Dict[str, Tuple[Subscription, ...]],
+    Tuple[Subscription, ...],
+]
 
 
 class EventBus:
-    """Central event bus for pub/sub"""
+    """
+    Central event bus for pub/sub.
+
+    Every subscription owns a bounded queue drained by a dedicated worker
+    thread, so ``publish`` only matches and enqueues: a slow subscriber
+    fills its own queue (and is handled by its backpressure policy) instead
+    of stalling publishers or other subscribers.  Subscriptions are indexed
+    by event type, then topic, so matching cost follows the number of
+    interested subscribers rather than the total.  History is a ring buffer.
+    """
 
     def __init__(self, max_history: int = 1000):
         self.subscriptions: Dict[str, Subscription] = {}
-        self.event_history: List[Event] = []
+        self.event_history: Deque[Event] = deque(maxlen=max_history)
         self.max_history = max_history
         self._lock = threading.RLock()
+        self._history_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._index: _SubscriptionIndex = ({}, {}, ())
 
         # Statistics
         self.total_published = 0
@@ -138,8 +290,26 @@ class EventBus:
         subscriber_name: str,
         callback: Callable[[Event], None],
         event_filter: Optional[EventFilter] = None,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP,
+        max_queue_size: int = 1000,
+        coalesce_key: Optional[Callable[[Event], Hashable]] = None,
+        block_timeout: Optional[float] = None,
     ) -> str:
-        """Subscribe to events"""
+        """
+        Subscribe to events.
+
+        Args:
+            subscriber_name: Name used in logs and statistics
+            callback: Called with each event on the subscription's worker
+            event_filter: Optional filter; event types and topics are indexed
+            policy: Backpressure policy when the queue is full
+            max_queue_size: Capacity of the subscription's queue
+            coalesce_key: Key for COALESCE (default: event type and topic)
+            block_timeout: Longest a BLOCK publisher waits (None = no limit)
+
+        Returns:
+            Subscription ID
+        """
         subscription_id = str(uuid.uuid4())
 
         subscription = Subscription(
@@ -147,74 +317,154 @@ class EventBus:
             subscriber_name=subscriber_name,
             callback=callback,
             event_filter=event_filter,
+            queue=SubscriptionQueue(
+                maxsize=max_queue_size,
+                policy=policy,
+                coalesce_key=coalesce_key,
+                block_timeout=block_timeout,
+            ),
         )
+        subscription.worker = threading.Thread(
+            target=self._dispatch_loop,
+            args=(subscription,),
+            name=f"event-bus-{subscriber_name}",
+            daemon=True,
+        )
+        subscription.worker.start()
 
         with self._lock:
             self.subscriptions[subscription_id] = subscription
+            self._rebuild_index()
 
         logger.info(f"Subscriber '{subscriber_name}' registered: {subscription_id}")
         return subscription_id
 
     def unsubscribe(self, subscription_id: str) -> bool:
-        """Unsubscribe from events"""
+        """Unsubscribe from events, discarding undelivered events"""
         with self._lock:
             if subscription_id in self.subscriptions:
                 subscriber = self.subscriptions[subscription_id]
                 subscriber.active = False
+                subscriber.queue.close()
                 del self.subscriptions[subscription_id]
+                self._rebuild_index()
                 logger.info(f"Unsubscribed: {subscription_id}")
                 return True
             return False
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the subscription index (copy-on-write; caller holds lock)"""
+        by_type: Dict[str, List[Subscription]] = defaultdict(list)
+        by_topic: Dict[str, List[Subscription]] = defaultdict(list)
+        unindexed: List[Subscription] = []
+
+        for subscription in self.subscriptions.values():
+            event_filter = subscription.event_filter
+            if event_filter and event_filter.event_types:
+                for event_type in event_filter.event_types:
+                    by_type[event_type].append(subscription)
+            elif event_filter and event_filter.topics:
+                for topic in event_filter.topics:
+                    by_topic[topic].append(subscription)
+            else:
+                unindexed.append(subscription)
+
+        self._index = (
+            {key: tuple(subs) for key, subs in by_type.items()},
+            {key: tuple(subs) for key, subs in by_topic.items()},
+            tuple(unindexed),
+        )
+
+    def _dispatch_loop(self, subscription: Subscription) -> None:
+        """Worker: deliver queued events to one subscriber"""
+        queue = subscription.queue
+        while True:
+            event = queue.get()
+            if event is None:
+                return
+
+            try:
+                subscription.callback(event)
+                subscription.event_count += 1
+                subscription.last_event_time = datetime.now()
+                with self._stats_lock:
+                    self.total_delivered += 1
+            except Exception as e:
+                logger.error(
+                    f"Error delivering event to {subscription.subscriber_name}: {e}"
+                )
+            finally:
+                queue.task_done()
+
     def publish(self, event: Event) -> int:
-        """Publish event to all matching subscribers"""
-        delivered = 0
+        """
+        Publish event to all matching subscribers.
 
-        with self._lock:
-            # Add to history
-            self.event_history.append(event)
-            if len(self.event_history) > self.max_history:
-                self.event_history.pop(0)
+        Delivery is asynchronous; use ``drain`` to wait for subscribers.
 
+        Returns:
+            Number of subscriptions that accepted the event
+        """
+        with self._history_lock:
+            self.event_history.append(event)
+        with self._stats_lock:
             self.total_published += 1
 
-            # Deliver to subscribers
-            for subscription in list(self.subscriptions.values()):
-                if not subscription.active:
-                    continue
+        by_type, by_topic, unindexed = self._index
+        candidates = chain(
+            by_type.get(event.event_type, ()),
+            by_topic.get(event.topic, ()),
+            unindexed,
+        )
 
-                # Check filter
-                if subscription.event_filter and not subscription.event_filter.matches(
-                    event
-                ):
-                    continue
+        accepted = 0
+        for subscription in candidates:
+            event_filter = subscription.event_filter
+            if event_filter and not event_filter.matches(event):
+                continue
+            if subscription.queue.put(event):
+                accepted += 1
 
-                # Deliver event
-                try:
-                    subscription.callback(event)
-                    subscription.event_count += 1
-                    subscription.last_event_time = datetime.now()
-                    delivered += 1
-                    self.total_delivered += 1
-                except Exception as e:
-                    logger.error(
-                        f"Error delivering event to {subscription.subscriber_name}: {e}"
-                    )
+        logger.debug(f"Published event {event.event_id} to {accepted} subscribers")
+        return accepted
 
-        logger.debug(f"Published event {event.event_id} to {delivered} subscribers")
-        return delivered
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every subscription has processed its queued events.
+
+        Returns:
+            True if all queues drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            subscriptions = list(self.subscriptions.values())
+
+        for subscription in subscriptions:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0.0)
+            if not subscription.queue.join(remaining):
+                return False
+        return True
+
+    def close(self) -> None:
+        """Stop all dispatch workers"""
+        with self._lock:
+            subscription_ids = list(self.subscriptions)
+        for subscription_id in subscription_ids:
+            self.unsubscribe(subscription_id)
 
     def get_history(
         self, event_filter: Optional[EventFilter] = None, limit: int = 100
     ) -> List[Event]:
         """Get event history"""
-        with self._lock:
-            events = self.event_history[-limit:]
+        with self._history_lock:
+            events = list(islice(reversed(self.event_history), limit))[::-1]
 
-            if event_filter:
-                events = [e for e in events if event_filter.matches(e)]
+        if event_filter:
+            events = [e for e in events if event_filter.matches(e)]
 
-            return events
+        return events
 
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus statistics"""
@@ -233,6 +483,10 @@ class EventBus:
                             if sub.last_event_time
                             else None
                         ),
+                        "policy": sub.queue.policy.value,
+                        "queued": len(sub.queue),
+                        "dropped": sub.queue.dropped,
+                        "coalesced": sub.queue.coalesced,
                     }
                     for sub in self.subscriptions.values()
                 ],
@@ -443,6 +697,9 @@ if __name__ == "__main__":
     )
     time.sleep(0.1)
 
+    # Wait for subscriber workers to catch up
+    bus.drain(timeout=5)
+
     # Statistics
     print("\n--- Event Bus Statistics ---")
     stats = bus.get_stats()
@@ -477,5 +734,6 @@ if __name__ == "__main__":
 
     time.sleep(1)
     stream.stop()
+    bus.close()
 
     print("\n=== Demo Complete ===")
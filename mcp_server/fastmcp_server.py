@@ -7,6 +7,7 @@ for cleaner, more maintainable code with 50-70% less boilerplate.
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
 import pandas as pd
@@ -14,6 +15,8 @@ import pandas as pd
 # Import lifespan and settings
 from .fastmcp_lifespan import nba_lifespan
 from .fastmcp_settings import NBAMCPSettings
+from .profiling.loop_monitor import LoopStallDetector
+from .profiling.tool_metrics import instrument_tools
 
 # Import Pydantic models (from Quick Win #3)
 from .tools.params import (
@@ -69,6 +72,7 @@ from .tools.params import (
     BlockPercentageParams,
     WinSharesParams,
     BoxPlusMinusParams,
+    LeagueMetricsParams,
     # Sprint 7 parameters (ML)
     KMeansClusteringParams,
     EuclideanDistanceParams,
@@ -133,6 +137,7 @@ from .tools.params import (
     PlaygroundAddFormulaParams,
     PlaygroundUpdateVariablesParams,
     PlaygroundCalculateResultsParams,
+    PlaygroundBatchEvaluateParams,
     PlaygroundGenerateVisualizationsParams,
     PlaygroundGetRecommendationsParams,
     PlaygroundShareSessionParams,
@@ -373,6 +378,7 @@ from .responses import (
     PlaygroundFormulaResult,
     PlaygroundVariablesResult,
     PlaygroundResultsResult,
+    PlaygroundBatchResult,
     PlaygroundVisualizationsResult,
     PlaygroundRecommendationsResult,
     PlaygroundShareResult,
@@ -446,6 +452,29 @@ from .responses import (
 # Initialize settings
 settings = NBAMCPSettings()
 
+stall_detector = LoopStallDetector(stall_threshold_ms=settings.loop_stall_threshold_ms)
+
+
+@asynccontextmanager
+async def server_lifespan(app):
+    """
+    NBA resources plus the event-loop stall detector.
+
+    SSE and streamable-http enter the lifespan once per session; the
+    detector reference-counts start/stop so closing one session leaves
+    monitoring running for the others.
+    """
+    monitor = settings.enable_loop_stall_detector
+    if monitor:
+        stall_detector.start()
+    try:
+        async with nba_lifespan(app) as context:
+            yield context
+    finally:
+        if monitor:
+            await stall_detector.stop()
+
+
 # Create FastMCP server with lifespan
 mcp = FastMCP(
     name="nba-mcp-fastmcp",
@@ -454,12 +483,16 @@ mcp = FastMCP(
     log_level=settings.log_level,
     host=settings.host,
     port=settings.port,
-    lifespan=nba_lifespan,
+    lifespan=server_lifespan,
     warn_on_duplicate_tools=settings.warn_on_duplicate_tools,
     warn_on_duplicate_resources=settings.warn_on_duplicate_resources,
     warn_on_duplicate_prompts=settings.warn_on_duplicate_prompts,
 )
 
+# Time every tool registered below (latency, CPU, event-loop blocking, sizes)
+tool_metrics = instrument_tools(mcp)
+stall_detector.attach(tool_metrics)
+
 
 # =============================================================================
 # Database Tools
@@ -2113,6 +2146,7 @@ from .tools import (
     math_helper,
     stats_helper,
     nba_metrics_helper,
+    league_metrics,
     correlation_helper,
     timeseries_helper,
     # Sprint 7 ML helpers
@@ -3584,6 +3618,62 @@ async def nba_box_plus_minus(
         )
 
 
+@mcp.tool()
+async def nba_league_advanced_metrics(
+    params: LeagueMetricsParams, ctx: Context
+) -> dict:
+    """
+    Calculate advanced metrics for every player in a box score table.
+
+    Computes PER, BPM, Win Shares, usage, rebound/assist/steal/block rates
+    and shooting efficiency for all rows at once, with team, opponent and
+    league context (pace, team totals) derived from the table.
+
+    Args:
+        params: Box score rows or dataset path, team/game columns, metrics
+        ctx: FastMCP context
+
+    Returns:
+        Dictionary with per-row metrics, team context and league constants
+    """
+    await ctx.info("Calculating league-wide advanced metrics")
+
+    try:
+        if params.dataset_path:
+            if params.dataset_path.endswith(".parquet"):
+                box_scores = pd.read_parquet(params.dataset_path)
+            else:
+                box_scores = pd.read_csv(params.dataset_path)
+        else:
+            box_scores = pd.DataFrame(params.box_scores)
+
+        result = await asyncio.to_thread(
+            league_metrics.compute_league_metrics,
+            box_scores,
+            team_col=params.team_col,
+            game_col=params.game_col,
+        )
+
+        players = result.players
+        if params.metrics:
+            metric_columns = set(result.players.columns) - set(box_scores.columns)
+            unknown = set(params.metrics) - metric_columns
+            if unknown:
+                raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+            players = players[list(box_scores.columns) + params.metrics]
+
+        return {
+            "players": players.round(3).to_dict(orient="records"),
+            "teams": result.teams.round(3).reset_index().to_dict(orient="records"),
+            "league": result.league,
+            "rows": len(players),
+            "success": True,
+        }
+    except Exception as e:
+        await ctx.error(f"League metrics calculation failed: {str(e)}")
+        return {"players": [], "success": False, "error": str(e)}
+
+
 # =============================================================================
 # Machine Learning Tools - Sprint 7
 # =============================================================================
@@ -6356,8 +6446,8 @@ async def playground_create_session(
         PlaygroundSessionResult with session details
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Create session
         session = playground.create_session(
@@ -6402,12 +6492,12 @@ async def playground_add_formula(
         PlaygroundFormulaResult with formula details
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Add formula to session
         result = playground.add_formula_to_session(
-            params.session_id, params.formula, params.description
+            params.session_id, params.formula, params.description, params.name
         )
 
         if result["success"]:
@@ -6446,8 +6536,8 @@ async def playground_update_variables(
         PlaygroundVariablesResult with update status
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Update variables
         result = playground.update_variables(params.session_id, params.variables)
@@ -6485,8 +6575,8 @@ async def playground_calculate_results(
         PlaygroundResultsResult with calculation results
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Calculate results
         result = playground.calculate_formula_results(params.session_id)
@@ -6502,6 +6592,41 @@ async def playground_calculate_results(
         return PlaygroundResultsResult(success=False, error=str(e))
 
 
+@mcp.tool()
+async def playground_batch_evaluate(
+    params: PlaygroundBatchEvaluateParams, ctx: Context
+) -> PlaygroundBatchResult:
+    """
+    Evaluate playground formulas over whole columns at once.
+
+    Each formula is compiled once and evaluated over every row of the
+    supplied columns, dataset or what-if grid. Named formulas can build on
+    each other and are evaluated in dependency order.
+
+    Args:
+        params: Session ID and one of columns, dataset path or grid
+        ctx: FastMCP context
+
+    Returns:
+        PlaygroundBatchResult with one result column per formula
+    """
+    try:
+        playground = formula_playground.get_formula_playground()
+
+        result = await asyncio.to_thread(
+            playground.evaluate_batch,
+            params.session_id,
+            data=params.columns if params.columns is not None else params.dataset_path,
+            grid=params.grid,
+            formula_ids=params.formula_ids,
+        )
+
+        return PlaygroundBatchResult(**result)
+
+    except Exception as e:
+        return PlaygroundBatchResult(success=False, error=str(e))
+
+
 @mcp.tool()
 async def playground_generate_visualizations(
     params: PlaygroundGenerateVisualizationsParams, ctx: Context
@@ -6520,8 +6645,8 @@ async def playground_generate_visualizations(
         PlaygroundVisualizationsResult with visualizations
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Convert string types to enum
         viz_types = []
@@ -6563,8 +6688,8 @@ async def playground_get_recommendations(
         PlaygroundRecommendationsResult with recommendations
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Get recommendations
         recommendations = playground.get_recommendations(params.session_id)
@@ -6609,8 +6734,8 @@ async def playground_share_session(
         PlaygroundShareResult with sharing details
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Share session
         result = playground.share_session(params.session_id)
@@ -6645,8 +6770,8 @@ async def playground_get_shared_session(
         PlaygroundSessionResult with session details
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Get shared session
         result = playground.get_shared_session(params.share_token)
@@ -6678,8 +6803,8 @@ async def playground_create_experiment(
         PlaygroundExperimentResult with experiment details
     """
     try:
-        # Initialize playground
-        playground = formula_playground.InteractiveFormulaPlayground()
+        # Shared playground, so sessions persist across tool calls
+        playground = formula_playground.get_formula_playground()
 
         # Create experiment
         result = playground.create_experiment(
@@ -8299,7 +8424,8 @@ async def symbolic_regression_discover_formula(
     await ctx.info(f"Discovering formula for {params.target_variable}...")
 
     try:
-        result = symbolic_regression.discover_formula_from_data(
+        result = await asyncio.to_thread(
+            symbolic_regression.discover_formula_from_data,
             data=params.data,
             target_variable=params.target_variable,
             input_variables=params.input_variables,
@@ -8307,6 +8433,10 @@ async def symbolic_regression_discover_formula(
             optimization_method=params.optimization_method,
             max_complexity=params.max_complexity,
             min_r_squared=params.min_r_squared,
+            generations=params.generations,
+            population_size=params.population_size,
+            tournament_size=params.tournament_size,
+            n_jobs=params.n_jobs,
         )
 
         await ctx.info(f"✓ Formula discovered with R²={result['r_squared']:.3f}")
@@ -12682,7 +12812,7 @@ async def database_schema(ctx: Context) -> str:
 # =============================================================================
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 from datetime import datetime
 import time
 
@@ -12764,8 +12894,15 @@ async def metrics_endpoint(request: Request) -> JSONResponse:
     """
     Prometheus-compatible metrics endpoint.
 
-    Returns current operational metrics.
+    Returns current operational metrics as JSON, or per-tool histograms in
+    Prometheus text format with ``?format=prometheus``.
     """
+    if request.query_params.get("format") == "prometheus":
+        return PlainTextResponse(
+            tool_metrics.export_prometheus() + stall_detector.export_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
     uptime = int(time.time() - start_time)
 
     metrics = {
@@ -12778,12 +12915,52 @@ async def metrics_endpoint(request: Request) -> JSONResponse:
             "success_rate": (query_count - error_count) / max(query_count, 1),
             "queries_per_minute": (query_count / max(uptime / 60, 1)),
         },
+        "slow_tools": tool_metrics.top_slow_tools(n=5),
+        "event_loop": stall_detector.get_lag_stats(),
         "timestamp": datetime.now().isoformat(),
     }
 
     return JSONResponse(metrics)
 
 
+@mcp.custom_route("/metrics/slow-tools", methods=["GET"])
+async def slow_tools_endpoint(request: Request) -> JSONResponse:
+    """
+    Top slow MCP tools.
+
+    Query params: ``n`` (default 10) and ``by`` (p95, p99, avg, total,
+    blocking or cpu).
+    """
+    try:
+        tools = tool_metrics.top_slow_tools(
+            n=int(request.query_params.get("n", 10)),
+            by=request.query_params.get("by", "p95"),
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    return JSONResponse({"tools": tools, "timestamp": datetime.now().isoformat()})
+
+
+@mcp.custom_route("/metrics/loop-stalls", methods=["GET"])
+async def loop_stalls_endpoint(request: Request) -> JSONResponse:
+    """
+    Event-loop lag percentiles and the worst blocking call sites.
+
+    Query params: ``n`` (default 10) sites to return.
+    """
+    return JSONResponse(
+        {
+            "lag": stall_detector.get_lag_stats(),
+            "sites": stall_detector.top_blocking_sites(
+                n=int(request.query_params.get("n", 10))
+            ),
+            "tools": stall_detector.get_tool_stalls(),
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+
+
 @mcp.custom_route("/ready", methods=["GET"])
 async def readiness_check(request: Request) -> JSONResponse:
     """
@@ -14334,22 +14511,74 @@ async def bayesian_updating(
 
     try:
         import numpy as np
+        from .bayesian_time_series import SequentialConjugateUpdater
+
+        new_df = pd.DataFrame(params.new_data)
+        missing = [p for p in params.parameter_names if p not in new_df.columns]
+        if missing:
+            raise ValueError(f"Parameters not found in new_data: {missing}")
+
+        updated_posterior = {}
+        posterior_mean = {}
+        posterior_std = {}
+        prior_mean = {}
+        information_gain = {}
+
+        for param in params.parameter_names:
+            values = new_df[param].dropna().to_numpy(dtype=float)
+            prior = params.prior_distribution.get(param, {})
+            mu0 = float(prior.get("mean", 0.0))
+            prior_sd = float(prior.get("std", 10.0))
+            kappa0 = float(prior.get("kappa", 1.0))
+            alpha0 = float(prior.get("alpha", 2.0))
+            # Choose beta0 so the prior sd of the mean equals the requested std
+            beta0 = float(prior.get("beta", prior_sd**2 * (alpha0 - 1) * kappa0))
+
+            # Conjugate Normal-Inverse-Gamma update: O(1) in prior history
+            updater = SequentialConjugateUpdater(
+                "normal", mu0=mu0, kappa0=kappa0, alpha0=alpha0, beta0=beta0
+            )
+            updater.update(np.full(len(values), param, dtype=object), values)
+            post = updater.posterior(param)
+
+            post_sd = float(post["std"])
+            # KL(posterior || prior), normal approximation for the mean
+            kl = (
+                np.log(prior_sd / post_sd)
+                + (post_sd**2 + (post["mean"] - mu0) ** 2) / (2 * prior_sd**2)
+                - 0.5
+            )
 
-        # Stub implementation
-        updated_posterior = {
-            param: {"mean": 0.0, "std": 1.0} for param in params.parameter_names
-        }
+            prior_mean[param] = mu0
+            posterior_mean[param] = float(post["mean"])
+            posterior_std[param] = post_sd
+            information_gain[param] = float(kl)
+            updated_posterior[param] = {
+                "mean": float(post["mean"]),
+                "std": post_sd,
+                "ci_95": [float(post["lower"]), float(post["upper"])],
+                "sigma": float(post["sigma"]),
+                "kappa": float(updater.kappa[0]),
+                "alpha": float(updater.alpha[0]),
+                "beta": float(updater.beta[0]),
+            }
 
         await ctx.info(
             f"✓ Bayesian updating complete for {len(params.parameter_names)} parameters"
         )
         return BayesianUpdatingResult(
             updated_posterior=updated_posterior,
-            prior_specification=params.prior_distribution,
-            posterior_samples=[],
+            posterior_mean=posterior_mean,
+            posterior_std=posterior_std,
+            prior_mean=prior_mean,
+            information_gain=information_gain,
             n_samples=params.n_samples,
-            kl_divergence=0.1,
-            interpretation="Posterior updated with new data",
+            n_data_points=len(new_df),
+            interpretation=(
+                "Closed-form conjugate update; pass updated_posterior "
+                "(mean/kappa/alpha/beta) as the next prior to keep updating "
+                "sequentially"
+            ),
             recommendations=[],
             success=True,
         )
@@ -14357,10 +14586,12 @@ async def bayesian_updating(
         await ctx.error(f"Bayesian updating failed: {str(e)}")
         return BayesianUpdatingResult(
             updated_posterior={},
-            prior_specification={},
-            posterior_samples=[],
+            posterior_mean={},
+            posterior_std={},
+            prior_mean={},
+            information_gain={},
             n_samples=0,
-            kl_divergence=0.0,
+            n_data_points=0,
             interpretation="Updating failed",
             recommendations=[],
             success=False,
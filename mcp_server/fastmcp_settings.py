@@ -261,6 +261,12 @@ class NBAMCPSettings(BaseSettings):
     enable_structured_logging: bool = True
     """Enable structured JSON logging"""
 
+    enable_loop_stall_detector: bool = True
+    """Measure event-loop lag and capture stacks of blocking calls"""
+
+    loop_stall_threshold_ms: float = 100.0
+    """Event-loop lag above which a stall is recorded"""
+
     log_dir: str = "logs"
     """Directory for log files"""
 
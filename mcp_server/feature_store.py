@@ -7,12 +7,26 @@ Enhanced with CI/CD hooks, Week 1 integration, and advanced feature management.
 """
 
 import logging
-from typing import Dict, Optional, Any, List, Callable, Tuple
-from datetime import datetime
+from typing import Dict, Optional, Any, List, Callable, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field, asdict
 import json
 from pathlib import Path
 import hashlib
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# Parquet storage (optional; history stays in memory without it)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
 
 # Week 1 Integration
 try:
@@ -75,24 +89,575 @@ class FeatureSet:
     tags: Dict[str, str] = field(default_factory=dict)
 
 
+# ==============================================================================
+# Columnar Storage Engine
+# ==============================================================================
+
+ENTITY_COLUMN = "entity_id"
+TIMESTAMP_COLUMN = "event_time"
+DEFAULT_PARTITION = "_default"
+
+
+def _to_utc_naive(values: Any) -> np.ndarray:
+    """Convert timestamps (naive = UTC) to a naive UTC datetime64[ns] array."""
+    stamps = pd.to_datetime(pd.Series(values), utc=True).dt.tz_convert(None)
+    return stamps.to_numpy(dtype="datetime64[ns]")
+
+
+def _utc_timestamp(value: Optional[Any]) -> np.datetime64:
+    """Single-value variant of ``_to_utc_naive``; ``None`` means now."""
+    stamp = pd.Timestamp(value if value is not None else datetime.now(timezone.utc))
+    if stamp.tzinfo is not None:
+        stamp = stamp.tz_convert("UTC").tz_localize(None)
+    return stamp.to_datetime64().astype("datetime64[ns]")
+
+
+class _LatestValueIndex:
+    """
+    Latest value per (entity, feature), stored column-wise.
+
+    Entities map to row positions; each feature owns an object array of
+    values and a datetime64 array of the event times they were observed at,
+    so batched reads are fancy-indexing rather than per-entity dict walks.
+    A write only replaces a value when its event time is not older than the
+    one already held, which keeps late-arriving history from clobbering
+    fresher values.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, int] = {}
+        self._capacity = 0
+        self._values: Dict[str, np.ndarray] = {}
+        self._times: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def feature_ids(self) -> List[str]:
+        return list(self._values)
+
+    def _grow(self, needed: int):
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, 1024)
+        for feature_id in self._values:
+            values = np.empty(capacity, dtype=object)
+            values[: self._capacity] = self._values[feature_id]
+            times = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+            times[: self._capacity] = self._times[feature_id]
+            self._values[feature_id] = values
+            self._times[feature_id] = times
+        self._capacity = capacity
+
+    def _column(self, feature_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        if feature_id not in self._values:
+            self._values[feature_id] = np.empty(self._capacity, dtype=object)
+            self._times[feature_id] = np.full(
+                self._capacity, np.datetime64("NaT"), dtype="datetime64[ns]"
+            )
+        return self._values[feature_id], self._times[feature_id]
+
+    def _assign_positions(self, entity_ids: Sequence[str]) -> np.ndarray:
+        positions = self._positions
+        out = np.empty(len(entity_ids), dtype=np.intp)
+        for i, entity_id in enumerate(entity_ids):
+            entity_id = str(entity_id)
+            pos = positions.get(entity_id)
+            if pos is None:
+                pos = positions[entity_id] = len(positions)
+            out[i] = pos
+        self._grow(len(positions))
+        return out
+
+    def lookup(self, entity_ids: Sequence[str]) -> np.ndarray:
+        """Row positions for ``entity_ids`` (-1 for unknown entities)."""
+        get = self._positions.get
+        return np.fromiter(
+            (get(str(entity_id), -1) for entity_id in entity_ids),
+            dtype=np.intp,
+            count=len(entity_ids),
+        )
+
+    def set(self, entity_id: str, features: Dict[str, Any], event_time):
+        """Scalar update used by single-entity writes."""
+        pos = self._assign_positions([entity_id])[0]
+        for feature_id, value in features.items():
+            values, times = self._column(feature_id)
+            current = times[pos]
+            if np.isnat(current) or event_time >= current:
+                values[pos] = value
+                times[pos] = event_time
+
+    def update(
+        self,
+        entity_ids: np.ndarray,
+        feature_id: str,
+        values: np.ndarray,
+        event_times: np.ndarray,
+    ):
+        """Vectorized update of one feature for many entities."""
+        if len(entity_ids) == 0:
+            return
+        positions = self._assign_positions(entity_ids)
+        column_values, column_times = self._column(feature_id)
+
+        # Keep the newest observation per entity (later rows win ties)
+        order = np.argsort(event_times, kind="stable")
+        positions, values, event_times = (
+            positions[order],
+            values[order],
+            event_times[order],
+        )
+        _, first_reversed = np.unique(positions[::-1], return_index=True)
+        keep = len(positions) - 1 - first_reversed
+        positions, values, event_times = (
+            positions[keep],
+            values[keep],
+            event_times[keep],
+        )
+
+        current = column_times[positions]
+        newer = np.isnat(current) | (event_times >= current)
+        column_values[positions[newer]] = values[newer]
+        column_times[positions[newer]] = event_times[newer]
+
+    def to_dicts(
+        self, entity_ids: Sequence[str], feature_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Latest values as ``{entity_id: {feature_id: value}}``."""
+        result: Dict[str, Dict[str, Any]] = {entity_id: {} for entity_id in entity_ids}
+        positions = self.lookup(entity_ids)
+        found = positions >= 0
+        found_ids = np.asarray(entity_ids, dtype=object)[found]
+        found_positions = positions[found]
+
+        for feature_id in feature_ids or self.feature_ids:
+            if feature_id not in self._values:
+                continue
+            has_value = ~np.isnat(self._times[feature_id][found_positions])
+            for entity_id, value in zip(
+                found_ids[has_value],
+                self._values[feature_id][found_positions[has_value]],
+            ):
+                result[entity_id][feature_id] = value
+        return result
+
+    def to_frame(
+        self, entity_ids: Sequence[str], feature_ids: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """Latest values as an entity-indexed frame (NaN where missing)."""
+        positions = self.lookup(entity_ids)
+        missing = positions < 0
+        safe = np.where(missing, 0, positions)
+
+        columns = {}
+        for feature_id in feature_ids or self.feature_ids:
+            if feature_id in self._values and self._capacity:
+                column = self._values[feature_id][safe]
+                column[missing] = None
+            else:
+                column = np.full(len(entity_ids), None, dtype=object)
+            columns[feature_id] = column
+
+        frame = pd.DataFrame(columns, index=pd.Index(entity_ids, name=ENTITY_COLUMN))
+        return frame.infer_objects()
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _arrow_table(frame: pd.DataFrame) -> "pa.Table":
+    """
+    Arrow table for a history partition.
+
+    Object columns mixing types Arrow cannot unify (e.g. numbers and text)
+    are stored as text, keeping nulls, so one odd value cannot block a flush.
+    """
+    try:
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        pass
+
+    frame = frame.copy()
+    for column in frame.columns[frame.dtypes == object]:
+        try:
+            pa.array(frame[column], from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            logger.warning(f"Feature column {column} has mixed types; storing as text")
+            frame[column] = frame[column].map(
+                lambda value: None if _is_missing(value) else str(value)
+            )
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+class ColumnarFeatureLog:
+    """
+    Append-only feature history with an in-memory latest-value index.
+
+    Writes land in a small in-memory buffer and are flushed to immutable
+    Parquet files laid out as
+    ``<root>/feature_set=<id>/date=<YYYY-MM-DD>/part-<ns>-<uid>.parquet``,
+    one wide row per (entity, event time) write.  Only the latest value per
+    (entity, feature) is kept resident; history reads prune partitions by
+    feature set and date and project just the requested feature columns,
+    so memory follows the working set rather than the full history.
+
+    Without pyarrow the buffer is never flushed and history stays in memory.
+    """
+
+    def __init__(self, root: Path, flush_rows: int = 50_000):
+        """
+        Initialize the log and rebuild the latest-value index from disk.
+
+        Args:
+            root: Directory holding the partitioned Parquet files
+            flush_rows: Buffered rows that trigger a flush to Parquet
+        """
+        self.root = Path(root)
+        self.flush_rows = flush_rows
+        self.latest = _LatestValueIndex()
+
+        self._buffer: Dict[str, List[pd.DataFrame]] = {}
+        self._pending_rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._buffered_rows = 0
+        self._next_flush = flush_rows
+        self._warned_no_parquet = False
+
+        self._load_latest()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append_row(
+        self,
+        entity_id: str,
+        features: Dict[str, Any],
+        event_time: np.datetime64,
+        feature_set: str = DEFAULT_PARTITION,
+    ):
+        """Append one entity's feature values observed at ``event_time``."""
+        entity_id = str(entity_id)  # ids are stored as text, as in append_frame
+        self.latest.set(entity_id, features, event_time)
+        row = {ENTITY_COLUMN: entity_id, TIMESTAMP_COLUMN: event_time, **features}
+        self._pending_rows.setdefault(feature_set, []).append(row)
+        self._after_append(1)
+
+    def append_frame(self, frame: pd.DataFrame, feature_set: str = DEFAULT_PARTITION):
+        """
+        Append a wide frame of ``entity_id``, ``event_time`` and feature columns.
+
+        Null cells mean "not observed in this write" and leave the latest
+        value untouched.
+        """
+        if frame.empty:
+            return
+        entity_ids = frame[ENTITY_COLUMN].to_numpy(dtype=object)
+        event_times = frame[TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        for feature_id in frame.columns.drop([ENTITY_COLUMN, TIMESTAMP_COLUMN]):
+            values = frame[feature_id].to_numpy(dtype=object)
+            observed = pd.notna(frame[feature_id]).to_numpy()
+            self.latest.update(
+                entity_ids[observed],
+                feature_id,
+                values[observed],
+                event_times[observed],
+            )
+
+        self._seal_rows(feature_set)
+        self._buffer.setdefault(feature_set, []).append(frame)
+        self._after_append(len(frame))
+
+    def _seal_rows(self, feature_set: str):
+        """Turn pending single-row writes into a frame, keeping write order."""
+        rows = self._pending_rows.pop(feature_set, None)
+        if rows:
+            frame = pd.DataFrame(rows)
+            frame[TIMESTAMP_COLUMN] = frame[TIMESTAMP_COLUMN].astype("datetime64[ns]")
+            self._buffer.setdefault(feature_set, []).append(frame)
+
+    def _after_append(self, n_rows: int):
+        self._buffered_rows += n_rows
+        if PARQUET_AVAILABLE and self._buffered_rows >= self._next_flush:
+            try:
+                self.flush()
+            except Exception as e:
+                # Rows stay buffered; retry after another flush_rows writes
+                # instead of failing every write from here on
+                logger.error(f"Feature log flush failed, keeping rows buffered: {e}")
+                self._next_flush = self._buffered_rows + self.flush_rows
+
+    def _buffered_frames(self) -> Dict[str, pd.DataFrame]:
+        for feature_set in list(self._pending_rows):
+            self._seal_rows(feature_set)
+        for feature_set, frames in self._buffer.items():
+            if len(frames) > 1:
+                self._buffer[feature_set] = [pd.concat(frames, ignore_index=True)]
+        return {
+            feature_set: frames[0]
+            for feature_set, frames in self._buffer.items()
+            if frames
+        }
+
+    def flush(self) -> int:
+        """
+        Write buffered rows to new Parquet partition files.
+
+        Returns:
+            Number of rows written (0 when pyarrow is unavailable)
+        """
+        if not PARQUET_AVAILABLE:
+            if not self._warned_no_parquet:
+                logger.warning(
+                    "pyarrow not available; feature history is kept in memory only"
+                )
+                self._warned_no_parquet = True
+            return 0
+
+        written = 0
+        for feature_set, frame in self._buffered_frames().items():
+            # Convert every partition before writing any, so a bad column
+            # leaves this feature set buffered rather than half written
+            dates = frame[TIMESTAMP_COLUMN].dt.strftime("%Y-%m-%d")
+            tables = [
+                (date, _arrow_table(part.dropna(axis=1, how="all")))
+                for date, part in frame.groupby(dates, sort=True)
+            ]
+            for date, table in tables:
+                directory = self.root / f"feature_set={feature_set}" / f"date={date}"
+                directory.mkdir(parents=True, exist_ok=True)
+                path = directory / (
+                    f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+                )
+                pq.write_table(table, path)
+
+            del self._buffer[feature_set]
+            self._buffered_rows -= len(frame)
+            written += len(frame)
+
+        self._next_flush = self._buffered_rows + self.flush_rows
+        if written:
+            logger.debug(f"Flushed {written} feature rows to {self.root}")
+        return written
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+
+    def _partition_files(
+        self,
+        feature_sets: Optional[Sequence[str]] = None,
+        start: Optional[np.datetime64] = None,
+        end: Optional[np.datetime64] = None,
+    ) -> List[Path]:
+        """Parquet files whose partition keys overlap the requested range."""
+        if not self.root.exists():
+            return []
+        start_date = str(start.astype("datetime64[D]")) if start is not None else None
+        end_date = str(end.astype("datetime64[D]")) if end is not None else None
+
+        files = []
+        for set_dir in self.root.glob("feature_set=*"):
+            if feature_sets and set_dir.name.split("=", 1)[1] not in feature_sets:
+                continue
+            for date_dir in set_dir.glob("date=*"):
+                date = date_dir.name.split("=", 1)[1]
+                if start_date and date < start_date:
+                    continue
+                if end_date and date > end_date:
+                    continue
+                files.extend(date_dir.glob("part-*.parquet"))
+        # File names start with the write time, so this is append order
+        return sorted(files, key=lambda path: path.name)
+
+    def _load_latest(self):
+        """Rebuild the latest-value index one partition file at a time."""
+        if not PARQUET_AVAILABLE:
+            return
+        files = self._partition_files()
+        for path in files:
+            self.latest_from_frame(pq.read_table(path).to_pandas())
+        if files:
+            logger.info(
+                f"Indexed {len(self.latest)} entities from {len(files)} partitions"
+            )
+
+    def latest_from_frame(self, frame: pd.DataFrame):
+        """Fold a history frame into the latest-value index."""
+        entity_ids = frame[ENTITY_COLUMN].to_numpy(dtype=object)
+        event_times = frame[TIMESTAMP_COLUMN].to_numpy(dtype="datetime64[ns]")
+        for feature_id in frame.columns.drop([ENTITY_COLUMN, TIMESTAMP_COLUMN]):
+            observed = pd.notna(frame[feature_id]).to_numpy()
+            self.latest.update(
+                entity_ids[observed],
+                feature_id,
+                frame[feature_id].to_numpy(dtype=object)[observed],
+                event_times[observed],
+            )
+
+    def history(
+        self,
+        feature_ids: Sequence[str],
+        entity_ids: Optional[Sequence[str]] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        feature_sets: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read feature history in append order.
+
+        Args:
+            feature_ids: Feature columns to project
+            entity_ids: Optional entity filter
+            start: Optional inclusive lower bound on event time
+            end: Optional inclusive upper bound on event time
+            feature_sets: Optional feature-set partitions to scan
+
+        Returns:
+            DataFrame with ``entity_id``, ``event_time`` and one column per
+            requested feature that has any history
+        """
+        start = _utc_timestamp(start) if start is not None else None
+        end = _utc_timestamp(end) if end is not None else None
+        wanted = set(feature_ids)
+        if entity_ids is not None:
+            entity_ids = [str(entity_id) for entity_id in entity_ids]
+
+        frames = []
+        if PARQUET_AVAILABLE:
+            for path in self._partition_files(feature_sets, start, end):
+                columns = [
+                    name for name in pq.read_schema(path).names if name in wanted
+                ]
+                if not columns:
+                    continue
+                filters = []
+                if entity_ids is not None:
+                    filters.append((ENTITY_COLUMN, "in", list(entity_ids)))
+                table = pq.read_table(
+                    path,
+                    columns=[ENTITY_COLUMN, TIMESTAMP_COLUMN] + columns,
+                    filters=filters or None,
+                )
+                frames.append(table.to_pandas())
+
+        for feature_set, frame in self._buffered_frames().items():
+            if feature_sets and feature_set not in feature_sets:
+                continue
+            columns = [name for name in frame.columns if name in wanted]
+            if not columns:
+                continue
+            frame = frame[[ENTITY_COLUMN, TIMESTAMP_COLUMN] + columns]
+            if entity_ids is not None:
+                frame = frame[frame[ENTITY_COLUMN].isin(entity_ids)]
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=[ENTITY_COLUMN, TIMESTAMP_COLUMN])
+
+        history = pd.concat(frames, ignore_index=True)
+        history[TIMESTAMP_COLUMN] = history[TIMESTAMP_COLUMN].astype("datetime64[ns]")
+        mask = np.ones(len(history), dtype=bool)
+        if start is not None:
+            mask &= (history[TIMESTAMP_COLUMN] >= start).to_numpy()
+        if end is not None:
+            mask &= (history[TIMESTAMP_COLUMN] <= end).to_numpy()
+        history = history[mask].reset_index(drop=True)
+        return history.dropna(axis=1, how="all")
+
+    def point_in_time_join(
+        self,
+        entity_df: pd.DataFrame,
+        feature_ids: Sequence[str],
+        entity_column: str = ENTITY_COLUMN,
+        timestamp_column: str = TIMESTAMP_COLUMN,
+        max_age: Optional[timedelta] = None,
+    ) -> pd.DataFrame:
+        """
+        Attach, for every spine row, each feature's value as of that row's time.
+
+        A value observed at exactly the spine timestamp is included; values
+        observed later never are, so training sets carry no leakage.
+
+        Args:
+            entity_df: Spine of (entity, timestamp) rows
+            feature_ids: Features to join
+            entity_column: Entity id column in ``entity_df``
+            timestamp_column: Timestamp column in ``entity_df``
+            max_age: Optional staleness limit; older values join as NaN
+
+        Returns:
+            Copy of ``entity_df`` with one column per feature
+        """
+        result = entity_df.reset_index(drop=True).copy()
+        if result.empty:
+            for feature_id in feature_ids:
+                result[feature_id] = pd.Series(dtype=object)
+            return result
+
+        spine = pd.DataFrame(
+            {
+                "_row": np.arange(len(result)),
+                ENTITY_COLUMN: result[entity_column].astype(str).to_numpy(),
+                TIMESTAMP_COLUMN: _to_utc_naive(result[timestamp_column]),
+            }
+        ).sort_values(TIMESTAMP_COLUMN, kind="stable")
+
+        end = spine[TIMESTAMP_COLUMN].max()
+        start = spine[TIMESTAMP_COLUMN].min() - max_age if max_age else None
+        history = self.history(
+            feature_ids,
+            entity_ids=spine[ENTITY_COLUMN].unique().tolist(),
+            start=start,
+            end=end,
+        )
+
+        for feature_id in feature_ids:
+            if feature_id not in history.columns:
+                result[feature_id] = np.nan
+                continue
+            observed = history.loc[
+                history[feature_id].notna(),
+                [ENTITY_COLUMN, TIMESTAMP_COLUMN, feature_id],
+            ].sort_values(TIMESTAMP_COLUMN, kind="stable")
+            joined = pd.merge_asof(
+                spine,
+                observed,
+                on=TIMESTAMP_COLUMN,
+                by=ENTITY_COLUMN,
+                direction="backward",
+                tolerance=pd.Timedelta(max_age) if max_age else None,
+            )
+            values = np.empty(len(result), dtype=object)
+            values[joined["_row"].to_numpy()] = joined[feature_id].to_numpy(
+                dtype=object
+            )
+            result[feature_id] = pd.Series(values).infer_objects()
+        return result
+
+
 class FeatureStore:
     """Centralized feature store"""
 
-    def __init__(self, store_path: str = "./feature_store"):
+    def __init__(self, store_path: str = "./feature_store", flush_rows: int = 50_000):
         """
         Initialize feature store.
 
         Args:
             store_path: Path to feature store storage
+            flush_rows: Buffered feature rows that trigger a Parquet flush
         """
         self.store_path = Path(store_path)
         self.store_path.mkdir(parents=True, exist_ok=True)
 
         self.features: Dict[str, FeatureDefinition] = {}
         self.feature_sets: Dict[str, FeatureSet] = {}
-        self.feature_values: Dict[str, Dict[str, Any]] = (
-            {}
-        )  # {entity_id: {feature_id: value}}
+        # Time-stamped value history plus the latest value per entity
+        self.feature_log = ColumnarFeatureLog(
+            self.store_path / "values", flush_rows=flush_rows
+        )
         self.deployment_hooks: Dict[str, List[Callable]] = {
             "pre_deployment": [],
             "post_deployment": [],
@@ -273,15 +838,26 @@ class FeatureStore:
         return feature_set
 
     @handle_errors(reraise=True, notify=False) if WEEK1_AVAILABLE else lambda f: f
-    def write_features(self, entity_id: str, features: Dict[str, Any]):
+    def write_features(
+        self,
+        entity_id: str,
+        features: Dict[str, Any],
+        event_time: Optional[datetime] = None,
+        feature_set_id: Optional[str] = None,
+    ):
         """
         Write feature values for an entity.
 
+        Values are appended to the feature history; the latest-value index
+        only moves forward in event time.
+
         **Week 1 Integration:** Uses error handling and monitoring from Phase 10A Week 1.
 
         Args:
             entity_id: Entity identifier (e.g., player_id, game_id)
             features: Dictionary of {feature_id: value}
+            event_time: When the values were observed (defaults to now, UTC)
+            feature_set_id: Feature set partition to store the values under
         """
         import time
 
@@ -295,10 +871,13 @@ class FeatureStore:
                 continue
             valid_features[feat_id] = value
 
-        if entity_id not in self.feature_values:
-            self.feature_values[entity_id] = {}
-
-        self.feature_values[entity_id].update(valid_features)
+        if valid_features:
+            self.feature_log.append_row(
+                entity_id,
+                valid_features,
+                _utc_timestamp(event_time),
+                feature_set_id or DEFAULT_PARTITION,
+            )
 
         # Week 1 Monitoring Integration
         if WEEK1_AVAILABLE:
@@ -336,25 +915,7 @@ class FeatureStore:
 
         start_time = time.time()
 
-        result = {}
-
-        for entity_id in entity_ids:
-            if entity_id not in self.feature_values:
-                result[entity_id] = {}
-                continue
-
-            entity_features = self.feature_values[entity_id]
-
-            if feature_ids:
-                # Filter to requested features
-                result[entity_id] = {
-                    feat_id: entity_features.get(feat_id)
-                    for feat_id in feature_ids
-                    if feat_id in entity_features
-                }
-            else:
-                # Return all features
-                result[entity_id] = entity_features.copy()
+        result = self.feature_log.latest.to_dicts(entity_ids, feature_ids)
 
         # Week 1 Monitoring Integration
         if WEEK1_AVAILABLE:
@@ -389,6 +950,134 @@ class FeatureStore:
 
         return self.read_features(entity_ids, feature_set.features)
 
+    @handle_errors(reraise=True, notify=False) if WEEK1_AVAILABLE else lambda f: f
+    def write_features_batch(
+        self,
+        frame: pd.DataFrame,
+        entity_column: str = ENTITY_COLUMN,
+        timestamp_column: Optional[str] = None,
+        feature_set_id: Optional[str] = None,
+    ) -> int:
+        """
+        Write feature values for many entities in one vectorized append.
+
+        Args:
+            frame: One row per (entity, observation) with a column per feature;
+                null cells are treated as not observed
+            entity_column: Column holding entity identifiers
+            timestamp_column: Column holding event times (None = now, UTC)
+            feature_set_id: Feature set partition to store the values under
+
+        Returns:
+            Number of rows written
+        """
+        import time
+
+        start_time = time.time()
+
+        reserved = {entity_column, timestamp_column}
+        valid_features = []
+        for feat_id in frame.columns:
+            if feat_id in reserved:
+                continue
+            if feat_id not in self.features:
+                logger.warning(f"Feature {feat_id} not registered, skipping")
+                continue
+            valid_features.append(feat_id)
+
+        batch = frame[valid_features].reset_index(drop=True)
+        batch.insert(0, ENTITY_COLUMN, frame[entity_column].astype(str).to_numpy())
+        batch.insert(
+            1,
+            TIMESTAMP_COLUMN,
+            (
+                _to_utc_naive(frame[timestamp_column])
+                if timestamp_column
+                else np.full(len(frame), _utc_timestamp(None))
+            ),
+        )
+        if valid_features:
+            self.feature_log.append_frame(batch, feature_set_id or DEFAULT_PARTITION)
+
+        # Week 1 Monitoring Integration
+        if WEEK1_AVAILABLE:
+            try:
+                monitor = get_health_monitor()
+                write_time_ms = (time.time() - start_time) * 1000
+                monitor.track_metric("feature_store.writes", 1)
+                monitor.track_metric("feature_store.write_time_ms", write_time_ms)
+                monitor.track_metric(
+                    "feature_store.features_written",
+                    len(valid_features) * len(batch),
+                )
+            except Exception as e:
+                logger.debug(f"Could not track monitoring metrics: {e}")
+
+        logger.debug(
+            f"Wrote {len(valid_features)} features for {len(batch)} entity rows"
+        )
+        return len(batch) if valid_features else 0
+
+    def read_features_frame(
+        self, entity_ids: Sequence[str], feature_ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read the latest feature values for many entities as a DataFrame.
+
+        Args:
+            entity_ids: Entity identifiers (one output row each, in order)
+            feature_ids: Optional list of specific features (None for all)
+
+        Returns:
+            DataFrame indexed by entity_id, NaN where no value exists
+        """
+        return self.feature_log.latest.to_frame(list(entity_ids), feature_ids)
+
+    def get_historical_features(
+        self,
+        entity_df: pd.DataFrame,
+        feature_ids: List[str],
+        entity_column: str = ENTITY_COLUMN,
+        timestamp_column: str = TIMESTAMP_COLUMN,
+        max_age: Optional[timedelta] = None,
+    ) -> pd.DataFrame:
+        """
+        Build a training set with point-in-time correct feature values.
+
+        Each row of ``entity_df`` receives the value of every feature as of
+        its own timestamp, never a value observed afterwards.
+
+        Args:
+            entity_df: Rows of (entity, timestamp), e.g. one per game
+            feature_ids: Features to join
+            entity_column: Entity id column in ``entity_df``
+            timestamp_column: Timestamp column in ``entity_df``
+            max_age: Optional staleness limit; older values join as NaN
+
+        Returns:
+            Copy of ``entity_df`` with one column per feature
+        """
+        for feat_id in feature_ids:
+            if feat_id not in self.features:
+                raise ValueError(f"Feature {feat_id} not found")
+
+        return self.feature_log.point_in_time_join(
+            entity_df,
+            feature_ids,
+            entity_column=entity_column,
+            timestamp_column=timestamp_column,
+            max_age=max_age,
+        )
+
+    def flush(self) -> int:
+        """
+        Persist buffered feature values to Parquet partitions.
+
+        Returns:
+            Number of rows written
+        """
+        return self.feature_log.flush()
+
     def search_features(
         self,
         name_pattern: Optional[str] = None,
@@ -431,7 +1120,7 @@ class FeatureStore:
         return {
             "total_features": len(self.features),
             "total_feature_sets": len(self.feature_sets),
-            "total_entities": len(self.feature_values),
+            "total_entities": len(self.feature_log.latest),
             "by_data_type": type_counts,
         }
 
@@ -10,13 +10,21 @@ from prometheus_client import (
     Counter,
     Histogram,
     Gauge,
+    REGISTRY,
     start_http_server,
     generate_latest,
 )
+from prometheus_client.core import HistogramMetricFamily
 from flask import Flask, Response, request
 import threading
 import os
 
+from mcp_server.profiling.performance import (
+    DEFAULT_EXPORT_BUCKETS,
+    PerformanceProfiler,
+    get_profiler,
+)
+
 logger = logging.getLogger(__name__)
 
 # Prometheus metrics
@@ -77,6 +85,51 @@ MEMORY_USAGE = Gauge("memory_usage_bytes", "Memory usage in bytes", ["component"
 CPU_USAGE = Gauge("cpu_usage_percent", "CPU usage percentage", ["component"])
 
 
+class ProfilerCollector:
+    """
+    Export PerformanceProfiler latency histograms at scrape time.
+
+    The profiler keeps its own fixed-size histograms, so nothing is recorded
+    through prometheus_client on the hot path; each scrape converts them
+    into cumulative Prometheus buckets labelled by kind (function/tool).
+    """
+
+    def __init__(self, profiler: PerformanceProfiler, buckets=DEFAULT_EXPORT_BUCKETS):
+        self.profiler = profiler
+        self.buckets = buckets
+
+    def collect(self):
+        family = HistogramMetricFamily(
+            "nba_mcp_profile_duration_seconds",
+            "Profiled call latency by function and MCP tool",
+            labels=["kind", "name"],
+        )
+        for kind in ("function", "tool"):
+            for name, histogram in self.profiler.get_histograms(kind).items():
+                cumulative = histogram.cumulative_counts(self.buckets)
+                buckets = [
+                    (str(bound), count)
+                    for bound, count in zip(self.buckets, cumulative)
+                ]
+                buckets.append(("+Inf", histogram.count))
+                family.add_metric([kind, name], buckets, histogram.total_ns / 1e9)
+        yield family
+
+
+_profiler_collector = None
+_profiler_collector_lock = threading.Lock()
+
+
+def register_profiler_metrics(profiler: PerformanceProfiler = None):
+    """Expose profiler histograms on /metrics (idempotent)"""
+    global _profiler_collector
+    with _profiler_collector_lock:
+        if _profiler_collector is None:
+            _profiler_collector = ProfilerCollector(profiler or get_profiler())
+            REGISTRY.register(_profiler_collector)
+        return _profiler_collector
+
+
 class MetricsCollector:
     """Collect and expose application metrics"""
 
@@ -179,6 +232,7 @@ def get_metrics_collector() -> MetricsCollector:
 
 def start_metrics_server():
     """Start the metrics server"""
+    register_profiler_metrics()
     metrics_collector.start()
 
 
@@ -8,6 +8,8 @@ Methods:
 1. Base ParticleFilter: Generic particle filter framework
 2. PlayerPerformanceParticleFilter: Track player performance states
 3. LiveGameProbabilityFilter: Real-time win probability updates
+4. BatchedParticleFilter: Log-space filter over many entities at once
+5. BatchedPlayerPerformanceFilter: League-wide player tracking per game day
 
 Resampling:
 -----------
@@ -39,6 +41,7 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 from scipy import stats
+from scipy.special import gammaln, logsumexp
 
 
 # ==============================================================================
@@ -895,6 +898,680 @@ class LiveGameProbabilityFilter(ParticleFilter):
         )
 
 
+# ==============================================================================
+# Batched Multi-Entity Particle Filter
+# ==============================================================================
+
+
+@dataclass
+class BatchedParticleFilterResult:
+    """
+    Results from a batched (multi-entity) particle filter run.
+
+    Attributes
+    ----------
+    states : np.ndarray
+        Estimated states over time (T, n_entities, state_dim)
+    state_variance : np.ndarray
+        State uncertainty over time (T, n_entities, state_dim)
+    particles : np.ndarray
+        Particle clouds at final time (n_entities, N_particles, state_dim)
+    log_weights : np.ndarray
+        Normalized log particle weights at final time (n_entities, N_particles)
+    ess_history : np.ndarray
+        Effective sample size per step and entity (T, n_entities)
+    resampling_history : np.ndarray
+        Resampling flags per step and entity (T, n_entities)
+    log_likelihood : np.ndarray
+        Total log likelihood of observations per entity (n_entities,)
+    observed : np.ndarray
+        Observation mask (T, n_entities); False where an entity had no
+        observation at that step (e.g. player did not play)
+    entity_ids : List
+        Entity identifiers, in array order
+    """
+
+    states: np.ndarray
+    state_variance: np.ndarray
+    particles: np.ndarray
+    log_weights: np.ndarray
+    ess_history: np.ndarray
+    resampling_history: np.ndarray
+    log_likelihood: np.ndarray
+    observed: np.ndarray
+    entity_ids: List
+
+    def entity_result(self, entity) -> ParticleFilterResult:
+        """
+        Extract a single entity's trajectory as a ParticleFilterResult.
+
+        Only the steps at which the entity was observed are included.
+
+        Parameters
+        ----------
+        entity : hashable
+            Entity identifier (must be in ``entity_ids``)
+
+        Returns
+        -------
+        ParticleFilterResult
+            Per-entity filtering results
+        """
+        i = self.entity_ids.index(entity)
+        steps = self.observed[:, i]
+
+        return ParticleFilterResult(
+            states=self.states[steps, i],
+            state_variance=self.state_variance[steps, i],
+            particles=self.particles[i].copy(),
+            weights=np.exp(self.log_weights[i]),
+            ess_history=self.ess_history[steps, i].tolist(),
+            resampling_history=self.resampling_history[steps, i].tolist(),
+            log_likelihood=float(self.log_likelihood[i]),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchedParticleFilterResult(\n"
+            f"  T={self.states.shape[0]}, "
+            f"  n_entities={self.states.shape[1]}, "
+            f"  state_dim={self.states.shape[2]},\n"
+            f"  N_particles={self.particles.shape[1]},\n"
+            f"  total_log_likelihood={np.sum(self.log_likelihood):.2f}\n"
+            f")"
+        )
+
+
+@dataclass
+class BatchedPlayerPerformanceResult(BatchedParticleFilterResult):
+    """
+    Extended batched result for league-wide player tracking.
+
+    Additional Attributes
+    ---------------------
+    form_states : pd.DataFrame
+        Long-format player form over time (entity, date, means, variances),
+        one row per observed player-game
+    """
+
+    form_states: pd.DataFrame = None
+
+
+def compute_ess_log(log_weights: np.ndarray) -> np.ndarray:
+    """
+    Compute Effective Sample Size from normalized log weights.
+
+    ESS = 1 / sum(w_i^2) = exp(-logsumexp(2 * log w_i))
+
+    Parameters
+    ----------
+    log_weights : np.ndarray
+        Normalized log particle weights (..., N)
+
+    Returns
+    -------
+    np.ndarray
+        Effective sample size per leading index
+    """
+    return np.exp(-logsumexp(2.0 * log_weights, axis=-1))
+
+
+def batched_resampling(
+    weights: np.ndarray,
+    method: str = "systematic",
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Vectorized resampling of many particle sets at once.
+
+    Each row is resampled independently. Rows are offset by their index so a
+    single ``searchsorted`` over the flattened cumulative weights replaces the
+    per-entity Python loop.
+
+    Parameters
+    ----------
+    weights : np.ndarray
+        Normalized particle weights (n_entities, N)
+    method : str
+        'systematic', 'multinomial', or 'stratified'
+    rng : Optional[np.random.Generator]
+        Random generator (default: fresh ``np.random.default_rng()``)
+
+    Returns
+    -------
+    np.ndarray
+        Resampled indices within each row (n_entities, N)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    E, N = weights.shape
+
+    if method == "systematic":
+        positions = (np.arange(N) + rng.uniform(size=(E, 1))) / N
+    elif method == "stratified":
+        positions = (np.arange(N) + rng.uniform(size=(E, N))) / N
+    elif method == "multinomial":
+        positions = np.sort(rng.uniform(size=(E, N)), axis=1)
+    else:
+        raise ValueError(
+            f"Unknown resampling_method: {method}. "
+            f"Choose 'systematic', 'multinomial', or 'stratified'"
+        )
+
+    cumsum = np.cumsum(weights, axis=1)
+    cumsum[:, -1] = 1.0  # Guard against round-off
+
+    offsets = np.arange(E)[:, None]
+    flat = np.searchsorted(
+        (cumsum + offsets).ravel(), (positions + offsets).ravel(), side="right"
+    )
+    indices = flat.reshape(E, N) - offsets * N
+
+    return np.clip(indices, 0, N - 1)
+
+
+class BatchedParticleFilter:
+    """
+    Batched particle filter tracking many independent entities at once.
+
+    Particles are held as a single (n_entities, n_particles, state_dim) array
+    and weights are kept in log-space, so every predict/update/resample step
+    is one vectorized operation across all entities and long sequences do not
+    underflow.
+
+    Observations are supplied per step as an (n_entities,) or
+    (n_entities, obs_dim) array with an optional boolean mask; entities
+    without an observation at a step (e.g. players not on that game day) are
+    neither propagated nor reweighted.
+
+    Parameters
+    ----------
+    n_entities : int
+        Number of entities (players, games, ...)
+    n_particles : int
+        Number of particles per entity
+    state_dim : int
+        State dimension
+    transition_fn : Callable
+        Vectorized transition f(particles, rng, **kwargs) -> particles, where
+        particles is (n_entities, n_particles, state_dim)
+    log_observation_fn : Callable
+        Vectorized log-likelihood g(particles, observations, **kwargs) ->
+        (n_entities, n_particles)
+    resampling_method : str
+        'systematic', 'multinomial', or 'stratified'
+    resampling_threshold : float
+        ESS threshold for resampling (fraction of n_particles)
+    random_state : Optional[int]
+        Seed for the filter's random generator
+    """
+
+    def __init__(
+        self,
+        n_entities: int,
+        n_particles: int = 1000,
+        state_dim: int = 1,
+        transition_fn: Optional[Callable] = None,
+        log_observation_fn: Optional[Callable] = None,
+        resampling_method: str = "systematic",
+        resampling_threshold: float = 0.5,
+        random_state: Optional[int] = None,
+    ):
+        if n_entities < 1:
+            raise ValueError("n_entities must be >= 1")
+        if n_particles < 100:
+            raise ValueError("n_particles should be at least 100")
+        if state_dim < 1:
+            raise ValueError("state_dim must be >= 1")
+        if resampling_method not in ("systematic", "multinomial", "stratified"):
+            raise ValueError(
+                f"Unknown resampling_method: {resampling_method}. "
+                f"Choose 'systematic', 'multinomial', or 'stratified'"
+            )
+
+        self.n_entities = n_entities
+        self.n_particles = n_particles
+        self.state_dim = state_dim
+        self.transition_fn = transition_fn
+        self.log_observation_fn = log_observation_fn
+        self.resampling_method = resampling_method
+        self.resampling_threshold = resampling_threshold
+        self.rng = np.random.default_rng(random_state)
+
+        # State
+        self.particles = None
+        self.log_weights = None
+        self.log_likelihood = np.zeros(n_entities)
+
+    def initialize_particles(
+        self,
+        initial_states: np.ndarray,
+        initial_variance: Union[float, np.ndarray] = 1.0,
+    ):
+        """
+        Initialize every entity's particle cloud around its initial state.
+
+        Parameters
+        ----------
+        initial_states : np.ndarray
+            Initial state means (n_entities, state_dim), or (state_dim,) to
+            share one initial state across entities
+        initial_variance : Union[float, np.ndarray]
+            Initial state variance (scalar or per-dimension)
+        """
+        initial_states = np.broadcast_to(
+            np.asarray(initial_states, dtype=float),
+            (self.n_entities, self.state_dim),
+        )
+        scale = np.sqrt(np.asarray(initial_variance, dtype=float))
+
+        noise = self.rng.standard_normal(
+            (self.n_entities, self.n_particles, self.state_dim)
+        )
+        self.particles = initial_states[:, None, :] + scale * noise
+        self.log_weights = np.full(
+            (self.n_entities, self.n_particles), -np.log(self.n_particles)
+        )
+        self.log_likelihood = np.zeros(self.n_entities)
+
+    def predict(self, mask: Optional[np.ndarray] = None, **kwargs):
+        """
+        Prediction step: propagate particles through the transition model.
+
+        Parameters
+        ----------
+        mask : Optional[np.ndarray]
+            Boolean (n_entities,) mask of entities to propagate (default: all)
+        **kwargs : dict
+            Additional arguments for transition_fn
+        """
+        if self.transition_fn is None:
+            raise ValueError("transition_fn not set")
+
+        new_particles = self.transition_fn(self.particles, self.rng, **kwargs)
+
+        if mask is None:
+            self.particles = new_particles
+        else:
+            self.particles = np.where(
+                mask[:, None, None], new_particles, self.particles
+            )
+
+    def update(
+        self,
+        observations: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        **kwargs,
+    ):
+        """
+        Update step: reweight particles in log-space.
+
+        Parameters
+        ----------
+        observations : np.ndarray
+            Current observations (n_entities,) or (n_entities, obs_dim)
+        mask : Optional[np.ndarray]
+            Boolean (n_entities,) mask of observed entities (default: all)
+        **kwargs : dict
+            Additional arguments for log_observation_fn
+        """
+        if self.log_observation_fn is None:
+            raise ValueError("log_observation_fn not set")
+
+        log_lik = self.log_observation_fn(self.particles, observations, **kwargs)
+        log_lik = np.where(np.isnan(log_lik), -np.inf, log_lik)
+        if mask is not None:
+            log_lik = np.where(mask[:, None], log_lik, 0.0)
+
+        log_weights = self.log_weights + log_lik
+        log_norm = logsumexp(log_weights, axis=1)
+
+        # All likelihoods zero for an entity - reinitialize its weights
+        dead = ~np.isfinite(log_norm)
+        if np.any(dead):
+            log_weights[dead] = -np.log(self.n_particles)
+            log_norm[dead] = 0.0
+
+        self.log_weights = log_weights - log_norm[:, None]
+        self.log_likelihood += log_norm
+
+    def resample_if_needed(self) -> np.ndarray:
+        """
+        Resample the entities whose ESS fell below threshold.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean (n_entities,) flags of entities that were resampled
+        """
+        ess = compute_ess_log(self.log_weights)
+        needs = ess < self.resampling_threshold * self.n_particles
+
+        if np.any(needs):
+            weights = np.exp(self.log_weights[needs])
+            indices = batched_resampling(weights, self.resampling_method, self.rng)
+            self.particles[needs] = np.take_along_axis(
+                self.particles[needs], indices[:, :, None], axis=1
+            )
+            self.log_weights[needs] = -np.log(self.n_particles)
+
+        return needs
+
+    def get_state_estimate(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get weighted mean and variance of every entity's current state.
+
+        Returns
+        -------
+        mean : np.ndarray
+            Weighted means (n_entities, state_dim)
+        variance : np.ndarray
+            Weighted variances (n_entities, state_dim)
+        """
+        weights = np.exp(self.log_weights)
+        mean = np.einsum("en,end->ed", weights, self.particles)
+        diff = self.particles - mean[:, None, :]
+        variance = np.einsum("en,end->ed", weights, diff**2)
+
+        return mean, variance
+
+    def filter(
+        self,
+        observations: np.ndarray,
+        initial_states: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        initial_variance: Union[float, np.ndarray] = 1.0,
+        step_kwargs: Optional[Dict[str, np.ndarray]] = None,
+        entity_ids: Optional[List] = None,
+        **kwargs,
+    ) -> BatchedParticleFilterResult:
+        """
+        Run the batched filter over a full observation sequence.
+
+        Parameters
+        ----------
+        observations : np.ndarray
+            Observations (T, n_entities) or (T, n_entities, obs_dim)
+        initial_states : np.ndarray
+            Initial states (n_entities, state_dim) or (state_dim,)
+        mask : Optional[np.ndarray]
+            Boolean (T, n_entities) observation mask (default: all observed)
+        initial_variance : Union[float, np.ndarray]
+            Initial state variance
+        step_kwargs : Optional[Dict[str, np.ndarray]]
+            Time-varying arguments indexed by step (first axis T), passed to
+            transition and observation functions as ``name=array[t]``
+        entity_ids : Optional[List]
+            Entity identifiers (default: range(n_entities))
+        **kwargs : dict
+            Static arguments for transition/observation functions
+
+        Returns
+        -------
+        BatchedParticleFilterResult
+            Filtering results for all entities
+        """
+        observations = np.asarray(observations)
+        T = observations.shape[0]
+        if observations.shape[1] != self.n_entities:
+            raise ValueError(
+                f"observations has {observations.shape[1]} entities, "
+                f"expected {self.n_entities}"
+            )
+
+        if mask is None:
+            mask = np.ones((T, self.n_entities), dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool)
+        step_kwargs = step_kwargs or {}
+
+        states = np.zeros((T, self.n_entities, self.state_dim))
+        state_variance = np.zeros((T, self.n_entities, self.state_dim))
+        ess_history = np.zeros((T, self.n_entities))
+        resampling_history = np.zeros((T, self.n_entities), dtype=bool)
+
+        self.initialize_particles(initial_states, initial_variance)
+
+        for t in range(T):
+            step = {**kwargs, **{k: v[t] for k, v in step_kwargs.items()}}
+
+            self.predict(mask=mask[t], **step)
+            self.update(observations[t], mask=mask[t], **step)
+
+            states[t], state_variance[t] = self.get_state_estimate()
+
+            ess_history[t] = compute_ess_log(self.log_weights)
+            resampling_history[t] = self.resample_if_needed()
+
+        return BatchedParticleFilterResult(
+            states=states,
+            state_variance=state_variance,
+            particles=self.particles.copy(),
+            log_weights=self.log_weights.copy(),
+            ess_history=ess_history,
+            resampling_history=resampling_history,
+            log_likelihood=self.log_likelihood.copy(),
+            observed=mask,
+            entity_ids=(
+                list(entity_ids)
+                if entity_ids is not None
+                else list(range(self.n_entities))
+            ),
+        )
+
+
+class BatchedPlayerPerformanceFilter(BatchedParticleFilter):
+    """
+    League-wide player performance tracking with one batched filter.
+
+    Uses the same [skill, form] state model and Poisson observation model as
+    PlayerPerformanceParticleFilter, but filters every player at once per
+    game day and accumulates weights in log-space.
+
+    Parameters
+    ----------
+    n_entities : int
+        Number of players
+    n_particles : int
+        Number of particles per player
+    skill_drift : float
+        Expected change in skill per game (default: 0)
+    skill_volatility : float
+        Volatility of skill changes (default: 0.05)
+    form_persistence : float
+        AR(1) coefficient for form (default: 0.7)
+    form_volatility : float
+        Volatility of form shocks (default: 0.2)
+    """
+
+    def __init__(
+        self,
+        n_entities: int,
+        n_particles: int = 1000,
+        skill_drift: float = 0.0,
+        skill_volatility: float = 0.05,
+        form_persistence: float = 0.7,
+        form_volatility: float = 0.2,
+        **kwargs,
+    ):
+        super().__init__(
+            n_entities=n_entities, n_particles=n_particles, state_dim=2, **kwargs
+        )  # [skill, form]
+
+        self.skill_drift = skill_drift
+        self.skill_volatility = skill_volatility
+        self.form_persistence = form_persistence
+        self.form_volatility = form_volatility
+
+        self.transition_fn = self._transition_model
+        self.log_observation_fn = self._log_observation_likelihood
+
+    def _transition_model(
+        self, particles: np.ndarray, rng: np.random.Generator, **kwargs
+    ) -> np.ndarray:
+        """
+        State transition for all players: [skill, form].
+
+        skill_t = skill_{t-1} + drift + N(0, skill_vol^2)
+        form_t = rho * form_{t-1} + N(0, form_vol^2)
+        """
+        shape = particles.shape[:2]
+        new_particles = np.empty_like(particles)
+
+        new_particles[..., 0] = (
+            particles[..., 0]
+            + self.skill_drift
+            + rng.normal(0, self.skill_volatility, size=shape)
+        )
+        new_particles[..., 1] = self.form_persistence * particles[
+            ..., 1
+        ] + rng.normal(0, self.form_volatility, size=shape)
+
+        return new_particles
+
+    def _log_observation_likelihood(
+        self,
+        particles: np.ndarray,
+        observations: np.ndarray,
+        covariates: Optional[np.ndarray] = None,
+        coefficients: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Poisson log-likelihood log p(y | exp(skill + form + X*beta)).
+
+        Parameters
+        ----------
+        particles : np.ndarray
+            Particle states (n_entities, N, 2)
+        observations : np.ndarray
+            Observed counts (n_entities,)
+        covariates : Optional[np.ndarray]
+            Covariates X for this step (n_entities, n_covariates)
+        coefficients : Optional[np.ndarray]
+            Regression coefficients beta
+
+        Returns
+        -------
+        np.ndarray
+            Log-likelihoods (n_entities, N)
+        """
+        log_rate = particles[..., 0] + particles[..., 1]
+
+        if covariates is not None and coefficients is not None:
+            log_rate = log_rate + (covariates @ coefficients)[:, None]
+
+        # Clamp rate to [1e-10, 1e4], as in the single-entity filter
+        log_rate = np.clip(log_rate, np.log(1e-10), np.log(1e4))
+
+        y = np.asarray(observations, dtype=float).reshape(self.n_entities, -1)[:, :1]
+        y = np.nan_to_num(y)
+
+        return y * log_rate - np.exp(log_rate) - gammaln(y + 1)
+
+    def filter_league_season(
+        self,
+        data: pd.DataFrame,
+        entity_col: str = "player_id",
+        date_col: str = "date",
+        target_col: str = "points",
+        covariate_cols: Optional[List[str]] = None,
+        coefficients: Optional[np.ndarray] = None,
+    ) -> BatchedPlayerPerformanceResult:
+        """
+        Filter every player's season in one pass over game days.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Long-format game logs, one row per player-game
+        entity_col : str
+            Column identifying the player
+        date_col : str
+            Column identifying the game day (filter step)
+        target_col : str
+            Column name for target variable (e.g., 'points')
+        covariate_cols : Optional[List[str]]
+            Covariate column names
+        coefficients : Optional[np.ndarray]
+            Regression coefficients for covariates
+
+        Returns
+        -------
+        BatchedPlayerPerformanceResult
+            Tracking results for all players
+        """
+        entity_ids = list(pd.unique(data[entity_col]))
+        if len(entity_ids) != self.n_entities:
+            raise ValueError(
+                f"data has {len(entity_ids)} players, filter configured for "
+                f"{self.n_entities}"
+            )
+
+        dates = np.sort(pd.unique(data[date_col]))
+        entity_pos = pd.Index(entity_ids).get_indexer(data[entity_col])
+        date_pos = pd.Index(dates).get_indexer(data[date_col])
+
+        T, E = len(dates), self.n_entities
+        observations = np.zeros((T, E))
+        observations[date_pos, entity_pos] = data[target_col].to_numpy(dtype=float)
+        mask = np.zeros((T, E), dtype=bool)
+        mask[date_pos, entity_pos] = True
+
+        step_kwargs = {}
+        if covariate_cols is not None:
+            covariates = np.zeros((T, E, len(covariate_cols)))
+            covariates[date_pos, entity_pos] = data[covariate_cols].to_numpy(
+                dtype=float
+            )
+            step_kwargs["covariates"] = covariates
+
+        # Initial skill: log mean of each player's first five games
+        first_games = (
+            data.sort_values(date_col).groupby(entity_col, sort=False).head(5)
+        )
+        initial_mean = first_games.groupby(entity_col)[target_col].mean()
+        initial_states = np.column_stack(
+            [
+                np.log(initial_mean.reindex(entity_ids).to_numpy() + 1),
+                np.zeros(E),
+            ]
+        )
+
+        base_result = self.filter(
+            observations=observations,
+            initial_states=initial_states,
+            mask=mask,
+            step_kwargs=step_kwargs,
+            entity_ids=entity_ids,
+            coefficients=coefficients,
+        )
+
+        steps, players = np.nonzero(mask)
+        form_states = pd.DataFrame(
+            {
+                entity_col: np.asarray(entity_ids, dtype=object)[players],
+                date_col: dates[steps],
+                "skill_mean": base_result.states[steps, players, 0],
+                "form_mean": base_result.states[steps, players, 1],
+                "skill_variance": base_result.state_variance[steps, players, 0],
+                "form_variance": base_result.state_variance[steps, players, 1],
+            }
+        )
+
+        return BatchedPlayerPerformanceResult(
+            states=base_result.states,
+            state_variance=base_result.state_variance,
+            particles=base_result.particles,
+            log_weights=base_result.log_weights,
+            ess_history=base_result.ess_history,
+            resampling_history=base_result.resampling_history,
+            log_likelihood=base_result.log_likelihood,
+            observed=base_result.observed,
+            entity_ids=base_result.entity_ids,
+            form_states=form_states,
+        )
+
+
 # ==============================================================================
 # Utility Functions
 # ==============================================================================
@@ -1,15 +1,32 @@
 """
 Prediction Logging & Storage Module
 Logs all predictions for auditing, debugging, and model improvement.
+
+Recent predictions are appended to daily JSONL files; ``compact`` rewrites
+closed days into date-partitioned Parquet with a catalog of per-file
+statistics (row counts, timestamp/latency/confidence ranges and a model_id
+index), which queries and aggregations use to skip files and push filters
+down into the Parquet reader.
 """
 
 import logging
 import json
-from typing import Dict, Optional, Any, List
+import time
+import uuid
+from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from pathlib import Path
 
+# Parquet compaction (optional; queries fall back to JSONL scans without it)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -31,6 +48,61 @@ class PredictionLog:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Free-form fields stored as JSON strings in Parquet
+_JSON_FIELDS = ("inputs", "prediction", "metadata")
+_LOG_FIELDS = [f.name for f in fields(PredictionLog)]
+_GROUP_BY_FIELDS = ("model_id", "model_version", "user_id", "session_id")
+_INDEX_FILE = "_index.json"
+
+
+def _parquet_schema() -> "pa.Schema":
+    return pa.schema(
+        [
+            ("prediction_id", pa.string()),
+            ("model_id", pa.string()),
+            ("model_version", pa.string()),
+            ("inputs", pa.string()),
+            ("prediction", pa.string()),
+            ("confidence", pa.float64()),
+            ("latency_ms", pa.float64()),
+            ("user_id", pa.string()),
+            ("session_id", pa.string()),
+            ("timestamp", pa.string()),
+            ("metadata", pa.string()),
+        ]
+    )
+
+
+def _jsonl_date(log_file: Path) -> str:
+    """``predictions_20240105.jsonl`` -> ``2024-01-05``"""
+    raw = log_file.stem.split("_", 1)[1]
+    return f"{raw[:4]}-{raw[4:6]}-{raw[6:8]}"
+
+
+def _matches(
+    entry: Dict[str, Any],
+    model_id: Optional[str],
+    user_id: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> bool:
+    if model_id and entry["model_id"] != model_id:
+        return False
+    if user_id and entry.get("user_id") != user_id:
+        return False
+    if start_date and entry["timestamp"] < start_date:
+        return False
+    if end_date and entry["timestamp"] > end_date:
+        return False
+    return True
+
+
+def _range_stats(values: List[Optional[float]]) -> List[Optional[float]]:
+    """[min, max] of the non-null values (JSON-friendly for the catalog)"""
+    present = [v for v in values if v is not None]
+    return [min(present), max(present)] if present else [None, None]
+
+
 class PredictionLogger:
     """Logs predictions to storage for analysis and debugging"""
 
@@ -48,6 +120,10 @@ class PredictionLogger:
         self.buffer: List[PredictionLog] = []
         self.buffer_size = 100
 
+        # Compacted Parquet partitions and their per-file statistics
+        self.compacted_path = self.storage_path / "compacted"
+        self.file_index: Dict[str, Dict[str, Any]] = self._load_index()
+
         # Statistics
         self.stats = {
             "total_predictions": 0,
@@ -138,6 +214,162 @@ class PredictionLogger:
         logger.info(f"Flushed {len(self.buffer)} predictions to {log_file}")
         self.buffer.clear()
 
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the per-file statistics catalog for compacted partitions"""
+        index_file = self.compacted_path / _INDEX_FILE
+        if not index_file.exists():
+            return {}
+        with open(index_file, "r") as f:
+            return json.load(f)
+
+    def _save_index(self):
+        self.compacted_path.mkdir(parents=True, exist_ok=True)
+        index_file = self.compacted_path / _INDEX_FILE
+        tmp_file = index_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self.file_index, f, indent=2)
+        tmp_file.replace(index_file)
+
+    def compact(self, before_date: Optional[str] = None) -> int:
+        """
+        Rewrite daily JSONL logs into date-partitioned Parquet files.
+
+        Rows are sorted by model_id then timestamp so row-group statistics
+        stay tight for the common per-model filters.  Each file's row count,
+        timestamp/latency/confidence ranges and per-model row counts are
+        recorded in the catalog, and the JSONL source is removed once the
+        Parquet file and catalog entry are written.
+
+        Args:
+            before_date: Only compact days strictly before this date
+                (YYYY-MM-DD); defaults to today (UTC), which is still being
+                appended to
+
+        Returns:
+            Number of predictions compacted
+        """
+        if not PARQUET_AVAILABLE:
+            logger.warning("pyarrow not available; prediction logs stay in JSONL")
+            return 0
+
+        self.flush()
+        before_date = before_date or datetime.utcnow().strftime("%Y-%m-%d")
+
+        compacted = 0
+        for log_file in sorted(self.storage_path.glob("predictions_*.jsonl")):
+            date = _jsonl_date(log_file)
+            if date >= before_date:
+                continue
+
+            with open(log_file, "r") as f:
+                rows = [json.loads(line) for line in f if line.strip()]
+            if rows:
+                compacted += self._write_partition(date, rows)
+            log_file.unlink()
+
+        if compacted:
+            logger.info(f"Compacted {compacted} predictions into Parquet")
+        return compacted
+
+    def _write_partition(self, date: str, rows: List[Dict[str, Any]]) -> int:
+        rows.sort(key=lambda row: (row["model_id"], row["timestamp"]))
+        columns = {name: [row.get(name) for row in rows] for name in _LOG_FIELDS}
+        for name in _JSON_FIELDS:
+            columns[name] = [json.dumps(value) for value in columns[name]]
+
+        relative = (
+            f"date={date}/part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+        )
+        path = self.compacted_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(
+            pa.Table.from_pydict(columns, schema=_parquet_schema()),
+            path,
+            row_group_size=64_000,
+        )
+
+        models: Dict[str, int] = {}
+        for model in columns["model_id"]:
+            models[model] = models.get(model, 0) + 1
+        timestamps = columns["timestamp"]
+        self.file_index[relative] = {
+            "date": date,
+            "rows": len(rows),
+            "min_timestamp": min(timestamps),
+            "max_timestamp": max(timestamps),
+            "latency_ms": _range_stats(columns["latency_ms"]),
+            "confidence": _range_stats(columns["confidence"]),
+            "models": models,
+        }
+        self._save_index()
+        return len(rows)
+
+    def _candidate_files(
+        self,
+        model_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> List[str]:
+        """Compacted files whose catalog statistics can satisfy the filters"""
+        candidates = []
+        for relative, stats in self.file_index.items():
+            if model_id and model_id not in stats["models"]:
+                continue
+            if start_date and stats["max_timestamp"] < start_date:
+                continue
+            if end_date and stats["min_timestamp"] > end_date:
+                continue
+            candidates.append(relative)
+        return sorted(candidates)
+
+    @staticmethod
+    def _pushdown_filters(
+        model_id: Optional[str],
+        user_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Optional[List[Tuple[str, str, Any]]]:
+        filters = []
+        if model_id:
+            filters.append(("model_id", "==", model_id))
+        if user_id:
+            filters.append(("user_id", "==", user_id))
+        if start_date:
+            filters.append(("timestamp", ">=", start_date))
+        if end_date:
+            filters.append(("timestamp", "<=", end_date))
+        return filters or None
+
+    def _sources(
+        self,
+        model_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> List[Tuple[str, str, Path]]:
+        """Compacted files and JSONL logs to scan, in date order"""
+        sources = []
+        if PARQUET_AVAILABLE:
+            for relative in self._candidate_files(model_id, start_date, end_date):
+                date = self.file_index[relative]["date"]
+                sources.append((date, "parquet", self.compacted_path / relative))
+
+        for log_file in self.storage_path.glob("predictions_*.jsonl"):
+            date = _jsonl_date(log_file)
+            # Entries are flushed no earlier than they are logged, so a day's
+            # file cannot hold anything newer than that day
+            if start_date and date < start_date[:10]:
+                continue
+            sources.append((date, "jsonl", log_file))
+        return sorted(sources, key=lambda source: (source[0], source[1] == "jsonl"))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
     def query_predictions(
         self,
         model_id: Optional[str] = None,
@@ -149,6 +381,10 @@ class PredictionLogger:
         """
         Query prediction logs.
 
+        Compacted files are pruned with the catalog and read with the
+        filters pushed into the Parquet reader; JSONL logs that have not
+        been compacted yet are scanned line by line.
+
         Args:
             model_id: Filter by model ID
             user_id: Filter by user ID
@@ -159,34 +395,132 @@ class PredictionLogger:
         Returns:
             List of matching PredictionLog entries
         """
-        results = []
+        results: List[PredictionLog] = []
+        filters = self._pushdown_filters(model_id, user_id, start_date, end_date)
 
-        # Iterate through log files
-        for log_file in sorted(self.storage_path.glob("predictions_*.jsonl")):
-            with open(log_file, "r") as f:
+        for _, kind, path in self._sources(model_id, start_date, end_date):
+            if len(results) >= limit:
+                break
+
+            if kind == "parquet":
+                table = pq.read_table(path, filters=filters)
+                table = table.sort_by("timestamp")
+                for row in table.slice(0, limit - len(results)).to_pylist():
+                    for name in _JSON_FIELDS:
+                        row[name] = json.loads(row[name])
+                    results.append(PredictionLog(**row))
+                continue
+
+            with open(path, "r") as f:
                 for line in f:
                     if len(results) >= limit:
                         break
-
                     entry_dict = json.loads(line)
-                    entry = PredictionLog(**entry_dict)
+                    if _matches(entry_dict, model_id, user_id, start_date, end_date):
+                        results.append(PredictionLog(**entry_dict))
 
-                    # Apply filters
-                    if model_id and entry.model_id != model_id:
-                        continue
-                    if user_id and entry.user_id != user_id:
-                        continue
-                    if start_date and entry.timestamp < start_date:
-                        continue
-                    if end_date and entry.timestamp > end_date:
-                        continue
+        return results
 
-                    results.append(entry)
+    def aggregate_predictions(
+        self,
+        group_by: str = "model_id",
+        model_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate prediction counts, confidence and latency per group.
 
-            if len(results) >= limit:
-                break
+        Compacted files are aggregated inside the Parquet reader, touching
+        only the grouping and metric columns.
 
-        return results
+        Args:
+            group_by: One of model_id, model_version, user_id, session_id
+            model_id: Filter by model ID
+            user_id: Filter by user ID
+            start_date: Filter by start date (ISO format)
+            end_date: Filter by end date (ISO format)
+
+        Returns:
+            Dictionary of {group: {count, mean_confidence, mean_latency_ms,
+            max_latency_ms}}
+        """
+        if group_by not in _GROUP_BY_FIELDS:
+            raise ValueError(
+                f"Cannot group by '{group_by}'. Must be one of {_GROUP_BY_FIELDS}"
+            )
+
+        # {group: [count, conf_sum, conf_count, latency_sum, latency_count, latency_max]}
+        totals: Dict[str, List[float]] = {}
+
+        def accumulate(group, count, conf_sum, conf_n, lat_sum, lat_n, lat_max):
+            acc = totals.setdefault(group, [0, 0.0, 0, 0.0, 0, None])
+            acc[0] += count
+            acc[1] += conf_sum or 0.0
+            acc[2] += conf_n
+            acc[3] += lat_sum or 0.0
+            acc[4] += lat_n
+            if lat_max is not None and (acc[5] is None or lat_max > acc[5]):
+                acc[5] = lat_max
+
+        filters = self._pushdown_filters(model_id, user_id, start_date, end_date)
+        columns = sorted({group_by, "model_id", "user_id", "timestamp"})
+        columns += ["confidence", "latency_ms"]
+
+        for _, kind, path in self._sources(model_id, start_date, end_date):
+            if kind == "parquet":
+                table = pq.read_table(path, columns=columns, filters=filters)
+                grouped = table.group_by(group_by).aggregate(
+                    [
+                        ([], "count_all"),
+                        ("confidence", "sum"),
+                        ("confidence", "count"),
+                        ("latency_ms", "sum"),
+                        ("latency_ms", "count"),
+                        ("latency_ms", "max"),
+                    ]
+                )
+                for row in grouped.to_pylist():
+                    accumulate(
+                        row[group_by],
+                        row["count_all"],
+                        row["confidence_sum"],
+                        row["confidence_count"],
+                        row["latency_ms_sum"],
+                        row["latency_ms_count"],
+                        row["latency_ms_max"],
+                    )
+                continue
+
+            with open(path, "r") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if not _matches(entry, model_id, user_id, start_date, end_date):
+                        continue
+                    confidence = entry.get("confidence")
+                    latency = entry.get("latency_ms")
+                    accumulate(
+                        entry.get(group_by),
+                        1,
+                        confidence,
+                        confidence is not None,
+                        latency,
+                        latency is not None,
+                        latency,
+                    )
+
+        return {
+            group: {
+                "count": int(count),
+                "mean_confidence": conf_sum / conf_n if conf_n else None,
+                "mean_latency_ms": lat_sum / lat_n if lat_n else None,
+                "max_latency_ms": lat_max,
+            }
+            for group, (count, conf_sum, conf_n, lat_sum, lat_n, lat_max) in (
+                totals.items()
+            )
+        }
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get prediction logging statistics"""
@@ -197,6 +531,10 @@ class PredictionLogger:
                 sorted(self.stats["predictions_by_hour"].items(), reverse=True)[:24]
             ),  # Last 24 hours
             "buffer_size": len(self.buffer),
+            "compacted_files": len(self.file_index),
+            "compacted_predictions": sum(
+                stats["rows"] for stats in self.file_index.values()
+            ),
             "storage_path": str(self.storage_path),
         }
 
@@ -5,17 +5,24 @@ Provides function-level profiling, bottleneck identification, and performance re
 """
 
 from mcp_server.profiling.performance import (
+    LatencyHistogram,
     PerformanceProfiler,
     profile,
     profile_async,
     ProfileResult,
 )
 from mcp_server.profiling.metrics_reporter import MetricsReporter
+from mcp_server.profiling.tool_metrics import ToolMetrics, instrument_tools
+from mcp_server.profiling.loop_monitor import LoopStallDetector
 
 __all__ = [
+    "LatencyHistogram",
     "PerformanceProfiler",
     "profile",
     "profile_async",
     "ProfileResult",
     "MetricsReporter",
+    "ToolMetrics",
+    "instrument_tools",
+    "LoopStallDetector",
 ]
@@ -0,0 +1,412 @@
+"""
+Event-Loop Stall Detector for the MCP Server
+
+A heartbeat task measures event-loop lag continuously. A watchdog thread
+notices when the heartbeat is overdue, captures the loop thread's stack while
+it is still blocked and attributes the stall to the tool running at the time.
+
+Provides:
+- Loop lag percentiles (bounded histogram)
+- Ranked worst blocking call sites with the tools that hit them
+- Span events on the active OpenTelemetry span (see distributed_tracing.py)
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from mcp_server.profiling.metrics_reporter import _escape_label, _histogram_lines
+from mcp_server.profiling.performance import DEFAULT_EXPORT_BUCKETS, LatencyHistogram
+
+try:
+    from opentelemetry import trace as otel_trace
+
+    TRACING_AVAILABLE = True
+except ImportError:
+    TRACING_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+UNATTRIBUTED_SITE = "<unattributed>"
+NO_TOOL = "<none>"
+
+# Frames under the project root (outside site-packages) are call sites we can
+# act on; deeper library frames are kept in the stack only
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+_THIS_FILE = str(Path(__file__).resolve())
+
+
+@dataclass
+class _StallCapture:
+    """Stack captured by the watchdog during one overdue heartbeat"""
+
+    beat_ns: int
+    site: str
+    stack: List[str]
+    tool: Optional[str]
+
+
+class _StallSite:
+    """Accumulated stalls for one blocking call site"""
+
+    __slots__ = ("count", "total_ns", "max_ns", "tools", "stack")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.tools: Counter = Counter()
+        self.stack: List[str] = []
+
+
+def _is_project_frame(filename: str) -> bool:
+    return (
+        filename.startswith(_PROJECT_ROOT)
+        and "site-packages" not in filename
+        and filename != _THIS_FILE
+    )
+
+
+class LoopStallDetector:
+    """
+    Measures event-loop lag and attributes stalls to call sites and tools.
+
+    Lag is how late the heartbeat's ``asyncio.sleep(interval)`` wakes up.
+    Anything over ``stall_threshold_ms`` is a stall; the watchdog polls at a
+    fraction of the threshold so the stack is captured mid-stall.
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = 50.0,
+        stall_threshold_ms: float = 100.0,
+        tool_metrics=None,
+        max_sites: int = 200,
+        stack_limit: int = 32,
+    ):
+        """
+        Initialize stall detector.
+
+        Args:
+            interval_ms: Heartbeat interval
+            stall_threshold_ms: Lag above which the loop counts as stalled
+            tool_metrics: ToolMetrics used to attribute stalls to tools
+            max_sites: Call sites retained (least total stall time evicted)
+            stack_limit: Frames captured per stall
+        """
+        if interval_ms <= 0 or stall_threshold_ms <= 0:
+            raise ValueError("interval_ms and stall_threshold_ms must be positive")
+
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self.max_sites = max_sites
+        self.stack_limit = stack_limit
+
+        self._interval_ns = int(interval_ms * 1_000_000)
+        self._threshold_ns = int(stall_threshold_ms * 1_000_000)
+        self._poll_s = max(stall_threshold_ms / 4000, 0.005)
+
+        self.lag_histogram = LatencyHistogram()
+        self.stall_count = 0
+        self._sites: Dict[str, _StallSite] = {}
+        self._tool_stalls: Counter = Counter()
+        self._lock = threading.Lock()
+
+        self._beat_ns: Optional[int] = None
+        self._capture: Optional[_StallCapture] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._users = 0
+
+        self.tool_metrics = None
+        if tool_metrics is not None:
+            self.attach(tool_metrics)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def attach(self, tool_metrics) -> None:
+        """
+        Attribute stalls to tools and emit span events for blocking steps.
+
+        Args:
+            tool_metrics: ToolMetrics instrumenting the server's tools
+        """
+        self.tool_metrics = tool_metrics
+        tool_metrics.slow_step_ns = self._threshold_ns
+        tool_metrics.on_slow_step = self._on_slow_step
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Start the heartbeat and watchdog (call from the event loop).
+
+        Starts are reference counted so concurrent sessions can share one
+        detector: it keeps running until every start has been matched by a
+        stop.
+        """
+        self._users += 1
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._task = loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-stall-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            f"Loop stall detector started (interval={self.interval_ms}ms, "
+            f"threshold={self.stall_threshold_ms}ms)"
+        )
+
+    async def stop(self, force: bool = False) -> None:
+        """
+        Release one start; stop the heartbeat and watchdog after the last.
+
+        Args:
+            force: Stop now regardless of other outstanding starts
+        """
+        self._users = 0 if force else max(self._users - 1, 0)
+        if self._users:
+            return
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._beat_ns = None
+
+    # ------------------------------------------------------------------
+    # Measurement
+    # ------------------------------------------------------------------
+
+    async def _heartbeat(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        interval_s = self._interval_ns / 1e9
+        perf_counter_ns = time.perf_counter_ns
+
+        while True:
+            beat_ns = self._beat_ns = perf_counter_ns()
+            await asyncio.sleep(interval_s)
+            lag_ns = max(perf_counter_ns() - beat_ns - self._interval_ns, 0)
+            with self._lock:
+                self.lag_histogram.add_many((lag_ns,), self._threshold_ns)
+            if lag_ns > self._threshold_ns:
+                self._record_stall(beat_ns, lag_ns)
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop's stack once per overdue beat"""
+        while not self._stopped.wait(self._poll_s):
+            beat_ns = self._beat_ns
+            if beat_ns is None or self._loop_thread_id is None:
+                continue
+            overdue_ns = time.perf_counter_ns() - beat_ns - self._interval_ns
+            capture = self._capture
+            if overdue_ns > self._threshold_ns and (
+                capture is None or capture.beat_ns != beat_ns
+            ):
+                self._capture = self._capture_stack(beat_ns)
+
+    def _capture_stack(self, beat_ns: int) -> _StallCapture:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        tool = None
+        if self.tool_metrics is not None:
+            tool = self.tool_metrics.active_tool(self._loop_thread_id)
+
+        stack: List[str] = []
+        site = None
+        while frame is not None and len(stack) < self.stack_limit:
+            code = frame.f_code
+            location = f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+            stack.append(location)
+            if site is None and _is_project_frame(code.co_filename):
+                relative = code.co_filename[len(_PROJECT_ROOT) :].lstrip("/\\")
+                site = f"{relative}:{frame.f_lineno} in {code.co_name}"
+            frame = frame.f_back
+
+        if site is None:
+            site = stack[0] if stack else UNATTRIBUTED_SITE
+        return _StallCapture(beat_ns=beat_ns, site=site, stack=stack, tool=tool)
+
+    def _current_capture(self, beat_ns: Optional[int]) -> Optional[_StallCapture]:
+        capture = self._capture
+        if capture is not None and capture.beat_ns == beat_ns:
+            return capture
+        return None
+
+    def _record_stall(self, beat_ns: int, lag_ns: int) -> None:
+        capture = self._current_capture(beat_ns)
+        site = capture.site if capture else UNATTRIBUTED_SITE
+        tool = (capture.tool if capture else None) or NO_TOOL
+
+        with self._lock:
+            self.stall_count += 1
+            self._tool_stalls[tool] += lag_ns
+
+            stats = self._sites.get(site)
+            if stats is None:
+                if len(self._sites) >= self.max_sites:
+                    evict = min(self._sites, key=lambda s: self._sites[s].total_ns)
+                    del self._sites[evict]
+                stats = self._sites[site] = _StallSite()
+            stats.count += 1
+            stats.total_ns += lag_ns
+            stats.tools[tool] += 1
+            if lag_ns >= stats.max_ns:
+                stats.max_ns = lag_ns
+                if capture:
+                    stats.stack = capture.stack
+
+        logger.warning(
+            f"Event loop stalled for {lag_ns / 1e6:.1f}ms at {site} (tool: {tool})"
+        )
+
+    def _on_slow_step(self, tool: str, step_ns: int) -> None:
+        """Runs in the blocking tool's context, so the current span is its own"""
+        if not TRACING_AVAILABLE:
+            return
+        span = otel_trace.get_current_span()
+        if not span.is_recording():
+            return
+        capture = self._current_capture(self._beat_ns)
+        span.add_event(
+            "event_loop.stall",
+            attributes={
+                "tool": tool,
+                "blocked_ms": step_ns / 1e6,
+                "site": capture.site if capture else UNATTRIBUTED_SITE,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_lag_stats(self) -> Dict[str, Any]:
+        """
+        Get event-loop lag percentiles and stall totals.
+
+        Returns:
+            Dict with lag percentiles (ms) and stall counts
+        """
+        with self._lock:
+            histogram = LatencyHistogram()
+            histogram.merge(self.lag_histogram)
+            stall_total_ns = sum(self._tool_stalls.values())
+
+        return {
+            "running": self.running,
+            "samples": histogram.count,
+            "p50_lag_ms": histogram.percentile_ns(0.5) / 1e6,
+            "p95_lag_ms": histogram.percentile_ns(0.95) / 1e6,
+            "p99_lag_ms": histogram.percentile_ns(0.99) / 1e6,
+            "max_lag_ms": histogram.max_ns / 1e6,
+            "stall_threshold_ms": self.stall_threshold_ms,
+            "stall_count": self.stall_count,
+            "stall_total_ms": stall_total_ns / 1e6,
+        }
+
+    def top_blocking_sites(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the call sites that blocked the loop longest.
+
+        Args:
+            n: Number of sites to return
+
+        Returns:
+            List of sites ranked by total stall time, with the stack of the
+            worst stall and a count of stalls per tool
+        """
+        with self._lock:
+            ranked = sorted(
+                self._sites.items(), key=lambda item: item[1].total_ns, reverse=True
+            )[:n]
+            return [
+                {
+                    "site": site,
+                    "stalls": stats.count,
+                    "total_ms": stats.total_ns / 1e6,
+                    "max_ms": stats.max_ns / 1e6,
+                    "tools": dict(stats.tools),
+                    "stack": list(stats.stack),
+                }
+                for site, stats in ranked
+            ]
+
+    def get_tool_stalls(self) -> Dict[str, float]:
+        """Total stall time (ms) attributed to each tool"""
+        with self._lock:
+            return {tool: ns / 1e6 for tool, ns in self._tool_stalls.most_common()}
+
+    def export_prometheus(
+        self, buckets: Sequence[float] = DEFAULT_EXPORT_BUCKETS, max_sites: int = 20
+    ) -> str:
+        """
+        Render loop lag and stall attribution in Prometheus text format.
+
+        Args:
+            buckets: Lag histogram upper bounds in seconds
+            max_sites: Worst call sites to export
+
+        Returns:
+            Prometheus exposition text
+        """
+        with self._lock:
+            histogram = LatencyHistogram()
+            histogram.merge(self.lag_histogram)
+
+        metric = "nba_mcp_event_loop_lag_seconds"
+        lines = [
+            f"# HELP {metric} Event loop heartbeat lag",
+            f"# TYPE {metric} histogram",
+        ]
+        lines += _histogram_lines(metric, "", histogram, buckets)
+
+        lines += [
+            "# HELP nba_mcp_event_loop_stall_seconds_total Stall time by tool",
+            "# TYPE nba_mcp_event_loop_stall_seconds_total counter",
+        ]
+        for tool, ms in sorted(self.get_tool_stalls().items()):
+            lines.append(
+                f'nba_mcp_event_loop_stall_seconds_total{{tool="{_escape_label(tool)}"}} '
+                f"{ms / 1e3}"
+            )
+
+        lines += [
+            "# HELP nba_mcp_event_loop_site_stall_seconds_total Stall time by call site",
+            "# TYPE nba_mcp_event_loop_site_stall_seconds_total counter",
+        ]
+        for site in self.top_blocking_sites(max_sites):
+            lines.append(
+                "nba_mcp_event_loop_site_stall_seconds_total"
+                f'{{site="{_escape_label(site["site"])}"}} {site["total_ms"] / 1e3}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear lag samples and stall attribution"""
+        with self._lock:
+            self.lag_histogram.clear()
+            self.stall_count = 0
+            self._sites.clear()
+            self._tool_stalls.clear()
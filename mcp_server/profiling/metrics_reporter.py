@@ -7,13 +7,35 @@ Generates reports, exports data, and creates performance dashboards.
 import json
 import csv
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from datetime import datetime
 from pathlib import Path
 
+from mcp_server.profiling.performance import DEFAULT_EXPORT_BUCKETS
+
 logger = logging.getLogger(__name__)
 
 
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(
+    metric_name: str, labels: str, histogram, buckets: Sequence[float]
+) -> List[str]:
+    """Prometheus sample lines for one LatencyHistogram (labels may be empty)"""
+    prefix = f"{labels}," if labels else ""
+    lines = [
+        f'{metric_name}_bucket{{{prefix}le="{bound}"}} {count}'
+        for bound, count in zip(buckets, histogram.cumulative_counts(buckets))
+    ]
+    lines.append(f'{metric_name}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+    lines.append(f"{metric_name}_sum{{{labels}}} {histogram.total_ns / 1e9}")
+    lines.append(f"{metric_name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
 class MetricsReporter:
     """
     Generates performance reports and exports metrics data.
@@ -50,6 +72,7 @@ class MetricsReporter:
                 "timestamp": datetime.now().isoformat(),
                 "summary": self.profiler.get_summary(),
                 "function_stats": self.profiler.get_all_stats(),
+                "tool_stats": self.profiler.get_tool_stats(),
                 "slowest_functions": self.profiler.get_slowest_functions(),
                 "most_called_functions": self.profiler.get_most_called_functions(),
                 "bottlenecks": self.profiler.identify_bottlenecks(),
@@ -80,6 +103,37 @@ class MetricsReporter:
             logger.error(f"Failed to export metrics to JSON: {e}")
             return False
 
+    def export_prometheus(
+        self,
+        buckets: Sequence[float] = DEFAULT_EXPORT_BUCKETS,
+        metric_name: str = "nba_mcp_profile_duration_seconds",
+        kinds: Sequence[str] = ("function", "tool"),
+        description: str = "Profiled call latency by function and MCP tool",
+    ) -> str:
+        """
+        Render function and tool latency histograms in Prometheus text format.
+
+        Args:
+            buckets: Histogram upper bounds in seconds
+            metric_name: Exported metric name
+            kinds: Histogram families to include
+            description: HELP text for the metric
+
+        Returns:
+            Prometheus exposition text
+        """
+        lines = [
+            f"# HELP {metric_name} {description}",
+            f"# TYPE {metric_name} histogram",
+        ]
+
+        for kind in kinds:
+            for name, histogram in sorted(self.profiler.get_histograms(kind).items()):
+                labels = f'kind="{kind}",name="{_escape_label(name)}"'
+                lines += _histogram_lines(metric_name, labels, histogram, buckets)
+
+        return "\n".join(lines) + "\n"
+
     def export_to_csv(self, output_path: str) -> bool:
         """
         Export aggregated function stats to CSV file.
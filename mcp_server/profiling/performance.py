@@ -2,17 +2,30 @@
 Performance Profiling for Function-Level Analysis
 
 Provides decorators and tools for profiling execution time and memory usage.
+
+Every call is timed into a fixed-size, HDR-style latency histogram, so
+profiling can stay on in production: the hot path only appends the elapsed
+nanoseconds to a per-thread buffer, which is folded into the histogram in
+vectorized batches.  Full ``ProfileResult`` samples - with memory and
+optional stack capture - are taken for 1 in ``sample_every`` calls and kept
+in a bounded buffer per function.
 """
 
 import time
 import logging
 import functools
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+import sys
+import threading
+import weakref
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Callable, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import tracemalloc
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +45,202 @@ class ProfileResult:
     timestamp: datetime = field(default_factory=datetime.now)
     args_sample: Optional[tuple] = None
     kwargs_sample: Optional[Dict] = None
+    stack: Optional[List[str]] = None
+
+
+# ==============================================================================
+# Latency Histograms
+# ==============================================================================
+
+# Log-linear buckets: 32 linear sub-buckets per power of two (~3% relative
+# error), covering 1ns to ~38 minutes in 1216 fixed slots; longer latencies
+# land in the last slot.
+_SUB_BUCKET_BITS = 5
+_MAX_SHIFT = 36
+_N_BUCKETS = (_MAX_SHIFT + 2) << _SUB_BUCKET_BITS
+
+# Buffered latencies per thread and function before a histogram fold
+_FOLD_SIZE = 1024
+
+# Default Prometheus bucket bounds (seconds)
+DEFAULT_EXPORT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _bucket_index(elapsed_ns: np.ndarray) -> np.ndarray:
+    """Histogram slot for each latency"""
+    _, bit_length = np.frexp(elapsed_ns.astype(np.float64))
+    shift = np.maximum(bit_length - (_SUB_BUCKET_BITS + 1), 0)
+    index = (shift << _SUB_BUCKET_BITS) + (elapsed_ns >> shift)
+    return np.minimum(index, _N_BUCKETS - 1)
+
+
+def _bucket_midpoints() -> np.ndarray:
+    """Representative latency (ns) of every slot"""
+    index = np.arange(_N_BUCKETS, dtype=np.int64)
+    shift = np.maximum((index >> _SUB_BUCKET_BITS) - 1, 0)
+    low = (index - (shift << _SUB_BUCKET_BITS)) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+_BUCKET_MIDPOINTS = _bucket_midpoints()
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear (HDR-style) histogram of nanosecond latencies.
+
+    Count, total, min, max and slow-call counts are exact; percentiles are
+    accurate to the bucket width (~3%).  Instances are not locked - the
+    profiler gives each thread its own and merges them on read.
+    """
+
+    __slots__ = ("counts", "count", "total_ns", "min_ns", "max_ns", "slow")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Zero the histogram in place"""
+        self.counts = np.zeros(_N_BUCKETS, dtype=np.int64)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+        self.slow = 0
+
+    def add_many(self, elapsed_ns: Sequence[int], slow_ns: Optional[int] = None):
+        """
+        Record a batch of latencies.
+
+        Args:
+            elapsed_ns: Non-negative latencies in nanoseconds
+            slow_ns: Optional threshold above which calls count as slow
+        """
+        values = np.asarray(elapsed_ns, dtype=np.int64)
+        if not len(values):
+            return
+        values = np.maximum(values, 0)
+
+        self.counts += np.bincount(_bucket_index(values), minlength=_N_BUCKETS)
+        self.count += len(values)
+        self.total_ns += int(values.sum())
+        low, high = int(values.min()), int(values.max())
+        self.min_ns = low if self.min_ns is None else min(self.min_ns, low)
+        self.max_ns = max(self.max_ns, high)
+        if slow_ns is not None:
+            self.slow += int(np.count_nonzero(values > slow_ns))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one"""
+        if not other.count:
+            return
+        self.counts = self.counts + other.counts
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.min_ns = (
+            other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+        )
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.slow += other.slow
+
+    def percentile_ns(self, q: float) -> float:
+        """Latency at quantile ``q`` (0-1), clamped to the observed range"""
+        if not self.count:
+            return 0.0
+        rank = min(max(1, int(round(q * self.count))), self.count)
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return float(np.clip(_BUCKET_MIDPOINTS[index], self.min_ns, self.max_ns))
+
+    def cumulative_counts(self, bounds_seconds: Sequence[float]) -> List[int]:
+        """Cumulative counts at each upper bound (Prometheus ``le`` buckets)"""
+        cumulative = np.cumsum(self.counts)
+        positions = np.searchsorted(
+            _BUCKET_MIDPOINTS, np.asarray(bounds_seconds) * 1e9, side="right"
+        )
+        return [int(cumulative[p - 1]) if p else 0 for p in positions]
+
+
+class _CallBuffer:
+    """One thread's pending latencies and folded histogram for a function"""
+
+    __slots__ = ("pending", "histogram", "seen")
+
+    def __init__(self):
+        self.pending: List[int] = []
+        self.histogram = LatencyHistogram()
+        # Calls buffered so far; drives sampling (pending is emptied on fold)
+        self.seen = 0
+
+    def fold(self, slow_ns: int) -> None:
+        pending, self.pending = self.pending, []
+        self.histogram.add_many(pending, slow_ns)
+
+
+class _ShardOwner:
+    """Weak-referenceable marker kept in a thread's locals"""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(profiler_ref, shard) -> None:
+    profiler = profiler_ref()
+    if profiler is not None:
+        profiler._retire(shard)
+
+
+# ==============================================================================
+# Sampled Memory Tracking
+# ==============================================================================
+
+# tracemalloc is process-global: sampled calls share one tracing session
+# (reference counted) instead of each starting/stopping it, so nested and
+# concurrent sampled calls cannot stop tracing underneath each other.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _memory_begin() -> int:
+    """Join the shared tracing session; returns current traced bytes"""
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0:
+            _tracemalloc_owned = not tracemalloc.is_tracing()
+            if _tracemalloc_owned:
+                tracemalloc.start()
+        _tracemalloc_users += 1
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _memory_end(before: int) -> Tuple[float, float]:
+    """Leave the tracing session; returns (peak_mb, delta_mb)"""
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+    return peak / (1024 * 1024), (current - before) / (1024 * 1024)
+
+
+# ==============================================================================
+# Profiler
+# ==============================================================================
 
 
 class PerformanceProfiler:
@@ -39,8 +248,8 @@ class PerformanceProfiler:
     Tracks and analyzes function performance across the application.
 
     Features:
-    - Execution time tracking
-    - Memory profiling
+    - Execution time tracking (bounded latency histograms per function/tool)
+    - Sampled memory profiling and stack capture
     - Call count statistics
     - Bottleneck identification
     """
@@ -50,58 +259,212 @@ class PerformanceProfiler:
         enabled: bool = True,
         track_memory: bool = False,
         slow_threshold_ms: float = 100.0,
+        sample_every: int = 1,
+        max_samples: int = 1000,
+        capture_stacks: bool = False,
     ):
         """
         Initialize performance profiler.
 
         Args:
             enabled: Enable/disable profiling
-            track_memory: Track memory usage (adds overhead)
+            track_memory: Track memory usage on sampled calls (adds overhead)
             slow_threshold_ms: Threshold for flagging slow functions
+            sample_every: Keep a full ProfileResult for 1 in N calls
+            max_samples: ProfileResults retained per function
+            capture_stacks: Capture the call stack on sampled calls
         """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+
         self.enabled = enabled
         self.track_memory = track_memory
         self.slow_threshold_ms = slow_threshold_ms
+        self.sample_every = sample_every
+        self.max_samples = max_samples
+        self.capture_stacks = capture_stacks
 
-        # Profile storage
-        self.profiles: Dict[str, List[ProfileResult]] = {}
+        # Sampled profile results (bounded per function)
+        self.profiles: Dict[str, Deque[ProfileResult]] = {}
 
-        # Aggregate statistics
-        self.total_calls = 0
-        self.total_time_ms = 0.0
+        # Per-thread {(kind, name): _CallBuffer} shards, merged on read.
+        # When a thread exits its shard is folded into the first, shared
+        # shard, so short-lived worker threads do not accumulate.
+        self._local = threading.local()
+        self._retired: Dict[Tuple[str, str], _CallBuffer] = {}
+        self._shards: List[Dict[Tuple[str, str], _CallBuffer]] = [self._retired]
+        self._shards_lock = threading.Lock()
 
         logger.info(
             f"PerformanceProfiler initialized (enabled={enabled}, "
-            f"memory_tracking={track_memory}, slow_threshold={slow_threshold_ms}ms)"
+            f"memory_tracking={track_memory}, slow_threshold={slow_threshold_ms}ms, "
+            f"sample_every={sample_every})"
+        )
+
+    @classmethod
+    def production(
+        cls,
+        sample_every: int = 1000,
+        max_samples: int = 256,
+        slow_threshold_ms: float = 1000.0,
+    ) -> "PerformanceProfiler":
+        """
+        Profiler configured to stay on in production.
+
+        Every call is counted in the histograms; memory and stacks are only
+        captured for 1 in ``sample_every`` calls.
+        """
+        return cls(
+            enabled=True,
+            track_memory=True,
+            slow_threshold_ms=slow_threshold_ms,
+            sample_every=sample_every,
+            max_samples=max_samples,
+            capture_stacks=True,
         )
 
-    def record(self, result: ProfileResult):
+    @property
+    def slow_threshold_ms(self) -> float:
+        return self._slow_threshold_ms
+
+    @slow_threshold_ms.setter
+    def slow_threshold_ms(self, value: float):
+        self._slow_threshold_ms = value
+        self._slow_ns = int(value * 1_000_000)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _calls(self, name: str, kind: str = "function") -> _CallBuffer:
+        """This thread's call buffer for (kind, name)"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            # The owner is dropped with this thread's locals
+            owner = self._local.owner = _ShardOwner()
+            weakref.finalize(owner, _retire_shard, weakref.ref(self), shard)
+            with self._shards_lock:
+                self._shards.append(shard)
+
+        key = (kind, name)
+        calls = shard.get(key)
+        if calls is None:
+            calls = shard[key] = _CallBuffer()
+        return calls
+
+    def _should_sample(self, calls: _CallBuffer) -> bool:
+        return calls.seen % self.sample_every == 0
+
+    def _after_call(self, calls: _CallBuffer, name: str, elapsed_ns: int, kind: str):
+        """Slow path once a call is buffered: fold and/or warn"""
+        if len(calls.pending) >= _FOLD_SIZE:
+            calls.fold(self._slow_ns)
+
+        # Log slow functions
+        if elapsed_ns > self._slow_ns:
+            logger.warning(
+                f"Slow {kind} detected: {name} took {elapsed_ns / 1e6:.2f}ms "
+                f"(threshold: {self.slow_threshold_ms}ms)"
+            )
+
+    def observe(self, name: str, elapsed_ns: int, kind: str = "function") -> None:
+        """
+        Record one call's latency (the always-on path).
+
+        Args:
+            name: Function or tool name
+            elapsed_ns: Elapsed time in nanoseconds
+            kind: Histogram family, e.g. "function" or "tool"
+        """
+        if not self.enabled:
+            return
+
+        calls = self._calls(name, kind)
+        calls.pending.append(elapsed_ns)
+        calls.seen += 1
+        self._after_call(calls, name, elapsed_ns, kind)
+
+    def record(self, result: ProfileResult, kind: str = "function"):
         """
         Record a profile result.
 
         Args:
             result: ProfileResult to record
+            kind: Histogram family, e.g. "function" or "tool"
         """
         if not self.enabled:
             return
 
-        func_name = result.function_name
+        self.observe(
+            result.function_name,
+            int(round(result.execution_time_ms * 1_000_000)),
+            kind,
+        )
 
-        if func_name not in self.profiles:
-            self.profiles[func_name] = []
+        samples = self.profiles.get(result.function_name)
+        if samples is None:
+            samples = self.profiles.setdefault(
+                result.function_name, deque(maxlen=self.max_samples)
+            )
+        samples.append(result)
 
-        self.profiles[func_name].append(result)
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
 
-        # Update aggregate stats
-        self.total_calls += 1
-        self.total_time_ms += result.execution_time_ms
+    def get_histograms(self, kind: str = "function") -> Dict[str, LatencyHistogram]:
+        """
+        Merge the per-thread histograms and pending latencies of one family.
 
-        # Log slow functions
-        if result.execution_time_ms > self.slow_threshold_ms:
-            logger.warning(
-                f"Slow function detected: {func_name} took {result.execution_time_ms:.2f}ms "
-                f"(threshold: {self.slow_threshold_ms}ms)"
-            )
+        Args:
+            kind: Histogram family, e.g. "function" or "tool"
+
+        Returns:
+            Dict of {name: merged LatencyHistogram}
+        """
+        merged: Dict[str, LatencyHistogram] = {}
+        # Held while merging so a thread retiring its shard is seen once
+        with self._shards_lock:
+            for shard in self._shards:
+                for (shard_kind, name), calls in shard.copy().items():
+                    if shard_kind != kind:
+                        continue
+                    if name not in merged:
+                        merged[name] = LatencyHistogram()
+                    merged[name].merge(calls.histogram)
+                    merged[name].add_many(list(calls.pending), self._slow_ns)
+        return {name: h for name, h in merged.items() if h.count}
+
+    def _retire(self, shard: Dict[Tuple[str, str], _CallBuffer]) -> None:
+        """Fold an exited thread's shard into the retired shard"""
+        with self._shards_lock:
+            self._shards = [s for s in self._shards if s is not shard]
+            for key, calls in shard.items():
+                calls.fold(self._slow_ns)
+                retired = self._retired.get(key)
+                if retired is None:
+                    retired = self._retired[key] = _CallBuffer()
+                retired.histogram.merge(calls.histogram)
+
+    def _stats_from_histogram(
+        self, name: str, histogram: LatencyHistogram
+    ) -> Dict[str, Any]:
+        samples = self.profiles.get(name)
+        return {
+            "function_name": name,
+            "call_count": histogram.count,
+            "total_time_ms": histogram.total_ns / 1e6,
+            "avg_time_ms": histogram.total_ns / histogram.count / 1e6,
+            "min_time_ms": histogram.min_ns / 1e6,
+            "max_time_ms": histogram.max_ns / 1e6,
+            "median_time_ms": histogram.percentile_ns(0.5) / 1e6,
+            "p95_time_ms": histogram.percentile_ns(0.95) / 1e6,
+            "p99_time_ms": histogram.percentile_ns(0.99) / 1e6,
+            "slow_calls": histogram.slow,
+            "last_called": samples[-1].timestamp.isoformat() if samples else None,
+        }
 
     def get_function_stats(self, function_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -113,38 +476,29 @@ class PerformanceProfiler:
         Returns:
             Dict with aggregated stats or None if not profiled
         """
-        if function_name not in self.profiles:
+        histogram = self.get_histograms().get(function_name)
+        if histogram is None:
             return None
+        return self._stats_from_histogram(function_name, histogram)
 
-        results = self.profiles[function_name]
-
-        execution_times = [r.execution_time_ms for r in results]
-
-        return {
-            "function_name": function_name,
-            "call_count": len(results),
-            "total_time_ms": sum(execution_times),
-            "avg_time_ms": sum(execution_times) / len(results),
-            "min_time_ms": min(execution_times),
-            "max_time_ms": max(execution_times),
-            "median_time_ms": sorted(execution_times)[len(execution_times) // 2],
-            "slow_calls": sum(1 for t in execution_times if t > self.slow_threshold_ms),
-            "last_called": results[-1].timestamp.isoformat(),
-        }
-
-    def get_all_stats(self) -> Dict[str, Any]:
+    def get_all_stats(self, kind: str = "function") -> Dict[str, Any]:
         """
         Get statistics for all profiled functions.
 
+        Args:
+            kind: Histogram family, e.g. "function" or "tool"
+
         Returns:
             Dict with stats for each function
         """
-        stats = {}
-
-        for func_name in self.profiles.keys():
-            stats[func_name] = self.get_function_stats(func_name)
+        return {
+            name: self._stats_from_histogram(name, histogram)
+            for name, histogram in self.get_histograms(kind).items()
+        }
 
-        return stats
+    def get_tool_stats(self) -> Dict[str, Any]:
+        """Get statistics for all profiled MCP tools"""
+        return self.get_all_stats(kind="tool")
 
     def get_slowest_functions(self, n: int = 10) -> List[Dict[str, Any]]:
         """
@@ -250,22 +604,49 @@ class PerformanceProfiler:
     def reset(self):
         """Reset all profiling data"""
         self.profiles.clear()
-        self.total_calls = 0
-        self.total_time_ms = 0.0
+        # Reset in place: decorated functions keep references to call buffers
+        with self._shards_lock:
+            for shard in self._shards:
+                for calls in shard.copy().values():
+                    calls.pending = []
+                    calls.seen = 0
+                    calls.histogram.clear()
         logger.info("Profiling data reset")
 
+    def _totals(self) -> Tuple[int, int]:
+        histograms = list(self.get_histograms().values())
+        histograms += self.get_histograms("tool").values()
+        return (
+            sum(h.count for h in histograms),
+            sum(h.total_ns for h in histograms),
+        )
+
+    @property
+    def total_calls(self) -> int:
+        """Calls recorded across all functions and tools"""
+        return self._totals()[0]
+
+    @property
+    def total_time_ms(self) -> float:
+        """Time recorded across all functions and tools"""
+        return self._totals()[1] / 1e6
+
     def get_summary(self) -> Dict[str, Any]:
         """Get overall profiling summary"""
+        total_calls, total_ns = self._totals()
+        total_time_ms = total_ns / 1e6
         return {
             "enabled": self.enabled,
-            "total_functions_profiled": len(self.profiles),
-            "total_calls": self.total_calls,
-            "total_time_ms": self.total_time_ms,
+            "total_functions_profiled": len(self.get_histograms()),
+            "total_tools_profiled": len(self.get_histograms("tool")),
+            "total_calls": total_calls,
+            "total_time_ms": total_time_ms,
             "avg_time_per_call_ms": (
-                self.total_time_ms / self.total_calls if self.total_calls > 0 else 0.0
+                total_time_ms / total_calls if total_calls > 0 else 0.0
             ),
             "slow_threshold_ms": self.slow_threshold_ms,
             "memory_tracking": self.track_memory,
+            "sample_every": self.sample_every,
         }
 
 
@@ -278,15 +659,51 @@ def get_profiler() -> PerformanceProfiler:
     return _global_profiler
 
 
+def _capture_stack(skip: int = 2, limit: int = 16) -> List[str]:
+    """Cheap ``file:line in function`` stack (no source line lookups)"""
+    frames = []
+    frame = sys._getframe(skip)
+    while frame is not None and len(frames) < limit:
+        code = frame.f_code
+        frames.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+    return frames
+
+
+def _sampled_result(
+    prof: PerformanceProfiler,
+    name: str,
+    elapsed_ns: int,
+    memory: Optional[Tuple[float, float]],
+    args: tuple,
+    kwargs: dict,
+) -> ProfileResult:
+    return ProfileResult(
+        function_name=name,
+        execution_time_ms=elapsed_ns / 1e6,
+        memory_peak_mb=memory[0] if memory else None,
+        memory_delta_mb=memory[1] if memory else None,
+        args_sample=args[:3] if args else None,  # First 3 args
+        kwargs_sample=dict(list(kwargs.items())[:3]) if kwargs else None,
+        stack=_capture_stack(skip=3) if prof.capture_stacks else None,
+    )
+
+
 def profile(
     func: Optional[Callable] = None,
     *,
     profiler: Optional[PerformanceProfiler] = None,
     track_memory: bool = False,
+    name: Optional[str] = None,
+    kind: str = "function",
 ):
     """
     Decorator to profile a synchronous function.
 
+    Unsampled calls only buffer their latency for the histogram; 1 in
+    ``sample_every`` calls also records a full ProfileResult (with memory
+    when tracked).
+
     Usage:
         @profile
         def my_function():
@@ -299,10 +716,16 @@ def profile(
     Args:
         func: Function to profile (when used without parentheses)
         profiler: Custom profiler instance (uses global if None)
-        track_memory: Track memory usage for this function
+        track_memory: Track memory usage for this function's sampled calls
+        name: Name to record under (defaults to module.function)
+        kind: Histogram family, e.g. "function" or "tool"
     """
 
     def decorator(f):
+        func_name = name or f"{f.__module__}.{f.__name__}"
+        perf_counter_ns = time.perf_counter_ns
+        local = threading.local()  # this thread's call buffer for f
+
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
             prof = profiler or _global_profiler
@@ -310,51 +733,39 @@ def profile(
             if not prof.enabled:
                 return f(*args, **kwargs)
 
-            # Start memory tracking if enabled
-            if track_memory or prof.track_memory:
-                tracemalloc.start()
-                snapshot_before = tracemalloc.take_snapshot()
-
-            # Time execution
-            start_time = time.time()
+            try:
+                calls = local.calls
+            except AttributeError:
+                calls = local.calls = prof._calls(func_name, kind)
+
+            if calls.seen % prof.sample_every:
+                # Fast path: buffer the latency only
+                start_ns = perf_counter_ns()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    elapsed_ns = perf_counter_ns() - start_ns
+                    pending = calls.pending
+                    pending.append(elapsed_ns)
+                    calls.seen += 1
+                    if len(pending) >= _FOLD_SIZE or elapsed_ns > prof._slow_ns:
+                        prof._after_call(calls, func_name, elapsed_ns, kind)
+
+            tracking = track_memory or prof.track_memory
+            memory_before = _memory_begin() if tracking else 0
+            start_ns = perf_counter_ns()
 
             try:
-                result = f(*args, **kwargs)
-                return result
+                return f(*args, **kwargs)
 
             finally:
-                execution_time_ms = (time.time() - start_time) * 1000
-
-                # Get memory stats if tracking
-                memory_peak_mb = None
-                memory_delta_mb = None
-
-                if track_memory or prof.track_memory:
-                    snapshot_after = tracemalloc.take_snapshot()
-                    top_stats = snapshot_after.compare_to(snapshot_before, "lineno")
-
-                    if top_stats:
-                        memory_delta_mb = sum(stat.size_diff for stat in top_stats) / (
-                            1024 * 1024
-                        )
-
-                    current, peak = tracemalloc.get_traced_memory()
-                    memory_peak_mb = peak / (1024 * 1024)
-
-                    tracemalloc.stop()
-
-                # Record result
-                profile_result = ProfileResult(
-                    function_name=f"{f.__module__}.{f.__name__}",
-                    execution_time_ms=execution_time_ms,
-                    memory_peak_mb=memory_peak_mb,
-                    memory_delta_mb=memory_delta_mb,
-                    args_sample=args[:3] if args else None,  # First 3 args
-                    kwargs_sample=dict(list(kwargs.items())[:3]) if kwargs else None,
+                elapsed_ns = perf_counter_ns() - start_ns
+                memory = _memory_end(memory_before) if tracking else None
+                prof.record(
+                    _sampled_result(prof, func_name, elapsed_ns, memory, args, kwargs),
+                    kind,
                 )
 
-                prof.record(profile_result)
-
         return wrapper
 
     # Handle both @profile and @profile()
@@ -369,10 +780,16 @@ def profile_async(
     *,
     profiler: Optional[PerformanceProfiler] = None,
     track_memory: bool = False,
+    name: Optional[str] = None,
+    kind: str = "function",
 ):
     """
     Decorator to profile an async function.
 
+    Latency is wall time across awaits.  The call buffer is looked up after
+    the await, so concurrent tasks and coroutines resumed on another thread
+    only ever append to the current thread's buffer.
+
     Usage:
         @profile_async
         async def my_async_function():
@@ -381,10 +798,15 @@ def profile_async(
     Args:
         func: Function to profile
         profiler: Custom profiler instance
-        track_memory: Track memory usage
+        track_memory: Track memory usage on sampled calls
+        name: Name to record under (defaults to module.function)
+        kind: Histogram family, e.g. "function" or "tool"
     """
 
     def decorator(f):
+        func_name = name or f"{f.__module__}.{f.__name__}"
+        perf_counter_ns = time.perf_counter_ns
+
         @functools.wraps(f)
         async def wrapper(*args, **kwargs):
             prof = profiler or _global_profiler
@@ -392,51 +814,29 @@ def profile_async(
             if not prof.enabled:
                 return await f(*args, **kwargs)
 
-            # Start memory tracking if enabled
-            if track_memory or prof.track_memory:
-                tracemalloc.start()
-                snapshot_before = tracemalloc.take_snapshot()
+            if not prof._should_sample(prof._calls(func_name, kind)):
+                # Fast path: buffer the latency only
+                start_ns = perf_counter_ns()
+                try:
+                    return await f(*args, **kwargs)
+                finally:
+                    prof.observe(func_name, perf_counter_ns() - start_ns, kind)
 
-            # Time execution
-            start_time = time.time()
+            tracking = track_memory or prof.track_memory
+            memory_before = _memory_begin() if tracking else 0
+            start_ns = perf_counter_ns()
 
             try:
-                result = await f(*args, **kwargs)
-                return result
+                return await f(*args, **kwargs)
 
             finally:
-                execution_time_ms = (time.time() - start_time) * 1000
-
-                # Get memory stats if tracking
-                memory_peak_mb = None
-                memory_delta_mb = None
-
-                if track_memory or prof.track_memory:
-                    snapshot_after = tracemalloc.take_snapshot()
-                    top_stats = snapshot_after.compare_to(snapshot_before, "lineno")
-
-                    if top_stats:
-                        memory_delta_mb = sum(stat.size_diff for stat in top_stats) / (
-                            1024 * 1024
-                        )
-
-                    current, peak = tracemalloc.get_traced_memory()
-                    memory_peak_mb = peak / (1024 * 1024)
-
-                    tracemalloc.stop()
-
-                # Record result
-                profile_result = ProfileResult(
-                    function_name=f"{f.__module__}.{f.__name__}",
-                    execution_time_ms=execution_time_ms,
-                    memory_peak_mb=memory_peak_mb,
-                    memory_delta_mb=memory_delta_mb,
-                    args_sample=args[:3] if args else None,
-                    kwargs_sample=dict(list(kwargs.items())[:3]) if kwargs else None,
+                elapsed_ns = perf_counter_ns() - start_ns
+                memory = _memory_end(memory_before) if tracking else None
+                prof.record(
+                    _sampled_result(prof, func_name, elapsed_ns, memory, args, kwargs),
+                    kind,
                 )
 
-                prof.record(profile_result)
-
         return wrapper
 
     # Handle both @profile_async and @profile_async()
@@ -0,0 +1,563 @@
+"""
+Per-Tool Instrumentation for FastMCP Tools
+
+Wraps every tool once, at registration, to record:
+- Wall latency, CPU time and event-loop blocking time (bounded histograms)
+- Request/response payload sizes (sampled)
+- Concurrency (in-flight and peak) and errors by exception class
+
+Results feed the PerformanceProfiler histograms, Prometheus exposition and a
+"top slow tools" query.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_server.profiling.metrics_reporter import MetricsReporter, _escape_label
+from mcp_server.profiling.performance import PerformanceProfiler, get_profiler
+
+logger = logging.getLogger(__name__)
+
+# Histogram families recorded in the profiler for each tool
+WALL_KIND = "tool"
+CPU_KIND = "tool_cpu"
+BLOCKING_KIND = "tool_blocking"
+
+SLOW_TOOL_ORDERINGS = {
+    "p95": "p95_time_ms",
+    "p99": "p99_time_ms",
+    "avg": "avg_time_ms",
+    "total": "total_time_ms",
+    "blocking": "blocking_p95_ms",
+    "cpu": "cpu_p95_ms",
+}
+
+
+def _payload_bytes(value: Any) -> int:
+    """Approximate serialized size of a tool argument or result"""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="replace"))
+    if hasattr(value, "model_dump_json"):
+        return len(value.model_dump_json())
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+def _is_context_parameter(parameter: inspect.Parameter) -> bool:
+    annotation = parameter.annotation
+    return getattr(annotation, "__name__", annotation) == "Context"
+
+
+class _ToolCounters:
+    """Non-histogram state for one tool"""
+
+    __slots__ = (
+        "calls",
+        "in_flight",
+        "peak_in_flight",
+        "errors",
+        "request_bytes",
+        "response_bytes",
+        "sized_calls",
+        "max_response_bytes",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self.errors: Counter = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.sized_calls = 0
+        self.max_response_bytes = 0
+
+
+class _SteppedCoroutine:
+    """
+    Await a coroutine while timing each step it runs on the event loop.
+
+    Each ``send``/``throw`` is the coroutine holding the loop until its next
+    suspension, so the sum of step times is how long the tool blocked other
+    tasks, and the thread CPU time over those steps is the tool's own CPU
+    time (other tasks run between steps, not during them).
+    """
+
+    __slots__ = ("coro", "name", "metrics", "blocking_ns", "cpu_ns")
+
+    def __init__(self, coro, name: str, metrics: "ToolMetrics"):
+        self.coro = coro
+        self.name = name
+        self.metrics = metrics
+        self.blocking_ns = 0
+        self.cpu_ns = 0
+
+    def __await__(self):
+        coro, name, metrics = self.coro, self.name, self.metrics
+        value, error = None, None
+        perf_counter_ns = time.perf_counter_ns
+        thread_time_ns = time.thread_time_ns
+
+        while True:
+            active = metrics._enter(name)
+            wall_start, cpu_start = perf_counter_ns(), thread_time_ns()
+            try:
+                if error is None:
+                    yielded = coro.send(value)
+                else:
+                    yielded = coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                step_ns = perf_counter_ns() - wall_start
+                self.blocking_ns += step_ns
+                self.cpu_ns += thread_time_ns() - cpu_start
+                metrics._exit(active, name, step_ns)
+
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class ToolMetrics:
+    """
+    Collects per-tool metrics for an MCP server.
+
+    Latency histograms live in the PerformanceProfiler (kinds "tool",
+    "tool_cpu" and "tool_blocking"), so they share its bounded storage and
+    Prometheus export; concurrency, errors and payload sizes are kept here.
+    """
+
+    def __init__(
+        self,
+        profiler: Optional[PerformanceProfiler] = None,
+        size_sample_every: int = 100,
+    ):
+        """
+        Initialize tool metrics.
+
+        Args:
+            profiler: Profiler holding the histograms (uses global if None)
+            size_sample_every: Measure payload sizes for 1 in N calls
+        """
+        if size_sample_every < 1:
+            raise ValueError("size_sample_every must be at least 1")
+
+        self.profiler = profiler or get_profiler()
+        self.size_sample_every = size_sample_every
+        self._counters: Dict[str, _ToolCounters] = {}
+        self._lock = threading.Lock()
+
+        # {thread id: tool currently running on it}, read by stall detectors
+        self._active: Dict[int, str] = {}
+
+        # Called (in the tool's own context) when one uninterrupted step of a
+        # tool holds its thread longer than slow_step_ns
+        self.slow_step_ns: Optional[int] = None
+        self.on_slow_step: Optional[Callable[[str, int], None]] = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _begin(self, name: str) -> Tuple[_ToolCounters, bool]:
+        """Count a call in flight; returns (counters, size this call?)"""
+        with self._lock:
+            counters = self._counters.get(name)
+            if counters is None:
+                counters = self._counters[name] = _ToolCounters()
+            sized = counters.calls % self.size_sample_every == 0
+            counters.calls += 1
+            counters.in_flight += 1
+            if counters.in_flight > counters.peak_in_flight:
+                counters.peak_in_flight = counters.in_flight
+            return counters, sized
+
+    def _enter(self, name: str) -> Tuple[int, Optional[str]]:
+        """Mark ``name`` as running on this thread; returns the previous owner"""
+        thread_id = threading.get_ident()
+        previous = self._active.get(thread_id)
+        self._active[thread_id] = name
+        return thread_id, previous
+
+    def _exit(self, active: Tuple[int, Optional[str]], name: str, step_ns: int):
+        thread_id, previous = active
+        if previous is None:
+            self._active.pop(thread_id, None)
+        else:
+            self._active[thread_id] = previous
+
+        if self.slow_step_ns is not None and step_ns > self.slow_step_ns:
+            try:
+                self.on_slow_step(name, step_ns)
+            except Exception:  # listeners must never fail the tool call
+                logger.debug(f"Slow-step listener failed for {name}", exc_info=True)
+
+    def active_tool(self, thread_id: int) -> Optional[str]:
+        """
+        Tool currently holding a thread (e.g. the event loop thread).
+
+        Args:
+            thread_id: Thread identifier (``threading.get_ident()``)
+
+        Returns:
+            Tool name, or None when no instrumented tool is running there
+        """
+        return self._active.get(thread_id)
+
+    def _end(
+        self,
+        name: str,
+        counters: _ToolCounters,
+        wall_ns: int,
+        cpu_ns: int,
+        blocking_ns: int,
+        error: Optional[BaseException],
+        request_bytes: Optional[int],
+        result: Any,
+    ) -> None:
+        response_bytes = None
+        if request_bytes is not None and error is None:
+            try:
+                response_bytes = _payload_bytes(result)
+            except Exception:  # sizing must never fail the tool call
+                logger.debug(f"Could not size response of {name}", exc_info=True)
+
+        with self._lock:
+            counters.in_flight -= 1
+            if error is not None:
+                counters.errors[type(error).__name__] += 1
+            if response_bytes is not None:
+                counters.sized_calls += 1
+                counters.request_bytes += request_bytes
+                counters.response_bytes += response_bytes
+                counters.max_response_bytes = max(
+                    counters.max_response_bytes, response_bytes
+                )
+
+        profiler = self.profiler
+        profiler.observe(name, wall_ns, WALL_KIND)
+        profiler.observe(name, cpu_ns, CPU_KIND)
+        profiler.observe(name, blocking_ns, BLOCKING_KIND)
+
+    def _request_bytes(self, name, context_params, args, kwargs) -> Optional[int]:
+        """Size the tool arguments, skipping the injected Context"""
+        try:
+            payload = list(args)
+            payload += [v for k, v in kwargs.items() if k not in context_params]
+            return sum(_payload_bytes(value) for value in payload)
+        except Exception:
+            logger.debug(f"Could not size request of {name}", exc_info=True)
+            return None
+
+    def instrument(self, fn: Callable, name: Optional[str] = None) -> Callable:
+        """
+        Wrap a tool function so every call is measured.
+
+        The wrapper keeps the original signature (via ``functools.wraps``) so
+        MCP argument parsing and Context injection are unaffected.
+
+        Args:
+            fn: Tool function (sync or async)
+            name: Tool name (defaults to the function name)
+
+        Returns:
+            Instrumented function
+        """
+        tool_name = name or fn.__name__
+        context_params = {
+            param_name
+            for param_name, parameter in inspect.signature(fn).parameters.items()
+            if _is_context_parameter(parameter)
+        }
+        perf_counter_ns = time.perf_counter_ns
+        thread_time_ns = time.thread_time_ns
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not self.profiler.enabled:
+                    return await fn(*args, **kwargs)
+
+                counters, sized = self._begin(tool_name)
+                request_bytes = (
+                    self._request_bytes(tool_name, context_params, args, kwargs)
+                    if sized
+                    else None
+                )
+                stepped = _SteppedCoroutine(fn(*args, **kwargs), tool_name, self)
+                error, result = None, None
+                start_ns = perf_counter_ns()
+                try:
+                    result = await stepped
+                    return result
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    self._end(
+                        tool_name,
+                        counters,
+                        perf_counter_ns() - start_ns,
+                        stepped.cpu_ns,
+                        stepped.blocking_ns,
+                        error,
+                        request_bytes,
+                        result,
+                    )
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def sync_wrapper(*args, **kwargs):
+            if not self.profiler.enabled:
+                return fn(*args, **kwargs)
+
+            counters, sized = self._begin(tool_name)
+            request_bytes = (
+                self._request_bytes(tool_name, context_params, args, kwargs)
+                if sized
+                else None
+            )
+            error, result = None, None
+            active = self._enter(tool_name)
+            start_ns, cpu_start = perf_counter_ns(), thread_time_ns()
+            try:
+                result = fn(*args, **kwargs)
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                wall_ns = perf_counter_ns() - start_ns
+                self._exit(active, tool_name, wall_ns)
+                # Sync tools run on the event loop thread: all of it blocks
+                self._end(
+                    tool_name,
+                    counters,
+                    wall_ns,
+                    thread_time_ns() - cpu_start,
+                    wall_ns,
+                    error,
+                    request_bytes,
+                    result,
+                )
+
+        return sync_wrapper
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_tool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get combined latency, CPU, blocking, size and error stats per tool.
+
+        Returns:
+            Dict of {tool_name: stats}
+        """
+        wall = self.profiler.get_histograms(WALL_KIND)
+        cpu = self.profiler.get_histograms(CPU_KIND)
+        blocking = self.profiler.get_histograms(BLOCKING_KIND)
+        with self._lock:
+            counters = {
+                name: (
+                    c.in_flight,
+                    c.peak_in_flight,
+                    dict(c.errors),
+                    c.sized_calls,
+                    c.request_bytes,
+                    c.response_bytes,
+                    c.max_response_bytes,
+                )
+                for name, c in self._counters.items()
+            }
+
+        stats = {}
+        for name, histogram in wall.items():
+            in_flight, peak, errors, sized, req, resp, max_resp = counters.get(
+                name, (0, 0, {}, 0, 0, 0, 0)
+            )
+            cpu_histogram, blocking_histogram = cpu.get(name), blocking.get(name)
+            stats[name] = {
+                "tool_name": name,
+                "call_count": histogram.count,
+                "total_time_ms": histogram.total_ns / 1e6,
+                "avg_time_ms": histogram.total_ns / histogram.count / 1e6,
+                "p50_time_ms": histogram.percentile_ns(0.5) / 1e6,
+                "p95_time_ms": histogram.percentile_ns(0.95) / 1e6,
+                "p99_time_ms": histogram.percentile_ns(0.99) / 1e6,
+                "max_time_ms": histogram.max_ns / 1e6,
+                "cpu_total_ms": cpu_histogram.total_ns / 1e6 if cpu_histogram else 0.0,
+                "cpu_p95_ms": (
+                    cpu_histogram.percentile_ns(0.95) / 1e6 if cpu_histogram else 0.0
+                ),
+                "blocking_total_ms": (
+                    blocking_histogram.total_ns / 1e6 if blocking_histogram else 0.0
+                ),
+                "blocking_p95_ms": (
+                    blocking_histogram.percentile_ns(0.95) / 1e6
+                    if blocking_histogram
+                    else 0.0
+                ),
+                "errors": errors,
+                "error_count": sum(errors.values()),
+                "in_flight": in_flight,
+                "peak_in_flight": peak,
+                "avg_request_bytes": req / sized if sized else None,
+                "avg_response_bytes": resp / sized if sized else None,
+                "max_response_bytes": max_resp if sized else None,
+            }
+        return stats
+
+    def top_slow_tools(self, n: int = 10, by: str = "p95") -> List[Dict[str, Any]]:
+        """
+        Get the N slowest tools.
+
+        Args:
+            n: Number of tools to return
+            by: Ordering - "p95", "p99", "avg", "total", "blocking" or "cpu"
+
+        Returns:
+            List of tool stats, slowest first
+        """
+        if by not in SLOW_TOOL_ORDERINGS:
+            raise ValueError(
+                f"Unknown ordering '{by}'. Use one of: {sorted(SLOW_TOOL_ORDERINGS)}"
+            )
+        key = SLOW_TOOL_ORDERINGS[by]
+        stats = sorted(
+            self.get_tool_stats().values(), key=lambda s: s[key], reverse=True
+        )
+        return stats[:n]
+
+    def export_prometheus(self) -> str:
+        """
+        Render all tool metrics in Prometheus text format.
+
+        Returns:
+            Prometheus exposition text
+        """
+        reporter = MetricsReporter(self.profiler)
+        sections = [
+            reporter.export_prometheus(
+                metric_name="nba_mcp_tool_duration_seconds",
+                kinds=(WALL_KIND,),
+                description="MCP tool wall-clock latency",
+            ),
+            reporter.export_prometheus(
+                metric_name="nba_mcp_tool_cpu_seconds",
+                kinds=(CPU_KIND,),
+                description="CPU time spent in MCP tools on the calling thread",
+            ),
+            reporter.export_prometheus(
+                metric_name="nba_mcp_tool_loop_blocking_seconds",
+                kinds=(BLOCKING_KIND,),
+                description="Time MCP tools held the event loop",
+            ),
+        ]
+
+        lines = [
+            "# HELP nba_mcp_tool_in_flight MCP tool calls currently running",
+            "# TYPE nba_mcp_tool_in_flight gauge",
+        ]
+        stats = self.get_tool_stats()
+        for name, tool in sorted(stats.items()):
+            lines.append(
+                f'nba_mcp_tool_in_flight{{name="{_escape_label(name)}"}} '
+                f'{tool["in_flight"]}'
+            )
+        lines += [
+            "# HELP nba_mcp_tool_peak_in_flight Peak concurrent MCP tool calls",
+            "# TYPE nba_mcp_tool_peak_in_flight gauge",
+        ]
+        for name, tool in sorted(stats.items()):
+            lines.append(
+                f'nba_mcp_tool_peak_in_flight{{name="{_escape_label(name)}"}} '
+                f'{tool["peak_in_flight"]}'
+            )
+        lines += [
+            "# HELP nba_mcp_tool_errors_total MCP tool errors by exception class",
+            "# TYPE nba_mcp_tool_errors_total counter",
+        ]
+        for name, tool in sorted(stats.items()):
+            for error, count in sorted(tool["errors"].items()):
+                lines.append(
+                    f'nba_mcp_tool_errors_total{{name="{_escape_label(name)}",'
+                    f'error="{_escape_label(error)}"}} {count}'
+                )
+        lines += [
+            "# HELP nba_mcp_tool_payload_bytes Sampled MCP tool payload size",
+            "# TYPE nba_mcp_tool_payload_bytes gauge",
+        ]
+        for name, tool in sorted(stats.items()):
+            if tool["avg_request_bytes"] is None:
+                continue
+            label = _escape_label(name)
+            lines.append(
+                f'nba_mcp_tool_payload_bytes{{name="{label}",direction="request"}} '
+                f'{tool["avg_request_bytes"]}'
+            )
+            lines.append(
+                f'nba_mcp_tool_payload_bytes{{name="{label}",direction="response"}} '
+                f'{tool["avg_response_bytes"]}'
+            )
+
+        return "".join(sections) + "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Reset counters (histograms are reset with the profiler)"""
+        with self._lock:
+            for counters in self._counters.values():
+                counters.reset()
+                counters.peak_in_flight = counters.in_flight
+
+
+def instrument_tools(server, metrics: Optional[ToolMetrics] = None) -> ToolMetrics:
+    """
+    Instrument every tool registered on a FastMCP server from now on.
+
+    Replaces ``server.add_tool`` (which ``@server.tool()`` calls) so each
+    tool function is wrapped exactly once, when it is registered. Call it
+    right after creating the server, before any ``@mcp.tool()``.
+
+    Args:
+        server: FastMCP server instance
+        metrics: ToolMetrics to record into (creates one if None)
+
+    Returns:
+        The ToolMetrics instance
+    """
+    if getattr(server, "_tool_metrics", None) is not None:
+        return server._tool_metrics
+    metrics = metrics or ToolMetrics()
+
+    add_tool = server.add_tool
+
+    @functools.wraps(add_tool)
+    def instrumented_add_tool(fn, name=None, *args, **kwargs):
+        return add_tool(metrics.instrument(fn, name), name, *args, **kwargs)
+
+    server.add_tool = instrumented_add_tool
+    server._tool_metrics = metrics
+    return metrics
@@ -640,6 +640,17 @@ class PlaygroundResultsResult(BaseModel):
     error: Optional[str] = None
 
 
+class PlaygroundBatchResult(BaseModel):
+    """Response for vectorized playground evaluation"""
+
+    success: bool
+    rows: int = 0
+    order: Optional[List[str]] = None
+    columns: Optional[Dict[str, List[Optional[float]]]] = None
+    errors: Optional[Dict[str, str]] = None
+    error: Optional[str] = None
+
+
 class PlaygroundVisualizationsResult(BaseModel):
     """Response for playground visualizations"""
 
@@ -9,6 +9,8 @@ Agents:
 - Agent 11: Advanced Simulation Models
 - Agent 12: Simulation Deployment
 - Agent 13: Simulator Integration & Testing
+
+Season and playoff odds live in ``simulations.season``.
 """
 
 __version__ = "0.1.0"
@@ -10,6 +10,8 @@ from .simulation_service import (
     SimulationResult,
     SimulationService,
     BatchSimulator,
+    MonteCarloEngine,
+    MonteCarloSummary,
 )
 
 __all__ = [
@@ -20,4 +22,6 @@ __all__ = [
     "SimulationResult",
     "SimulationService",
     "BatchSimulator",
+    "MonteCarloEngine",
+    "MonteCarloSummary",
 ]
@@ -7,14 +7,20 @@ Integrates with:
 - Agent 2 (Monitoring): Track simulation requests and performance
 - Agent 10 (Validation): Validate requests and results
 - Agent 11 (Models): Use deployed models for simulation
+
+Simulations are vectorized: each request draws an (n_sims x n_features)
+matrix of feature perturbations plus residual noise, predicts all
+simulations in one batched model call, and summarizes with NumPy.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Callable
+import threading
+import time
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Callable, Union
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 import hashlib
 import json
 
@@ -33,6 +39,7 @@ class SimulationRequest:
     model_id: str
     model_version: Optional[str] = None
     num_simulations: int = 1
+    random_seed: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
 
@@ -51,8 +58,18 @@ class SimulationRequest:
         return cls(**data)
 
     def get_hash(self) -> str:
-        """Get hash of request for caching"""
-        key = f"{self.home_team_id}_{self.away_team_id}_{self.model_id}_{self.model_version}"
+        """
+        Get hash of request for caching.
+
+        The key covers the matchup, model, simulation count and seed. An
+        unseeded request (random_seed=None) shares its key with every other
+        unseeded request for the same matchup and count, so a cache hit
+        returns the earlier request's draw rather than a fresh one.
+        """
+        key = (
+            f"{self.home_team_id}_{self.away_team_id}_{self.model_id}_"
+            f"{self.model_version}_{self.num_simulations}_{self.random_seed}"
+        )
         return hashlib.md5(key.encode()).hexdigest()
 
 
@@ -88,6 +105,212 @@ class SimulationResult:
         return cls(**data)
 
 
+@dataclass
+class MonteCarloSummary:
+    """Vectorized Monte Carlo output for one matchup"""
+
+    margins: np.ndarray
+    home_scores: np.ndarray
+    away_scores: np.ndarray
+    home_win_probability: float
+    mean_margin: float
+    std_margin: float
+    margin_quantiles: Dict[str, float]
+    home_score_quantiles: Dict[str, float]
+    away_score_quantiles: Dict[str, float]
+
+
+class MonteCarloEngine:
+    """
+    Vectorized Monte Carlo engine for game outcomes.
+
+    The deployed model predicts home point differential from a feature
+    vector. Each simulation perturbs the features (input uncertainty) and
+    adds residual noise (game-to-game variation the model cannot explain):
+
+        margin_i = model(x + eps_i) + e_i,   eps_i ~ N(0, feature_noise_std^2)
+                                             e_i   ~ N(0, residual_std^2)
+        total_i  = league_total + u_i,       u_i   ~ N(0, total_std^2)
+
+    All draws are made as arrays and the model is called once per request.
+    A single simulation is treated as a point forecast (no noise), matching
+    the service's behaviour for ``num_simulations=1``.
+    Feature, residual and total-score noise use independent child streams of
+    the request's SeedSequence, so changing one noise source does not shift
+    the others.
+    """
+
+    def __init__(
+        self,
+        residual_std: float = 12.0,
+        feature_noise_std: Union[float, Sequence[float]] = 0.0,
+        league_total: float = 200.0,
+        total_std: float = 0.0,
+        quantiles: Sequence[float] = (0.025, 0.05, 0.25, 0.5, 0.75, 0.95, 0.975),
+    ):
+        """
+        Initialize Monte Carlo engine.
+
+        Args:
+            residual_std: Std. dev. of point-differential residuals (NBA games
+                are roughly 12 points around the expected margin)
+            feature_noise_std: Std. dev. of feature perturbations, scalar or
+                one value per feature (0 disables perturbation)
+            league_total: Expected combined score of both teams
+            total_std: Std. dev. of the combined score
+            quantiles: Quantiles reported for margin and scores
+        """
+        if residual_std < 0 or total_std < 0:
+            raise ValueError("Noise standard deviations must be non-negative")
+
+        self.residual_std = float(residual_std)
+        self.feature_noise_std = np.asarray(feature_noise_std, dtype=float)
+        self.league_total = float(league_total)
+        self.total_std = float(total_std)
+        self.quantiles = tuple(quantiles)
+
+    def simulate(
+        self,
+        model: Any,
+        features: np.ndarray,
+        n_simulations: int,
+        rng: Union[np.random.SeedSequence, int, None] = None,
+    ) -> MonteCarloSummary:
+        """
+        Run n_simulations of one matchup.
+
+        Args:
+            model: Object with a batched ``predict(X)`` method
+            features: Feature vector (n_features,)
+            n_simulations: Number of simulated games
+            rng: SeedSequence, integer seed, or None for fresh entropy
+
+        Returns:
+            MonteCarloSummary
+        """
+        return self.simulate_many(model, [features], [n_simulations], [rng])[0]
+
+    def simulate_many(
+        self,
+        model: Any,
+        features: Sequence[np.ndarray],
+        n_simulations: Sequence[int],
+        rngs: Optional[Sequence[Union[np.random.SeedSequence, int, None]]] = None,
+    ) -> List[MonteCarloSummary]:
+        """
+        Simulate several matchups that share a model with one predict call.
+
+        Each matchup's model inputs (its perturbed feature rows, or its single
+        feature row when there is no input noise) are stacked into one matrix,
+        predicted together, and split back. Noise for each matchup comes from
+        its own seed stream, so results are identical to simulating the
+        matchups one at a time.
+
+        Args:
+            model: Object with a batched ``predict(X)`` method
+            features: Feature vector per matchup (all the same length)
+            n_simulations: Number of simulated games per matchup
+            rngs: Seed per matchup (SeedSequence, int or None)
+
+        Returns:
+            MonteCarloSummary per matchup, in input order
+        """
+        if len(features) != len(n_simulations):
+            raise ValueError("features and n_simulations must have the same length")
+        if rngs is None:
+            rngs = [None] * len(features)
+        if any(n < 1 for n in n_simulations):
+            raise ValueError("n_simulations must be >= 1")
+
+        streams = []
+        blocks = []
+        for x, n, rng in zip(features, n_simulations, rngs):
+            seed_seq = (
+                rng
+                if isinstance(rng, np.random.SeedSequence)
+                else np.random.SeedSequence(rng)
+            )
+            feature_rng, residual_rng, total_rng = (
+                np.random.default_rng(s) for s in seed_seq.spawn(3)
+            )
+            streams.append((residual_rng, total_rng))
+
+            x = np.asarray(x, dtype=float).ravel()
+            if n > 1 and np.any(self.feature_noise_std > 0):
+                blocks.append(
+                    x
+                    + self.feature_noise_std * feature_rng.standard_normal((n, x.size))
+                )
+            else:
+                # Deterministic model and no input noise: predict once
+                blocks.append(x.reshape(1, -1))
+
+        sizes = [len(b) for b in blocks]
+        predicted = np.asarray(model.predict(np.vstack(blocks)), dtype=float).ravel()
+        if predicted.size != sum(sizes):
+            raise ValueError(
+                f"Model returned {predicted.size} predictions for {sum(sizes)} rows"
+            )
+
+        return [
+            self._summarize(expected, n, residual_rng, total_rng)
+            for expected, n, (residual_rng, total_rng) in zip(
+                np.split(predicted, np.cumsum(sizes)[:-1]), n_simulations, streams
+            )
+        ]
+
+    def _summarize(
+        self,
+        expected: np.ndarray,
+        n_simulations: int,
+        residual_rng: np.random.Generator,
+        total_rng: np.random.Generator,
+    ) -> MonteCarloSummary:
+        """Add outcome noise to expected margins and summarize."""
+        stochastic = n_simulations > 1
+        margins = np.broadcast_to(expected, (n_simulations,)).astype(float)
+
+        if stochastic and self.residual_std > 0:
+            margins = margins + self.residual_std * residual_rng.standard_normal(
+                n_simulations
+            )
+
+        totals = np.full(n_simulations, self.league_total)
+        if stochastic and self.total_std > 0:
+            totals = totals + self.total_std * total_rng.standard_normal(n_simulations)
+
+        home_scores = (totals + margins) / 2
+        away_scores = (totals - margins) / 2
+
+        q = np.asarray(self.quantiles)
+        margin_q, home_q, away_q = np.quantile(
+            np.vstack([margins, home_scores, away_scores]), q, axis=1
+        ).T
+        labels = [f"q{100 * p:g}" for p in self.quantiles]
+
+        # Ties are measure-zero for continuous outcomes; split them evenly
+        home_win = np.mean(margins > 0) + 0.5 * np.mean(margins == 0)
+
+        return MonteCarloSummary(
+            margins=margins,
+            home_scores=home_scores,
+            away_scores=away_scores,
+            home_win_probability=float(home_win),
+            mean_margin=float(margins.mean()),
+            std_margin=float(margins.std()),
+            margin_quantiles=dict(zip(labels, margin_q.tolist())),
+            home_score_quantiles=dict(zip(labels, home_q.tolist())),
+            away_score_quantiles=dict(zip(labels, away_q.tolist())),
+        )
+
+
+def _copy_seed(seed: np.random.SeedSequence) -> np.random.SeedSequence:
+    """Fresh SeedSequence with the same state (spawn() advances the original)"""
+    return np.random.SeedSequence(
+        seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size
+    )
+
+
 class SimulationService:
     """
     Service for executing game simulations.
@@ -97,10 +320,16 @@ class SimulationService:
     - Request validation
     - Result caching
     - Performance monitoring
+    - Vectorized, seeded Monte Carlo simulation
     """
 
     def __init__(
-        self, model_registry: Any, cache_enabled: bool = True, cache_size: int = 100
+        self,
+        model_registry: Any,
+        cache_enabled: bool = True,
+        cache_size: int = 100,
+        engine: Optional[MonteCarloEngine] = None,
+        random_seed: Optional[int] = None,
     ):
         """
         Initialize simulation service.
@@ -109,14 +338,25 @@ class SimulationService:
             model_registry: ModelRegistry instance
             cache_enabled: Whether to cache results
             cache_size: Maximum cache size
+            engine: Monte Carlo engine (default: MonteCarloEngine())
+            random_seed: Root seed. Requests without their own random_seed
+                get successive child streams of it, so a run is reproducible
+                given the same request order.
         """
         self.model_registry = model_registry
         self.cache_enabled = cache_enabled
         self.cache_size = cache_size
+        self.engine = engine or MonteCarloEngine()
+        self._seed_sequence = np.random.SeedSequence(random_seed)
+        self._seed_lock = threading.Lock()
+        # Guards the result cache and counters; BatchSimulator runs model
+        # groups from worker threads
+        self._state_lock = threading.Lock()
         self.cache: Dict[str, SimulationResult] = {}
         self.loaded_models: Dict[str, Any] = {}
         self.requests_processed = 0
         self.cache_hits = 0
+        self.predict_calls = 0
 
     def simulate(self, request: SimulationRequest) -> SimulationResult:
         """
@@ -128,73 +368,223 @@ class SimulationService:
         Returns:
             SimulationResult object
         """
-        # Check cache
-        if self.cache_enabled:
-            cache_key = request.get_hash()
-            if cache_key in self.cache:
-                self.cache_hits += 1
-                self.requests_processed += 1
-                logger.debug(f"Cache hit for request {request.request_id}")
-                return self.cache[cache_key]
+        result = self.simulate_many([request], return_exceptions=True)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
+    def simulate_many(
+        self, requests: List[SimulationRequest], return_exceptions: bool = False
+    ) -> List[Union[SimulationResult, Exception]]:
+        """
+        Execute several requests, batching model calls per model.
+
+        Cache misses are grouped by (model_id, model_version); each group's
+        feature vectors are stacked and predicted with a single model call,
+        and the summaries are scattered back to their requests.
+
+        Args:
+            requests: SimulationRequest objects
+            return_exceptions: Return a failed request's exception in place
+                of its result instead of raising
+
+        Returns:
+            SimulationResult (or Exception) per request, in input order
+        """
+        results: List[Any] = [None] * len(requests)
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+
+        for idx, request in enumerate(requests):
+            # Check cache
+            if self.cache_enabled:
+                with self._state_lock:
+                    cached = self.cache.get(request.get_hash())
+                    if cached is not None:
+                        self.cache_hits += 1
+                        self.requests_processed += 1
+                if cached is not None:
+                    logger.debug(f"Cache hit for request {request.request_id}")
+                    results[idx] = cached
+                    continue
+
+            groups.setdefault((request.model_id, request.model_version), []).append(idx)
+
+        for (model_id, version), indices in groups.items():
+            group = [requests[i] for i in indices]
+            try:
+                group_results = self._simulate_group(model_id, version, group)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                logger.error(
+                    f"Simulation failed for {len(group)} request(s) on "
+                    f"{model_id}:{version or 'latest'}: {e}"
+                )
+                group_results = [e] * len(group)
+
+            for idx, result in zip(indices, group_results):
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                results[idx] = result
+
+        return results
+
+    def _simulate_group(
+        self,
+        model_id: str,
+        version: Optional[str],
+        requests: List[SimulationRequest],
+    ) -> List[Union[SimulationResult, Exception]]:
+        """
+        Simulate requests that share a model with one batched predict.
+
+        Requests that fail validation get their exception in place of a
+        result and are left out of the batch. If the batched call fails, each
+        remaining request is retried on its own so one bad input cannot fail
+        the whole group.
+        """
         # Load model
-        model = self._get_model(request.model_id, request.model_version)
+        model = self._get_model(model_id, version)
+
+        results: List[Any] = [None] * len(requests)
+        valid: List[int] = []
+        features: List[np.ndarray] = []
+        for i, request in enumerate(requests):
+            try:
+                features.append(self._validate_request(request))
+            except Exception as e:
+                logger.error(f"Invalid simulation request {request.request_id}: {e}")
+                results[i] = e
+            else:
+                valid.append(i)
+
+        if not valid:
+            return results
+
+        # Run simulations (prediction is home point differential)
+        seeds = [self._request_seed(requests[i]) for i in valid]
+        try:
+            summaries = self._run_engine(
+                model, features, [requests[i] for i in valid], seeds
+            )
+        except Exception as e:
+            if len(valid) == 1:
+                summaries = [e]
+            else:
+                logger.warning(
+                    f"Batched predict failed for {len(valid)} request(s) on "
+                    f"{model_id}:{version or 'latest'}, retrying one at a time: {e}"
+                )
+                summaries = []
+                for i, x, seed in zip(valid, features, seeds):
+                    try:
+                        summaries.extend(
+                            self._run_engine(
+                                model, [x], [requests[i]], [_copy_seed(seed)]
+                            )
+                        )
+                    except Exception as request_error:
+                        summaries.append(request_error)
+
+        for i, summary in zip(valid, summaries):
+            request = requests[i]
+            if isinstance(summary, Exception):
+                logger.error(
+                    f"Simulation failed for request {request.request_id}: {summary}"
+                )
+                results[i] = summary
+                continue
+
+            result = self._build_result(request, summary)
+            with self._state_lock:
+                # Update cache
+                if self.cache_enabled:
+                    self._update_cache(request.get_hash(), result)
+                self.requests_processed += 1
+            results[i] = result
 
-        # Prepare features
-        features = self._prepare_features(request.home_features, request.away_features)
+        return results
 
-        # Run simulations
-        predictions = []
-        for _ in range(request.num_simulations):
-            pred = model.predict(features.reshape(1, -1))[0]
-            predictions.append(float(pred))
+    def _run_engine(
+        self,
+        model: Any,
+        features: List[np.ndarray],
+        requests: List[SimulationRequest],
+        seeds: List[np.random.SeedSequence],
+    ) -> List[MonteCarloSummary]:
+        """One batched engine call, counted in predict_calls."""
+        with self._state_lock:
+            self.predict_calls += 1
+        return self.engine.simulate_many(
+            model, features, [r.num_simulations for r in requests], seeds
+        )
 
-        # Compute statistics
-        predictions_array = np.array(predictions)
-        mean_pred = float(predictions_array.mean())
-        std_pred = float(predictions_array.std())
+    def _validate_request(self, request: SimulationRequest) -> np.ndarray:
+        """
+        Check a request and prepare its feature vector.
 
-        # Compute win probabilities (assuming prediction is point differential)
-        home_win_prob = float(np.mean(predictions_array > 0))
-        away_win_prob = 1.0 - home_win_prob
+        Args:
+            request: SimulationRequest object
 
-        # Compute expected scores (assuming mean of ~100 points per team)
-        expected_home = 100.0 + mean_pred / 2
-        expected_away = 100.0 - mean_pred / 2
+        Returns:
+            Feature array
 
-        # Compute confidence interval
-        if request.num_simulations > 1:
-            ci_95 = (
-                float(mean_pred - 1.96 * std_pred),
-                float(mean_pred + 1.96 * std_pred),
+        Raises:
+            ValueError: If the simulation count or features are invalid
+        """
+        if request.num_simulations < 1:
+            raise ValueError(
+                f"num_simulations must be >= 1, got {request.num_simulations}"
             )
+        features = self._prepare_features(
+            request.home_features, request.away_features
+        ).astype(float)
+        if features.size == 0:
+            raise ValueError("Request has no features")
+        if not np.all(np.isfinite(features)):
+            raise ValueError("Request features must be finite numbers")
+        return features
+
+    def _build_result(
+        self, request: SimulationRequest, summary: MonteCarloSummary
+    ) -> SimulationResult:
+        """Convert an engine summary into a SimulationResult."""
+        home_win_prob = summary.home_win_probability
+
+        # Empirical 95% interval of the simulated margin
+        if request.num_simulations > 1:
+            lower, upper = np.quantile(summary.margins, [0.025, 0.975])
+            ci_95 = (float(lower), float(upper))
         else:
             ci_95 = None
 
-        # Create result
-        result = SimulationResult(
+        return SimulationResult(
             request_id=request.request_id,
             home_win_probability=home_win_prob,
-            away_win_probability=away_win_prob,
-            expected_home_score=expected_home,
-            expected_away_score=expected_away,
-            predictions=predictions,
+            away_win_probability=1.0 - home_win_prob,
+            expected_home_score=float(summary.home_scores.mean()),
+            expected_away_score=float(summary.away_scores.mean()),
+            predictions=summary.margins.tolist(),
             simulation_count=request.num_simulations,
             confidence_interval_95=ci_95,
             metadata={
                 "model_id": request.model_id,
                 "model_version": request.model_version,
-                "mean_prediction": mean_pred,
-                "std_prediction": std_pred,
+                "mean_prediction": summary.mean_margin,
+                "std_prediction": summary.std_margin,
+                "margin_quantiles": summary.margin_quantiles,
+                "home_score_quantiles": summary.home_score_quantiles,
+                "away_score_quantiles": summary.away_score_quantiles,
+                "random_seed": request.random_seed,
             },
         )
 
-        # Update cache
-        if self.cache_enabled:
-            self._update_cache(cache_key, result)
-
-        self.requests_processed += 1
-        return result
+    def _request_seed(self, request: SimulationRequest) -> np.random.SeedSequence:
+        """Seed stream for a request: its own seed, else the next service child."""
+        if request.random_seed is not None:
+            return np.random.SeedSequence(request.random_seed)
+        with self._seed_lock:
+            return self._seed_sequence.spawn(1)[0]
 
     def _get_model(self, model_id: str, version: Optional[str]) -> Any:
         """
@@ -245,7 +635,7 @@ class SimulationService:
         return np.array(all_features)
 
     def _update_cache(self, key: str, result: SimulationResult):
-        """Update result cache with LRU eviction"""
+        """Update result cache with LRU eviction (caller holds _state_lock)"""
         if len(self.cache) >= self.cache_size:
             # Remove oldest entry (simple FIFO for now)
             oldest_key = next(iter(self.cache))
@@ -255,7 +645,8 @@ class SimulationService:
 
     def clear_cache(self):
         """Clear result cache"""
-        self.cache.clear()
+        with self._state_lock:
+            self.cache.clear()
         logger.info("Cleared simulation cache")
 
     def clear_models(self):
@@ -265,43 +656,67 @@ class SimulationService:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get service statistics"""
+        with self._state_lock:
+            requests_processed = self.requests_processed
+            cache_hits = self.cache_hits
+            cache_size = len(self.cache)
+            predict_calls = self.predict_calls
+
         cache_hit_rate = (
-            self.cache_hits / self.requests_processed
-            if self.requests_processed > 0
-            else 0.0
+            cache_hits / requests_processed if requests_processed > 0 else 0.0
         )
 
         return {
-            "requests_processed": self.requests_processed,
-            "cache_hits": self.cache_hits,
+            "requests_processed": requests_processed,
+            "cache_hits": cache_hits,
             "cache_hit_rate": cache_hit_rate,
-            "cache_size": len(self.cache),
+            "cache_size": cache_size,
             "loaded_models": len(self.loaded_models),
+            "predict_calls": predict_calls,
         }
 
 
 class BatchSimulator:
     """
-    Execute simulations in batch with parallel processing.
+    Execute simulations in batch with request coalescing.
 
     Features:
-    - Parallel execution
-    - Progress tracking
+    - Matrix batching: requests sharing a model run as one predict call
+    - Micro-batching: concurrent submit() callers share batches within a
+      short wait window
     - Error handling
     - Result aggregation
     """
 
-    def __init__(self, simulation_service: SimulationService, max_workers: int = 4):
+    def __init__(
+        self,
+        simulation_service: SimulationService,
+        max_workers: int = 4,
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 256,
+    ):
         """
         Initialize batch simulator.
 
         Args:
             simulation_service: SimulationService instance
-            max_workers: Maximum parallel workers
+            max_workers: Maximum parallel workers (one model group per worker)
+            max_wait_ms: How long submit() holds the first pending request
+                waiting for others to join its batch
+            max_batch_size: Dispatch immediately once this many requests wait
         """
         self.simulation_service = simulation_service
         self.max_workers = max_workers
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
         self.batches_processed = 0
+        self.coalesced_requests = 0
+
+        self._pending: List[Tuple[SimulationRequest, Future]] = []
+        self._pending_since: Optional[float] = None
+        self._condition = threading.Condition()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
 
     def simulate_batch(
         self, requests: List[SimulationRequest], parallel: bool = True
@@ -311,7 +726,8 @@ class BatchSimulator:
 
         Args:
             requests: List of SimulationRequest objects
-            parallel: Whether to execute in parallel
+            parallel: Coalesce requests into one predict call per model
+                (False runs each request on its own)
 
         Returns:
             List of SimulationResult objects
@@ -325,18 +741,9 @@ class BatchSimulator:
                     results.append(result)
                 except Exception as e:
                     logger.error(f"Simulation failed for request {req.request_id}: {e}")
-                    # Create error result
-                    error_result = SimulationResult(
-                        request_id=req.request_id,
-                        home_win_probability=0.5,
-                        away_win_probability=0.5,
-                        expected_home_score=100.0,
-                        expected_away_score=100.0,
-                        metadata={"error": str(e)},
-                    )
-                    results.append(error_result)
+                    results.append(self._error_result(req, e))
         else:
-            # Parallel execution
+            # Coalesced execution
             results = self._simulate_parallel(requests)
 
         self.batches_processed += 1
@@ -348,7 +755,11 @@ class BatchSimulator:
         self, requests: List[SimulationRequest]
     ) -> List[SimulationResult]:
         """
-        Execute simulations in parallel.
+        Execute simulations grouped by model.
+
+        Each (model_id, version) group is stacked into one predict call.
+        Distinct models are dispatched to the thread pool, where native
+        predict code can release the GIL.
 
         Args:
             requests: List of requests
@@ -356,33 +767,152 @@ class BatchSimulator:
         Returns:
             List of results
         """
-        results = [None] * len(requests)
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for idx, req in enumerate(requests):
+            groups.setdefault((req.model_id, req.model_version), []).append(idx)
+
+        results: List[Any] = [None] * len(requests)
+
+        def run_group(indices: List[int]) -> None:
+            group = [requests[i] for i in indices]
+            for idx, result in zip(
+                indices,
+                self.simulation_service.simulate_many(group, return_exceptions=True),
+            ):
+                results[idx] = (
+                    self._error_result(requests[idx], result)
+                    if isinstance(result, Exception)
+                    else result
+                )
+
+        if len(groups) == 1 or self.max_workers <= 1:
+            for indices in groups.values():
+                run_group(indices)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for future in [
+                    executor.submit(run_group, indices) for indices in groups.values()
+                ]:
+                    future.result()
+
+        self.coalesced_requests += len(requests)
+        return results
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_idx = {
-                executor.submit(self.simulation_service.simulate, req): idx
-                for idx, req in enumerate(requests)
-            }
+    # ------------------------------------------------------------------
+    # Micro-batching
+    # ------------------------------------------------------------------
 
-            # Collect results
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
+    def submit(self, request: SimulationRequest) -> Future:
+        """
+        Queue a request for the next micro-batch.
+
+        Requests submitted from any thread within ``max_wait_ms`` of each
+        other are coalesced into one simulate_batch call.
+
+        Args:
+            request: SimulationRequest object
+
+        Returns:
+            Future resolving to the SimulationResult
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchSimulator is closed")
+            if self._dispatcher is None or not self._dispatcher.is_alive():
+                # First submit, or the previous dispatcher died
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop,
+                    name="batch-simulator-dispatch",
+                    daemon=True,
+                )
+                self._dispatcher.start()
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append((request, future))
+            self._condition.notify()
+        return future
+
+    def simulate(
+        self, request: SimulationRequest, timeout: Optional[float] = None
+    ) -> SimulationResult:
+        """Submit a request and wait for its micro-batched result."""
+        return self.submit(request).result(timeout=timeout)
+
+    def _dispatch_loop(self) -> None:
+        """Background thread draining the pending queue in micro-batches."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending and self._closed:
+                    return
+
+                # Hold the window open until it expires or the batch is full
+                deadline = self._pending_since + self.max_wait_ms / 1000.0
+                while (
+                    len(self._pending) < self.max_batch_size
+                    and not self._closed
+                    and time.monotonic() < deadline
+                ):
+                    self._condition.wait(max(0.0, deadline - time.monotonic()))
+
+                batch = self._pending[: self.max_batch_size]
+                self._pending = self._pending[self.max_batch_size :]
+                self._pending_since = time.monotonic() if self._pending else None
+
+            # Drop requests whose callers cancelled while they waited
+            batch = [
+                (req, future)
+                for req, future in batch
+                if future.set_running_or_notify_cancel()
+            ]
+            if not batch:
+                continue
+
+            requests = [req for req, _ in batch]
+            try:
+                results = self.simulate_batch(requests, parallel=True)
+            except Exception as e:  # pragma: no cover - simulate_batch traps errors
+                results = [e] * len(batch)
+
+            for (req, future), result in zip(batch, results):
                 try:
-                    results[idx] = future.result()
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
                 except Exception as e:
-                    logger.error(f"Simulation failed for request {idx}: {e}")
-                    # Create error result
-                    results[idx] = SimulationResult(
-                        request_id=requests[idx].request_id,
-                        home_win_probability=0.5,
-                        away_win_probability=0.5,
-                        expected_home_score=100.0,
-                        expected_away_score=100.0,
-                        metadata={"error": str(e)},
+                    logger.error(
+                        f"Could not deliver result for request {req.request_id}: {e}"
                     )
 
-        return results
+    def close(self, wait: bool = True) -> None:
+        """Flush pending requests and stop the dispatcher thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            dispatcher = self._dispatcher
+        if wait and dispatcher is not None:
+            dispatcher.join()
+
+    def __enter__(self) -> "BatchSimulator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _error_result(request: SimulationRequest, error: Exception) -> SimulationResult:
+        """Neutral result recorded for a failed request."""
+        return SimulationResult(
+            request_id=request.request_id,
+            home_win_probability=0.5,
+            away_win_probability=0.5,
+            expected_home_score=100.0,
+            expected_away_score=100.0,
+            metadata={"error": str(error)},
+        )
 
     def aggregate_results(self, results: List[SimulationResult]) -> Dict[str, Any]:
         """
@@ -415,6 +945,7 @@ class BatchSimulator:
         """Get batch simulator statistics"""
         return {
             "batches_processed": self.batches_processed,
+            "coalesced_requests": self.coalesced_requests,
             "max_workers": self.max_workers,
             "service_stats": self.simulation_service.get_statistics(),
         }
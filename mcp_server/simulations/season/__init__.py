@@ -0,0 +1,33 @@
+"""
+Season Simulation
+
+Vectorized Monte Carlo simulation of full seasons and playoff brackets:
+- Possession-level game outcomes with overtime
+- NBA tiebreakers, play-in and best-of-seven series
+- Parallel chunks with reproducible seed streams
+- Standings distributions, seed/title odds and convergence diagnostics
+
+Integrates with:
+- simulations/models: Team strength from point-differential models
+- games table: Schedule and results to date
+"""
+
+from mcp_server.simulations.season.season_simulator import (
+    TeamStrength,
+    SeasonSimulator,
+    SeasonSimulationResult,
+    strengths_from_ratings,
+    strengths_from_model,
+    load_schedule,
+    convergence_table,
+)
+
+__all__ = [
+    "TeamStrength",
+    "SeasonSimulator",
+    "SeasonSimulationResult",
+    "strengths_from_ratings",
+    "strengths_from_model",
+    "load_schedule",
+    "convergence_table",
+]
@@ -0,0 +1,809 @@
+"""
+Season Simulator
+
+Monte Carlo simulation of an NBA regular season and playoff bracket to
+estimate win totals, seeding, and playoff / title odds.
+
+Games are simulated at the possession level: each team gets ~pace
+possessions and each possession scores 0/1/2/3 points with probabilities
+scaled to the matchup's expected points per possession. Draws are
+vectorized over simulations (a chunk of seasons is a (n_sims x n_games)
+array), overtime is replayed for tied games, and chunks run across cores
+with independent seed streams.
+
+Standings use NBA-style tiebreakers: win percentage, head-to-head among
+tied teams, conference record, point differential, then a random draw.
+The postseason uses a 7-10 play-in per conference, best-of-seven series
+with 2-2-1-1-1 home court, and a Finals between conference champions.
+
+Integrates with:
+- simulations/models: point-differential models supply team strength
+- games table: schedule and already-played results
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Per-possession scoring template (P[1], P[2], P[3] points) at TEMPLATE_PPP;
+# scaled to each matchup's expected points per possession
+SCORING_TEMPLATE = np.array([0.07, 0.33, 0.12])
+TEMPLATE_PPP = float(SCORING_TEMPLATE @ np.array([1.0, 2.0, 3.0]))
+
+# Round reached in the postseason (SeasonSimulationResult.playoff_round)
+MISSED_PLAYOFFS = 0
+FIRST_ROUND = 1
+SECOND_ROUND = 2
+CONFERENCE_FINALS = 3
+FINALS = 4
+CHAMPION = 5
+
+# Higher-seed home games in a best-of-seven (2-2-1-1-1)
+SERIES_HOME_PATTERN = np.array([True, True, False, False, True, False, True])
+
+
+@dataclass
+class TeamStrength:
+    """Possession-level strength of one team"""
+
+    team_id: str
+    ortg: float = 114.0  # Points scored per 100 possessions
+    drtg: float = 114.0  # Points allowed per 100 possessions
+    pace: float = 99.0  # Possessions per 48 minutes
+    conference: Optional[str] = None
+
+    @property
+    def net_rating(self) -> float:
+        return self.ortg - self.drtg
+
+
+@dataclass
+class SeasonSimulationResult:
+    """Per-simulation outcomes of a season simulation"""
+
+    teams: List[str]
+    conferences: List[Optional[str]]
+    wins: np.ndarray  # (n_sims, n_teams)
+    losses: np.ndarray  # (n_sims, n_teams)
+    regular_season_rank: np.ndarray  # (n_sims, n_teams), rank within conference
+    playoff_seed: np.ndarray  # (n_sims, n_teams), 0 = missed playoffs
+    playoff_round: np.ndarray  # (n_sims, n_teams), MISSED_PLAYOFFS..CHAMPION
+    play_in: np.ndarray  # (n_sims, n_teams), bool
+    convergence: pd.DataFrame = field(default_factory=pd.DataFrame)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def n_simulations(self) -> int:
+        return int(self.wins.shape[0])
+
+    def standings(self) -> pd.DataFrame:
+        """Standings distribution and postseason odds per team."""
+        wins = self.wins.astype(float)
+        p5, p50, p95 = np.percentile(wins, [5, 50, 95], axis=0)
+        rounds = self.playoff_round
+
+        df = pd.DataFrame(
+            {
+                "team_id": self.teams,
+                "conference": self.conferences,
+                "mean_wins": wins.mean(axis=0),
+                "std_wins": wins.std(axis=0),
+                "wins_p5": p5,
+                "wins_p50": p50,
+                "wins_p95": p95,
+                "mean_rank": self.regular_season_rank.mean(axis=0),
+                "play_in_prob": self.play_in.mean(axis=0),
+                "playoff_prob": (rounds >= FIRST_ROUND).mean(axis=0),
+                "second_round_prob": (rounds >= SECOND_ROUND).mean(axis=0),
+                "conf_finals_prob": (rounds >= CONFERENCE_FINALS).mean(axis=0),
+                "finals_prob": (rounds >= FINALS).mean(axis=0),
+                "title_prob": (rounds >= CHAMPION).mean(axis=0),
+            }
+        )
+        return df.sort_values(
+            ["conference", "mean_wins"], ascending=[True, False], na_position="first"
+        ).reset_index(drop=True)
+
+    def seed_probabilities(self) -> pd.DataFrame:
+        """Probability of each final playoff seed (0 = missed playoffs)."""
+        max_seed = int(self.playoff_seed.max()) if self.playoff_seed.size else 0
+        counts = np.stack(
+            [(self.playoff_seed == s).mean(axis=0) for s in range(max_seed + 1)],
+            axis=1,
+        )
+        columns = ["missed"] + [f"seed_{s}" for s in range(1, max_seed + 1)]
+        return pd.DataFrame(
+            counts, index=pd.Index(self.teams, name="team_id"), columns=columns
+        )
+
+    def win_distribution(self, team_id: str) -> pd.Series:
+        """Probability of each regular-season win total for one team."""
+        col = self.wins[:, self.teams.index(team_id)]
+        return pd.Series(np.bincount(col)).div(len(col)).rename_axis("wins")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary suitable for JSON responses."""
+        return {
+            "n_simulations": self.n_simulations,
+            "standings": self.standings().to_dict(orient="records"),
+            "convergence": self.convergence.to_dict(orient="records"),
+            "metadata": self.metadata,
+        }
+
+
+# =============================================================================
+# Team Strength and Schedule
+# =============================================================================
+
+
+def strengths_from_ratings(ratings: pd.DataFrame) -> List[TeamStrength]:
+    """
+    Build team strengths from a ratings table.
+
+    Args:
+        ratings: DataFrame with team_id and any of ortg, drtg, pace, conference
+
+    Returns:
+        List of TeamStrength
+    """
+    defaults = TeamStrength(team_id="")
+    strengths = []
+    for _, row in ratings.iterrows():
+        conference = row.get("conference")
+        strengths.append(
+            TeamStrength(
+                team_id=str(row["team_id"]),
+                ortg=float(row.get("ortg", defaults.ortg)),
+                drtg=float(row.get("drtg", defaults.drtg)),
+                pace=float(row.get("pace", defaults.pace)),
+                conference=None if pd.isna(conference) else conference,
+            )
+        )
+    return strengths
+
+
+def strengths_from_model(
+    model: Any,
+    team_features: Dict[str, Dict[str, float]],
+    conferences: Optional[Dict[str, str]] = None,
+    league_ortg: float = 114.0,
+    pace: float = 99.0,
+) -> List[TeamStrength]:
+    """
+    Derive team strengths from a point-differential model.
+
+    Each team is played at home and on the road against a league-average
+    opponent (the mean of all team features); half the difference of the
+    two predicted margins is the team's neutral-site net rating per game.
+    Features are ordered as in SimulationService: sorted home keys, then
+    sorted away keys.
+
+    Args:
+        model: Object with ``predict(X)`` returning home point differential
+            (e.g. EnsembleSimulator, StackedEnsemble, sklearn regressor)
+        team_features: Team id -> feature dict
+        conferences: Team id -> conference
+        league_ortg: League-average offensive rating
+        pace: League-average pace
+
+    Returns:
+        List of TeamStrength
+    """
+    teams = list(team_features)
+    keys = sorted(team_features[teams[0]])
+    F = np.array([[team_features[t][k] for k in keys] for t in teams], dtype=float)
+    avg = np.broadcast_to(F.mean(axis=0), F.shape)
+
+    X = np.vstack([np.hstack([F, avg]), np.hstack([avg, F])])
+    margins = np.asarray(model.predict(X), dtype=float).ravel()
+    home_margin, road_margin = margins[: len(teams)], -margins[len(teams) :]
+    net_per_game = (home_margin + road_margin) / 2
+
+    # Split net rating evenly between offense and defense (per 100 poss.)
+    half_net = net_per_game * 100.0 / pace / 2
+    conferences = conferences or {}
+    return [
+        TeamStrength(
+            team_id=str(t),
+            ortg=league_ortg + h,
+            drtg=league_ortg - h,
+            pace=pace,
+            conference=conferences.get(t),
+        )
+        for t, h in zip(teams, half_net)
+    ]
+
+
+def load_schedule(db_conn: Any, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Load a regular-season schedule (and results so far) from the games table.
+
+    Preseason and playoff games in the date window are excluded; playoffs are
+    simulated from the final standings.
+
+    Args:
+        db_conn: DB-API connection (psycopg2-style %s parameters)
+        start_date: First game date (YYYY-MM-DD)
+        end_date: Last game date (YYYY-MM-DD)
+
+    Returns:
+        DataFrame with game_id, game_date, home_team_id, away_team_id,
+        home_score, away_score (scores NULL for unplayed games)
+    """
+    query = """
+        SELECT game_id, game_date, home_team_id, away_team_id,
+               home_score, away_score
+        FROM games
+        WHERE game_date >= %s AND game_date <= %s
+          AND season_type = 2  -- regular season
+        ORDER BY game_date
+    """
+    cursor = db_conn.cursor()
+    try:
+        cursor.execute(query, (start_date, end_date))
+        rows = cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
+    finally:
+        cursor.close()
+    return pd.DataFrame(rows, columns=columns)
+
+
+# =============================================================================
+# Vectorized Game Simulation
+# =============================================================================
+
+
+def _scoring_probs(ppp: np.ndarray) -> np.ndarray:
+    """P(1), P(2), P(3) points per possession at `ppp` expected points."""
+    probs = SCORING_TEMPLATE * (ppp / TEMPLATE_PPP)[..., None]
+    total = probs.sum(axis=-1, keepdims=True)
+    return np.where(total > 0.98, probs * 0.98 / total, probs)
+
+
+def _possession_moments(ppp: np.ndarray) -> tuple:
+    """Mean and variance of points on a single possession."""
+    probs = _scoring_probs(ppp)
+    points = np.array([1.0, 2.0, 3.0])
+    mean = probs @ points
+    return mean, probs @ points**2 - mean**2
+
+
+def _possession_points(
+    possessions: np.ndarray, ppp: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Points from `possessions` trips at `ppp` expected points per trip."""
+    probs = _scoring_probs(ppp)
+    p1, p2, p3 = probs[..., 0], probs[..., 1], probs[..., 2]
+
+    # Multinomial counts as a chain of conditional binomials
+    n1 = rng.binomial(possessions, p1)
+    rest = possessions - n1
+    n2 = rng.binomial(rest, p2 / (1 - p1))
+    rest = rest - n2
+    n3 = rng.binomial(rest, np.clip(p3 / (1 - p1 - p2), 0, 1))
+    return n1 + 2 * n2 + 3 * n3
+
+
+def _simulate_margins(
+    home: np.ndarray,
+    away: np.ndarray,
+    ortg: np.ndarray,
+    drtg: np.ndarray,
+    pace: np.ndarray,
+    home_court: float,
+    rng: np.random.Generator,
+    exact: bool = False,
+    max_overtimes: int = 6,
+) -> np.ndarray:
+    """
+    Simulate home-minus-away margins for arrays of matchups (any shape).
+
+    With exact=True every team's possessions are drawn as multinomial
+    0/1/2/3-point outcomes. Otherwise the margin is drawn from the normal
+    distribution with the same per-possession mean and variance (CLT over
+    ~100 possessions), rounded to whole points: one draw per game instead
+    of six binomials, and indistinguishable at season level.
+
+    Ties go to overtime (5 minutes of possessions) until decided; after
+    max_overtimes a coin flip decides by one point.
+    """
+    # Matchup quantities depend only on (home, away): compute them on the
+    # n_teams x n_teams table and gather, rather than per simulated game
+    pair_poss = np.rint((pace[:, None] + pace[None, :]) / 2)
+    hca_ppp = home_court / (2.0 * pair_poss)
+    pair_ppp_home = (ortg[:, None] + drtg[None, :]) / 200.0 + hca_ppp
+    pair_ppp_away = (ortg[None, :] + drtg[:, None]) / 200.0 - hca_ppp
+
+    possessions = pair_poss.astype(np.int64)[home, away]
+
+    if exact:
+        ppp_home = pair_ppp_home[home, away]
+        ppp_away = pair_ppp_away[home, away]
+
+        def draw(idx, n):
+            return _possession_points(n, ppp_home[idx], rng) - _possession_points(
+                n, ppp_away[idx], rng
+            )
+
+    else:
+        mean_home, var_home = _possession_moments(pair_ppp_home)
+        mean_away, var_away = _possession_moments(pair_ppp_away)
+        drift = (mean_home - mean_away)[home, away]
+        spread = (var_home + var_away)[home, away]
+
+        def draw(idx, n):
+            noise = np.sqrt(n * spread[idx]) * rng.standard_normal(n.shape)
+            return np.rint(n * drift[idx] + noise)
+
+    margin = draw(Ellipsis, possessions).astype(np.int64)
+
+    ot_possessions = np.maximum(1, np.rint(possessions * 5 / 48)).astype(np.int64)
+    for _ in range(max_overtimes):
+        tied = margin == 0
+        if not tied.any():
+            break
+        margin[tied] = draw(tied, ot_possessions[tied])
+
+    tied = margin == 0
+    if tied.any():
+        margin[tied] = rng.choice([-1, 1], size=int(tied.sum()))
+    return margin
+
+
+def _bracket_order(size: int) -> List[int]:
+    """Standard seeding order, e.g. 8 -> [1, 8, 4, 5, 2, 7, 3, 6]."""
+    order = [1]
+    while len(order) < size:
+        n = 2 * len(order) + 1
+        order = [s for seed in order for s in (seed, n - seed)]
+    return order
+
+
+# =============================================================================
+# Chunk Worker
+# =============================================================================
+
+
+def _rank_within_groups(
+    keys: Sequence[np.ndarray], group: np.ndarray, group_start: np.ndarray
+) -> np.ndarray:
+    """
+    Rank teams (1 = best) within their group for every simulation.
+
+    Args:
+        keys: Sort keys of shape (n_sims, n_teams), most significant first;
+            larger is better
+        group: Group index per team
+        group_start: Position of each group's first team in group order
+
+    Returns:
+        (n_sims, n_teams) rank array
+    """
+    n_sims, n_teams = keys[0].shape
+    group_key = np.broadcast_to(group, (n_sims, n_teams))
+    # lexsort: last key is primary; sort ascending so negate "larger is better"
+    order = np.lexsort([-k for k in reversed(keys)] + [group_key], axis=-1)
+    positions = np.broadcast_to(np.arange(n_teams), (n_sims, n_teams))
+    ranks = np.empty((n_sims, n_teams), dtype=np.int16)
+    np.put_along_axis(
+        ranks,
+        order,
+        positions - group_start[np.take_along_axis(group_key, order, -1)] + 1,
+        -1,
+    )
+    return ranks
+
+
+def _simulate_chunk(spec: Dict[str, Any], n_sims: int, seed: np.random.SeedSequence):
+    """Simulate n_sims seasons + postseasons. Runs in a worker process."""
+    rng = np.random.default_rng(seed)
+    n_teams = spec["n_teams"]
+    ortg, drtg, pace = spec["ortg"], spec["drtg"], spec["pace"]
+    hca = spec["home_court"]
+    exact = spec["exact_possessions"]
+    home, away = spec["home"], spec["away"]
+    group, group_start, n_groups = spec["group"], spec["group_start"], spec["n_groups"]
+
+    # ---------------------------------------------------------------- season
+    margins = np.empty((n_sims, len(home)), dtype=np.int64)
+    played = spec["played"]
+    margins[:, played] = spec["played_margin"][played]
+    todo = ~played
+    if todo.any():
+        margins[:, todo] = _simulate_margins(
+            np.broadcast_to(home[todo], (n_sims, todo.sum())),
+            np.broadcast_to(away[todo], (n_sims, todo.sum())),
+            ortg,
+            drtg,
+            pace,
+            hca,
+            rng,
+            exact,
+        )
+
+    home_won = margins > 0
+    winner = np.where(home_won, home, away)
+    loser = np.where(home_won, away, home)
+    sim_offset = (np.arange(n_sims) * n_teams)[:, None]
+
+    wins = np.bincount(
+        (sim_offset + winner).ravel(), minlength=n_sims * n_teams
+    ).reshape(n_sims, n_teams)
+    games_played = spec["games_played"]
+    losses = games_played - wins
+
+    point_diff = margins @ spec["margin_to_team"]
+
+    conf_game = spec["conf_game"]
+    conf_wins = np.bincount(
+        (sim_offset + winner)[:, conf_game].ravel(), minlength=n_sims * n_teams
+    ).reshape(n_sims, n_teams)
+    conf_pct = conf_wins / np.maximum(spec["conf_games_played"], 1)
+
+    # Head-to-head wins W[s, i, j] = wins of i over j
+    h2h = np.bincount(
+        ((sim_offset + winner) * n_teams + loser).ravel(),
+        minlength=n_sims * n_teams * n_teams,
+    ).reshape(n_sims, n_teams, n_teams)
+    win_pct = wins / np.maximum(games_played, 1)
+    tied = (win_pct[:, :, None] == win_pct[:, None, :]) & spec["same_group"][None]
+    h2h_games = (tied * spec["pair_games"][None]).sum(axis=-1)
+    h2h_pct = np.where(
+        h2h_games > 0, (tied * h2h).sum(axis=-1) / np.maximum(h2h_games, 1), 0.5
+    )
+
+    ranks = _rank_within_groups(
+        [win_pct, h2h_pct, conf_pct, point_diff, rng.random((n_sims, n_teams))],
+        group,
+        group_start,
+    )
+
+    # ------------------------------------------------------------ postseason
+    def play_series(hi, lo, n_games):
+        """Winner of a series between (n_sims,) team arrays; hi hosts game 1."""
+        if n_games == 1:
+            m = _simulate_margins(hi, lo, ortg, drtg, pace, hca, rng, exact)
+            return np.where(m > 0, hi, lo), np.where(m > 0, lo, hi)
+        pattern = SERIES_HOME_PATTERN[:n_games]
+        h = np.where(pattern, hi[:, None], lo[:, None])
+        a = np.where(pattern, lo[:, None], hi[:, None])
+        m = _simulate_margins(h, a, ortg, drtg, pace, hca, rng, exact)
+        hi_wins = ((m > 0) == pattern).sum(axis=1)
+        hi_won = hi_wins > n_games // 2
+        return np.where(hi_won, hi, lo), np.where(hi_won, lo, hi)
+
+    def home_court_first(a, b, a_seed, b_seed):
+        """Order a matchup so the team with the better record hosts."""
+        wa = np.take_along_axis(win_pct, a[:, None], 1)[:, 0]
+        wb = np.take_along_axis(win_pct, b[:, None], 1)[:, 0]
+        a_hosts = (wa > wb) | ((wa == wb) & (a_seed < b_seed))
+        return np.where(a_hosts, a, b), np.where(a_hosts, b, a)
+
+    rows = np.arange(n_sims)
+    team_at_rank = np.empty((n_sims, n_groups, n_teams + 1), dtype=np.int64)
+    team_at_rank[rows[:, None], group[None, :], ranks] = np.arange(n_teams)[None, :]
+
+    seeds = np.zeros((n_sims, n_teams), dtype=np.int8)
+    rounds = np.zeros((n_sims, n_teams), dtype=np.int8)
+    play_in = np.zeros((n_sims, n_teams), dtype=bool)
+
+    bracket_size = spec["bracket_size"]
+    n_games = spec["series_games"]
+    champions = []
+    for g in range(n_groups):
+        by_rank = team_at_rank[:, g, :]  # column r = team ranked r
+        seeded = [by_rank[:, s] for s in range(1, bracket_size + 1)]
+
+        if spec["play_in"]:
+            for r in range(7, 11):
+                play_in[rows, by_rank[:, r]] = True
+            w78, l78 = play_series(by_rank[:, 7], by_rank[:, 8], 1)
+            w910, _ = play_series(by_rank[:, 9], by_rank[:, 10], 1)
+            w8, _ = play_series(l78, w910, 1)
+            seeded[6], seeded[7] = w78, w8
+
+        for s, teams in enumerate(seeded, start=1):
+            seeds[rows, teams] = s
+            rounds[rows, teams] = FIRST_ROUND
+
+        # Bracket slots hold (team, seed) in standard order
+        slot_teams = [seeded[s - 1] for s in _bracket_order(bracket_size)]
+        slot_seeds = [np.full(n_sims, s) for s in _bracket_order(bracket_size)]
+        round_reached = FIRST_ROUND
+        while len(slot_teams) > 1:
+            next_teams, next_seeds = [], []
+            for i in range(0, len(slot_teams), 2):
+                a, b = slot_teams[i], slot_teams[i + 1]
+                sa, sb = slot_seeds[i], slot_seeds[i + 1]
+                hi, lo = home_court_first(a, b, sa, sb)
+                winner_team, _ = play_series(hi, lo, n_games)
+                next_teams.append(winner_team)
+                next_seeds.append(np.where(winner_team == a, sa, sb))
+            round_reached += 1
+            for t in next_teams:
+                rounds[rows, t] = round_reached
+            slot_teams, slot_seeds = next_teams, next_seeds
+        champions.append((slot_teams[0], slot_seeds[0]))
+
+    if n_groups == 2:
+        (a, sa), (b, sb) = champions
+        hi, lo = home_court_first(a, b, sa, sb)
+        for t in (a, b):
+            rounds[rows, t] = FINALS
+        champion, _ = play_series(hi, lo, n_games)
+    else:
+        champion = champions[0][0]
+    rounds[rows, champion] = CHAMPION
+
+    return (
+        wins.astype(np.int16),
+        losses.astype(np.int16),
+        ranks,
+        seeds,
+        rounds,
+        play_in,
+    )
+
+
+# =============================================================================
+# Season Simulator
+# =============================================================================
+
+
+class SeasonSimulator:
+    """
+    Vectorized, parallel Monte Carlo season and playoff simulator.
+
+    Examples:
+        >>> strengths = strengths_from_ratings(ratings_df)
+        >>> schedule = load_schedule(conn, "2024-10-22", "2025-04-13")
+        >>> sim = SeasonSimulator(strengths, schedule)
+        >>> result = sim.simulate(n_simulations=50_000, random_seed=7)
+        >>> result.standings()[["team_id", "mean_wins", "title_prob"]]
+    """
+
+    def __init__(
+        self,
+        strengths: List[TeamStrength],
+        schedule: pd.DataFrame,
+        home_court_advantage: float = 2.5,
+        series_games: int = 7,
+        play_in: Optional[bool] = None,
+        exact_possessions: bool = False,
+    ):
+        """
+        Initialize season simulator.
+
+        Args:
+            strengths: One TeamStrength per team
+            schedule: Games with home_team_id and away_team_id; rows with
+                home_score and away_score filled are treated as played
+            home_court_advantage: Home edge in points per game
+            series_games: Games per playoff series (odd)
+            play_in: Use the 7-10 play-in (default: True with two conferences)
+            exact_possessions: Draw every possession (multinomial) instead of
+                the moment-matched normal margin; ~20x slower
+        """
+        if not strengths:
+            raise ValueError("At least one team strength is required")
+        if series_games < 1 or series_games % 2 == 0:
+            raise ValueError("series_games must be a positive odd number")
+
+        self.strengths = strengths
+        self.teams = [str(s.team_id) for s in strengths]
+        self.home_court_advantage = home_court_advantage
+        self.series_games = series_games
+        self.exact_possessions = exact_possessions
+
+        conferences = [s.conference for s in strengths]
+        if any(c is None for c in conferences):
+            conferences = [None] * len(strengths)
+        self.conferences = conferences
+        groups = sorted({c for c in conferences if c is not None}) or [None]
+        if len(groups) > 2:
+            raise ValueError(f"At most two conferences supported, got {groups}")
+
+        n_groups = len(groups)
+        self.bracket_size = 16 // n_groups
+        self.play_in = (n_groups == 2) if play_in is None else play_in
+        min_teams = self.bracket_size + (2 if self.play_in else 0)
+
+        group = np.array([groups.index(c) for c in conferences])
+        group_sizes = np.bincount(group, minlength=n_groups)
+        if group_sizes.min() < min_teams:
+            raise ValueError(
+                f"Each conference needs at least {min_teams} teams for the bracket"
+            )
+
+        self._spec = self._build_spec(schedule, group, n_groups)
+
+    def _build_spec(
+        self, schedule: pd.DataFrame, group: np.ndarray, n_groups: int
+    ) -> Dict[str, Any]:
+        """Precompute the arrays each worker needs (built once, shipped per chunk)."""
+        index = {t: i for i, t in enumerate(self.teams)}
+        home_ids = schedule["home_team_id"].astype(str)
+        away_ids = schedule["away_team_id"].astype(str)
+        unknown = (set(home_ids) | set(away_ids)) - set(index)
+        if unknown:
+            raise ValueError(f"Schedule has teams without strengths: {sorted(unknown)}")
+
+        n_teams = len(self.teams)
+        home = home_ids.map(index).to_numpy(np.int64)
+        away = away_ids.map(index).to_numpy(np.int64)
+
+        if {"home_score", "away_score"} <= set(schedule.columns):
+            scores = schedule[["home_score", "away_score"]].apply(
+                pd.to_numeric, errors="coerce"
+            )
+            played = scores.notna().all(axis=1).to_numpy()
+            played_margin = (
+                (scores["home_score"] - scores["away_score"])
+                .fillna(0)
+                .to_numpy(np.int64)
+            )
+        else:
+            played = np.zeros(len(schedule), dtype=bool)
+            played_margin = np.zeros(len(schedule), dtype=np.int64)
+
+        pair_games = np.zeros((n_teams, n_teams), dtype=np.int64)
+        np.add.at(pair_games, (home, away), 1)
+        pair_games = pair_games + pair_games.T
+
+        conf_game = group[home] == group[away]
+        games_played = np.bincount(home, minlength=n_teams) + np.bincount(
+            away, minlength=n_teams
+        )
+        conf_games_played = np.bincount(
+            home[conf_game], minlength=n_teams
+        ) + np.bincount(away[conf_game], minlength=n_teams)
+
+        group_start = np.concatenate([[0], np.cumsum(np.bincount(group))[:-1]])
+
+        # (n_games, n_teams) +1 home / -1 away, so margins @ it = point diff
+        margin_to_team = np.zeros((len(home), n_teams))
+        margin_to_team[np.arange(len(home)), home] = 1.0
+        margin_to_team[np.arange(len(home)), away] = -1.0
+
+        return {
+            "n_teams": n_teams,
+            "ortg": np.array([s.ortg for s in self.strengths], dtype=float),
+            "drtg": np.array([s.drtg for s in self.strengths], dtype=float),
+            "pace": np.array([s.pace for s in self.strengths], dtype=float),
+            "home_court": float(self.home_court_advantage),
+            "home": home,
+            "away": away,
+            "played": played,
+            "played_margin": played_margin,
+            "games_played": games_played,
+            "margin_to_team": margin_to_team,
+            "conf_game": conf_game,
+            "conf_games_played": conf_games_played,
+            "pair_games": pair_games,
+            "same_group": group[:, None] == group[None, :],
+            "group": group,
+            "group_start": group_start,
+            "n_groups": n_groups,
+            "bracket_size": self.bracket_size,
+            "play_in": self.play_in,
+            "series_games": self.series_games,
+            "exact_possessions": self.exact_possessions,
+        }
+
+    def simulate(
+        self,
+        n_simulations: int = 10_000,
+        chunk_size: int = 2_000,
+        n_jobs: Optional[int] = None,
+        random_seed: Optional[int] = None,
+    ) -> SeasonSimulationResult:
+        """
+        Simulate seasons and postseasons.
+
+        Chunks get independent child streams of one SeedSequence, so results
+        depend on random_seed and chunk_size but not on n_jobs.
+
+        Args:
+            n_simulations: Number of simulated seasons
+            chunk_size: Seasons per vectorized chunk (bounds memory)
+            n_jobs: Worker processes (default: CPU count; 1 = in-process)
+            random_seed: Root seed for reproducibility
+
+        Returns:
+            SeasonSimulationResult
+        """
+        if n_simulations < 1:
+            raise ValueError("n_simulations must be >= 1")
+
+        sizes = [chunk_size] * (n_simulations // chunk_size)
+        if n_simulations % chunk_size:
+            sizes.append(n_simulations % chunk_size)
+        seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = max(1, min(n_jobs, len(sizes)))
+
+        logger.info(
+            f"Simulating {n_simulations} seasons in {len(sizes)} chunk(s) "
+            f"on {n_jobs} process(es)"
+        )
+
+        if n_jobs == 1:
+            chunks = [_simulate_chunk(self._spec, n, s) for n, s in zip(sizes, seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                chunks = list(
+                    executor.map(
+                        _simulate_chunk, [self._spec] * len(sizes), sizes, seeds
+                    )
+                )
+
+        wins, losses, ranks, seeds_arr, rounds, play_in = (
+            np.concatenate(parts) for parts in zip(*chunks)
+        )
+
+        return SeasonSimulationResult(
+            teams=self.teams,
+            conferences=self.conferences,
+            wins=wins,
+            losses=losses,
+            regular_season_rank=ranks,
+            playoff_seed=seeds_arr,
+            playoff_round=rounds,
+            play_in=play_in,
+            convergence=convergence_table(rounds >= CHAMPION, wins),
+            metadata={
+                "n_games": int(len(self._spec["home"])),
+                "n_played": int(self._spec["played"].sum()),
+                "chunk_size": chunk_size,
+                "n_jobs": n_jobs,
+                "random_seed": random_seed,
+                "home_court_advantage": self.home_court_advantage,
+            },
+        )
+
+
+def convergence_table(
+    title: np.ndarray, wins: np.ndarray, n_checkpoints: int = 10
+) -> pd.DataFrame:
+    """
+    Convergence of title odds and mean wins as simulations accumulate.
+
+    Args:
+        title: (n_sims, n_teams) bool, team won the title
+        wins: (n_sims, n_teams) regular-season wins
+        n_checkpoints: Number of (log-spaced) checkpoints
+
+    Returns:
+        DataFrame with n_simulations, max_title_std_error,
+        max_title_change (vs. final estimate) and max_mean_wins_change
+    """
+    n = title.shape[0]
+    checkpoints = np.unique(np.geomspace(min(100, n), n, num=n_checkpoints).astype(int))
+    title_cum = np.cumsum(title, axis=0)
+    wins_cum = np.cumsum(wins, axis=0, dtype=float)
+    final_title = title_cum[-1] / n
+    final_wins = wins_cum[-1] / n
+
+    records = []
+    for k in checkpoints:
+        p = title_cum[k - 1] / k
+        records.append(
+            {
+                "n_simulations": int(k),
+                "max_title_std_error": float(np.sqrt(p * (1 - p) / k).max()),
+                "max_title_change": float(np.abs(p - final_title).max()),
+                "max_mean_wins_change": float(
+                    np.abs(wins_cum[k - 1] / k - final_wins).max()
+                ),
+            }
+        )
+    return pd.DataFrame(records)
@@ -31,12 +31,14 @@ Author: Claude Code
 Date: November 2025
 """
 
+import bisect
 import logging
+import math
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
 import numpy as np
@@ -80,20 +82,349 @@ class StreamingStats:
     dropped_events: int = 0
 
 
+# Buckets per retention window in a buffer's WindowIndex
+DEFAULT_WINDOW_BUCKETS = 64
+
+# Index keys: every event, events of one game, PLAYER_STAT events of a player
+ALL_EVENTS = ("all",)
+
+
+def game_key(game_id: str) -> Tuple[str, str]:
+    """WindowIndex key for a game's events."""
+    return ("game", game_id)
+
+
+def player_key(player_id: str) -> Tuple[str, str]:
+    """WindowIndex key for a player's PLAYER_STAT events."""
+    return ("player", player_id)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+class WindowAggregate:
+    """
+    Running count, event type counts and moments of numeric data fields.
+
+    Supports removal as well as addition, so windows are maintained with
+    add/evict deltas instead of rescans.
+    """
+
+    __slots__ = ("count", "type_counts", "moments")
+
+    def __init__(self):
+        self.count = 0
+        self.type_counts: Dict[str, int] = {}
+        # field -> [n, sum of integer values, sum of other values,
+        #           sum of squares, n of non-integer values]
+        # Integer values are summed exactly so integer fields total to int.
+        self.moments: Dict[str, List[float]] = {}
+
+    def add(self, event: StreamEvent, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one event."""
+        self.count += sign
+        event_type = event.event_type.value
+        self.type_counts[event_type] = self.type_counts.get(event_type, 0) + sign
+        for name, value in event.data.items():
+            if not _is_number(value):
+                continue
+            moment = self.moments.get(name)
+            if moment is None:
+                moment = self.moments[name] = [0, 0, 0.0, 0.0, 0]
+            moment[0] += sign
+            if isinstance(value, (int, np.integer)):
+                moment[1] += sign * int(value)
+            else:
+                moment[2] += sign * value
+                moment[4] += sign
+            moment[3] += sign * value * value
+
+    def merge(self, other: "WindowAggregate", sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) another aggregate."""
+        self.count += sign * other.count
+        for event_type, n in other.type_counts.items():
+            self.type_counts[event_type] = (
+                self.type_counts.get(event_type, 0) + sign * n
+            )
+        for name, other_moment in other.moments.items():
+            moment = self.moments.get(name)
+            if moment is None:
+                moment = self.moments[name] = [0, 0, 0.0, 0.0, 0]
+            for i, value in enumerate(other_moment):
+                moment[i] += sign * value
+
+    def copy(self) -> "WindowAggregate":
+        """Independent copy."""
+        result = WindowAggregate()
+        result.count = self.count
+        result.type_counts = {k: n for k, n in self.type_counts.items() if n}
+        result.moments = {k: list(m) for k, m in self.moments.items() if m[0]}
+        return result
+
+    def total(self, name: str) -> Union[int, float]:
+        """
+        Sum of a data field (events without it count as 0).
+
+        An int when every value in the window is an integer.
+        """
+        moment = self.moments.get(name)
+        if not moment:
+            return 0
+        n, int_total, float_total, _, n_float = moment
+        return int_total + float_total if n_float else int_total
+
+    def mean_std(self, name: str) -> Tuple[int, float, float]:
+        """
+        Count, mean and population standard deviation of a data field.
+
+        Args:
+            name: Data field
+
+        Returns:
+            (n, mean, std); (0, 0.0, 0.0) if no event has the field
+        """
+        moment = self.moments.get(name)
+        if not moment or moment[0] <= 0:
+            return 0, 0.0, 0.0
+        n, int_total, float_total, total_sq, _ = moment
+        mean = (int_total + float_total) / n
+        return n, mean, math.sqrt(max(total_sq / n - mean * mean, 0.0))
+
+
+class _WindowCell:
+    """One key's events and aggregate in one time bucket."""
+
+    __slots__ = ("events", "aggregate")
+
+    def __init__(self):
+        self.events: Deque[Tuple[float, StreamEvent]] = deque()
+        self.aggregate = WindowAggregate()
+
+
+class _KeyWindow:
+    """A key's running totals plus its non-empty buckets, sorted."""
+
+    __slots__ = ("totals", "cells", "order")
+
+    def __init__(self):
+        self.totals = WindowAggregate()
+        self.cells: Dict[int, _WindowCell] = {}
+        self.order: List[int] = []
+
+
+class WindowIndex:
+    """
+    Time-bucketed sliding-window aggregates per key.
+
+    Each key (all events, a game, a player) keeps running totals over the
+    events currently held plus per-bucket aggregates. Adding or evicting an
+    event applies its delta to both. A windowed query starts from whichever
+    side is cheaper: the running totals minus the buckets older than the
+    window, or the sum of the buckets inside it. Events are scanned only in
+    the bucket that straddles the cutoff, so results are exact and the cost
+    does not grow with the number of events held.
+
+    Not thread-safe; StreamBuffer calls it under its lock.
+    """
+
+    def __init__(self, bucket_seconds: float = 1.0):
+        """
+        Initialize window index.
+
+        Args:
+            bucket_seconds: Width of a time bucket
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.bucket_seconds = bucket_seconds
+        self._keys: Dict[Tuple, _KeyWindow] = {}
+
+    @staticmethod
+    def keys_for(event: StreamEvent) -> List[Tuple]:
+        """Index keys an event contributes to."""
+        keys = [ALL_EVENTS]
+        if event.game_id:
+            keys.append(game_key(event.game_id))
+        if event.event_type == StreamEventType.PLAYER_STAT:
+            player_id = event.data.get("player_id")
+            if player_id is not None:
+                keys.append(player_key(player_id))
+        return keys
+
+    def _bucket(self, ts: float) -> int:
+        return math.floor(ts / self.bucket_seconds)
+
+    def add(self, event: StreamEvent) -> None:
+        """Add an event to every key it belongs to."""
+        ts = event.timestamp.timestamp()
+        bucket = self._bucket(ts)
+        for key in self.keys_for(event):
+            window = self._keys.get(key)
+            if window is None:
+                window = self._keys[key] = _KeyWindow()
+            cell = window.cells.get(bucket)
+            if cell is None:
+                cell = window.cells[bucket] = _WindowCell()
+                bisect.insort(window.order, bucket)
+            cell.events.append((ts, event))
+            cell.aggregate.add(event)
+            window.totals.add(event)
+
+    def remove(self, event: StreamEvent) -> None:
+        """Evict an event previously added."""
+        bucket = self._bucket(event.timestamp.timestamp())
+        for key in self.keys_for(event):
+            window = self._keys.get(key)
+            cell = window.cells.get(bucket) if window else None
+            if cell is None:
+                continue
+            if cell.events and cell.events[0][1] is event:
+                cell.events.popleft()  # usual case: oldest arrival
+            else:
+                for i, (_, held) in enumerate(cell.events):
+                    if held is event:
+                        del cell.events[i]
+                        break
+                else:
+                    continue
+            cell.aggregate.add(event, sign=-1)
+            window.totals.add(event, sign=-1)
+            if not cell.events:
+                del window.cells[bucket]
+                window.order.pop(bisect.bisect_left(window.order, bucket))
+                if not window.order:
+                    del self._keys[key]
+
+    def clear(self) -> None:
+        """Drop all events."""
+        self._keys.clear()
+
+    def aggregate(self, key: Tuple, cutoff: Optional[float] = None) -> WindowAggregate:
+        """
+        Aggregate of a key's events with timestamp >= cutoff.
+
+        Args:
+            key: Index key (ALL_EVENTS, game_key(...), player_key(...))
+            cutoff: Epoch seconds (None = every event held)
+
+        Returns:
+            WindowAggregate (a copy; safe to keep)
+        """
+        window = self._keys.get(key)
+        if window is None:
+            return WindowAggregate()
+        if cutoff is None:
+            return window.totals.copy()
+
+        boundary = self._bucket(cutoff)
+        first_live = bisect.bisect_left(window.order, boundary)
+        if first_live <= len(window.order) - first_live:
+            result = window.totals.copy()
+            for bucket in window.order[:first_live]:
+                result.merge(window.cells[bucket].aggregate, sign=-1)
+        else:
+            result = WindowAggregate()
+            for bucket in window.order[first_live:]:
+                result.merge(window.cells[bucket].aggregate)
+
+        cell = window.cells.get(boundary)
+        if cell is not None:
+            for ts, event in cell.events:
+                if ts < cutoff:
+                    result.add(event, sign=-1)
+        return result
+
+    def events(self, key: Tuple, cutoff: Optional[float] = None) -> List[StreamEvent]:
+        """
+        A key's events with timestamp >= cutoff, oldest bucket first.
+
+        Args:
+            key: Index key
+            cutoff: Epoch seconds (None = every event held)
+
+        Returns:
+            List of events
+        """
+        window = self._keys.get(key)
+        if window is None:
+            return []
+        start = None if cutoff is None else self._bucket(cutoff)
+        first_live = 0 if start is None else bisect.bisect_left(window.order, start)
+        result = []
+        for bucket in window.order[first_live:]:
+            cell = window.cells[bucket]
+            if bucket == start:
+                result.extend(e for ts, e in cell.events if ts >= cutoff)
+            else:
+                result.extend(e for _, e in cell.events)
+        return result
+
+    def time_range(
+        self, key: Tuple, cutoff: Optional[float] = None
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Earliest and latest timestamps of a key's events with ts >= cutoff.
+
+        Only the first and last live buckets are scanned.
+
+        Returns:
+            (start, end) or None if there are no such events
+        """
+        window = self._keys.get(key)
+        if window is None:
+            return None
+        first_live = (
+            0
+            if cutoff is None
+            else bisect.bisect_left(window.order, self._bucket(cutoff))
+        )
+        live = window.order[first_live:]
+        start = None
+        for bucket in live:
+            stamps = [
+                (ts, e.timestamp)
+                for ts, e in window.cells[bucket].events
+                if cutoff is None or ts >= cutoff
+            ]
+            if stamps:
+                start = min(stamps, key=lambda x: x[0])[1]
+                break
+        if start is None:
+            return None
+        last = window.cells[live[-1]].events
+        end = max(
+            ((ts, e.timestamp) for ts, e in last if cutoff is None or ts >= cutoff),
+            key=lambda x: x[0],
+        )[1]
+        return start, end
+
+
 class StreamBuffer:
     """
     Thread-safe buffer for streaming data.
 
     Implements a sliding window with configurable size and retention policy.
+    Held events are indexed in a WindowIndex so windowed counts and sums
+    are answered without rescanning the buffer.
     """
 
-    def __init__(self, max_size: int = 1000, max_age_seconds: Optional[float] = None):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_age_seconds: Optional[float] = None,
+        bucket_seconds: Optional[float] = None,
+    ):
         """
         Initialize stream buffer.
 
         Args:
             max_size: Maximum number of events to retain
             max_age_seconds: Maximum age of events (None = no age limit)
+            bucket_seconds: Window index bucket width (default:
+                max_age_seconds / DEFAULT_WINDOW_BUCKETS, or 1 second)
         """
         self.max_size = max_size
         self.max_age_seconds = max_age_seconds
@@ -101,23 +432,33 @@ class StreamBuffer:
         self.lock = Lock()
         self._sequence_counter = 0
 
+        if bucket_seconds is None:
+            bucket_seconds = (
+                max_age_seconds / DEFAULT_WINDOW_BUCKETS if max_age_seconds else 1.0
+            )
+        self.index = WindowIndex(bucket_seconds)
+
     def add(self, event: StreamEvent) -> None:
         """Add event to buffer (thread-safe)."""
         with self.lock:
-            event.sequence_id = self._sequence_counter
-            self._sequence_counter += 1
-            self.buffer.append(event)
+            self._append(event)
             self._cleanup_old_events()
 
     def add_batch(self, events: List[StreamEvent]) -> None:
         """Add multiple events (more efficient than individual adds)."""
         with self.lock:
             for event in events:
-                event.sequence_id = self._sequence_counter
-                self._sequence_counter += 1
-                self.buffer.append(event)
+                self._append(event)
             self._cleanup_old_events()
 
+    def _append(self, event: StreamEvent) -> None:
+        event.sequence_id = self._sequence_counter
+        self._sequence_counter += 1
+        if len(self.buffer) == self.max_size:
+            self.index.remove(self.buffer[0])  # about to fall off the deque
+        self.buffer.append(event)
+        self.index.add(event)
+
     def get_recent(self, n: int) -> List[StreamEvent]:
         """Get n most recent events."""
         with self.lock:
@@ -132,12 +473,37 @@ class StreamBuffer:
         """Get events within time window."""
         with self.lock:
             cutoff = datetime.now().timestamp() - window_seconds
-            return [e for e in self.buffer if e.timestamp.timestamp() >= cutoff]
+            window = self.index.aggregate(ALL_EVENTS, cutoff)
+            if window.count == len(self.buffer):
+                return list(self.buffer)
+            return self.index.events(ALL_EVENTS, cutoff)
+
+    def get_window_stats(
+        self, window_seconds: Optional[float], key: Tuple = ALL_EVENTS
+    ) -> Tuple[WindowAggregate, Optional[Tuple[datetime, datetime]]]:
+        """
+        Aggregate and time range of indexed events within a time window.
+
+        Args:
+            window_seconds: Time window (None = every event held)
+            key: Index key (ALL_EVENTS, game_key(...), player_key(...))
+
+        Returns:
+            (WindowAggregate, (start, end) or None)
+        """
+        with self.lock:
+            cutoff = (
+                None
+                if window_seconds is None
+                else datetime.now().timestamp() - window_seconds
+            )
+            return self.index.aggregate(key, cutoff), self.index.time_range(key, cutoff)
 
     def clear(self) -> None:
         """Clear all events."""
         with self.lock:
             self.buffer.clear()
+            self.index.clear()
 
     def _cleanup_old_events(self) -> None:
         """Remove events older than max_age_seconds."""
@@ -146,7 +512,7 @@ class StreamBuffer:
 
         cutoff = datetime.now().timestamp() - self.max_age_seconds
         while self.buffer and self.buffer[0].timestamp.timestamp() < cutoff:
-            self.buffer.popleft()
+            self.index.remove(self.buffer.popleft())
 
 
 class StreamingAnalyzer:
@@ -264,25 +630,22 @@ class StreamingAnalyzer:
         Returns:
             Dictionary of live stats
         """
-        window_events = self.buffer.get_window(self.window_seconds)
-
-        if game_id:
-            window_events = [
-                e for e in window_events if e.data.get("game_id") == game_id
-            ]
+        window, time_range = self.buffer.get_window_stats(
+            self.window_seconds, game_key(game_id) if game_id else ALL_EVENTS
+        )
 
-        if not window_events:
+        if not window.count:
             return {"event_count": 0}
 
         # Calculate statistics
         stats = {
-            "event_count": len(window_events),
+            "event_count": window.count,
             "window_seconds": self.window_seconds,
-            "events_per_minute": len(window_events) / (self.window_seconds / 60),
-            "event_types": self._count_event_types(window_events),
+            "events_per_minute": window.count / (self.window_seconds / 60),
+            "event_types": {t: n for t, n in window.type_counts.items() if n},
             "time_range": {
-                "start": min(e.timestamp for e in window_events).isoformat(),
-                "end": max(e.timestamp for e in window_events).isoformat(),
+                "start": time_range[0].isoformat(),
+                "end": time_range[1].isoformat(),
             },
         }
 
@@ -302,26 +665,18 @@ class StreamingAnalyzer:
             Player's live stats
         """
         window = window_seconds or self.window_seconds
-        events = self.buffer.get_window(window)
-
-        # Filter to player events
-        player_events = [
-            e
-            for e in events
-            if e.event_type == StreamEventType.PLAYER_STAT
-            and e.data.get("player_id") == player_id
-        ]
+        player_window, _ = self.buffer.get_window_stats(window, player_key(player_id))
 
-        if not player_events:
+        if not player_window.count:
             return {"player_id": player_id, "events": 0}
 
         # Aggregate stats
         stats = {
             "player_id": player_id,
-            "events": len(player_events),
-            "points": sum(e.data.get("points", 0) for e in player_events),
-            "rebounds": sum(e.data.get("rebounds", 0) for e in player_events),
-            "assists": sum(e.data.get("assists", 0) for e in player_events),
+            "events": player_window.count,
+            "points": player_window.total("points"),
+            "rebounds": player_window.total("rebounds"),
+            "assists": player_window.total("assists"),
             "time_window_seconds": window,
         }
 
@@ -340,21 +695,24 @@ class StreamingAnalyzer:
         Returns:
             List of detected anomalies
         """
-        events = self.buffer.get_window(self.window_seconds)
-
-        # Extract metric values
-        values = [e.data.get(metric, 0) for e in events if metric in e.data]
+        # Window moments come from the running index
+        window, _ = self.buffer.get_window_stats(self.window_seconds)
+        n, mean, std = window.mean_std(metric)
 
-        if len(values) < 10:  # Need enough data
+        if n < 10:  # Need enough data
             return []
 
-        # Calculate statistics
-        mean = np.mean(values)
-        std = np.std(values)
+        # Only events carrying the metric are candidates
+        events = [
+            e
+            for e in self.buffer.get_window(self.window_seconds)
+            if _is_number(e.data.get(metric))
+        ]
 
         # Find anomalies
         anomalies = []
-        for event, value in zip(events, values):
+        for event in events:
+            value = event.data[metric]
             if abs(value - mean) > threshold_std * std:
                 anomalies.append(
                     {
@@ -404,14 +762,6 @@ class StreamingAnalyzer:
                 results[name] = None
         return results
 
-    def _count_event_types(self, events: List[StreamEvent]) -> Dict[str, int]:
-        """Count events by type."""
-        counts: Dict[str, int] = {}
-        for event in events:
-            event_type = event.event_type.value
-            counts[event_type] = counts.get(event_type, 0) + 1
-        return counts
-
 
 class LiveGameTracker:
     """
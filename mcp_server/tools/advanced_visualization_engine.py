@@ -26,8 +26,10 @@ import math
 
 import numpy as np
 import pandas as pd
-from sympy import symbols, sympify, latex, simplify, expand, factor
-from sympy import Symbol, Expr, lambdify
+from sympy import symbols, latex, simplify, expand, factor
+from sympy import Symbol, Expr
+
+from .formula_cache import cached_sympify, compile_formula
 
 # Visualization libraries
 try:
@@ -233,7 +235,7 @@ class AdvancedVisualizationEngine:
                 config = self.default_config
 
             # Parse the formula
-            expr = sympify(formula)
+            expr = cached_sympify(formula)
 
             # Generate visualization based on type
             if visualization_type == VisualizationType.FORMULA_GRAPH:
@@ -482,8 +484,9 @@ class AdvancedVisualizationEngine:
             if not self.matplotlib_available:
                 return {"error": "Matplotlib not available"}
 
-            # Get free symbols from expression
-            free_symbols = list(expr.free_symbols)
+            # Get free symbols (sorted) and cached NumPy callables
+            compiled = compile_formula(expr)
+            free_symbols = list(compiled.free_symbols)
 
             if len(free_symbols) == 1:
                 # Single variable function
@@ -491,7 +494,7 @@ class AdvancedVisualizationEngine:
                 x_vals = np.linspace(-10, 10, 1000)
 
                 # Create lambda function
-                f = lambdify(x, expr, "numpy")
+                f = compiled.function([x])
                 y_vals = f(x_vals)
 
                 # Create plot
@@ -515,7 +518,7 @@ class AdvancedVisualizationEngine:
                 X, Y = np.meshgrid(x_vals, y_vals)
 
                 # Create lambda function
-                f = lambdify([x, y], expr, "numpy")
+                f = compiled.function([x, y])
                 Z = f(X, Y)
 
                 # Create contour plot
@@ -570,8 +573,9 @@ class AdvancedVisualizationEngine:
 
             from mpl_toolkits.mplot3d import Axes3D
 
-            # Get free symbols from expression
-            free_symbols = list(expr.free_symbols)
+            # Get free symbols (sorted) and cached NumPy callables
+            compiled = compile_formula(expr)
+            free_symbols = list(compiled.free_symbols)
 
             if len(free_symbols) >= 2:
                 x, y = free_symbols[:2]
@@ -580,7 +584,7 @@ class AdvancedVisualizationEngine:
                 X, Y = np.meshgrid(x_vals, y_vals)
 
                 # Create lambda function
-                f = lambdify([x, y], expr, "numpy")
+                f = compiled.function([x, y])
                 Z = f(X, Y)
 
                 # Create 3D plot
@@ -625,8 +629,9 @@ class AdvancedVisualizationEngine:
             if not self.plotly_available:
                 return {"error": "Plotly not available"}
 
-            # Get free symbols from expression
-            free_symbols = list(expr.free_symbols)
+            # Get free symbols (sorted) and cached NumPy callables
+            compiled = compile_formula(expr)
+            free_symbols = list(compiled.free_symbols)
 
             if len(free_symbols) == 1:
                 # Single variable function
@@ -634,7 +639,7 @@ class AdvancedVisualizationEngine:
                 x_vals = np.linspace(-10, 10, 1000)
 
                 # Create lambda function
-                f = lambdify(x, expr, "numpy")
+                f = compiled.function([x])
                 y_vals = f(x_vals)
 
                 # Create interactive plot
@@ -658,7 +663,7 @@ class AdvancedVisualizationEngine:
                 X, Y = np.meshgrid(x_vals, y_vals)
 
                 # Create lambda function
-                f = lambdify([x, y], expr, "numpy")
+                f = compiled.function([x, y])
                 Z = f(X, Y)
 
                 # Create 3D surface plot
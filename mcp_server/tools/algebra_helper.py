@@ -20,7 +20,7 @@ try:
     import sympy as sp
     from sympy import symbols, solve, diff, integrate, simplify, expand, factor
     from sympy import latex, pretty_print, Matrix, Symbol, Eq
-    from sympy.parsing.sympy_parser import parse_expr
+    from .formula_cache import cached_parse_expr
 
     SYMPY_AVAILABLE = True
 except ImportError:
@@ -80,12 +80,12 @@ def solve_equation(equation_str: str, variable: str = None) -> Dict[str, Any]:
         # Parse the equation
         if "=" in equation_str:
             left, right = equation_str.split("=", 1)
-            left_expr = parse_expr(left.strip())
-            right_expr = parse_expr(right.strip())
+            left_expr = cached_parse_expr(left.strip())
+            right_expr = cached_parse_expr(right.strip())
             equation = Eq(left_expr, right_expr)
         else:
             # Assume it's an expression equal to 0
-            equation = Eq(parse_expr(equation_str), 0)
+            equation = Eq(cached_parse_expr(equation_str), 0)
 
         # Auto-detect variable if not specified
         if variable is None:
@@ -153,7 +153,7 @@ def simplify_expression(expression_str: str) -> Dict[str, Any]:
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(expression_str)
+        expr = cached_parse_expr(expression_str)
         simplified = simplify(expr)
 
         return {
@@ -200,7 +200,7 @@ def differentiate_expression(
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(expression_str)
+        expr = cached_parse_expr(expression_str)
         var_symbol = symbols(variable)
 
         derivative = diff(expr, var_symbol, order)
@@ -256,7 +256,7 @@ def integrate_expression(
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(expression_str)
+        expr = cached_parse_expr(expression_str)
         var_symbol = symbols(variable)
 
         if lower_limit is not None and upper_limit is not None:
@@ -772,7 +772,7 @@ def get_sports_formula(formula_name: str, **kwargs) -> Dict[str, Any]:
 
         # Parse formula as sympy expression
         try:
-            expr = parse_expr(preprocessed_formula)
+            expr = cached_parse_expr(preprocessed_formula)
         except Exception as parse_error:
             logger.error(
                 f"Could not parse formula '{preprocessed_formula}': {parse_error}"
@@ -908,7 +908,7 @@ def render_equation_latex(
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(expression_str)
+        expr = cached_parse_expr(expression_str)
         latex_code = latex(expr)
 
         # Wrap in LaTeX delimiters to include backslashes
@@ -1098,11 +1098,11 @@ def solve_equation_system(equations: List[str], variables: List[str]) -> Dict[st
         for eq_str in equations:
             if "=" in eq_str:
                 left, right = eq_str.split("=", 1)
-                left_expr = parse_expr(left.strip())
-                right_expr = parse_expr(right.strip())
+                left_expr = cached_parse_expr(left.strip())
+                right_expr = cached_parse_expr(right.strip())
                 parsed_equations.append(Eq(left_expr, right_expr))
             else:
-                parsed_equations.append(Eq(parse_expr(eq_str), 0))
+                parsed_equations.append(Eq(cached_parse_expr(eq_str), 0))
 
         # Create variable symbols
         var_symbols = symbols(variables)
@@ -1187,7 +1187,7 @@ def get_formula_variables(formula_str: str) -> List[str]:
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(formula_str)
+        expr = cached_parse_expr(formula_str)
         variables = [str(sym) for sym in expr.free_symbols]
         return sorted(variables)
     except Exception as e:
@@ -1225,7 +1225,7 @@ def expand_formula(formula_str: str) -> Dict[str, Any]:
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(formula_str)
+        expr = cached_parse_expr(formula_str)
         expanded = expand(expr)
 
         return {
@@ -1260,7 +1260,7 @@ def factor_formula(formula_str: str) -> Dict[str, Any]:
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(formula_str)
+        expr = cached_parse_expr(formula_str)
         factored = factor(expr)
 
         return {
@@ -1336,7 +1336,7 @@ def substitute_variables(
     check_sympy_dependency()
 
     try:
-        expr = parse_expr(formula_str)
+        expr = cached_parse_expr(formula_str)
 
         # Convert string keys to symbols
         subs_dict = {symbols(k): v for k, v in substitutions.items()}
@@ -15,11 +15,11 @@ from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import sympy as sp
-from sympy.parsing.sympy_parser import parse_expr
 from sympy import latex, simplify, expand, factor
 
 # Import other modules
 from .formula_intelligence import FormulaIntelligence
+from .formula_cache import cached_parse_expr, compile_formula
 
 logger = logging.getLogger(__name__)
 
@@ -524,9 +524,9 @@ class InteractiveFormulaBuilder:
 
             # Generate LaTeX
             try:
-                expr = parse_expr(formula_str)
-                preview["latex"] = latex(expr)
-                preview["simplified"] = latex(simplify(expr))
+                compiled = compile_formula(formula_str)
+                preview["latex"] = compiled.latex
+                preview["simplified"] = latex(compiled.simplified)
             except Exception as e:
                 preview["error"] = f"LaTeX generation failed: {str(e)}"
 
@@ -639,7 +639,7 @@ class InteractiveFormulaBuilder:
         try:
             # Preprocess formula to handle variables like 3PM
             preprocessed = self._preprocess_formula_for_parsing(formula_str)
-            expr = parse_expr(preprocessed)
+            expr = cached_parse_expr(preprocessed)
 
             if format_type == "latex":
                 return latex(expr)
@@ -788,7 +788,7 @@ class InteractiveFormulaBuilder:
         try:
             # Preprocess formula to handle variables like 3PM
             preprocessed = self._preprocess_formula_for_parsing(formula_str)
-            expr = parse_expr(preprocessed)
+            expr = cached_parse_expr(preprocessed)
             # Basic semantic checks passed
         except Exception as e:
             errors.append(f"Semantic error: {str(e)}")
@@ -861,14 +861,17 @@ class InteractiveFormulaBuilder:
         self, formula_str: str, variable_values: Dict[str, float]
     ) -> float:
         """Calculate formula with given variable values"""
-        # Substitute variables with values
-        substituted = formula_str
-        for var, value in variable_values.items():
-            substituted = substituted.replace(var, str(value))
-
-        # Parse and evaluate
-        expr = parse_expr(substituted)
-        return float(expr.evalf())
+        # Evaluate the cached compiled formula instead of re-parsing the text
+        # with the values substituted in; provided names always parse as
+        # symbols (so e.g. "E" is a variable, not Euler's number)
+        values = {
+            f"VAR_{var}" if var[0].isdigit() else var: value
+            for var, value in variable_values.items()
+        }
+        compiled = compile_formula(
+            self._preprocess_formula_for_parsing(formula_str), symbols=values
+        )
+        return float(compiled.evaluate(values, modules="math"))
 
     def _get_initial_suggestions(self) -> List[str]:
         """Get initial suggestions for empty formula"""
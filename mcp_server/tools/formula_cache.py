@@ -0,0 +1,289 @@
+"""
+Compiled-Expression Cache for Sympy Formula Tools
+
+Parsing formula text and generating NumPy code with ``lambdify`` dominate the
+latency of the formula tools, and the same formulas arrive on every request.
+This module keeps one bounded, thread-safe LRU of compiled formulas keyed by
+normalized formula text (or by expression), each holding:
+
+- The parsed expression and its free symbols (sorted by name)
+- Lazily computed simplified form and LaTeX
+- Lambdified callables per argument ordering and module set
+
+Usage:
+    from mcp_server.tools.formula_cache import compile_formula
+
+    compiled = compile_formula("PTS / (2 * (FGA + 0.44 * FTA))")
+    ts = compiled.function(["PTS", "FGA", "FTA"])(pts, fga, fta)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr
+
+logger = logging.getLogger(__name__)
+
+PARSERS = ("parse_expr", "sympify")
+DEFAULT_MAX_SIZE = 1024
+
+
+def normalize_formula(formula: str) -> str:
+    """Collapse whitespace so trivially different spellings share an entry"""
+    return " ".join(formula.split())
+
+
+class CompiledFormula:
+    """A parsed formula with cached derived forms and lambdified callables"""
+
+    def __init__(self, expr: sp.Basic, source: Optional[str] = None):
+        self.expr = expr
+        self.source = source
+        self.free_symbols = tuple(sorted(expr.free_symbols, key=lambda s: s.name))
+        self._functions: Dict[Any, Callable] = {}
+        self._simplified: Optional[sp.Basic] = None
+        self._latex: Optional[str] = None
+        self._lock = threading.Lock()
+        self._cache: Optional["FormulaCache"] = None
+
+    @property
+    def variables(self) -> List[str]:
+        """Names of the free symbols, sorted"""
+        return [s.name for s in self.free_symbols]
+
+    @property
+    def simplified(self) -> sp.Basic:
+        """``simplify(expr)``, computed once"""
+        if self._simplified is None:
+            self._simplified = sp.simplify(self.expr)
+        return self._simplified
+
+    @property
+    def latex(self) -> str:
+        """LaTeX rendering of the expression, computed once"""
+        if self._latex is None:
+            self._latex = sp.latex(self.expr)
+        return self._latex
+
+    def _symbol(self, arg: Union[str, sp.Symbol]) -> sp.Symbol:
+        if isinstance(arg, sp.Symbol):
+            return arg
+        for symbol in self.free_symbols:
+            if symbol.name == arg:
+                return symbol  # keep the parsed symbol's assumptions
+        return sp.Symbol(arg)
+
+    def function(
+        self,
+        args: Optional[Sequence[Union[str, sp.Symbol]]] = None,
+        modules: Union[str, Sequence[str]] = "numpy",
+    ) -> Callable:
+        """
+        Lambdified callable for an argument ordering, generated once.
+
+        Args:
+            args: Argument symbols or names (defaults to ``free_symbols``)
+            modules: lambdify modules (default "numpy")
+
+        Returns:
+            Callable taking the arguments positionally
+        """
+        symbols = (
+            self.free_symbols if args is None else tuple(self._symbol(a) for a in args)
+        )
+        key = (symbols, modules if isinstance(modules, str) else tuple(modules))
+
+        fn = self._functions.get(key)
+        if fn is not None:
+            if self._cache is not None:
+                self._cache._count("function_hits")
+            return fn
+
+        if self._cache is not None:
+            self._cache._count("function_misses")
+        fn = sp.lambdify(symbols, self.expr, modules)
+        with self._lock:
+            return self._functions.setdefault(key, fn)
+
+    def evaluate(self, values: Dict[str, Any], modules="numpy") -> Any:
+        """
+        Evaluate the formula for named values (scalars or arrays).
+
+        Args:
+            values: {variable name: value}; must cover every free symbol
+            modules: lambdify modules
+
+        Returns:
+            Result of the lambdified expression
+
+        Raises:
+            ValueError: If a free symbol has no value
+        """
+        missing = [name for name in self.variables if name not in values]
+        if missing:
+            raise ValueError(f"Missing values for variables: {', '.join(missing)}")
+        fn = self.function(modules=modules)
+        return fn(*(values[name] for name in self.variables))
+
+
+class FormulaCache:
+    """
+    Bounded, thread-safe LRU of CompiledFormula entries.
+
+    Text entries are keyed by (parser, evaluate, forced symbols, normalized
+    text); expression entries by the (immutable, hashable) expression.
+    Parsing happens outside the lock, so concurrent misses on the same key
+    may both parse, but only one result is kept.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize formula cache.
+
+        Args:
+            max_size: Maximum compiled formulas retained
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, CompiledFormula]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("hits", "misses", "evictions", "function_hits", "function_misses"), 0
+        )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _lookup(self, key) -> Optional[CompiledFormula]:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self._counts["hits"] += 1
+            else:
+                self._counts["misses"] += 1
+            return compiled
+
+    def _store(self, key, compiled: CompiledFormula) -> CompiledFormula:
+        compiled._cache = self
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            self._entries[key] = compiled
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+            return compiled
+
+    def compile(
+        self,
+        formula: Union[str, sp.Basic],
+        parser: str = "parse_expr",
+        evaluate: bool = True,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> CompiledFormula:
+        """
+        Get (or parse and cache) a compiled formula.
+
+        Args:
+            formula: Formula text or an already parsed expression
+            parser: "parse_expr" or "sympify" (they differ, e.g. on ``^``)
+            evaluate: Passed to the parser
+            symbols: Names forced to parse as plain symbols (e.g. "E", "S")
+
+        Returns:
+            CompiledFormula
+
+        Raises:
+            ValueError: If the parser is unknown
+        """
+        if isinstance(formula, sp.Basic):
+            key = ("expr", formula)
+            compiled = self._lookup(key)
+            if compiled is None:
+                compiled = self._store(key, CompiledFormula(formula))
+            return compiled
+
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser}'. Use one of: {PARSERS}")
+
+        text = normalize_formula(str(formula))
+        forced = frozenset(symbols) if symbols else frozenset()
+        key = (parser, evaluate, forced, text)
+        compiled = self._lookup(key)
+        if compiled is not None:
+            return compiled
+
+        local_dict = {name: sp.Symbol(name) for name in forced} or None
+        if parser == "sympify":
+            expr = sp.sympify(text, locals=local_dict, evaluate=evaluate)
+        else:
+            expr = parse_expr(text, local_dict=local_dict, evaluate=evaluate)
+        return self._store(key, CompiledFormula(expr, source=text))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit-rate metrics.
+
+        Returns:
+            Dict with size, hits, misses, evictions and hit rates
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            size = len(self._entries)
+        lookups = counts["hits"] + counts["misses"]
+        functions = counts["function_hits"] + counts["function_misses"]
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            **counts,
+            "hit_rate": counts["hits"] / lookups if lookups else 0.0,
+            "function_hit_rate": (
+                counts["function_hits"] / functions if functions else 0.0
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset metrics"""
+        with self._lock:
+            self._entries.clear()
+            for name in self._counts:
+                self._counts[name] = 0
+
+
+# Global cache shared by the formula tools
+_global_cache = FormulaCache()
+
+
+def get_formula_cache() -> FormulaCache:
+    """Get global formula cache instance"""
+    return _global_cache
+
+
+def compile_formula(
+    formula: Union[str, sp.Basic],
+    parser: str = "parse_expr",
+    evaluate: bool = True,
+    symbols: Optional[Iterable[str]] = None,
+) -> CompiledFormula:
+    """Compile a formula through the global cache (see FormulaCache.compile)"""
+    return _global_cache.compile(formula, parser, evaluate, symbols)
+
+
+def cached_parse_expr(formula: str, evaluate: bool = True) -> sp.Basic:
+    """Drop-in for ``parse_expr(formula, evaluate=...)`` backed by the cache"""
+    return _global_cache.compile(formula, "parse_expr", evaluate).expr
+
+
+def cached_sympify(formula: Union[str, sp.Basic]) -> sp.Basic:
+    """Drop-in for ``sympify(formula)`` on formula text backed by the cache"""
+    if isinstance(formula, sp.Basic):
+        return formula
+    return _global_cache.compile(formula, "sympify").expr
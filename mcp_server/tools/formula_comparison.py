@@ -12,7 +12,6 @@ from enum import Enum
 from datetime import datetime
 import sympy as sp
 from sympy import latex, simplify, expand, factor, diff, integrate, solve
-from sympy.parsing.sympy_parser import parse_expr
 import json
 import uuid
 import difflib
@@ -26,6 +25,7 @@ from .formula_validation import (
     ValidationType,
 )
 from .algebra_helper import get_sports_formula
+from .formula_cache import cached_parse_expr
 
 logger = logging.getLogger(__name__)
 
@@ -499,8 +499,8 @@ class MultiBookFormulaComparison:
         try:
             # Parse formulas with more robust error handling
             try:
-                expr_a = parse_expr(formula_a, evaluate=False)
-                expr_b = parse_expr(formula_b, evaluate=False)
+                expr_a = cached_parse_expr(formula_a, evaluate=False)
+                expr_b = cached_parse_expr(formula_b, evaluate=False)
 
                 # Compare symbolic expressions
                 if expr_a.equals(expr_b):
@@ -542,8 +542,8 @@ class MultiBookFormulaComparison:
 
         try:
             # Parse formulas
-            expr_a = parse_expr(formula_a, evaluate=False)
-            expr_b = parse_expr(formula_b, evaluate=False)
+            expr_a = cached_parse_expr(formula_a, evaluate=False)
+            expr_b = cached_parse_expr(formula_b, evaluate=False)
 
             # Compare coefficients
             coeffs_a = self._extract_coefficients(expr_a)
@@ -650,8 +650,8 @@ class MultiBookFormulaComparison:
         # Test with sample data if available
         if version_a.test_data and version_b.test_data:
             try:
-                expr_a = parse_expr(version_a.formula, evaluate=False)
-                expr_b = parse_expr(version_b.formula, evaluate=False)
+                expr_a = cached_parse_expr(version_a.formula, evaluate=False)
+                expr_b = cached_parse_expr(version_b.formula, evaluate=False)
 
                 # Use version A's test data
                 test_data = version_a.test_data
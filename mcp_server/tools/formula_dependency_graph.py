@@ -409,6 +409,44 @@ def _analyze_formula_dependencies(
     return dependencies
 
 
+def resolve_evaluation_order(dependencies: Dict[str, List[str]]) -> List[str]:
+    """
+    Order formulas so each one is evaluated after the formulas it uses.
+
+    Args:
+        dependencies: {formula_id: ids of formulas whose results it uses}
+
+    Returns:
+        Formula ids in evaluation order (input order kept among independents)
+
+    Raises:
+        ToolError: If the formulas reference each other in a cycle
+    """
+    pending = {
+        formula_id: {dep for dep in deps if dep in dependencies}
+        for formula_id, deps in dependencies.items()
+    }
+    dependents: Dict[str, List[str]] = {formula_id: [] for formula_id in pending}
+    for formula_id, deps in pending.items():
+        for dep in deps:
+            dependents[dep].append(formula_id)
+
+    ready = [formula_id for formula_id, deps in pending.items() if not deps]
+    order: List[str] = []
+    while ready:
+        formula_id = ready.pop(0)
+        order.append(formula_id)
+        for dependent in dependents[formula_id]:
+            pending[dependent].discard(formula_id)
+            if not pending[dependent]:
+                ready.append(dependent)
+
+    if len(order) != len(pending):
+        cycle = sorted(formula_id for formula_id in pending if pending[formula_id])
+        raise ToolError(f"Circular formula dependencies: {', '.join(cycle)}")
+    return order
+
+
 @log_operation("formula_dependency_visualize_graph")
 def visualize_dependency_graph(
     graph: DependencyGraph,
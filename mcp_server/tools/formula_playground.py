@@ -13,21 +13,34 @@ Date: 2025-01-11
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional, Union
+import re
+from pathlib import Path
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
+import numpy as np
+import pandas as pd
 import sympy as sp
 from sympy import latex, simplify, expand, factor, diff, integrate, solve
-from sympy.parsing.sympy_parser import parse_expr
 
 # Import other modules
 from .formula_intelligence import FormulaIntelligence
 from .formula_builder import InteractiveFormulaBuilder
 from .algebra_helper import get_sports_formula
+from .formula_cache import compile_formula
+from .formula_dependency_graph import resolve_evaluation_order
 
 logger = logging.getLogger(__name__)
 
+# Variable-like tokens, including names that start with a digit (3PM)
+_TOKEN_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _safe_name(name: str) -> str:
+    """Symbol name used for a variable once the formula is preprocessed"""
+    return f"VAR_{name}" if name[:1].isdigit() else name
+
 
 class PlaygroundMode(Enum):
     """Playground interaction modes"""
@@ -298,9 +311,14 @@ class InteractiveFormulaPlayground:
         return session
 
     def add_formula_to_session(
-        self, session_id: str, formula: str, description: str = ""
+        self, session_id: str, formula: str, description: str = "", name: str = ""
     ) -> Dict[str, Any]:
-        """Add a formula to a playground session"""
+        """
+        Add a formula to a playground session.
+
+        A named formula's result can be used as a variable by other formulas
+        in batch evaluation.
+        """
         if session_id not in self.sessions:
             raise ValueError(f"Session {session_id} not found")
 
@@ -323,6 +341,7 @@ class InteractiveFormulaPlayground:
         # Create formula entry
         formula_entry = {
             "id": str(len(session.formulas)),
+            "name": name,
             "formula": formula,
             "description": description,
             "analysis": analysis,
@@ -453,6 +472,202 @@ class InteractiveFormulaPlayground:
             "variables_used": session.variables,
         }
 
+    def evaluate_batch(
+        self,
+        session_id: str,
+        data: Optional[Union[Mapping[str, Sequence[float]], pd.DataFrame, str]] = None,
+        grid: Optional[Mapping[str, Sequence[float]]] = None,
+        formula_ids: Optional[List[str]] = None,
+        as_frame: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate all session formulas over whole columns at once.
+
+        Each formula is compiled once (through the shared formula cache) and
+        evaluated as a NumPy expression over every row. Named formulas can
+        use each other's results; they are evaluated in dependency order.
+        Variables missing from the data fall back to the session's scalar
+        values.
+
+        Args:
+            session_id: Session ID
+            data: Columns as {name: values}, a DataFrame, or a path to a
+                CSV/Parquet dataset (e.g. a season of player-games)
+            grid: What-if axes as {name: values}; every combination becomes
+                a row (cannot be combined with ``data``)
+            formula_ids: Only return these formulas (by id or name)
+            as_frame: Return results as a DataFrame instead of lists
+
+        Returns:
+            Dictionary with row count, evaluation order, result columns
+            (keyed by formula name, or id when unnamed) and per-formula errors
+        """
+        if session_id not in self.sessions:
+            raise ValueError(f"Session {session_id} not found")
+        if data is not None and grid is not None:
+            raise ValueError("Provide either data or grid, not both")
+
+        session = self.sessions[session_id]
+        entries = []
+        for i, formula_entry in enumerate(session.formulas):
+            if isinstance(formula_entry, str):
+                entries.append((str(i), str(i), formula_entry))
+            else:
+                label = formula_entry.get("name") or formula_entry["id"]
+                entries.append((formula_entry["id"], label, formula_entry["formula"]))
+
+        tokens = {
+            token
+            for _, _, formula in entries
+            for token in _TOKEN_PATTERN.findall(formula)
+        }
+        columns = self._batch_columns(data, grid, tokens)
+        rows = len(next(iter(columns.values()))) if columns else 1
+
+        inputs = {_safe_name(name): values for name, values in columns.items()}
+        scalars = {_safe_name(name): value for name, value in session.variables.items()}
+        producers = {
+            _safe_name(label): formula_id
+            for formula_id, label, _ in entries
+            if _safe_name(label) not in inputs
+        }
+        available = set(inputs) | set(scalars) | set(producers)
+
+        compiled, dependencies, errors = {}, {}, {}
+        for formula_id, label, formula in entries:
+            try:
+                formula_symbols = {
+                    _safe_name(token) for token in _TOKEN_PATTERN.findall(formula)
+                }
+                compiled[formula_id] = compile_formula(
+                    self.formula_builder._preprocess_formula_for_parsing(formula),
+                    symbols=formula_symbols & available,
+                )
+            except Exception as e:
+                errors[formula_id] = f"Parse failed: {str(e)}"
+                dependencies[formula_id] = []
+                continue
+            dependencies[formula_id] = [
+                producers[var]
+                for var in compiled[formula_id].variables
+                if var in producers and producers[var] != formula_id
+            ]
+
+        try:
+            order = resolve_evaluation_order(dependencies)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        labels = {formula_id: label for formula_id, label, _ in entries}
+        results: Dict[str, np.ndarray] = {}
+        for formula_id in order:
+            if formula_id in errors:
+                continue
+            failed = [dep for dep in dependencies[formula_id] if dep not in results]
+            if failed:
+                errors[formula_id] = "Depends on failed formula: " + ", ".join(
+                    labels[dep] for dep in failed
+                )
+                continue
+
+            formula = compiled[formula_id]
+            args, missing = [], []
+            for var in formula.variables:
+                if var in inputs:
+                    args.append(inputs[var])
+                elif var in producers:
+                    args.append(results[producers[var]])
+                elif var in scalars:
+                    args.append(scalars[var])
+                else:
+                    missing.append(var)
+            if missing:
+                errors[formula_id] = f"Missing values for: {', '.join(missing)}"
+                continue
+
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    value = np.asarray(formula.function()(*args), dtype=float)
+                results[formula_id] = np.broadcast_to(value, (rows,))
+            except Exception as e:
+                errors[formula_id] = f"Evaluation failed: {str(e)}"
+
+        selected = [
+            formula_id
+            for formula_id in order
+            if formula_ids is None
+            or formula_id in formula_ids
+            or labels[formula_id] in formula_ids
+        ]
+        output = {
+            labels[formula_id]: results[formula_id]
+            for formula_id in selected
+            if formula_id in results
+        }
+
+        session.history.append(
+            {
+                "action": "evaluate_batch",
+                "rows": rows,
+                "formulas": [labels[formula_id] for formula_id in selected],
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+
+        return {
+            "success": True,
+            "rows": rows,
+            "order": [labels[formula_id] for formula_id in order],
+            "columns": (
+                pd.DataFrame(output)
+                if as_frame
+                else {
+                    label: [v if np.isfinite(v) else None for v in values.tolist()]
+                    for label, values in output.items()
+                }
+            ),
+            "errors": {
+                labels[formula_id]: message
+                for formula_id, message in errors.items()
+                if formula_id in selected
+            },
+        }
+
+    def _batch_columns(
+        self,
+        data: Optional[Union[Mapping[str, Sequence[float]], pd.DataFrame, str]],
+        grid: Optional[Mapping[str, Sequence[float]]],
+        tokens: set,
+    ) -> Dict[str, np.ndarray]:
+        """Resolve batch inputs to equal-length float columns used by formulas"""
+        if grid is not None:
+            axes = {
+                name: np.asarray(values, dtype=float) for name, values in grid.items()
+            }
+            mesh = np.meshgrid(*axes.values(), indexing="ij")
+            return {name: values.ravel() for name, values in zip(axes, mesh)}
+
+        if data is None:
+            return {}
+        if isinstance(data, (str, Path)):
+            path = Path(data)
+            if path.suffix == ".parquet":
+                data = pd.read_parquet(path)
+            elif path.suffix == ".csv":
+                data = pd.read_csv(path, usecols=lambda column: column in tokens)
+            else:
+                raise ValueError(f"Unsupported dataset format: {path.suffix}")
+
+        columns = {
+            name: np.asarray(values, dtype=float)
+            for name, values in data.items()
+            if name in tokens
+        }
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All data columns must have the same length")
+        return columns
+
     def generate_visualizations(
         self, session_id: str, visualization_types: List[VisualizationType]
     ) -> Dict[str, Any]:
@@ -623,12 +838,12 @@ class InteractiveFormulaPlayground:
         for formula_entry in session.formulas:
             formula = formula_entry["formula"]
             try:
-                expr = parse_expr(formula, evaluate=False)
+                compiled = compile_formula(formula, evaluate=False)
                 latex_formulas.append(
                     {
                         "formula": formula,
-                        "latex": latex(expr),
-                        "simplified": latex(simplify(expr)),
+                        "latex": compiled.latex,
+                        "simplified": latex(compiled.simplified),
                     }
                 )
             except Exception as e:
@@ -720,3 +935,15 @@ class InteractiveFormulaPlayground:
             )
 
         return related[:3]  # Limit to 3 related formulas
+
+
+# Global playground instance
+_global_playground: Optional[InteractiveFormulaPlayground] = None
+
+
+def get_formula_playground() -> InteractiveFormulaPlayground:
+    """Get global formula playground instance shared across tool calls"""
+    global _global_playground
+    if _global_playground is None:
+        _global_playground = InteractiveFormulaPlayground()
+    return _global_playground
@@ -12,7 +12,6 @@ from enum import Enum
 from datetime import datetime
 import sympy as sp
 from sympy import latex, simplify, expand, factor, diff, integrate, solve
-from sympy.parsing.sympy_parser import parse_expr
 import json
 import uuid
 
@@ -20,6 +19,7 @@ import uuid
 from .formula_intelligence import FormulaIntelligence
 from .formula_extractor import FormulaExtractor
 from .algebra_helper import get_sports_formula
+from .formula_cache import cached_parse_expr
 
 logger = logging.getLogger(__name__)
 
@@ -294,7 +294,7 @@ class FormulaValidationEngine:
         """Validate mathematical correctness of formula"""
         try:
             # Parse the formula
-            expr = parse_expr(formula, evaluate=False)
+            expr = cached_parse_expr(formula, evaluate=False)
 
             # Check for mathematical validity
             issues = []
@@ -384,7 +384,7 @@ class FormulaValidationEngine:
                 )
 
             # Calculate formula result
-            expr = parse_expr(formula, evaluate=False)
+            expr = cached_parse_expr(formula, evaluate=False)
 
             # Check if all variables are provided
             missing_vars = [
@@ -735,7 +735,7 @@ class FormulaValidationEngine:
             start_time = time.time()
 
             try:
-                expr = parse_expr(formula, evaluate=False)
+                expr = cached_parse_expr(formula, evaluate=False)
                 substituted_expr = expr.subs(
                     {sp.Symbol(k): v for k, v in test_data.items()}
                 )
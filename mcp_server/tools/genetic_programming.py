@@ -0,0 +1,597 @@
+"""
+Genetic Programming Engine for Symbolic Regression
+
+Evolves expression trees to discover formulas from tabular data, sized for
+datasets of hundreds of thousands of rows (e.g. a season of player-games):
+
+- Every program is evaluated with NumPy over whole columns
+- Evaluated sub-expression columns are kept in a bounded LRU, so subtrees
+  shared by parents, children and elites are computed once
+- Fitness is scored in parallel worker processes; each worker holds its own
+  copy of the data and cache, and programs are routed to workers by hash so
+  surviving programs hit a warm cache
+- Linear scaling (y ~ a * f(X) + b) is solved in closed form, so evolution
+  only has to find the shape of the formula
+- Parsimony pressure penalizes program size to keep formulas readable
+
+Usage:
+    from mcp_server.tools.genetic_programming import SymbolicRegressor
+
+    model = SymbolicRegressor(population_size=500, generations=20, n_jobs=-1)
+    model.fit(X, y, feature_names=["PTS", "FGA", "FTA"])
+    print(model.formula_, model.program_.r_squared)
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+# Trees are nested tuples: ("x", column), ("c", value) or (function, *children)
+Tree = Tuple[Any, ...]
+
+VARIABLE = "x"
+CONSTANT = "c"
+
+
+def _protected_div(a, b):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(np.abs(b) > 1e-6, np.divide(a, b), 1.0)
+
+
+def _protected_log(a):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(np.abs(a) > 1e-6, np.log(np.abs(a)), 0.0)
+
+
+@dataclass(frozen=True)
+class Function:
+    """A primitive available to evolved programs"""
+
+    name: str
+    arity: int
+    numpy: Callable
+    sympy: Callable
+
+
+FUNCTIONS: Dict[str, Function] = {
+    f.name: f
+    for f in [
+        Function("add", 2, np.add, lambda a, b: a + b),
+        Function("sub", 2, np.subtract, lambda a, b: a - b),
+        Function("mul", 2, np.multiply, lambda a, b: a * b),
+        Function("div", 2, _protected_div, lambda a, b: a / b),
+        Function("sqrt", 1, lambda a: np.sqrt(np.abs(a)), lambda a: sp.sqrt(sp.Abs(a))),
+        Function("log", 1, _protected_log, lambda a: sp.log(sp.Abs(a))),
+        Function("square", 1, np.square, lambda a: a**2),
+    ]
+}
+
+DEFAULT_FUNCTIONS = ("add", "sub", "mul", "div", "sqrt", "log", "square")
+
+# Attempts to breed a child not already in the next generation
+_DUPLICATE_RETRIES = 10
+
+
+# =============================================================================
+# Tree Utilities
+# =============================================================================
+
+
+def _is_terminal(tree: Tree) -> bool:
+    return tree[0] in (VARIABLE, CONSTANT)
+
+
+def tree_size(tree: Tree) -> int:
+    """Number of nodes in a tree"""
+    if _is_terminal(tree):
+        return 1
+    return 1 + sum(tree_size(child) for child in tree[1:])
+
+
+def tree_depth(tree: Tree) -> int:
+    """Depth of a tree (a single terminal has depth 0)"""
+    if _is_terminal(tree):
+        return 0
+    return 1 + max(tree_depth(child) for child in tree[1:])
+
+
+def _paths(tree: Tree, path: Tuple[int, ...] = ()):
+    yield path, tree
+    if not _is_terminal(tree):
+        for i, child in enumerate(tree[1:], 1):
+            yield from _paths(child, path + (i,))
+
+
+def _replace(tree: Tree, path: Tuple[int, ...], new: Tree) -> Tree:
+    if not path:
+        return new
+    i = path[0]
+    return tree[:i] + (_replace(tree[i], path[1:], new),) + tree[i + 1 :]
+
+
+def tree_to_sympy(tree: Tree, symbols: Sequence[sp.Symbol]) -> sp.Expr:
+    """Convert a tree to a SymPy expression over the given feature symbols"""
+    if tree[0] == VARIABLE:
+        return symbols[tree[1]]
+    if tree[0] == CONSTANT:
+        return sp.Float(tree[1])
+    return FUNCTIONS[tree[0]].sympy(*(tree_to_sympy(c, symbols) for c in tree[1:]))
+
+
+# =============================================================================
+# Vectorized Evaluation and Scoring
+# =============================================================================
+
+
+class _Evaluator:
+    """Evaluates trees over data columns, caching sub-expression columns"""
+
+    def __init__(self, X: np.ndarray, cache_entries: int = 0):
+        self.columns = [np.ascontiguousarray(X[:, i]) for i in range(X.shape[1])]
+        self.cache_entries = cache_entries
+        self._cache: "OrderedDict[Tree, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, tree: Tree):
+        kind = tree[0]
+        if kind == VARIABLE:
+            return self.columns[tree[1]]
+        if kind == CONSTANT:
+            return tree[1]
+
+        value = self._cache.get(tree)
+        if value is not None:
+            self._cache.move_to_end(tree)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        args = [self.evaluate(child) for child in tree[1:]]
+        with np.errstate(all="ignore"):
+            value = FUNCTIONS[kind].numpy(*args)
+        if self.cache_entries:
+            self._cache[tree] = value
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return value
+
+
+class _Scorer:
+    """Linear-scaled R-squared of programs against a fixed target"""
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, cache_entries: int):
+        self.evaluator = _Evaluator(X, cache_entries)
+        self.y_mean = float(y.mean())
+        self.y_centered = y - self.y_mean
+        self.ss_total = float(self.y_centered @ self.y_centered)
+
+    def score(self, tree: Tree) -> Tuple[float, float, float]:
+        """Return (r_squared, scale, offset); r_squared is -inf if invalid"""
+        f = self.evaluator.evaluate(tree)
+        f = np.broadcast_to(np.asarray(f, dtype=float), self.y_centered.shape)
+        if not np.isfinite(f).all():
+            return -np.inf, 0.0, self.y_mean
+
+        f_mean = float(f.mean())
+        f_centered = f - f_mean
+        variance = float(f_centered @ f_centered)
+        if variance <= 1e-12 * len(f):
+            return 0.0, 0.0, self.y_mean  # constant program
+
+        covariance = float(f_centered @ self.y_centered)
+        scale = covariance / variance
+        r_squared = covariance * covariance / (variance * self.ss_total)
+        return r_squared, scale, self.y_mean - scale * f_mean
+
+    def score_many(self, trees: List[Tree]) -> Tuple[List[Tuple], int, int]:
+        hits, misses = self.evaluator.hits, self.evaluator.misses
+        scores = [self.score(tree) for tree in trees]
+        return (
+            scores,
+            self.evaluator.hits - hits,
+            self.evaluator.misses - misses,
+        )
+
+
+# Per-process scorer for worker pools
+_worker_scorer: Optional[_Scorer] = None
+
+
+def _init_worker(X: np.ndarray, y: np.ndarray, cache_entries: int) -> None:
+    global _worker_scorer
+    _worker_scorer = _Scorer(X, y, cache_entries)
+
+
+def _score_in_worker(trees: List[Tree]) -> Tuple[List[Tuple], int, int]:
+    return _worker_scorer.score_many(trees)
+
+
+# =============================================================================
+# Symbolic Regressor
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Program:
+    """An evaluated program: y ~ scale * tree(X) + offset"""
+
+    tree: Tree
+    r_squared: float
+    scale: float
+    offset: float
+    size: int
+    fitness: float
+
+
+class SymbolicRegressor:
+    """
+    Genetic-programming symbolic regression.
+
+    Fitness is ``(1 - R^2) + parsimony_coefficient * size`` (lower is
+    better), where R^2 is that of the best linear scaling of the program.
+    """
+
+    def __init__(
+        self,
+        population_size: int = 500,
+        generations: int = 20,
+        tournament_size: int = 20,
+        max_depth: int = 5,
+        parsimony_coefficient: float = 0.001,
+        p_crossover: float = 0.7,
+        p_subtree_mutation: float = 0.1,
+        p_hoist_mutation: float = 0.05,
+        p_point_mutation: float = 0.1,
+        function_set: Sequence[str] = DEFAULT_FUNCTIONS,
+        const_range: Tuple[float, float] = (-5.0, 5.0),
+        n_jobs: int = 1,
+        cache_mb: int = 256,
+        stopping_r_squared: float = 0.9999,
+        random_state: Optional[int] = None,
+    ):
+        """
+        Initialize symbolic regressor.
+
+        Args:
+            population_size: Programs per generation
+            generations: Maximum generations to evolve
+            tournament_size: Programs competing in each parent selection
+            max_depth: Maximum tree depth
+            parsimony_coefficient: Fitness penalty per node
+            p_crossover: Probability a child is produced by crossover
+            p_subtree_mutation: Probability of subtree mutation
+            p_hoist_mutation: Probability of hoist mutation (shrinks trees)
+            p_point_mutation: Probability of point mutation
+            function_set: Names of functions from FUNCTIONS to use
+            const_range: Range of random constants (None to disable)
+            n_jobs: Worker processes for fitness scoring (-1 for all cores)
+            cache_mb: Sub-expression cache budget per process
+            stopping_r_squared: Stop early once the best program reaches this
+            random_state: Seed for reproducibility
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if population_size < 2:
+            raise ValueError("population_size must be at least 2")
+        if generations < 1:
+            raise ValueError("generations must be at least 1")
+        if not 1 <= tournament_size <= population_size:
+            raise ValueError("tournament_size must be between 1 and population_size")
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+        if p_crossover + p_subtree_mutation + p_hoist_mutation + p_point_mutation > 1:
+            raise ValueError("Genetic operator probabilities must sum to at most 1")
+        unknown = [name for name in function_set if name not in FUNCTIONS]
+        if unknown or not function_set:
+            raise ValueError(
+                f"Unknown functions {unknown}. Use some of: {list(FUNCTIONS)}"
+            )
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs < 1:
+            raise ValueError("n_jobs must be positive or -1")
+
+        self.population_size = population_size
+        self.generations = generations
+        self.tournament_size = tournament_size
+        self.max_depth = max_depth
+        self.parsimony_coefficient = parsimony_coefficient
+        self.p_crossover = p_crossover
+        self.p_subtree_mutation = p_subtree_mutation
+        self.p_hoist_mutation = p_hoist_mutation
+        self.p_point_mutation = p_point_mutation
+        self.functions = [FUNCTIONS[name] for name in function_set]
+        self.const_range = const_range
+        self.n_jobs = n_jobs
+        self.cache_mb = cache_mb
+        self.stopping_r_squared = stopping_r_squared
+        self.random_state = random_state
+
+        self.program_: Optional[Program] = None
+        self.feature_names_: List[str] = []
+        self.history_: List[Dict[str, Any]] = []
+
+    # -------------------------------------------------------------------------
+    # Fitting
+    # -------------------------------------------------------------------------
+
+    def fit(
+        self, X, y, feature_names: Optional[Sequence[str]] = None
+    ) -> "SymbolicRegressor":
+        """
+        Evolve programs that predict y from the columns of X.
+
+        Args:
+            X: Inputs, shape (n_samples, n_features)
+            y: Target, shape (n_samples,)
+            feature_names: Names used in the discovered formula
+
+        Returns:
+            self, with ``program_``, ``formula_`` and ``history_`` set
+
+        Raises:
+            ValueError: If the data is malformed or the target is constant
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if X.ndim != 2 or y.ndim != 1 or len(X) != len(y):
+            raise ValueError("X must be 2-D and y 1-D with the same number of rows")
+        if not (np.isfinite(X).all() and np.isfinite(y).all()):
+            raise ValueError("X and y must be finite")
+        if np.ptp(y) == 0:
+            raise ValueError("Target is constant")
+
+        self.n_features_ = X.shape[1]
+        self.feature_names_ = list(
+            feature_names or [f"x{i}" for i in range(X.shape[1])]
+        )
+        self.history_ = []
+        rng = np.random.default_rng(self.random_state)
+        cache_entries = max(16, self.cache_mb * 2**20 // (8 * len(y)))
+
+        population = self._initial_population(rng)
+        best: Optional[Program] = None
+        pools = self._start_pools(X, y, cache_entries)
+        local = None if pools else _Scorer(X, y, cache_entries)
+        try:
+            for generation in range(self.generations):
+                start = time.perf_counter()
+                programs, hits, misses = self._evaluate(population, pools, local)
+                leader = min(programs, key=lambda p: p.fitness)
+                if best is None or leader.fitness < best.fitness:
+                    best = leader
+
+                self.history_.append(
+                    {
+                        "generation": generation,
+                        "best_r_squared": leader.r_squared,
+                        "best_size": leader.size,
+                        "mean_size": float(np.mean([p.size for p in programs])),
+                        "cache_hit_rate": (
+                            hits / (hits + misses) if hits + misses else 0.0
+                        ),
+                        "seconds": time.perf_counter() - start,
+                    }
+                )
+                logger.debug(
+                    f"Generation {generation}: R²={leader.r_squared:.4f} "
+                    f"size={leader.size}"
+                )
+
+                if (
+                    leader.r_squared >= self.stopping_r_squared
+                    or generation == self.generations - 1
+                ):
+                    break
+                population = self._next_generation(programs, best, rng)
+        finally:
+            for pool in pools:
+                pool.shutdown(cancel_futures=True)
+
+        self.program_ = best
+        return self
+
+    def _start_pools(self, X, y, cache_entries) -> List[ProcessPoolExecutor]:
+        if self.n_jobs == 1:
+            return []
+        # One single-process pool per worker so a program always lands on the
+        # same worker (and its warm cache). Workers are spawned, not forked:
+        # callers such as the MCP server run fit() from a thread of a
+        # multithreaded process, where fork can copy held locks.
+        context = multiprocessing.get_context("spawn")
+        return [
+            ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(X, y, cache_entries),
+            )
+            for _ in range(self.n_jobs)
+        ]
+
+    def _evaluate(
+        self,
+        population: List[Tree],
+        pools: List[ProcessPoolExecutor],
+        local: Optional[_Scorer],
+    ) -> Tuple[List[Program], int, int]:
+        unique = list(dict.fromkeys(population))
+        if local is not None:
+            scores, hits, misses = local.score_many(unique)
+            scored = dict(zip(unique, scores))
+        else:
+            chunks: List[List[Tree]] = [[] for _ in pools]
+            for tree in unique:
+                chunks[hash(tree) % len(pools)].append(tree)
+            futures = [
+                (chunk, pool.submit(_score_in_worker, chunk))
+                for chunk, pool in zip(chunks, pools)
+                if chunk
+            ]
+            scored, hits, misses = {}, 0, 0
+            for chunk, future in futures:
+                scores, chunk_hits, chunk_misses = future.result()
+                scored.update(zip(chunk, scores))
+                hits += chunk_hits
+                misses += chunk_misses
+
+        programs = []
+        for tree in population:
+            r_squared, scale, offset = scored[tree]
+            size = tree_size(tree)
+            fitness = (
+                np.inf
+                if r_squared == -np.inf
+                else 1.0 - r_squared + self.parsimony_coefficient * size
+            )
+            programs.append(Program(tree, r_squared, scale, offset, size, fitness))
+        return programs, hits, misses
+
+    # -------------------------------------------------------------------------
+    # Evolution
+    # -------------------------------------------------------------------------
+
+    def _random_terminal(self, rng) -> Tree:
+        if self.const_range is None or rng.random() < self.n_features_ / (
+            self.n_features_ + 1
+        ):
+            return (VARIABLE, int(rng.integers(self.n_features_)))
+        return (CONSTANT, round(float(rng.uniform(*self.const_range)), 2))
+
+    def _random_tree(self, rng, depth: int, full: bool) -> Tree:
+        terminal_ratio = (self.n_features_ + 1) / (
+            self.n_features_ + 1 + len(self.functions)
+        )
+        if depth == 0 or (not full and rng.random() < terminal_ratio):
+            return self._random_terminal(rng)
+        function = self.functions[rng.integers(len(self.functions))]
+        return (function.name,) + tuple(
+            self._random_tree(rng, depth - 1, full) for _ in range(function.arity)
+        )
+
+    def _initial_population(self, rng) -> List[Tree]:
+        """Ramped half-and-half initialization"""
+        depths = range(min(2, self.max_depth), self.max_depth + 1)
+        return [
+            self._random_tree(rng, depths[i % len(depths)], full=i % 2 == 0)
+            for i in range(self.population_size)
+        ]
+
+    def _tournament(self, programs: List[Program], rng) -> Program:
+        contenders = rng.integers(len(programs), size=self.tournament_size)
+        return min((programs[i] for i in contenders), key=lambda p: p.fitness)
+
+    def _random_node(self, tree: Tree, rng) -> Tuple[Tuple[int, ...], Tree]:
+        """Pick a node, preferring functions over terminals (90/10)"""
+        nodes = list(_paths(tree))
+        functions = [node for node in nodes if not _is_terminal(node[1])]
+        if functions and rng.random() < 0.9:
+            nodes = functions
+        return nodes[rng.integers(len(nodes))]
+
+    def _crossover(self, tree: Tree, donor: Tree, rng) -> Tree:
+        path, _ = self._random_node(tree, rng)
+        _, subtree = self._random_node(donor, rng)
+        return _replace(tree, path, subtree)
+
+    def _hoist(self, tree: Tree, rng) -> Tree:
+        path, subtree = self._random_node(tree, rng)
+        _, hoisted = self._random_node(subtree, rng)
+        return _replace(tree, path, hoisted)
+
+    def _point_mutation(self, tree: Tree, rng) -> Tree:
+        path, node = self._random_node(tree, rng)
+        if _is_terminal(node):
+            return _replace(tree, path, self._random_terminal(rng))
+        same_arity = [f for f in self.functions if f.arity == len(node) - 1]
+        function = same_arity[rng.integers(len(same_arity))]
+        return _replace(tree, path, (function.name,) + node[1:])
+
+    def _next_generation(
+        self, programs: List[Program], best: Program, rng
+    ) -> List[Tree]:
+        thresholds = np.cumsum(
+            [
+                self.p_crossover,
+                self.p_subtree_mutation,
+                self.p_hoist_mutation,
+                self.p_point_mutation,
+            ]
+        )
+        population = [best.tree]  # elitism
+        seen = {best.tree}
+        retries = 0
+        while len(population) < self.population_size:
+            parent = self._tournament(programs, rng).tree
+            operator = np.searchsorted(thresholds, rng.random(), side="right")
+            if operator == 0:
+                child = self._crossover(
+                    parent, self._tournament(programs, rng).tree, rng
+                )
+            elif operator == 1:
+                donor = self._random_tree(rng, max(1, self.max_depth // 2), full=False)
+                child = self._crossover(parent, donor, rng)
+            elif operator == 2:
+                child = self._hoist(parent, rng)
+            elif operator == 3:
+                child = self._point_mutation(parent, rng)
+            else:
+                child = parent  # reproduction
+
+            if tree_depth(child) > self.max_depth:
+                continue  # select and vary again
+            if child in seen and retries < _DUPLICATE_RETRIES:
+                retries += 1  # keep the population diverse
+                continue
+            retries = 0
+            seen.add(child)
+            population.append(child)
+        return population
+
+    # -------------------------------------------------------------------------
+    # Results
+    # -------------------------------------------------------------------------
+
+    def _check_fitted(self) -> Program:
+        if self.program_ is None:
+            raise ValueError("SymbolicRegressor is not fitted yet")
+        return self.program_
+
+    def predict(self, X) -> np.ndarray:
+        """Predict targets for X with the best program"""
+        program = self._check_fitted()
+        X = np.asarray(X, dtype=float)
+        values = _Evaluator(X).evaluate(program.tree)
+        values = np.broadcast_to(np.asarray(values, dtype=float), (len(X),))
+        return program.scale * values + program.offset
+
+    def to_sympy(self, digits: int = 4) -> sp.Expr:
+        """
+        Best program as a SymPy expression (constants rounded).
+
+        Division, square root and logarithm are protected during evolution
+        (x / ~0 -> 1, sqrt|x|, log|x|); the expression shows the plain forms.
+        """
+        program = self._check_fitted()
+        symbols = [sp.Symbol(name) for name in self.feature_names_]
+        expr = program.scale * tree_to_sympy(program.tree, symbols) + program.offset
+        return expr.xreplace(
+            {f: sp.Float(round(f, digits)) for f in expr.atoms(sp.Float)}
+        )
+
+    @property
+    def formula_(self) -> str:
+        """Best program as a formula string"""
+        return str(self.to_sympy())
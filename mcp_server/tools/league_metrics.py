@@ -0,0 +1,346 @@
+"""
+League-Wide Advanced Metrics
+Vectorized advanced statistics for whole box score tables
+
+Computes the advanced metric set for every row of a player-game or
+player-season table at once. Team totals, opponent totals, team pace and
+league constants are derived from the table itself, so PER gets its full
+league/pace adjustment and BPM its team adjustment.
+
+Formulas follow Basketball Reference; see nba_metrics_helper for the
+single-player versions.
+
+Usage:
+    from mcp_server.tools.league_metrics import compute_league_metrics
+
+    result = compute_league_metrics(player_games, team_col="team", game_col="game_id")
+    result.players[["player_id", "per", "usg_pct", "bpm", "ws"]]
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from mcp_server.exceptions import ValidationError
+
+# Box score columns the engine works with
+STAT_COLUMNS = [
+    "minutes",
+    "points",
+    "fgm",
+    "fga",
+    "three_pm",
+    "three_pa",
+    "ftm",
+    "fta",
+    "orb",
+    "drb",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+]
+
+# Common source spellings (nba_api, Basketball Reference) -> engine columns
+COLUMN_ALIASES = {
+    "MIN": "minutes",
+    "MP": "minutes",
+    "PTS": "points",
+    "FGM": "fgm",
+    "FG": "fgm",
+    "FGA": "fga",
+    "FG3M": "three_pm",
+    "3PM": "three_pm",
+    "3P": "three_pm",
+    "FG3A": "three_pa",
+    "3PA": "three_pa",
+    "FTM": "ftm",
+    "FT": "ftm",
+    "FTA": "fta",
+    "OREB": "orb",
+    "ORB": "orb",
+    "DREB": "drb",
+    "DRB": "drb",
+    "AST": "assists",
+    "STL": "steals",
+    "BLK": "blocks",
+    "TOV": "turnovers",
+    "TO": "turnovers",
+    "PF": "fouls",
+}
+
+# Added to every player's raw BPM is this share of the team's gap (5 on court)
+PLAYERS_ON_COURT = 5
+
+
+@dataclass
+class LeagueMetricsResult:
+    """Vectorized metric results"""
+
+    players: pd.DataFrame  # Input rows with metric columns appended
+    teams: pd.DataFrame  # Team-season context (pace, ratings, BPM adjustment)
+    league: Dict[str, float]  # League constants (pace, VOP, factor, ...)
+
+
+def _ratio(numerator, denominator) -> np.ndarray:
+    """Elementwise division returning 0.0 where the denominator is not positive"""
+    numerator, denominator = np.broadcast_arrays(
+        np.asarray(numerator, dtype=float), np.asarray(denominator, dtype=float)
+    )
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(numerator.shape),
+        where=denominator > 0,
+    )
+
+
+def _possessions(stats) -> np.ndarray:
+    """Possessions estimate: FGA + 0.44 * FTA - ORB + TOV"""
+    return stats["fga"] + 0.44 * stats["fta"] - stats["orb"] + stats["turnovers"]
+
+
+def _normalize_columns(
+    box_scores: pd.DataFrame, columns: Optional[Dict[str, str]]
+) -> pd.DataFrame:
+    renames = {
+        source: target
+        for source, target in {**COLUMN_ALIASES, **(columns or {})}.items()
+        if source in box_scores.columns and target not in box_scores.columns
+    }
+    frame = box_scores.rename(columns=renames)
+
+    missing = [column for column in STAT_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValidationError(f"Missing box score columns: {', '.join(missing)}")
+    return frame
+
+
+def _group_totals(frame: pd.DataFrame, keys: List[str]):
+    """Sum stat columns per group; return (totals, row -> group codes)"""
+    grouped = frame.groupby(keys, sort=False)
+    codes = grouped.ngroup().to_numpy()
+    totals = grouped[STAT_COLUMNS].sum()
+    return totals, codes
+
+
+def _opponent_totals(
+    frame: pd.DataFrame,
+    team_totals: pd.DataFrame,
+    team_col: str,
+    game_col: Optional[str],
+    opponent_totals: Optional[pd.DataFrame],
+    league_totals: pd.Series,
+) -> pd.DataFrame:
+    """Opponent totals aligned with team_totals' index"""
+    if game_col is not None:
+        teams_per_game = frame.groupby(game_col)[team_col].nunique()
+        if (teams_per_game != 2).any():
+            bad = teams_per_game[teams_per_game != 2].index[:5].tolist()
+            raise ValidationError(f"Games must have exactly two teams: {bad}")
+        game_totals = team_totals.groupby(level=game_col).transform("sum")
+        return game_totals - team_totals
+
+    if opponent_totals is not None:
+        missing = set(team_totals.index) - set(opponent_totals.index)
+        if missing:
+            raise ValidationError(f"Missing opponent totals for: {sorted(missing)}")
+        return opponent_totals.loc[team_totals.index, STAT_COLUMNS]
+
+    # Season tables without opponents: a league-average opponent per minute
+    share = team_totals["minutes"] / league_totals["minutes"]
+    return pd.DataFrame(
+        np.outer(share, league_totals[STAT_COLUMNS]),
+        index=team_totals.index,
+        columns=STAT_COLUMNS,
+    )
+
+
+def compute_league_metrics(
+    box_scores: pd.DataFrame,
+    team_col: str = "team",
+    game_col: Optional[str] = None,
+    opponent_totals: Optional[pd.DataFrame] = None,
+    columns: Optional[Dict[str, str]] = None,
+) -> LeagueMetricsResult:
+    """
+    Compute advanced metrics for every row of a box score table.
+
+    Shooting and rate metrics:
+        ts_pct, efg_pct, three_par, ftr, tov_pct, usg_pct, ast_pct,
+        orb_pct, drb_pct, trb_pct, stl_pct, blk_pct
+    All-in-one metrics:
+        per (Hollinger, pace adjusted, league average 15.0),
+        bpm (PER-based estimate with Basketball Reference's team adjustment),
+        ows, dws, ws (simplified Win Shares)
+
+    Rate metrics use team/opponent totals of the row's context: the team in
+    that game for player-game tables, the team's season otherwise. PER, BPM
+    and Win Shares use team-season pace and ratings.
+
+    Args:
+        box_scores: One row per player-game or player-season with the
+            STAT_COLUMNS (common spellings such as PTS, FG3M, OREB are
+            recognized) and a team column
+        team_col: Team column
+        game_col: Game column for player-game tables; opponents are the
+            other team in each game
+        opponent_totals: Season tables only: opponent totals per team
+            (indexed by team). Defaults to a league-average opponent.
+        columns: Extra {source column: engine column} renames
+
+    Returns:
+        LeagueMetricsResult with player rows, team context and league constants
+
+    Raises:
+        ValidationError: If columns are missing, the table is empty, or a game
+            does not have exactly two teams
+    """
+    frame = _normalize_columns(box_scores, columns)
+    for key in filter(None, [team_col, game_col]):
+        if key not in frame.columns:
+            raise ValidationError(f"Missing column: {key}")
+    if frame.empty:
+        raise ValidationError("Box score table is empty")
+
+    stats = {c: frame[c].to_numpy(dtype=float) for c in STAT_COLUMNS}
+    stats["trb"] = stats["orb"] + stats["drb"]
+
+    # League constants
+    league_totals = frame[STAT_COLUMNS].sum()
+    lg = league_totals.to_dict()
+    lg_poss = float(_possessions(lg))
+    league = {
+        "pace": 48 * _ratio(lg_poss, lg["minutes"] / PLAYERS_ON_COURT).item(),
+        "points_per_possession": _ratio(lg["points"], lg_poss).item(),
+        "vop": _ratio(
+            lg["points"], lg["fga"] - lg["orb"] + lg["turnovers"] + 0.44 * lg["fta"]
+        ).item(),
+        "drb_pct": _ratio(lg["drb"], lg["orb"] + lg["drb"]).item(),
+        "factor": (
+            2 / 3
+            - _ratio(
+                0.5 * _ratio(lg["assists"], lg["fgm"]), 2 * _ratio(lg["fgm"], lg["ftm"])
+            ).item()
+        ),
+        "team_games": lg["minutes"] / (PLAYERS_ON_COURT * 48),
+    }
+
+    # Context totals (team in game, or team season) and opponents
+    context_keys = [game_col, team_col] if game_col else [team_col]
+    team_totals, codes = _group_totals(frame, context_keys)
+    opp_totals = _opponent_totals(
+        frame, team_totals, team_col, game_col, opponent_totals, league_totals
+    )
+    tm = {c: team_totals[c].to_numpy()[codes] for c in STAT_COLUMNS}
+    opp = {c: opp_totals[c].to_numpy()[codes] for c in STAT_COLUMNS}
+    tm["trb"] = tm["orb"] + tm["drb"]
+    opp["trb"] = opp["orb"] + opp["drb"]
+
+    mp = stats["minutes"]
+    on_court = tm["minutes"] / PLAYERS_ON_COURT  # team minutes per player slot
+    plays = stats["fga"] + 0.44 * stats["fta"] + stats["turnovers"]
+
+    metrics = {
+        "ts_pct": _ratio(stats["points"], 2 * (stats["fga"] + 0.44 * stats["fta"])),
+        "efg_pct": _ratio(stats["fgm"] + 0.5 * stats["three_pm"], stats["fga"]),
+        "three_par": _ratio(stats["three_pa"], stats["fga"]),
+        "ftr": _ratio(stats["fta"], stats["fga"]),
+        "tov_pct": 100 * _ratio(stats["turnovers"], plays),
+        "usg_pct": 100
+        * _ratio(
+            plays * on_court,
+            mp * (tm["fga"] + 0.44 * tm["fta"] + tm["turnovers"]),
+        ),
+        "ast_pct": 100
+        * _ratio(stats["assists"], _ratio(mp, on_court) * tm["fgm"] - stats["fgm"]),
+        "orb_pct": 100 * _ratio(stats["orb"] * on_court, mp * (tm["orb"] + opp["drb"])),
+        "drb_pct": 100 * _ratio(stats["drb"] * on_court, mp * (tm["drb"] + opp["orb"])),
+        "trb_pct": 100 * _ratio(stats["trb"] * on_court, mp * (tm["trb"] + opp["trb"])),
+        "stl_pct": 100 * _ratio(stats["steals"] * on_court, mp * _possessions(opp)),
+        "blk_pct": 100
+        * _ratio(stats["blocks"] * on_court, mp * (opp["fga"] - opp["three_pa"])),
+    }
+
+    # Team-season context for pace, ratings and the BPM team adjustment
+    season_totals, team_codes = _group_totals(frame, [team_col])
+    if game_col:
+        season_opp = opp_totals.groupby(level=team_col).sum().loc[season_totals.index]
+    else:
+        season_opp = opp_totals
+    team_poss = _possessions(season_totals)
+    opp_poss = _possessions(season_opp)
+    teams = pd.DataFrame(index=season_totals.index)
+    teams["minutes"] = season_totals["minutes"]
+    teams["possessions"] = team_poss
+    teams["pace"] = 48 * _ratio(
+        (team_poss + opp_poss) / 2, season_totals["minutes"] / PLAYERS_ON_COURT
+    )
+    teams["ortg"] = 100 * _ratio(season_totals["points"], team_poss)
+    teams["drtg"] = 100 * _ratio(season_opp["points"], opp_poss)
+    teams["net_rtg"] = teams["ortg"] - teams["drtg"]
+
+    team_pace = teams["pace"].to_numpy()[team_codes]
+    pace_adjustment = _ratio(league["pace"], team_pace)
+
+    # PER (Hollinger): unadjusted, pace adjusted, then scaled to league 15.0
+    team_ast_ratio = _ratio(tm["assists"], tm["fgm"])
+    vop, drb_pct = league["vop"], league["drb_pct"]
+    foul_cost = (
+        _ratio(lg["ftm"], lg["fouls"]) - 0.44 * _ratio(lg["fta"], lg["fouls"]) * vop
+    )
+    uper = _ratio(1.0, mp) * (
+        stats["three_pm"]
+        + (2 / 3) * stats["assists"]
+        + (2 - league["factor"] * team_ast_ratio) * stats["fgm"]
+        + stats["ftm"] * 0.5 * (1 + (1 - team_ast_ratio) + (2 / 3) * team_ast_ratio)
+        - vop * stats["turnovers"]
+        - vop * drb_pct * (stats["fga"] - stats["fgm"])
+        - vop * 0.44 * (0.44 + 0.56 * drb_pct) * (stats["fta"] - stats["ftm"])
+        + vop * (1 - drb_pct) * stats["drb"]
+        + vop * drb_pct * stats["orb"]
+        + vop * stats["steals"]
+        + vop * drb_pct * stats["blocks"]
+        - stats["fouls"] * foul_cost
+    )
+    aper = pace_adjustment * uper
+    league_aper = _ratio((aper * mp).sum(), mp.sum()).item()
+    metrics["per"] = aper * _ratio(15.0, league_aper).item()
+
+    # BPM: PER-based raw estimate, shifted per team so minute-weighted BPM
+    # matches the team's net rating
+    raw_bpm = 0.5 * (metrics["per"] - 15.0) * _ratio(team_pace, league["pace"])
+    minute_share = _ratio(
+        mp, teams["minutes"].to_numpy()[team_codes] / PLAYERS_ON_COURT
+    )
+    team_raw = np.bincount(
+        team_codes, weights=raw_bpm * minute_share, minlength=len(teams)
+    )
+    teams["bpm_adjustment"] = (teams["net_rtg"] - team_raw) / PLAYERS_ON_COURT
+    metrics["bpm"] = raw_bpm + teams["bpm_adjustment"].to_numpy()[team_codes]
+
+    # Win Shares (simplified): own-possession marginal offense and
+    # minutes-share marginal defense over marginal points per win
+    ppp = league["points_per_possession"]
+    points_per_team_game = _ratio(lg["points"], league["team_games"]).item()
+    marginal_ppw = 0.32 * points_per_team_game * _ratio(team_pace, league["pace"])
+    marginal_offense = stats["points"] - 0.92 * ppp * plays
+    team_drtg = teams["drtg"].to_numpy()[team_codes]
+    season_minutes = teams["minutes"].to_numpy()[team_codes]
+    marginal_defense = (
+        _ratio(mp, season_minutes)
+        * opp_poss.to_numpy()[team_codes]
+        * (1.08 * ppp - team_drtg / 100)
+    )
+    metrics["ows"] = _ratio(marginal_offense, marginal_ppw)
+    metrics["dws"] = _ratio(marginal_defense, marginal_ppw)
+    metrics["ws"] = metrics["ows"] + metrics["dws"]
+
+    players = pd.concat(
+        [box_scores.reset_index(drop=True), pd.DataFrame(metrics)], axis=1
+    )
+    players.index = box_scores.index
+    return LeagueMetricsResult(players=players, teams=teams, league=league)
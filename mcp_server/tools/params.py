@@ -8,7 +8,6 @@ from pydantic import ConfigDict, BaseModel, Field, field_validator, model_valida
 from typing import Optional, List, Dict, Any, Literal, Tuple, Union
 import re
 
-
 # ============================================================================
 # Database Tool Parameters
 # ============================================================================
@@ -1570,6 +1569,44 @@ class BoxPlusMinusParams(BaseModel):
     )
 
 
+class LeagueMetricsParams(BaseModel):
+    """Parameters for league-wide advanced metrics over a box score table"""
+
+    box_scores: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Player-game or player-season rows (minutes, points, fgm, fga, ...)",
+    )
+    dataset_path: Optional[str] = Field(
+        default=None, description="Path to a CSV or Parquet box score table"
+    )
+    team_col: str = Field(default="team", description="Team column")
+    game_col: Optional[str] = Field(
+        default=None, description="Game column for player-game tables"
+    )
+    metrics: Optional[List[str]] = Field(
+        default=None, description="Metric columns to return (default: all)"
+    )
+
+    @model_validator(mode="after")
+    def validate_source(self):
+        if (self.box_scores is None) == (self.dataset_path is None):
+            raise ValueError("Provide exactly one of box_scores or dataset_path")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "dataset_path": "data/player_games_2024.parquet",
+                    "team_col": "TEAM_ABBREVIATION",
+                    "game_col": "GAME_ID",
+                    "metrics": ["per", "usg_pct", "bpm", "ws"],
+                }
+            ]
+        }
+    )
+
+
 # ============================================================================
 # Sprint 9: Algebraic Equation Tool Parameters
 # ============================================================================
@@ -2265,6 +2302,10 @@ class PlaygroundAddFormulaParams(BaseModel):
     session_id: str = Field(..., description="Session ID")
     formula: str = Field(..., description="Formula string to add")
     description: str = Field(default="", description="Description of the formula")
+    name: str = Field(
+        default="",
+        description="Optional result name other formulas can use as a variable",
+    )
     model_config = ConfigDict(
         json_schema_extra={
             "examples": [
@@ -2272,6 +2313,7 @@ class PlaygroundAddFormulaParams(BaseModel):
                     "session_id": "session123",
                     "formula": "PTS / (2 * (FGA + 0.44 * FTA))",
                     "description": "True Shooting Percentage",
+                    "name": "TS",
                 },
                 {
                     "session_id": "session456",
@@ -2315,6 +2357,47 @@ class PlaygroundCalculateResultsParams(BaseModel):
     )
 
 
+class PlaygroundBatchEvaluateParams(BaseModel):
+    """Parameters for vectorized evaluation of playground formulas"""
+
+    session_id: str = Field(..., description="Session ID")
+    columns: Optional[Dict[str, List[float]]] = Field(
+        default=None, description="Input columns (variable name -> values)"
+    )
+    dataset_path: Optional[str] = Field(
+        default=None, description="Path to a CSV or Parquet dataset of inputs"
+    )
+    grid: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="What-if axes; every combination of values is evaluated",
+    )
+    formula_ids: Optional[List[str]] = Field(
+        default=None, description="Only return these formulas (by id or name)"
+    )
+
+    @model_validator(mode="after")
+    def validate_single_source(self):
+        sources = [self.columns, self.dataset_path, self.grid]
+        if sum(source is not None for source in sources) > 1:
+            raise ValueError("Provide only one of columns, dataset_path or grid")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "session_id": "session123",
+                    "columns": {"PTS": [30, 20], "FGA": [20, 15], "FTA": [5, 5]},
+                },
+                {
+                    "session_id": "session123",
+                    "grid": {"FGA": [15, 20, 25], "FTA": [0, 5, 10]},
+                },
+            ]
+        }
+    )
+
+
 class PlaygroundGenerateVisualizationsParams(BaseModel):
     """Parameters for generating visualizations in a playground session"""
 
@@ -4029,6 +4112,30 @@ class SymbolicRegressionParams(BaseModel):
     min_r_squared: float = Field(
         default=0.7, ge=0.0, le=1.0, description="Minimum R-squared threshold"
     )
+    generations: int = Field(
+        default=20,
+        ge=1,
+        le=500,
+        description="Generations to evolve (genetic_algorithm)",
+    )
+    population_size: int = Field(
+        default=500,
+        ge=10,
+        le=20000,
+        description="Programs per generation (genetic_algorithm)",
+    )
+    tournament_size: int = Field(
+        default=20,
+        ge=2,
+        le=500,
+        description="Parent selection pressure (genetic_algorithm)",
+    )
+    n_jobs: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Worker processes for fitness scoring (genetic_algorithm)",
+    )
 
     @field_validator("data")
     def validate_data(cls, v):
@@ -36,6 +36,7 @@ except ImportError:
 
 from ..exceptions import ValidationError
 from .logger_config import log_operation
+from .genetic_programming import SymbolicRegressor
 
 # Use ValidationError for all tool errors
 ToolError = ValidationError
@@ -69,25 +70,31 @@ def discover_formula_from_data(
     population_size: int = 500,
     tournament_size: int = 20,
     random_state: Optional[int] = None,
+    n_jobs: int = 1,
 ) -> Dict[str, Any]:
     """
     Discovers a mathematical formula from given sports data using regression.
 
-    This is a simplified version that uses polynomial regression and feature engineering
-    to discover formulas. For more advanced genetic programming, consider using gplearn.
+    With ``optimization_method="genetic_algorithm"`` formulas are evolved by
+    genetic programming (see genetic_programming.SymbolicRegressor). Otherwise
+    polynomial regression and feature engineering fit fixed template forms.
 
     Args:
         data: Dictionary mapping variable names to lists of values
         target_variable: The name of the variable to predict
         input_variables: A list of variable names to use as inputs
         regression_type: Type of regression ("linear", "polynomial", "custom")
-        optimization_method: Method for optimization
-        max_complexity: Maximum degree for polynomial features
+        optimization_method: Method for optimization ("genetic_algorithm" for
+            genetic programming)
+        max_complexity: Maximum degree for polynomial features, or maximum
+            expression tree depth for genetic programming
         min_r_squared: Minimum R-squared threshold
-        generations: Not used in this simplified version
-        population_size: Not used in this simplified version
-        tournament_size: Not used in this simplified version
+        generations: Generations to evolve (genetic programming only)
+        population_size: Programs per generation (genetic programming only)
+        tournament_size: Parent selection pressure (genetic programming only)
         random_state: Seed for reproducibility
+        n_jobs: Worker processes for fitness scoring, -1 for all cores
+            (genetic programming only)
 
     Returns:
         Dictionary with discovered formula, R-squared, and metrics
@@ -130,6 +137,23 @@ def discover_formula_from_data(
         X_train_scaled = scaler.fit_transform(X_train)
         X_test_scaled = scaler.transform(X_test)
 
+        if optimization_method == "genetic_algorithm":
+            return _discover_formula_genetic(
+                X_train,
+                X_test,
+                y_train,
+                y_test,
+                target_variable=target_variable,
+                input_variables=input_variables,
+                max_depth=max_complexity,
+                min_r_squared=min_r_squared,
+                generations=generations,
+                population_size=population_size,
+                tournament_size=tournament_size,
+                random_state=random_state,
+                n_jobs=n_jobs,
+            )
+
         best_model = None
         best_r2 = -np.inf
         best_formula_str = ""
@@ -251,6 +275,63 @@ def discover_formula_from_data(
         raise
 
 
+def _discover_formula_genetic(
+    X_train: np.ndarray,
+    X_test: np.ndarray,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    target_variable: str,
+    input_variables: List[str],
+    max_depth: int,
+    min_r_squared: float,
+    generations: int,
+    population_size: int,
+    tournament_size: int,
+    random_state: Optional[int],
+    n_jobs: int,
+) -> Dict[str, Any]:
+    """Evolve a formula on the training split and score it on the test split"""
+    model = SymbolicRegressor(
+        population_size=population_size,
+        generations=generations,
+        tournament_size=min(tournament_size, population_size),
+        max_depth=max_depth,
+        n_jobs=n_jobs,
+        random_state=random_state,
+    )
+    model.fit(X_train, y_train, feature_names=input_variables)
+
+    y_pred = model.predict(X_test)
+    r2 = r2_score(y_test, y_pred)
+    mse = mean_squared_error(y_test, y_pred)
+
+    if r2 < min_r_squared:
+        raise ToolError(
+            f"Best formula's R-squared ({r2:.2f}) is below minimum threshold ({min_r_squared})"
+        )
+
+    expr = model.to_sympy()
+    logger.info(
+        f"Formula evolved in {len(model.history_)} generations with R²={r2:.2f}, MSE={mse:.2f}"
+    )
+
+    return {
+        "formula_string": str(expr),
+        "formula_sympy": str(expr),
+        "formula_latex": sp.latex(expr),
+        "r_squared": float(r2),
+        "training_r_squared": float(model.program_.r_squared),
+        "mean_squared_error": float(mse),
+        "description": f"Discovered formula for {target_variable} using genetic programming",
+        "input_variables": input_variables,
+        "target_variable": target_variable,
+        "complexity": model.program_.size,
+        "regression_type": "symbolic",
+        "generations_run": len(model.history_),
+        "history": model.history_,
+    }
+
+
 @log_operation("symbolic_regression_validate_formula")
 def validate_discovered_formula(
     formula: str,
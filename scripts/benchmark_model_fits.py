@@ -0,0 +1,125 @@
+"""
+Benchmark model fits for the econometric stack.
+
+Runs the estimators registered in tests/benchmarks/model_fit_benchmarks.py on
+synthetic data at 1x / 10x / 100x of a season, writes a JSON report to
+benchmark_results/, and flags regressions against a stored baseline.
+
+Examples:
+    python scripts/benchmark_model_fits.py
+    python scripts/benchmark_model_fits.py --scales 1x 10x --repeats 5
+    python scripts/benchmark_model_fits.py --update-baseline
+    python scripts/benchmark_model_fits.py --fail-on-regression
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.benchmarks.model_fit_benchmarks import (
+    MODEL_FIT_CASES,
+    SEASON_SCALES,
+    ModelFitBenchmarkSuite,
+)
+
+DEFAULT_BASELINE = "benchmark_results/model_fit_baseline.json"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scales", nargs="+", default=["1x"], choices=list(SEASON_SCALES)
+    )
+    parser.add_argument(
+        "--benchmarks", nargs="+", default=None, choices=list(MODEL_FIT_CASES)
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--output-dir", default="benchmark_results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any regression is found",
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run in-process instead of one worker process per case",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    print("=" * 70)
+    print("MODEL-FIT BENCHMARKS")
+    print("=" * 70)
+
+    suite = ModelFitBenchmarkSuite(
+        output_dir=args.output_dir,
+        repeats=args.repeats,
+        isolate=not args.no_isolate,
+        timeout_s=args.timeout,
+    )
+
+    names = args.benchmarks or list(MODEL_FIT_CASES)
+    for scale in args.scales:
+        for name in names:
+            r = suite.run_case(name, scale)
+            if r.status == "ok":
+                print(
+                    f"  {name:<40} {scale:>4}  n={r.n_rows:<8} "
+                    f"median={r.wall_time_s['median']:.3f}s  "
+                    f"rss+={r.rss_delta_mb:.1f}MB  alloc={r.alloc_peak_mb:.1f}MB"
+                )
+            else:
+                print(f"  {name:<40} {scale:>4}  {r.status.upper()}: {r.error}")
+
+    report_path = suite.save()
+    print(f"\n📄 Results saved to: {report_path}")
+
+    exit_code = 0
+    if os.path.exists(args.baseline):
+        regressions = suite.compare_to_baseline(
+            args.baseline,
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+        )
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) vs {args.baseline}:")
+            for reg in regressions:
+                print(
+                    f"  {reg['benchmark']} [{reg['scale']}] {reg['metric']}: "
+                    f"{reg['baseline']} -> {reg['current']}"
+                )
+            if args.fail_on_regression:
+                exit_code = 1
+        else:
+            print(f"\n✅ No regressions vs {args.baseline}")
+    elif not args.update_baseline:
+        print(f"\nNo baseline at {args.baseline} (use --update-baseline)")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        shutil.copyfile(report_path, args.baseline)
+        print(f"📌 Baseline updated: {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
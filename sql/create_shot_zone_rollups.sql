@@ -0,0 +1,89 @@
+-- ==============================================================================
+-- Shot Zone Rollup Tables
+-- ==============================================================================
+--
+-- Precomputed shot zone aggregates read by ShotZoneAnalytics
+-- (mcp_server/analytics/shot_zones.py), so zone efficiency, league baselines,
+-- player profiles and team defense no longer scan hoopr_play_by_play.
+--
+-- Tables:
+--   1. shot_zone_game_rollup   - per (game, team, player, zone); the unit of
+--                                incremental refresh
+--   2. shot_zone_season_rollup - per (season, team, player, zone)
+--   3. shot_zone_defense_rollup - per (season, defending team, zone)
+--   4. shot_zone_rollup_games  - games included and their classified shot
+--                                count (a changed count marks the game stale)
+--
+-- Season is EXTRACT(YEAR FROM hoopr_schedule.date), matching the original
+-- analytics queries, stored as an integer so season filters use the keys.
+--
+-- Usage:
+--   psql -U <username> -d <database> -f sql/create_shot_zone_rollups.sql
+--
+--   Then populate (and later refresh after loading games):
+--   python -c "from mcp_server.analytics import ShotZoneAnalytics; \
+--              ShotZoneAnalytics().refresh_rollups()"
+--
+-- ==============================================================================
+
+CREATE TABLE IF NOT EXISTS shot_zone_game_rollup (
+    game_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    defense_team_id INTEGER,
+    player_id INTEGER NOT NULL,  -- 0 for shots without a shooter
+    shot_zone TEXT NOT NULL,
+
+    attempts INTEGER NOT NULL,
+    made INTEGER NOT NULL,
+    points INTEGER NOT NULL,  -- Points on made shots
+    score_value_total INTEGER NOT NULL,  -- SUM(score_value) over attempts
+
+    PRIMARY KEY (game_id, team_id, player_id, shot_zone)
+);
+
+CREATE INDEX IF NOT EXISTS idx_shot_zone_game_rollup_player
+ON shot_zone_game_rollup(season, team_id, player_id);
+
+CREATE INDEX IF NOT EXISTS idx_shot_zone_game_rollup_defense
+ON shot_zone_game_rollup(season, defense_team_id);
+
+CREATE TABLE IF NOT EXISTS shot_zone_season_rollup (
+    season INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    shot_zone TEXT NOT NULL,
+
+    attempts INTEGER NOT NULL,
+    made INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    score_value_total INTEGER NOT NULL,
+
+    PRIMARY KEY (season, team_id, player_id, shot_zone)
+);
+
+CREATE INDEX IF NOT EXISTS idx_shot_zone_season_rollup_player
+ON shot_zone_season_rollup(player_id, season);
+
+CREATE TABLE IF NOT EXISTS shot_zone_defense_rollup (
+    season INTEGER NOT NULL,
+    defense_team_id INTEGER NOT NULL,
+    shot_zone TEXT NOT NULL,
+
+    attempts INTEGER NOT NULL,
+    made INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+
+    PRIMARY KEY (season, defense_team_id, shot_zone)
+);
+
+CREATE TABLE IF NOT EXISTS shot_zone_rollup_games (
+    game_id TEXT PRIMARY KEY,
+    classified_shots INTEGER NOT NULL,
+    rolled_up_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==============================================================================
+-- Rollup tables created
+-- Expected query performance: single-digit ms for profile and baseline reads
+-- ==============================================================================
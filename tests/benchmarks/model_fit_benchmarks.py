@@ -0,0 +1,682 @@
+"""
+Model-fit benchmark harness for the econometric stack.
+
+Measures the heavy estimators (EconometricSuite.analyze, system GMM, frailty
+models, synthetic control, Markov switching) on synthetic NBA-shaped data at
+1x / 10x / 100x of one season, and writes results to ``benchmark_results/``
+in a stable JSON schema so optimizations can be compared run over run.
+
+Per (benchmark, scale) it records:
+- wall time over ``repeats`` runs (min / median / mean / max)
+- peak and delta resident set size (RSS) of an isolated worker process
+- Python allocations (tracemalloc peak and retained MB) from one extra run
+
+Usage:
+    python scripts/benchmark_model_fits.py --scales 1x 10x
+    python scripts/benchmark_model_fits.py --update-baseline
+"""
+
+import gc
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_VERSION = 1
+
+# Scale multipliers relative to one NBA season of data
+SEASON_SCALES: Dict[str, float] = {"1x": 1, "10x": 10, "100x": 100}
+
+# One season: 30 teams, ~450 rostered players, 82 games per team, 1230 games
+SEASON_TEAMS = 30
+SEASON_PLAYERS = 450
+SEASON_GAMES_PER_TEAM = 82
+SEASON_LEAGUE_GAMES = 1230
+
+
+# =============================================================================
+# Synthetic Data Generators
+# =============================================================================
+
+
+def generate_player_game_panel(scale: float = 1, seed: int = 42) -> pd.DataFrame:
+    """
+    Player-game panel: ``450 * scale`` players x 82 games.
+
+    Points follow a persistent AR(1) process with a player effect, so dynamic
+    panel estimators (difference/system GMM) have something to identify.
+    """
+    rng = np.random.default_rng(seed)
+    n_players = max(2, int(round(SEASON_PLAYERS * scale)))
+    n_games = SEASON_GAMES_PER_TEAM
+
+    player_effect = rng.normal(0, 4, n_players)
+    minutes = np.clip(rng.normal(24, 8, (n_players, n_games)), 5, 44)
+    usage = np.clip(rng.normal(0.2, 0.05, (n_players, n_games)), 0.05, 0.4)
+
+    points = np.zeros((n_players, n_games))
+    points[:, 0] = 10 + player_effect + rng.normal(0, 4, n_players)
+    for t in range(1, n_games):
+        points[:, t] = (
+            3
+            + 0.6 * points[:, t - 1]
+            + 0.25 * minutes[:, t]
+            + 10 * usage[:, t]
+            + 0.4 * player_effect
+            + rng.normal(0, 4, n_players)
+        )
+
+    return pd.DataFrame(
+        {
+            "player_id": np.repeat(np.arange(n_players), n_games),
+            "team_id": np.repeat(np.arange(n_players) % SEASON_TEAMS, n_games),
+            "game_number": np.tile(np.arange(1, n_games + 1), n_players),
+            "points": points.ravel(),
+            "minutes": minutes.ravel(),
+            "usage": usage.ravel(),
+        }
+    )
+
+
+def generate_career_data(scale: float = 1, seed: int = 42) -> pd.DataFrame:
+    """Player careers for survival models: ``450 * scale`` players."""
+    rng = np.random.default_rng(seed)
+    n = max(20, int(round(SEASON_PLAYERS * scale)))
+
+    team_id = rng.integers(0, SEASON_TEAMS, n)
+    team_frailty = rng.gamma(2.0, 0.5, SEASON_TEAMS)[team_id]
+    draft_pick = rng.integers(1, 61, n)
+    entry_age = rng.normal(21, 1.5, n)
+    ppg = np.clip(rng.normal(10, 5, n), 0, None)
+
+    hazard = (
+        0.12
+        * team_frailty
+        * np.exp(0.01 * draft_pick + 0.08 * (entry_age - 21) - 0.04 * ppg)
+    )
+    duration = np.ceil(rng.exponential(1 / hazard)).clip(1, 20)
+    censor_time = rng.integers(1, 21, n)
+    retired = (duration <= censor_time).astype(int)
+
+    return pd.DataFrame(
+        {
+            "player_id": np.arange(n),
+            "team_id": team_id,
+            "career_length": np.minimum(duration, censor_time),
+            "retired": retired,
+            "draft_pick": draft_pick,
+            "entry_age": entry_age,
+            "ppg": ppg,
+        }
+    )
+
+
+def generate_team_panel(scale: float = 1, seed: int = 42) -> pd.DataFrame:
+    """
+    Team x game panel for synthetic control: 30 teams x ``82 * scale`` games.
+
+    Team 0 receives a +3 net-rating treatment from the midpoint onward.
+    """
+    rng = np.random.default_rng(seed)
+    n_periods = max(10, int(round(SEASON_GAMES_PER_TEAM * scale)))
+
+    factors = rng.normal(0, 1, (n_periods, 3)).cumsum(axis=0) * 0.3
+    loadings = rng.normal(0, 1, (SEASON_TEAMS, 3))
+    outcome = factors @ loadings.T + rng.normal(0, 1, (n_periods, SEASON_TEAMS))
+
+    treatment_period = n_periods // 2
+    treated = np.zeros_like(outcome, dtype=int)
+    treated[treatment_period:, 0] = 1
+    outcome = outcome + 3.0 * treated
+
+    return pd.DataFrame(
+        {
+            "team_id": np.tile(np.arange(SEASON_TEAMS), n_periods),
+            "period": np.repeat(np.arange(n_periods), SEASON_TEAMS),
+            "net_rating": outcome.ravel(),
+            "treated": treated.ravel(),
+        }
+    )
+
+
+def generate_game_series(scale: float = 1, seed: int = 42) -> pd.Series:
+    """League game-level point differential: ``1230 * scale`` games, 2 regimes."""
+    rng = np.random.default_rng(seed)
+    n = max(50, int(round(SEASON_LEAGUE_GAMES * scale)))
+
+    regimes = np.zeros(n, dtype=int)
+    for t in range(1, n):
+        stay = 0.97 if regimes[t - 1] == 0 else 0.9
+        regimes[t] = regimes[t - 1] if rng.uniform() < stay else 1 - regimes[t - 1]
+
+    values = np.where(regimes == 0, 2.0, -4.0) + rng.normal(0, 6, n)
+    return pd.Series(values, name="point_differential")
+
+
+# =============================================================================
+# Benchmark Cases
+# =============================================================================
+
+
+@dataclass
+class ModelFitCase:
+    """A benchmarked estimator: data generator plus the call to time."""
+
+    name: str
+    generator: Callable[[float, int], Any]
+    run: Callable[[Any], Any]
+    description: str = ""
+    # Imported before measuring so import cost is not charged to the fit
+    modules: Tuple[str, ...] = ()
+
+
+def _run_suite_analyze(data: pd.DataFrame) -> Any:
+    from mcp_server.econometric_suite import EconometricSuite
+
+    suite = EconometricSuite(
+        data, target="points", entity_col="player_id", time_col="game_number"
+    )
+    return suite.analyze(method="auto")
+
+
+def _run_system_gmm(data: pd.DataFrame) -> Any:
+    from mcp_server.panel_data import PanelDataAnalyzer
+
+    analyzer = PanelDataAnalyzer(
+        data, entity_col="player_id", time_col="game_number", target_col="points"
+    )
+    return analyzer.system_gmm(
+        formula="points ~ lag(points, 1) + minutes + usage",
+        gmm_type="two_step",
+        max_lags=3,
+        collapse=True,
+    )
+
+
+def _run_frailty_model(data: pd.DataFrame) -> Any:
+    from mcp_server.survival_analysis import SurvivalAnalyzer
+
+    analyzer = SurvivalAnalyzer(
+        data,
+        duration_col="career_length",
+        event_col="retired",
+        covariates=["draft_pick", "entry_age", "ppg"],
+        entity_col="player_id",
+    )
+    return analyzer.frailty_model(shared_frailty_col="team_id")
+
+
+def _run_synthetic_control(data: pd.DataFrame) -> Any:
+    from mcp_server.causal_inference import CausalInferenceAnalyzer
+
+    periods = sorted(data["period"].unique())
+    analyzer = CausalInferenceAnalyzer(
+        data,
+        treatment_col="treated",
+        outcome_col="net_rating",
+        entity_col="team_id",
+        time_col="period",
+    )
+    return analyzer.synthetic_control(
+        treated_unit=0,
+        outcome_periods=periods,
+        treatment_period=periods[len(periods) // 2],
+        n_placebo=10,
+    )
+
+
+def _run_markov_switching(data: pd.Series) -> Any:
+    from mcp_server.advanced_time_series import AdvancedTimeSeriesAnalyzer
+
+    analyzer = AdvancedTimeSeriesAnalyzer(data)
+    return analyzer.markov_switching(n_regimes=2, regime_type="mean_shift")
+
+
+MODEL_FIT_CASES: Dict[str, ModelFitCase] = {
+    case.name: case
+    for case in [
+        ModelFitCase(
+            "econometric_suite.analyze",
+            generate_player_game_panel,
+            _run_suite_analyze,
+            "Auto-selected panel analysis on player-game panel",
+            ("mcp_server.econometric_suite",),
+        ),
+        ModelFitCase(
+            "panel_data.system_gmm",
+            generate_player_game_panel,
+            _run_system_gmm,
+            "Two-step Blundell-Bond GMM with collapsed instruments",
+            ("mcp_server.panel_data",),
+        ),
+        ModelFitCase(
+            "survival_analysis.frailty_model",
+            generate_career_data,
+            _run_frailty_model,
+            "Shared (team) gamma frailty on player careers",
+            ("mcp_server.survival_analysis",),
+        ),
+        ModelFitCase(
+            "causal_inference.synthetic_control",
+            generate_team_panel,
+            _run_synthetic_control,
+            "Synthetic control with 10 placebo fits",
+            ("mcp_server.causal_inference",),
+        ),
+        ModelFitCase(
+            "advanced_time_series.markov_switching",
+            generate_game_series,
+            _run_markov_switching,
+            "Two-regime mean-shift Markov switching",
+            ("mcp_server.advanced_time_series",),
+        ),
+    ]
+}
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+@dataclass
+class ModelFitMeasurement:
+    """Metrics for one (benchmark, scale) run."""
+
+    benchmark: str
+    scale: str
+    n_rows: int = 0
+    repeats: int = 0
+    wall_time_s: Dict[str, float] = field(default_factory=dict)
+    peak_rss_mb: Optional[float] = None
+    rss_delta_mb: Optional[float] = None
+    alloc_peak_mb: Optional[float] = None
+    alloc_retained_mb: Optional[float] = None
+    status: str = "ok"  # 'ok', 'error', 'skipped', 'timeout'
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the stable JSON schema."""
+        return {
+            "benchmark": self.benchmark,
+            "scale": self.scale,
+            "n_rows": self.n_rows,
+            "repeats": self.repeats,
+            "wall_time_s": {k: round(v, 6) for k, v in self.wall_time_s.items()},
+            "peak_rss_mb": _round(self.peak_rss_mb),
+            "rss_delta_mb": _round(self.rss_delta_mb),
+            "alloc_peak_mb": _round(self.alloc_peak_mb),
+            "alloc_retained_mb": _round(self.alloc_retained_mb),
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+def _round(value: Optional[float], ndigits: int = 3) -> Optional[float]:
+    return None if value is None else round(value, ndigits)
+
+
+def _current_rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return _peak_rss_mb()
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return maxrss / divisor
+
+
+def _data_rows(data: Any) -> int:
+    return int(len(data)) if hasattr(data, "__len__") else 0
+
+
+def measure_case(
+    case: ModelFitCase,
+    scale: str,
+    multiplier: float,
+    repeats: int = 3,
+    seed: int = 42,
+) -> ModelFitMeasurement:
+    """
+    Measure one case in the current process.
+
+    Timed repeats run without tracemalloc; allocations come from one extra
+    traced run so tracing overhead does not distort wall times.
+    """
+    measurement = ModelFitMeasurement(benchmark=case.name, scale=scale, repeats=repeats)
+
+    try:
+        for module in case.modules:
+            importlib.import_module(module)
+        data = case.generator(multiplier, seed)
+        measurement.n_rows = _data_rows(data)
+
+        gc.collect()
+        rss_start = _current_rss_mb()
+
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            case.run(data)
+            times.append(time.perf_counter() - start)
+
+        measurement.peak_rss_mb = _peak_rss_mb()
+        measurement.rss_delta_mb = max(0.0, measurement.peak_rss_mb - rss_start)
+        measurement.wall_time_s = {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "max": max(times),
+        }
+
+        tracemalloc.start()
+        try:
+            case.run(data)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        measurement.alloc_peak_mb = peak / (1024 * 1024)
+        measurement.alloc_retained_mb = retained / (1024 * 1024)
+
+    except ImportError as e:
+        measurement.status = "skipped"
+        measurement.error = f"Missing dependency: {e}"
+    except (Exception, SystemExit) as e:
+        # Some backends (pydynpd) exit on bad input instead of raising
+        measurement.status = "error"
+        measurement.error = f"{type(e).__name__}: {e}"
+
+    return measurement
+
+
+def _measure_in_child(conn, case_name, cases, scale, multiplier, repeats, seed):
+    """Worker-process entry point: measure and send the result back."""
+    try:
+        result = measure_case(cases[case_name], scale, multiplier, repeats, seed)
+        conn.send(result.to_dict())
+    except BaseException:
+        conn.send({"status": "error", "error": traceback.format_exc(limit=3)})
+    finally:
+        conn.close()
+
+
+class ModelFitBenchmarkSuite:
+    """
+    Runs model-fit benchmarks and compares them against a stored baseline.
+
+    Each (benchmark, scale) pair runs in a freshly forked worker process by
+    default, so peak RSS reflects only that estimator and a crash or timeout
+    in one method cannot take down the run.
+
+    Examples:
+        >>> suite = ModelFitBenchmarkSuite(repeats=3)
+        >>> suite.run(scales=["1x", "10x"])
+        >>> path = suite.save()
+        >>> regressions = suite.compare_to_baseline(
+        ...     "benchmark_results/model_fit_baseline.json"
+        ... )
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "benchmark_results",
+        cases: Optional[Dict[str, ModelFitCase]] = None,
+        scales: Optional[Dict[str, float]] = None,
+        repeats: int = 3,
+        seed: int = 42,
+        isolate: bool = True,
+        timeout_s: Optional[float] = 1800,
+    ):
+        """
+        Initialize benchmark suite.
+
+        Args:
+            output_dir: Directory for JSON results
+            cases: Benchmark cases (default: MODEL_FIT_CASES)
+            scales: Scale label -> season multiplier (default: SEASON_SCALES)
+            repeats: Timed repetitions per case
+            seed: Seed for synthetic data
+            isolate: Run each case in a forked worker process
+            timeout_s: Per-case timeout when isolated (None = no limit)
+        """
+        self.output_dir = output_dir
+        self.cases = cases if cases is not None else MODEL_FIT_CASES
+        self.scales = scales if scales is not None else SEASON_SCALES
+        self.repeats = repeats
+        self.seed = seed
+        self.isolate = isolate and "fork" in multiprocessing.get_all_start_methods()
+        self.timeout_s = timeout_s
+        self.results: List[ModelFitMeasurement] = []
+
+    def run_case(self, case_name: str, scale: str) -> ModelFitMeasurement:
+        """Run and record a single (benchmark, scale) measurement."""
+        if case_name not in self.cases:
+            raise KeyError(
+                f"Unknown benchmark '{case_name}'. Available: {sorted(self.cases)}"
+            )
+        if scale not in self.scales:
+            raise KeyError(f"Unknown scale '{scale}'. Available: {list(self.scales)}")
+
+        multiplier = self.scales[scale]
+        if not self.isolate:
+            measurement = measure_case(
+                self.cases[case_name], scale, multiplier, self.repeats, self.seed
+            )
+        else:
+            measurement = self._run_isolated(case_name, scale, multiplier)
+
+        self.results.append(measurement)
+        return measurement
+
+    def _run_isolated(
+        self, case_name: str, scale: str, multiplier: float
+    ) -> ModelFitMeasurement:
+        ctx = multiprocessing.get_context("fork")
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_measure_in_child,
+            args=(
+                child_conn,
+                case_name,
+                self.cases,
+                scale,
+                multiplier,
+                self.repeats,
+                self.seed,
+            ),
+        )
+        process.start()
+        child_conn.close()
+
+        measurement = ModelFitMeasurement(
+            benchmark=case_name, scale=scale, repeats=self.repeats
+        )
+        if parent_conn.poll(self.timeout_s):
+            payload = parent_conn.recv()
+            process.join()
+            for key, value in payload.items():
+                if hasattr(measurement, key):
+                    setattr(measurement, key, value)
+        else:
+            process.terminate()
+            process.join()
+            measurement.status = "timeout"
+            measurement.error = f"Exceeded {self.timeout_s}s"
+        parent_conn.close()
+        return measurement
+
+    def run(
+        self,
+        scales: Sequence[str] = ("1x",),
+        benchmarks: Optional[Sequence[str]] = None,
+    ) -> List[ModelFitMeasurement]:
+        """Run every selected benchmark at every selected scale."""
+        names = list(benchmarks) if benchmarks else list(self.cases)
+        return [self.run_case(name, scale) for scale in scales for name in names]
+
+    def to_report(self) -> Dict[str, Any]:
+        """Build the JSON report (schema_version 1)."""
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "suite": "model_fit",
+            "created_at": datetime.now().isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "numpy": np.__version__,
+                "pandas": pd.__version__,
+            },
+            "config": {
+                "repeats": self.repeats,
+                "seed": self.seed,
+                "isolated": self.isolate,
+                "scales": dict(self.scales),
+            },
+            "results": [r.to_dict() for r in self.results],
+        }
+
+    def save(self, filename: Optional[str] = None) -> str:
+        """Write the report to output_dir and return its path."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        if filename is None:
+            filename = f"model_fit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filepath = os.path.join(self.output_dir, filename)
+        with open(filepath, "w") as f:
+            json.dump(self.to_report(), f, indent=2)
+        return filepath
+
+    def compare_to_baseline(
+        self,
+        baseline: Any,
+        time_tolerance: float = 0.25,
+        memory_tolerance: float = 0.25,
+        min_time_delta_s: float = 0.05,
+        min_memory_delta_mb: float = 10.0,
+    ) -> List[Dict[str, Any]]:
+        """Compare this run's results with a baseline report or path."""
+        return compare_reports(
+            self.to_report(),
+            baseline,
+            time_tolerance=time_tolerance,
+            memory_tolerance=memory_tolerance,
+            min_time_delta_s=min_time_delta_s,
+            min_memory_delta_mb=min_memory_delta_mb,
+        )
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """Load a report and check its schema version."""
+    with open(path) as f:
+        report = json.load(f)
+    if report.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark schema {report.get('schema_version')} in {path}"
+        )
+    return report
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Any,
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.25,
+    min_time_delta_s: float = 0.05,
+    min_memory_delta_mb: float = 10.0,
+) -> List[Dict[str, Any]]:
+    """
+    Flag regressions of ``current`` relative to ``baseline``.
+
+    A metric regresses when it exceeds the baseline by more than the relative
+    tolerance AND by more than the absolute floor (so sub-noise changes on
+    very fast methods are ignored). Benchmarks that succeeded in the baseline
+    but fail now are also reported.
+
+    Args:
+        current: Report produced by ModelFitBenchmarkSuite.to_report()
+        baseline: Baseline report dict or path to one
+        time_tolerance: Allowed relative slowdown of median wall time
+        memory_tolerance: Allowed relative growth of RSS delta / alloc peak
+        min_time_delta_s: Absolute wall-time floor for a regression
+        min_memory_delta_mb: Absolute memory floor for a regression
+
+    Returns:
+        List of regression records (empty when nothing regressed)
+    """
+    if isinstance(baseline, (str, os.PathLike)):
+        baseline = load_report(str(baseline))
+
+    base_index = {(r["benchmark"], r["scale"]): r for r in baseline.get("results", [])}
+    checks = [
+        ("wall_time_s.median", time_tolerance, min_time_delta_s),
+        ("rss_delta_mb", memory_tolerance, min_memory_delta_mb),
+        ("alloc_peak_mb", memory_tolerance, min_memory_delta_mb),
+    ]
+
+    regressions = []
+    for result in current.get("results", []):
+        key = (result["benchmark"], result["scale"])
+        base = base_index.get(key)
+        if base is None or base.get("status") != "ok":
+            continue
+
+        if result.get("status") != "ok":
+            regressions.append(
+                {
+                    "benchmark": key[0],
+                    "scale": key[1],
+                    "metric": "status",
+                    "baseline": base.get("status"),
+                    "current": result.get("status"),
+                    "ratio": None,
+                }
+            )
+            continue
+
+        for metric, tolerance, floor in checks:
+            old, new = _metric(base, metric), _metric(result, metric)
+            if old is None or new is None:
+                continue
+            if new - old > floor and new > old * (1 + tolerance):
+                regressions.append(
+                    {
+                        "benchmark": key[0],
+                        "scale": key[1],
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "ratio": round(new / old, 3) if old else None,
+                    }
+                )
+
+    return regressions
+
+
+def _metric(record: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = record
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
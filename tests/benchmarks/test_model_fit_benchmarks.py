@@ -0,0 +1,194 @@
+"""
+Tests for the model-fit benchmark harness.
+"""
+
+import json
+
+import pytest
+
+from tests.benchmarks.model_fit_benchmarks import (
+    MODEL_FIT_CASES,
+    SCHEMA_VERSION,
+    ModelFitBenchmarkSuite,
+    ModelFitCase,
+    compare_reports,
+    generate_career_data,
+    generate_game_series,
+    generate_player_game_panel,
+    generate_team_panel,
+)
+
+
+def _cheap_case():
+    return ModelFitCase(
+        name="cheap.sum",
+        generator=generate_game_series,
+        run=lambda data: data.cumsum().sum(),
+    )
+
+
+def _report(median, rss=50.0, status="ok"):
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "results": [
+            {
+                "benchmark": "a",
+                "scale": "1x",
+                "wall_time_s": {"median": median},
+                "rss_delta_mb": rss,
+                "alloc_peak_mb": 1.0,
+                "status": status,
+            }
+        ],
+    }
+
+
+class TestGenerators:
+    def test_player_game_panel_scales_with_season(self):
+        df = generate_player_game_panel(scale=0.1)
+        assert len(df) == 45 * 82
+        assert df.groupby("player_id").size().eq(82).all()
+        assert {"points", "minutes", "usage", "team_id"} <= set(df.columns)
+
+    def test_career_data(self):
+        df = generate_career_data(scale=1)
+        assert len(df) == 450
+        assert set(df["retired"].unique()) <= {0, 1}
+        assert (df["career_length"] >= 1).all()
+
+    def test_team_panel_has_single_treated_unit(self):
+        df = generate_team_panel(scale=1)
+        assert df["team_id"].nunique() == 30
+        assert df.loc[df["treated"] == 1, "team_id"].unique().tolist() == [0]
+
+    def test_game_series_is_deterministic(self):
+        a = generate_game_series(scale=0.1, seed=7)
+        b = generate_game_series(scale=0.1, seed=7)
+        assert a.equals(b)
+
+    def test_all_requested_methods_registered(self):
+        assert set(MODEL_FIT_CASES) == {
+            "econometric_suite.analyze",
+            "panel_data.system_gmm",
+            "survival_analysis.frailty_model",
+            "causal_inference.synthetic_control",
+            "advanced_time_series.markov_switching",
+        }
+
+
+class TestSuite:
+    def test_in_process_measurement(self, tmp_path):
+        suite = ModelFitBenchmarkSuite(
+            output_dir=str(tmp_path),
+            cases={"cheap.sum": _cheap_case()},
+            scales={"tiny": 0.1},
+            repeats=2,
+            isolate=False,
+        )
+        (result,) = suite.run(scales=["tiny"])
+
+        assert result.status == "ok"
+        assert result.n_rows == 123
+        assert set(result.wall_time_s) == {"min", "median", "mean", "max"}
+        assert result.peak_rss_mb > 0
+        assert result.alloc_peak_mb is not None
+
+    def test_isolated_measurement(self, tmp_path):
+        suite = ModelFitBenchmarkSuite(
+            output_dir=str(tmp_path),
+            cases={"cheap.sum": _cheap_case()},
+            scales={"tiny": 0.1},
+            repeats=1,
+        )
+        result = suite.run_case("cheap.sum", "tiny")
+        assert result.status == "ok"
+        assert result.wall_time_s["median"] >= 0
+
+    def test_errors_are_recorded_not_raised(self, tmp_path):
+        def boom(_):
+            raise RuntimeError("fit failed")
+
+        case = ModelFitCase("boom", generate_game_series, boom)
+        suite = ModelFitBenchmarkSuite(
+            output_dir=str(tmp_path),
+            cases={"boom": case},
+            scales={"tiny": 0.1},
+            isolate=False,
+        )
+        result = suite.run_case("boom", "tiny")
+        assert result.status == "error"
+        assert "fit failed" in result.error
+
+    def test_save_writes_stable_schema(self, tmp_path):
+        suite = ModelFitBenchmarkSuite(
+            output_dir=str(tmp_path),
+            cases={"cheap.sum": _cheap_case()},
+            scales={"tiny": 0.1},
+            repeats=1,
+            isolate=False,
+        )
+        suite.run(scales=["tiny"])
+        path = suite.save("report.json")
+
+        with open(path) as f:
+            report = json.load(f)
+        assert report["schema_version"] == SCHEMA_VERSION
+        assert report["suite"] == "model_fit"
+        assert set(report["results"][0]) == {
+            "benchmark",
+            "scale",
+            "n_rows",
+            "repeats",
+            "wall_time_s",
+            "peak_rss_mb",
+            "rss_delta_mb",
+            "alloc_peak_mb",
+            "alloc_retained_mb",
+            "status",
+            "error",
+        }
+
+    def test_unknown_case_raises(self):
+        suite = ModelFitBenchmarkSuite(isolate=False)
+        with pytest.raises(KeyError):
+            suite.run_case("nope", "1x")
+
+
+class TestBaselineComparison:
+    def test_slowdown_flagged(self):
+        regressions = compare_reports(_report(2.0), _report(1.0))
+        assert [r["metric"] for r in regressions] == ["wall_time_s.median"]
+        assert regressions[0]["ratio"] == 2.0
+
+    def test_within_tolerance_not_flagged(self):
+        assert compare_reports(_report(1.1), _report(1.0)) == []
+
+    def test_tiny_absolute_change_ignored(self):
+        # 3x slower but only 20ms: below the absolute noise floor
+        assert compare_reports(_report(0.03), _report(0.01)) == []
+
+    def test_memory_growth_flagged(self):
+        regressions = compare_reports(_report(1.0, rss=200.0), _report(1.0))
+        assert [r["metric"] for r in regressions] == ["rss_delta_mb"]
+
+    def test_new_failure_flagged(self):
+        regressions = compare_reports(_report(1.0, status="error"), _report(1.0))
+        assert regressions[0]["metric"] == "status"
+
+    def test_baseline_from_path(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(_report(1.0)))
+        assert len(compare_reports(_report(5.0), str(path))) == 1
+
+
+@pytest.mark.slow
+def test_real_case_at_small_scale(tmp_path):
+    pytest.importorskip("statsmodels")
+    suite = ModelFitBenchmarkSuite(
+        output_dir=str(tmp_path),
+        scales={"tiny": 0.1},
+        repeats=1,
+        isolate=False,
+    )
+    result = suite.run_case("advanced_time_series.markov_switching", "tiny")
+    assert result.status == "ok", result.error
@@ -31,6 +31,8 @@ from mcp_server.bayesian import (
     NBABayesianModels,
     plot_posterior,
     plot_ppc,
+    PosteriorTraceCache,
+    hash_dataframe,
     PYMC_AVAILABLE,
 )
 
@@ -756,3 +758,127 @@ def test_analyzer_without_mlflow():
     analyzer.build_simple_model()
     result = analyzer.sample_posterior(draws=100, tune=100, chains=2)
     assert result is not None
+
+
+# ==============================================================================
+# Trace Cache Tests (5 tests)
+# ==============================================================================
+
+
+def test_hash_dataframe_stability(simple_regression_data):
+    """Test data hash is stable and sensitive to content."""
+    h1 = hash_dataframe(simple_regression_data)
+    h2 = hash_dataframe(simple_regression_data.copy())
+    changed = simple_regression_data.copy()
+    changed.loc[0, "y"] += 1.0
+
+    assert h1 == h2
+    assert hash_dataframe(changed) != h1
+    assert hash_dataframe(changed, ["x"]) == hash_dataframe(
+        simple_regression_data, ["x"]
+    )
+
+
+def test_trace_cache_memoize(tmp_path):
+    """Test derived quantities are computed once and persisted."""
+    cache = PosteriorTraceCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 1.5
+
+    assert cache.memoize("k", "waic", compute) == 1.5
+    assert cache.memoize("k", "waic", compute) == 1.5
+    assert len(calls) == 1
+
+    # A fresh cache instance reads the persisted value
+    reloaded = PosteriorTraceCache(tmp_path)
+    assert reloaded.memoize("k", "waic", compute) == 1.5
+    assert len(calls) == 1
+
+    with pytest.raises(Exception):
+        PosteriorTraceCache(tmp_path, storage_format="pickle")
+
+
+def test_sample_posterior_uses_trace_cache(simple_regression_data, tmp_path):
+    """Test a second identical request loads the stored trace."""
+    cache = PosteriorTraceCache(tmp_path)
+
+    analyzer = BayesianAnalyzer(
+        simple_regression_data, target="y", features=["x"], trace_cache=cache
+    )
+    analyzer.build_simple_model()
+    first = analyzer.sample_posterior(draws=100, tune=100, chains=2, random_seed=1)
+
+    assert first.cache_key is not None
+    assert cache.has(first.cache_key)
+    assert list(tmp_path.glob("*.nc"))
+
+    # New analyzer, same spec and data: no resampling
+    analyzer2 = BayesianAnalyzer(
+        simple_regression_data, target="y", features=["x"], trace_cache=cache
+    )
+    analyzer2.build_simple_model()
+    second = analyzer2.sample_posterior(draws=100, tune=100, chains=2, random_seed=1)
+
+    assert second.cache_key == first.cache_key
+    assert cache.stats["trace_hits"] >= 1
+    np.testing.assert_allclose(
+        first.trace.posterior["alpha"].values,
+        second.trace.posterior["alpha"].values,
+    )
+
+    # Different data produces a different key
+    changed = simple_regression_data.copy()
+    changed["y"] += 1.0
+    analyzer3 = BayesianAnalyzer(changed, target="y", features=["x"], trace_cache=cache)
+    analyzer3.build_simple_model()
+    assert analyzer3._trace_cache_key({"draws": 100}) != analyzer2._trace_cache_key(
+        {"draws": 100}
+    )
+
+
+def test_template_trace_keyed_on_template_data(nba_scoring_data, tmp_path):
+    """Test templates registered via use_model key on the data they were built on."""
+    cache = PosteriorTraceCache(tmp_path)
+    analyzer = BayesianAnalyzer(nba_scoring_data, target="points", trace_cache=cache)
+
+    def register(data):
+        model, enc = NBABayesianModels.player_scoring_model(data)
+        analyzer.use_model(model, enc["model_spec"], enc["columns"], data=data)
+        key = analyzer._trace_cache_key({"draws": 100})
+        analyzer.use_model(
+            model, enc["model_spec"], enc["columns"], data_hash=enc["data_hash"]
+        )
+        assert analyzer._trace_cache_key({"draws": 100}) == key
+        return key
+
+    base_key = register(nba_scoring_data)
+    assert register(nba_scoring_data.copy()) == base_key
+
+    # Another slate of games must not reuse the stored trace, even though the
+    # analyzer's own data is unchanged
+    other = nba_scoring_data.copy()
+    other["points"] += 1.0
+    assert register(other) != base_key
+
+
+def test_derived_quantities_memoized(simple_regression_data, tmp_path):
+    """Test WAIC/LOO/ESS/Rhat/intervals are served from the trace cache."""
+    cache = PosteriorTraceCache(tmp_path)
+    analyzer = BayesianAnalyzer(
+        simple_regression_data, target="y", features=["x"], trace_cache=cache
+    )
+    analyzer.build_simple_model()
+    result = analyzer.sample_posterior(draws=200, tune=200, chains=2, random_seed=2)
+
+    waic = analyzer.waic(result)
+    ci = analyzer.credible_interval(result, "alpha", prob=0.9)
+    ess = analyzer.effective_sample_size(result)
+    hits_before = cache.stats["derived_hits"]
+
+    assert analyzer.waic(result) == waic
+    assert analyzer.credible_interval(result, "alpha", prob=0.9).lower == ci.lower
+    assert analyzer.effective_sample_size(result) == ess
+    assert cache.stats["derived_hits"] >= hits_before + 3
@@ -1225,5 +1225,239 @@ class TestHierarchicalTSEdgeCases:
         assert model is not None
 
 
+# ==============================================================================
+# Sequential Updating Tests
+# ==============================================================================
+
+
+class TestSequentialConjugateUpdater:
+    """Tests for O(1) conjugate sequential updating."""
+
+    def test_sequential_equals_batch_normal(self):
+        """Game-by-game updates match a single batch update."""
+        from mcp_server.bayesian_time_series import SequentialConjugateUpdater
+
+        rng = np.random.default_rng(0)
+        players = np.repeat(["A", "B", "C"], 30)
+        points = rng.normal(20, 4, size=len(players))
+
+        batch = SequentialConjugateUpdater("normal", mu0=15, kappa0=2)
+        batch.update(players, points)
+
+        sequential = SequentialConjugateUpdater("normal", mu0=15, kappa0=2)
+        for night in range(30):
+            rows = np.arange(night, len(players), 30)
+            sequential.update(players[rows], points[rows])
+
+        pd.testing.assert_frame_equal(
+            batch.posterior().sort_values("entity").reset_index(drop=True),
+            sequential.posterior().sort_values("entity").reset_index(drop=True),
+        )
+
+    def test_normal_posterior_concentrates(self):
+        """Posterior mean approaches sample mean as games accumulate."""
+        from mcp_server.bayesian_time_series import SequentialConjugateUpdater
+
+        rng = np.random.default_rng(1)
+        values = rng.normal(25, 3, size=500)
+
+        updater = SequentialConjugateUpdater("normal", mu0=0, kappa0=1)
+        updater.update(["P1"] * 500, values)
+        post = updater.posterior("P1")
+
+        assert post["n_obs"] == 500
+        assert abs(post["mean"] - values.mean()) < 0.1
+        assert post["lower"] < values.mean() < post["upper"]
+        assert abs(post["sigma"] - 3) < 0.5
+
+    def test_poisson_gamma_update(self):
+        """Gamma-Poisson update adds counts to shape and games to rate."""
+        from mcp_server.bayesian_time_series import SequentialConjugateUpdater
+
+        updater = SequentialConjugateUpdater("poisson", alpha0=2.0, beta0=0.1)
+        updater.update(["P1", "P1", "P2"], [10, 14, 3])
+
+        assert np.isclose(updater.posterior("P1")["mean"], 26.0 / 2.1)
+        assert np.isclose(updater.posterior("P2")["mean"], 5.0 / 1.1)
+
+    def test_state_roundtrip(self):
+        """Persisted state restores identical posteriors."""
+        from mcp_server.bayesian_time_series import SequentialConjugateUpdater
+
+        updater = SequentialConjugateUpdater("normal", mu0=10)
+        updater.update(["A", "B", "A"], [12.0, 8.0, 14.0])
+
+        restored = SequentialConjugateUpdater.from_state_dict(updater.state_dict())
+        restored.update(["A"], [11.0])
+        updater.update(["A"], [11.0])
+
+        pd.testing.assert_frame_equal(updater.posterior(), restored.posterior())
+
+    def test_invalid_inputs(self):
+        """Invalid family and mismatched inputs raise errors."""
+        from mcp_server.bayesian_time_series import SequentialConjugateUpdater
+
+        with pytest.raises(ValueError, match="family"):
+            SequentialConjugateUpdater("binomial")
+        with pytest.raises(ValueError, match="same length"):
+            SequentialConjugateUpdater().update(["A", "B"], [1.0])
+        with pytest.raises(ValueError, match="no observations"):
+            SequentialConjugateUpdater().posterior("missing")
+
+
+class TestHierarchicalSequentialUpdate:
+    """Tests for importance-reweighting updates of HierarchicalBayesianTS."""
+
+    @pytest.fixture
+    def fitted(self):
+        """Analyzer plus a synthetic posterior centred on the true values."""
+        import arviz as az
+        from mcp_server.bayesian_time_series import HierarchicalBayesianTS
+
+        rng = np.random.default_rng(5)
+        rows = []
+        truth = {"P1": 20.0, "P2": 12.0}
+        for player, level in truth.items():
+            for t in range(20):
+                rows.append(
+                    {
+                        "player": player,
+                        "team": "T1",
+                        "time": t,
+                        "points": level + rng.normal(0, 2),
+                    }
+                )
+        analyzer = HierarchicalBayesianTS(
+            data=pd.DataFrame(rows),
+            player_col="player",
+            team_col="team",
+            time_col="time",
+            target_col="points",
+        )
+
+        n = 1000
+        alpha = np.column_stack(
+            [rng.normal(truth[p], 1.0, size=n) for p in analyzer.players]
+        )
+        posterior = {
+            "alpha_player": alpha[None],
+            "beta_player": rng.normal(0, 0.01, size=(1, n, 2)),
+            "sigma_player": np.abs(rng.normal(2, 0.1, size=(1, n, 2))),
+            "mu_alpha_team": rng.normal(16, 1, size=(1, n, 1)),
+            "mu_beta_team": rng.normal(0, 0.01, size=(1, n, 1)),
+            "mu_alpha_league": rng.normal(16, 1, size=(1, n)),
+            "mu_beta_league": rng.normal(0, 0.01, size=(1, n)),
+            "tau_alpha_league": np.abs(rng.normal(3, 0.1, size=(1, n))),
+            "tau_alpha_team": np.abs(rng.normal(3, 0.1, size=(1, n))),
+        }
+        result = HierarchicalTSResult(
+            trace=az.from_dict(posterior=posterior),
+            model=None,
+            summary=pd.DataFrame(),
+            diagnostics={"overall_ok": True},
+        )
+        return analyzer, result, truth
+
+    def test_update_reweights_without_refit(self, fitted):
+        """A single night of consistent games is absorbed by reweighting."""
+        analyzer, result, truth = fitted
+        new_games = pd.DataFrame(
+            {
+                "player": ["P1", "P2"],
+                "team": ["T1", "T1"],
+                "time": [20, 20],
+                "points": [21.0, 11.5],
+            }
+        )
+
+        updated = analyzer.update(result, new_games, random_seed=0)
+
+        assert updated.diagnostics["update_method"] == "importance_resampling"
+        assert updated.diagnostics["ess_fraction"] >= 0.5
+        assert updated.diagnostics["n_new_obs"] == 2
+        assert len(analyzer.data) == 42
+        assert updated.trace.posterior["alpha_player"].shape == (1, 1000, 2)
+
+        effects = updated.player_effects.set_index("player")["intercept"]
+        assert abs(effects["P1"] - truth["P1"]) < 1.5
+        assert abs(effects["P2"] - truth["P2"]) < 1.5
+
+    def test_update_missing_columns(self, fitted):
+        """Update data must carry the model columns."""
+        analyzer, result, _ = fitted
+
+        with pytest.raises(ValueError, match="Missing required columns"):
+            analyzer.update(result, pd.DataFrame({"player": ["P1"]}))
+
+    def test_refit_keeps_model_structure(self, fitted, monkeypatch):
+        """A refit reuses the AR order and trend setting of the original fit."""
+        analyzer, result, _ = fitted
+        result.diagnostics.update({"ar_order": 1, "include_trend": False})
+        calls = []
+        monkeypatch.setattr(
+            type(analyzer),
+            "fit",
+            lambda self, **kwargs: calls.append(kwargs) or result,
+        )
+        rookie = pd.DataFrame(
+            {"player": ["P3"], "team": ["T1"], "time": [20], "points": [8.0]}
+        )
+
+        analyzer.update(result, rookie, draws=50)
+        analyzer.update(result, rookie.assign(player="P4"), ar_order=0)
+
+        assert calls[0] == {"draws": 50, "ar_order": 1, "include_trend": False}
+        assert calls[1] == {"ar_order": 0, "include_trend": False}
+
+    def test_repeated_updates_refit_before_degenerating(self, fitted, monkeypatch):
+        """Nightly updates refit once resampling has left few distinct draws."""
+        analyzer, result, truth = fitted
+        refits = []
+
+        def fake_fit(self, **kwargs):
+            refits.append(len(self.data))
+            return result  # stands in for a fresh, non-degenerate posterior
+
+        monkeypatch.setattr(type(analyzer), "fit", fake_fit)
+        rng = np.random.default_rng(11)
+        current = result
+        for night in range(20, 80):
+            games = pd.DataFrame(
+                {
+                    "player": ["P1", "P2"],
+                    "team": ["T1", "T1"],
+                    "time": [night, night],
+                    "points": [truth["P1"], truth["P2"]] + rng.normal(0, 2, size=2),
+                }
+            )
+            current = analyzer.update(current, games, random_seed=night)
+            if current.diagnostics.get("update_method") == "importance_resampling":
+                assert current.diagnostics["unique_fraction"] >= 0.25
+                alpha = current.trace.posterior["alpha_player"].values[0]
+                assert len(np.unique(alpha, axis=0)) >= 250
+
+        assert refits
+        assert len(analyzer.data) == 40 + 2 * 60
+
+    @pytest.mark.slow
+    def test_update_refits_when_ess_collapses(self, fitted):
+        """Surprising data collapses ESS and triggers a full refit."""
+        analyzer, result, _ = fitted
+        shock = pd.DataFrame(
+            {
+                "player": ["P1"] * 5,
+                "team": ["T1"] * 5,
+                "time": list(range(20, 25)),
+                "points": [45.0] * 5,
+            }
+        )
+
+        updated = analyzer.update(result, shock, draws=50, tune=50, chains=1, cores=1)
+
+        assert updated.diagnostics["update_method"] == "full_fit"
+        assert updated.diagnostics["ess_before_refit"] < 500
+        assert len(analyzer.data) == 45
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
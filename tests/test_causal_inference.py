@@ -28,6 +28,7 @@ from mcp_server.causal_inference import (
     SensitivityResult,
     ate_inference,
     TreatmentType,
+    _simplex_qp,
 )
 
 
@@ -730,6 +731,76 @@ def test_synthetic_control_result_repr():
     assert "2.3" in repr_str
 
 
+def test_simplex_qp_matches_brute_force():
+    """Test simplex QP solver against a dense grid over 3 donors."""
+    rng = np.random.default_rng(0)
+    donors = rng.normal(80, 10, (12, 3))
+    treated = donors @ np.array([0.6, 0.4, 0.0]) + rng.normal(0, 1, 12)
+
+    weights = _simplex_qp(donors.T @ donors, donors.T @ treated)
+
+    assert weights.min() >= 0
+    assert abs(weights.sum() - 1) < 1e-10
+    grid = np.linspace(0, 1, 201)
+    best = min(
+        np.sum((treated - donors @ np.array([a, b, 1 - a - b])) ** 2)
+        for a in grid
+        for b in grid
+        if a + b <= 1
+    )
+    assert np.sum((treated - donors @ weights) ** 2) <= best + 1e-8
+
+
+def test_synthetic_control_parallel_placebos_match_serial(synthetic_control_data):
+    """Test process-parallel placebo fits reproduce the serial distribution."""
+    analyzer = CausalInferenceAnalyzer(
+        data=synthetic_control_data,
+        treatment_col="treatment",
+        outcome_col="outcome",
+        entity_col="entity",
+        time_col="time",
+    )
+    kwargs = dict(
+        treated_unit="treated",
+        outcome_periods=list(range(20)),
+        treatment_period=10,
+        n_placebo=10,
+        use_cache=False,
+    )
+
+    np.random.seed(0)
+    serial = analyzer.synthetic_control(n_jobs=1, **kwargs)
+    np.random.seed(0)
+    parallel = analyzer.synthetic_control(n_jobs=2, **kwargs)
+
+    np.testing.assert_allclose(
+        parallel.placebo_distribution, serial.placebo_distribution
+    )
+    assert parallel.p_value == serial.p_value
+
+
+def test_synthetic_control_cache(synthetic_control_data):
+    """Test repeated calls are served from cache until the panel changes."""
+    analyzer = CausalInferenceAnalyzer(
+        data=synthetic_control_data,
+        treatment_col="treatment",
+        outcome_col="outcome",
+        entity_col="entity",
+        time_col="time",
+    )
+    kwargs = dict(
+        treated_unit="treated", outcome_periods=list(range(20)), treatment_period=10
+    )
+
+    first = analyzer.synthetic_control(**kwargs)
+    assert analyzer.synthetic_control(**kwargs) is first
+    shifted = analyzer.synthetic_control(**{**kwargs, "treatment_period": 12})
+    assert shifted is not first
+
+    analyzer.data.loc[0, "outcome"] += 100.0
+    assert analyzer.synthetic_control(**kwargs) is not first
+
+
 # --- Sensitivity Analysis Tests ---
 
 
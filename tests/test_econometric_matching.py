@@ -0,0 +1,158 @@
+"""
+Tests for Econometric Completion Matching Module.
+
+Tests cover:
+- KD-tree neighbor index (k-NN, radius, greedy matching)
+- Propensity score nearest neighbor matching
+- Mahalanobis distance matching
+- Balance diagnostics
+"""
+
+import pytest
+import numpy as np
+
+from mcp_server.econometric_completion.matching import (
+    MatchingConfig,
+    NeighborIndex,
+    PropensityScoreMatcher,
+    MahalanobisDistanceMatcher,
+)
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+
+@pytest.fixture
+def matching_data():
+    """Generate observational data with selection on covariates."""
+    rng = np.random.default_rng(42)
+    n = 400
+    X = rng.normal(size=(n, 3))
+    p = 1 / (1 + np.exp(-(X[:, 0] - 0.5 * X[:, 1])))
+    treatment = (rng.random(n) < p).astype(int)
+    outcome = X @ np.array([1.0, 2.0, 0.5]) + 3.0 * treatment + rng.normal(size=n)
+    return X, treatment, outcome
+
+
+def _brute_force_greedy(ps_control, ps_treated, k, caliper):
+    """Reference sequential matching without replacement."""
+    used = set()
+    matches = []
+    for ps_t in ps_treated:
+        distances = np.abs(ps_control - ps_t)
+        chosen = []
+        for idx in np.argsort(distances, kind="stable"):
+            if len(chosen) == k or distances[idx] > caliper:
+                break
+            if idx not in used:
+                chosen.append(idx)
+                used.add(idx)
+        matches.append(chosen)
+    return matches
+
+
+# ==============================================================================
+# NeighborIndex Tests
+# ==============================================================================
+
+
+def test_neighbor_index_knn_caliper_is_inclusive():
+    """Test k-NN honours an inclusive caliper and pads missing neighbors."""
+    index = NeighborIndex(np.array([0.0, 0.25, 0.5]))
+
+    distances, indices = index.knn(np.array([0.5]), k=3, max_distance=0.25)
+
+    assert indices[0].tolist() == [2, 1, -1]
+    assert distances[0, 2] == np.inf
+
+
+def test_neighbor_index_radius_means():
+    """Test batched radius means against a direct scan."""
+    rng = np.random.default_rng(0)
+    controls = rng.random(500)
+    values = rng.normal(size=500)
+    queries = rng.random(50)
+
+    means, counts = NeighborIndex(controls).radius_means(queries, 0.01, values)
+
+    for q, mean, count in zip(queries, means, counts):
+        within = np.abs(controls - q) <= 0.01
+        assert count == within.sum()
+        if count:
+            assert mean == pytest.approx(values[within].mean())
+        else:
+            assert np.isnan(mean)
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test_neighbor_index_greedy_matches_sequential_loop(k):
+    """Test greedy matching without replacement reproduces the loop."""
+    rng = np.random.default_rng(1)
+    ps_control = rng.random(300)
+    ps_treated = rng.random(120)
+
+    matches = NeighborIndex(ps_control).greedy_match(ps_treated, k, 0.05)
+    expected = _brute_force_greedy(ps_control, ps_treated, k, 0.05)
+
+    assert [sorted(m.tolist()) for m in matches] == [sorted(e) for e in expected]
+
+
+def test_whitening_preserves_mahalanobis_distance(matching_data):
+    """Test whitened Euclidean distance equals Mahalanobis distance."""
+    X, _, _ = matching_data
+    cov_inv = np.linalg.inv(np.cov(X.T))
+    X_white = NeighborIndex.whiten(X, cov_inv)
+
+    diff = X[0] - X[1]
+    expected = np.sqrt(diff @ cov_inv @ diff)
+    assert np.linalg.norm(X_white[0] - X_white[1]) == pytest.approx(expected)
+
+
+# ==============================================================================
+# Matcher Tests
+# ==============================================================================
+
+
+@pytest.mark.parametrize("replace", [False, True])
+def test_psm_nearest_neighbor(matching_data, replace):
+    """Test PSM matches within the caliper and recovers the effect."""
+    X, treatment, outcome = matching_data
+    config = MatchingConfig(ps_caliper=0.05, replace=replace)
+
+    result = PropensityScoreMatcher(config).match(X, treatment, outcome)
+
+    assert result.n_matched > 0
+    assert abs(result.att - 3.0) < 1.0
+    controls = [c for cs in result.matched_indices.values() for c in cs]
+    if not replace:
+        assert len(controls) == len(set(controls))
+    assert result.balance_after is not None
+
+
+def test_mahalanobis_matching_nearest_control(matching_data):
+    """Test Mahalanobis matcher picks the closest control per treated unit."""
+    X, treatment, outcome = matching_data
+
+    result = MahalanobisDistanceMatcher(n_neighbors=1).match(X, treatment, outcome)
+
+    control_idx = np.where(treatment == 0)[0]
+    cov_inv = np.linalg.inv(np.cov(X.T))
+    t_idx, (c_idx,) = next(iter(result.matched_indices.items()))
+    diffs = X[control_idx] - X[t_idx]
+    distances = np.einsum("ij,jk,ik->i", diffs, cov_inv, diffs)
+    assert c_idx == control_idx[np.argmin(distances)]
+    assert result.n_matched == np.sum(treatment == 1)
+
+
+def test_balance_weighted_matches_unweighted_with_unit_weights(matching_data):
+    """Test vectorized balance handles weights consistently."""
+    X, treatment, _ = matching_data
+    matcher = PropensityScoreMatcher()
+
+    unweighted = matcher.calculate_balance(X, treatment)
+    weighted = matcher.calculate_balance(X, treatment, np.ones(len(X)))
+
+    assert unweighted.keys() == {"feature_0", "feature_1", "feature_2"}
+    for key in unweighted:
+        assert weighted[key] == pytest.approx(unweighted[key])
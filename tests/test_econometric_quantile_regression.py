@@ -0,0 +1,190 @@
+"""
+Tests for Econometric Completion Quantile Regression Module.
+
+Tests cover:
+- Frisch-Newton interior-point solver against an exact LP
+- Preprocessed (globbed) solves and warm starts along the quantile grid
+- Kernel and bootstrap standard errors
+- Quantile process and treatment effects
+"""
+
+import pytest
+import numpy as np
+from scipy.optimize import linprog
+
+from mcp_server.econometric_completion.quantile_regression import (
+    QuantileRegression,
+    QuantileProcess,
+    QuantileTreatmentEffect,
+    STATSMODELS_AVAILABLE,
+    _QuantileSolver,
+    _frisch_newton,
+)
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+
+def _heteroskedastic_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([np.ones(n), rng.normal(size=(n, 2))])
+    noise = rng.standard_t(3, size=n) * (1 + 0.5 * np.abs(X[:, 1]))
+    return X, X @ np.array([1.0, 2.0, -1.0]) + noise
+
+
+def _check_loss(beta, X, y, quantile):
+    residuals = y - X @ beta
+    return np.sum(residuals * (quantile - (residuals < 0)))
+
+
+@pytest.fixture
+def qr_data():
+    """Moderate-size regression data with heteroskedastic errors."""
+    return _heteroskedastic_data(400)
+
+
+# ==============================================================================
+# Solver Tests
+# ==============================================================================
+
+
+@pytest.mark.parametrize("quantile", [0.1, 0.5, 0.9])
+def test_frisch_newton_matches_exact_lp(qr_data, quantile):
+    """Test interior-point solution equals the simplex LP optimum."""
+    X, y = qr_data
+    n, p = X.shape
+
+    beta = _frisch_newton(X, y, quantile)
+
+    lp = linprog(
+        np.concatenate([np.zeros(p), np.full(n, quantile), np.full(n, 1 - quantile)]),
+        A_eq=np.hstack([X, np.eye(n), -np.eye(n)]),
+        b_eq=y,
+        bounds=[(None, None)] * p + [(0, None)] * (2 * n),
+        method="highs",
+    )
+    assert _check_loss(beta, X, y, quantile) == pytest.approx(lp.fun, rel=1e-8)
+
+
+def test_preprocessed_solver_matches_direct_solve():
+    """Test globbed solves on a large sample match the full interior point."""
+    X, y = _heteroskedastic_data(20_000, seed=1)
+    solver = _QuantileSolver(X, y, random_state=0)
+    assert solver.uses_preprocessing
+
+    for quantile in (0.25, 0.75):
+        direct = _frisch_newton(X, y, quantile)
+        globbed = solver.solve(quantile)
+        assert _check_loss(globbed, X, y, quantile) == pytest.approx(
+            _check_loss(direct, X, y, quantile), rel=1e-8
+        )
+
+
+def test_solve_path_warm_starts_match_independent_fits():
+    """Test warm-started quantile path equals independent solves."""
+    X, y = _heteroskedastic_data(20_000, seed=2)
+    quantiles = [0.9, 0.1, 0.5]
+
+    path = _QuantileSolver(X, y, random_state=0).solve_path(quantiles)
+
+    for q in quantiles:
+        independent = _QuantileSolver(X, y, random_state=0).solve(q)
+        np.testing.assert_allclose(path[q], independent, atol=1e-6)
+
+
+@pytest.mark.parametrize("n", [400, 20_000])
+def test_collinear_design_matches_full_rank_fit(n):
+    """Test team dummies plus an intercept fit like the reduced design."""
+    rng = np.random.default_rng(3)
+    team = rng.integers(0, 3, size=n)
+    X = np.column_stack([np.ones(n), np.eye(3)[team], rng.normal(size=n)])
+    y = X @ np.array([1.0, 2.0, -1.0, 0.5, 3.0]) + rng.standard_t(3, size=n)
+    full_rank = X[:, [0, 2, 3, 4]]
+
+    model = QuantileRegression(quantile=0.75).fit(X, y)
+    reference = _QuantileSolver(full_rank, y, random_state=0).solve(0.75)
+
+    assert model.get_result().coefficients.shape == (5,)
+    assert _check_loss(model.coefficients_, X, y, 0.75) == pytest.approx(
+        _check_loss(reference, full_rank, y, 0.75), rel=1e-8
+    )
+
+
+# ==============================================================================
+# Estimator Tests
+# ==============================================================================
+
+
+def test_quantile_regression_result_has_inference(qr_data):
+    """Test default solver reports kernel standard errors and p-values."""
+    X, y = qr_data
+
+    result = QuantileRegression(quantile=0.5).fit(X, y).get_result(X, y)
+
+    assert result.std_errors is not None
+    assert np.all(result.std_errors > 0)
+    assert result.p_values[1] < 0.01
+    assert 0 < result.pseudo_r2 < 1
+
+
+@pytest.mark.skipif(not STATSMODELS_AVAILABLE, reason="statsmodels not installed")
+def test_kernel_std_errors_match_statsmodels(qr_data):
+    """Test kernel sandwich SEs agree with statsmodels' QuantReg defaults."""
+    X, y = qr_data
+
+    ipm = QuantileRegression(0.5).fit(X, y).get_result(X, y)
+    sm = QuantileRegression(0.5, solver="statsmodels").fit(X, y).get_result(X, y)
+
+    np.testing.assert_allclose(ipm.coefficients, sm.coefficients, atol=0.05)
+    np.testing.assert_allclose(ipm.std_errors, sm.std_errors, rtol=0.05)
+
+
+def test_bootstrap_is_reproducible_across_workers(qr_data):
+    """Test parallel bootstrap draws do not depend on the worker count."""
+    X, y = qr_data
+    model = QuantileRegression(quantile=0.5).fit(X, y)
+
+    serial = model.bootstrap(X, y, n_bootstrap=12, n_jobs=1, random_state=3)
+    parallel = model.bootstrap(X, y, n_bootstrap=12, n_jobs=2, random_state=3)
+
+    np.testing.assert_allclose(serial, parallel)
+    np.testing.assert_allclose(model.get_result(X, y).std_errors, parallel)
+
+
+def test_quantile_process_with_bootstrap(qr_data):
+    """Test process fit keeps caller order and attaches bootstrap SEs."""
+    X, y = qr_data
+    quantiles = [0.75, 0.25, 0.5]
+
+    process = QuantileProcess(quantiles=quantiles).fit(
+        X, y, feature_names=["const", "x1", "x2"], n_bootstrap=10, n_jobs=1
+    )
+    results = process.get_results(X, y)
+
+    assert [r.quantile for r in results.results] == quantiles
+    assert all(r.std_errors.shape == (3,) for r in results.results)
+    _, path = results.get_coefficient_path("x1")
+    assert len(path) == 3
+
+
+def test_quantile_treatment_effect_heterogeneity():
+    """Test QTE recovers effects that grow with the quantile."""
+    rng = np.random.default_rng(4)
+    n = 2000
+    X = np.column_stack([np.ones(n), rng.normal(size=n)])
+    treatment = rng.integers(0, 2, size=n).astype(float)
+    outcome = X[:, 1] + rng.normal(size=n) * (1 + treatment)
+
+    qte = QuantileTreatmentEffect(quantiles=[0.1, 0.5, 0.9]).estimate(
+        X, treatment, outcome
+    )
+
+    assert qte[0.1] < 0 < qte[0.9]
+    assert abs(qte[0.5]) < 0.3
+
+
+def test_unknown_solver_raises():
+    """Test invalid solver name raises."""
+    with pytest.raises(ValueError):
+        QuantileRegression(quantile=0.5, solver="simplex")
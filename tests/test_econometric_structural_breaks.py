@@ -0,0 +1,152 @@
+"""
+Tests for Econometric Completion Structural Breaks Module.
+
+Tests cover:
+- Segment SSR table from cumulative cross-products
+- Dynamic-programming Bai-Perron partitions and break selection
+- Batch scanning of many series
+- CUSUM recursive residuals
+"""
+
+import itertools
+
+import pytest
+import numpy as np
+
+from mcp_server.econometric_completion.structural_breaks import (
+    BaiPerronTest,
+    CUSUMTest,
+    SupFTest,
+    detect_structural_breaks,
+)
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+
+@pytest.fixture
+def two_break_series():
+    """Per-game scoring series with two level shifts (at 120 and 270)."""
+    rng = np.random.default_rng(7)
+    y = np.concatenate(
+        [rng.normal(20, 3, 120), rng.normal(26, 3, 150), rng.normal(18, 3, 140)]
+    )
+    return np.ones((len(y), 1)), y
+
+
+def _segment_ssr(X, y, start, end):
+    beta = np.linalg.lstsq(X[start:end], y[start:end], rcond=None)[0]
+    return np.sum((y[start:end] - X[start:end] @ beta) ** 2)
+
+
+# ==============================================================================
+# Bai-Perron Tests
+# ==============================================================================
+
+
+def test_bai_perron_recovers_breaks(two_break_series):
+    """Test DP search finds both level shifts."""
+    X, y = two_break_series
+
+    result = BaiPerronTest(max_breaks=5).test(X, y)
+
+    assert result.has_breaks
+    indices = [bp.index for bp in result.break_points]
+    assert len(indices) == 2
+    assert abs(indices[0] - 120) <= 3
+    assert abs(indices[1] - 270) <= 3
+    assert all(bp.p_value < 0.01 for bp in result.break_points)
+
+
+@pytest.mark.parametrize("selection", ["sequential", "bic"])
+def test_bai_perron_stable_series_has_no_breaks(selection):
+    """Test no breaks are reported for a stationary series."""
+    rng = np.random.default_rng(3)
+    y = rng.normal(20, 3, 300)
+
+    result = BaiPerronTest(selection=selection).test(np.ones((300, 1)), y)
+
+    assert not result.has_breaks
+    assert result.break_points == []
+
+
+def test_bai_perron_partitions_are_globally_optimal():
+    """Test DP partitions against exhaustive search on a short series."""
+    rng = np.random.default_rng(11)
+    n = 40
+    X = np.column_stack([np.ones(n), rng.normal(size=n)])
+    y = X @ np.array([1.0, 0.5]) + np.where(np.arange(n) > 22, 2.0, 0.0)
+    y += rng.normal(size=n)
+    test = BaiPerronTest(max_breaks=2, trim=0.15)
+    min_size = max(int(n * 0.15), X.shape[1] + 1)
+
+    _, partitions = test.optimal_partitions(X, y)
+
+    for m in (1, 2):
+        best = min(
+            sum(_segment_ssr(X, y, a, b) for a, b in zip((0,) + combo, combo + (n,)))
+            for combo in itertools.combinations(range(1, n), m)
+            if all(b - a >= min_size for a, b in zip((0,) + combo, combo + (n,)))
+        )
+        assert partitions[m][0] == pytest.approx(best)
+
+
+def test_bai_perron_test_many(two_break_series):
+    """Test batch mode scans every series with a shared intercept design."""
+    _, y = two_break_series
+    rng = np.random.default_rng(5)
+    series = {"shifting": y, "steady": rng.normal(20, 3, 250)}
+
+    results = BaiPerronTest().test_many(series)
+
+    assert set(results) == {"shifting", "steady"}
+    assert len(results["shifting"].break_points) == 2
+    assert not results["steady"].has_breaks
+
+
+def test_detect_structural_breaks_passes_selection(two_break_series):
+    """Test convenience function forwards Bai-Perron options."""
+    X, y = two_break_series
+
+    result = detect_structural_breaks(X, y, method="bai_perron", selection="bic")
+
+    assert len(result.break_points) == 2
+
+
+def test_bai_perron_rejects_unknown_selection():
+    """Test invalid selection rule raises."""
+    with pytest.raises(ValueError):
+        BaiPerronTest(selection="aic")
+
+
+# ==============================================================================
+# CUSUM / Sup-F Tests
+# ==============================================================================
+
+
+def test_cusum_matches_refit_loop():
+    """Test recursive residuals equal one-step errors from expanding refits."""
+    rng = np.random.default_rng(2)
+    n = 80
+    X = np.column_stack([np.ones(n), rng.normal(size=n)])
+    y = X @ np.array([2.0, -1.0]) + rng.normal(size=n)
+
+    result = CUSUMTest().test(X, y)
+
+    residuals = []
+    for t in range(3, n):
+        beta = np.linalg.lstsq(X[:t], y[:t], rcond=None)[0]
+        residuals.append(y[t] - X[t] @ beta)
+    residuals = np.array(residuals)
+    np.testing.assert_allclose(result.cusum, np.cumsum(residuals / residuals.std()))
+
+
+def test_sup_f_detects_single_break(two_break_series):
+    """Test sup-F locates the dominant break."""
+    X, y = two_break_series
+
+    result = SupFTest().test(X[:270], y[:270])
+
+    assert result.has_breaks
+    assert abs(result.break_points[0].index - 120) <= 3
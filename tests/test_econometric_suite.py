@@ -1173,6 +1173,87 @@ def test_compare_time_series_methods(time_series_data):
     assert "rank" in comparison.columns
 
 
+def test_compare_methods_parallel_matches_serial(panel_data):
+    """Parallel comparison returns the same metrics as serial comparison."""
+    suite = EconometricSuite(
+        data=panel_data,
+        target="points",
+        entity_col="player_id",
+        time_col="season",
+    )
+
+    methods = [
+        {"category": "panel", "method": "fixed_effects", "params": {}},
+        {"category": "panel", "method": "random_effects", "params": {}},
+    ]
+
+    streamed = []
+    serial = suite.compare_methods(methods, metric="r_squared")
+    parallel = suite.compare_methods(
+        methods, metric="r_squared", parallel=True, on_result=streamed.append
+    )
+
+    assert len(streamed) == 2
+    assert (parallel["status"] == "ok").all()
+    np.testing.assert_allclose(
+        parallel.set_index("method")["r_squared"].sort_index(),
+        serial.set_index("method")["r_squared"].sort_index(),
+    )
+    # Analyzer built once and reused across specs
+    assert len(suite._analyzers) == 1
+
+
+class _SlowSuite(EconometricSuite):
+    def _run_method_spec(self, spec):
+        if spec["method"] == "slow":
+            import time
+
+            time.sleep(30)
+        return super()._run_method_spec(spec)
+
+
+def test_compare_methods_parallel_timeout(panel_data):
+    """A slow method is terminated without blocking the others."""
+    suite = _SlowSuite(
+        data=panel_data,
+        target="points",
+        entity_col="player_id",
+        time_col="season",
+    )
+
+    methods = [
+        {"category": "panel", "method": "slow", "params": {}, "timeout": 1},
+        {"category": "panel", "method": "fixed_effects", "params": {}},
+        {"category": "unknown", "method": "x", "params": {}},
+    ]
+
+    comparison = suite.compare_methods(methods, parallel=True, max_workers=3)
+    keys = comparison["category"] + "/" + comparison["method"]
+    statuses = dict(zip(keys, comparison["status"]))
+
+    assert statuses["panel/slow"] == "timeout"
+    assert statuses["panel/Fixed Effects"] == "ok"
+    assert statuses["unknown/x"] == "error"
+    assert comparison["fit_time_s"].max() < 10
+
+
+def test_model_averaging_from_comparison_metrics():
+    """Comparison DataFrame converts to model_metrics for AIC weighting."""
+    comparison = pd.DataFrame(
+        {
+            "method": ["a", "b", "c"],
+            "aic": [100.0, 110.0, None],
+            "status": ["ok", "ok", "timeout"],
+        }
+    )
+    metrics = ModelAverager.metrics_from_comparison(comparison)
+    assert set(metrics) == {"a", "b"}
+
+    predictions = {"a": np.array([1.0, 2.0]), "b": np.array([3.0, 4.0])}
+    averaged = ModelAverager.average(predictions, weights="aic", model_metrics=metrics)
+    assert averaged[0] < 2.0
+
+
 # ==============================================================================
 # Auto-Analysis Tests (3 tests)
 # ==============================================================================
@@ -0,0 +1,160 @@
+"""
+Tests for event_streaming.py module
+
+Tests asynchronous EventBus delivery, backpressure policies, subscription
+indexing and the ring-buffer history.
+"""
+
+import threading
+import time
+
+import pytest
+
+from mcp_server.event_streaming import (
+    BackpressurePolicy,
+    Event,
+    EventBus,
+    EventFilter,
+    EventPriority,
+    SubscriptionQueue,
+)
+
+
+@pytest.fixture
+def event_bus():
+    """Event bus whose workers are stopped after the test"""
+    bus = EventBus(max_history=5)
+    yield bus
+    bus.close()
+
+
+def _event(event_type="test.event", topic="test", **payload):
+    return Event(event_type=event_type, topic=topic, payload=payload)
+
+
+def test_slow_subscriber_does_not_block_publish(event_bus):
+    """Test publish returns before a slow callback finishes"""
+    release = threading.Event()
+    received = []
+    event_bus.subscribe("slow", lambda e: release.wait(5))
+    event_bus.subscribe("fast", received.append)
+
+    start = time.perf_counter()
+    for i in range(20):
+        event_bus.publish(_event(index=i))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    release.set()
+    assert event_bus.drain(timeout=5)
+    assert [e.payload["index"] for e in received] == list(range(20))
+    assert event_bus.get_stats()["total_delivered"] == 40
+
+
+def test_filters_route_through_index(event_bus):
+    """Test type/topic indexed subscriptions still apply the full filter"""
+    received = {"games": [], "alerts": [], "all": []}
+    event_bus.subscribe(
+        "games", received["games"].append, EventFilter(topics={"nba.games"})
+    )
+    event_bus.subscribe(
+        "alerts",
+        received["alerts"].append,
+        EventFilter(event_types={"alert"}, min_priority=EventPriority.HIGH),
+    )
+    event_bus.subscribe("all", received["all"].append)
+
+    event_bus.publish(_event("score", "nba.games"))
+    event_bus.publish(_event("alert", "system"))
+    event_bus.publish(
+        Event(event_type="alert", topic="system", priority=EventPriority.CRITICAL)
+    )
+    event_bus.drain(timeout=5)
+
+    assert [e.event_type for e in received["games"]] == ["score"]
+    assert [e.priority for e in received["alerts"]] == [EventPriority.CRITICAL]
+    assert len(received["all"]) == 3
+
+
+def test_drop_policy_counts_overflow():
+    """Test DROP discards new events once the queue is full"""
+    queue = SubscriptionQueue(maxsize=2, policy=BackpressurePolicy.DROP)
+
+    accepted = [queue.put(_event(index=i)) for i in range(4)]
+
+    assert accepted == [True, True, False, False]
+    assert queue.dropped == 2
+    assert queue.get().payload["index"] == 0
+
+
+def test_coalesce_policy_keeps_latest_per_key():
+    """Test COALESCE replaces pending events in place and evicts oldest"""
+    queue = SubscriptionQueue(
+        maxsize=2,
+        policy=BackpressurePolicy.COALESCE,
+        coalesce_key=lambda e: e.payload["player"],
+    )
+
+    queue.put(_event(player=1, ppg=10))
+    queue.put(_event(player=2, ppg=20))
+    queue.put(_event(player=1, ppg=11))
+    queue.put(_event(player=3, ppg=30))
+
+    assert queue.coalesced == 1
+    assert queue.dropped == 1
+    assert [queue.get().payload for _ in range(2)] == [
+        {"player": 2, "ppg": 20},
+        {"player": 3, "ppg": 30},
+    ]
+
+
+def test_block_policy_delivers_everything(event_bus):
+    """Test BLOCK makes publishers wait instead of dropping"""
+    received = []
+    event_bus.subscribe(
+        "blocking",
+        lambda e: (time.sleep(0.001), received.append(e)),
+        policy=BackpressurePolicy.BLOCK,
+        max_queue_size=2,
+    )
+
+    for i in range(50):
+        assert event_bus.publish(_event(index=i)) == 1
+    event_bus.drain(timeout=5)
+
+    assert len(received) == 50
+    assert event_bus.get_stats()["subscriptions"][0]["dropped"] == 0
+
+
+def test_block_policy_times_out():
+    """Test BLOCK gives up after block_timeout"""
+    queue = SubscriptionQueue(
+        maxsize=1, policy=BackpressurePolicy.BLOCK, block_timeout=0.05
+    )
+    queue.put(_event())
+
+    assert queue.put(_event()) is False
+    assert queue.dropped == 1
+
+
+def test_history_is_ring_buffer(event_bus):
+    """Test history keeps only the most recent max_history events"""
+    for i in range(8):
+        event_bus.publish(_event(index=i))
+
+    history = event_bus.get_history(limit=3)
+
+    assert [e.payload["index"] for e in history] == [5, 6, 7]
+    assert event_bus.get_stats()["history_size"] == 5
+
+
+def test_unsubscribe_stops_worker(event_bus):
+    """Test unsubscribing ends the dispatch worker"""
+    subscription_id = event_bus.subscribe("temp", lambda e: None)
+    worker = event_bus.subscriptions[subscription_id].worker
+
+    assert event_bus.unsubscribe(subscription_id)
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert event_bus.publish(_event()) == 0
@@ -8,11 +8,18 @@ Tests for feature store with CI/CD hooks, versioning, and lineage tracking.
 import pytest
 import tempfile
 import shutil
+from datetime import datetime, timedelta
 from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import mcp_server.feature_store as feature_store_module
 from mcp_server.feature_store import (
     FeatureStore,
     FeatureDefinition,
     FeatureSet,
+    PARQUET_AVAILABLE,
 )
 
 
@@ -383,6 +390,171 @@ def test_get_feature_lineage(feature_store):
     assert "f3" in feature_store.get_feature_lineage("f2")["dependent_features"]
 
 
+# Columnar Storage Tests (8 tests)
+
+
+@pytest.fixture
+def scoring_store(feature_store):
+    """Feature store with ppg/rpg registered"""
+    for feat_id in ("ppg", "rpg"):
+        feature_store.register_feature(
+            feature_id=feat_id, name=feat_id, description=feat_id, data_type="float"
+        )
+    return feature_store
+
+
+def test_write_out_of_order_keeps_latest(scoring_store):
+    """Test late-arriving history does not overwrite newer values"""
+    scoring_store.write_features("p1", {"ppg": 30.0}, event_time=datetime(2024, 3, 1))
+    scoring_store.write_features("p1", {"ppg": 10.0}, event_time=datetime(2024, 1, 1))
+
+    assert scoring_store.read_features(["p1"])["p1"] == {"ppg": 30.0}
+
+
+def test_batch_write_and_frame_read(scoring_store):
+    """Test vectorized batch writes and reads match per-row semantics"""
+    frame = pd.DataFrame(
+        {
+            "player": ["a", "b", "a", "c"],
+            "ts": pd.to_datetime(
+                ["2024-01-01", "2024-01-01", "2024-01-05", "2024-01-02"]
+            ),
+            "ppg": [10.0, 20.0, 12.0, 30.0],
+            "rpg": [5.0, np.nan, np.nan, 7.0],
+        }
+    )
+
+    written = scoring_store.write_features_batch(
+        frame, entity_column="player", timestamp_column="ts"
+    )
+    result = scoring_store.read_features_frame(["a", "b", "missing"])
+
+    assert written == 4
+    assert result.loc["a", "ppg"] == 12.0
+    assert result.loc["a", "rpg"] == 5.0
+    assert np.isnan(result.loc["b", "rpg"])
+    assert result.loc["missing"].isna().all()
+    assert scoring_store.read_features(["b"])["b"] == {"ppg": 20.0}
+
+
+def test_historical_features_point_in_time(scoring_store):
+    """Test training-set join never uses values from the future"""
+    for day, ppg in [(1, 10.0), (5, 20.0), (9, 30.0)]:
+        scoring_store.write_features(
+            "p1", {"ppg": ppg}, event_time=datetime(2024, 1, day)
+        )
+    spine = pd.DataFrame(
+        {
+            "entity_id": ["p1", "p1", "p1", "p2"],
+            "event_time": [
+                datetime(2023, 12, 31),
+                datetime(2024, 1, 5),
+                datetime(2024, 1, 8),
+                datetime(2024, 1, 8),
+            ],
+        }
+    )
+
+    result = scoring_store.get_historical_features(spine, ["ppg"])
+    stale = scoring_store.get_historical_features(
+        spine, ["ppg"], max_age=timedelta(days=2)
+    )
+
+    np.testing.assert_array_equal(result["ppg"], [np.nan, 20.0, 20.0, np.nan])
+    np.testing.assert_array_equal(stale["ppg"], [np.nan, 20.0, np.nan, np.nan])
+
+
+def test_historical_features_unknown_feature(scoring_store):
+    """Test point-in-time join rejects unregistered features"""
+    spine = pd.DataFrame({"entity_id": ["p1"], "event_time": [datetime(2024, 1, 1)]})
+
+    with pytest.raises(ValueError):
+        scoring_store.get_historical_features(spine, ["unknown"])
+
+
+@pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+def test_flush_partitions_and_reload(temp_store_path):
+    """Test Parquet partitions by feature set/date and index rebuild"""
+    store = FeatureStore(store_path=temp_store_path)
+    store.register_feature(
+        feature_id="ppg", name="PPG", description="Points", data_type="float"
+    )
+    store.write_features(
+        "p1", {"ppg": 10.0}, event_time=datetime(2024, 1, 1), feature_set_id="box"
+    )
+    store.write_features(
+        "p1", {"ppg": 20.0}, event_time=datetime(2024, 1, 2), feature_set_id="box"
+    )
+
+    assert store.flush() == 2
+    values_dir = Path(temp_store_path) / "values" / "feature_set=box"
+    assert sorted(p.name for p in values_dir.iterdir()) == [
+        "date=2024-01-01",
+        "date=2024-01-02",
+    ]
+
+    reloaded = FeatureStore(store_path=temp_store_path)
+    spine = pd.DataFrame({"entity_id": ["p1"], "event_time": [datetime(2024, 1, 1)]})
+    assert reloaded.read_features(["p1"])["p1"] == {"ppg": 20.0}
+    assert reloaded.get_historical_features(spine, ["ppg"])["ppg"].iloc[0] == 10.0
+    assert reloaded.get_feature_stats()["total_entities"] == 1
+
+
+def test_int_entity_ids_round_trip(scoring_store):
+    """Test int ids written singly are found by reads and historical joins"""
+    scoring_store.write_features(23, {"ppg": 27.0}, event_time=datetime(2024, 1, 1))
+    spine = pd.DataFrame({"entity_id": [23], "event_time": [datetime(2024, 1, 2)]})
+
+    assert scoring_store.read_features([23])[23] == {"ppg": 27.0}
+    assert scoring_store.read_features(["23"])["23"] == {"ppg": 27.0}
+    assert scoring_store.get_historical_features(spine, ["ppg"])["ppg"].iloc[0] == 27.0
+
+
+@pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+def test_flush_mixed_type_values_and_ids(temp_store_path):
+    """Test mixed-type values and ids flush instead of wedging the store"""
+    store = FeatureStore(store_path=temp_store_path, flush_rows=2)
+    for feat_id in ("ppg", "role"):
+        store.register_feature(
+            feature_id=feat_id, name=feat_id, description=feat_id, data_type="any"
+        )
+
+    day = datetime(2024, 1, 1)
+    store.write_features(1, {"ppg": 10.0, "role": 3}, event_time=day)
+    store.write_features("p2", {"ppg": 12.0, "role": "starter"}, event_time=day)
+    store.write_features("p3", {"ppg": 14.0}, event_time=day)
+
+    assert store.flush() == 1
+    assert store.feature_log._buffered_rows == 0
+    reloaded = FeatureStore(store_path=temp_store_path)
+    assert reloaded.read_features(["1", "p2"]) == {
+        "1": {"ppg": 10.0, "role": "3"},
+        "p2": {"ppg": 12.0, "role": "starter"},
+    }
+
+
+@pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+def test_failed_flush_keeps_rows_buffered(temp_store_path, monkeypatch):
+    """Test a flush error keeps rows and does not break later writes"""
+    store = FeatureStore(store_path=temp_store_path, flush_rows=1)
+    store.register_feature(
+        feature_id="ppg", name="PPG", description="Points", data_type="float"
+    )
+
+    def broken(table, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(feature_store_module.pq, "write_table", broken)
+    store.write_features("p1", {"ppg": 10.0}, event_time=datetime(2024, 1, 1))
+    store.write_features("p1", {"ppg": 11.0}, event_time=datetime(2024, 1, 2))
+    assert store.feature_log._buffered_rows == 2
+    monkeypatch.undo()
+
+    assert store.flush() == 2
+    history = store.feature_log.history(["ppg"])
+    assert history["ppg"].tolist() == [10.0, 11.0]
+
+
 # Statistics Tests (2 tests)
 
 
@@ -23,6 +23,12 @@ from mcp_server.particle_filters import (
     compare_resampling_methods,
     create_player_filter,
     create_game_filter,
+    BatchedParticleFilter,
+    BatchedParticleFilterResult,
+    BatchedPlayerPerformanceFilter,
+    BatchedPlayerPerformanceResult,
+    batched_resampling,
+    compute_ess_log,
 )
 
 
@@ -631,6 +637,223 @@ class TestParticleFilterIntegration:
         assert turning_point >= 3  # After halftime
 
 
+# ==============================================================================
+# Batched Particle Filter Tests
+# ==============================================================================
+
+
+def _random_walk_transition(particles, rng, **kwargs):
+    return particles + rng.normal(0, 0.1, size=particles.shape)
+
+
+def _gaussian_log_likelihood(particles, observations, **kwargs):
+    obs = np.asarray(observations, dtype=float).reshape(particles.shape[0], 1)
+    return -0.5 * ((obs - particles[..., 0]) / 0.5) ** 2
+
+
+@pytest.fixture
+def league_game_logs():
+    """Generate long-format game logs for several players."""
+    np.random.seed(7)
+    rows = []
+    dates = pd.date_range("2024-10-22", periods=30, freq="D")
+    for player_id, rate in [("p1", 25), ("p2", 12), ("p3", 6)]:
+        for date in dates:
+            if np.random.uniform() < 0.8:  # Players miss some game days
+                rows.append(
+                    {
+                        "player_id": player_id,
+                        "date": date,
+                        "points": np.random.poisson(rate),
+                        "minutes": 30.0,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+class TestBatchedParticleFilter:
+    """Test log-space batched multi-entity particle filter."""
+
+    def test_compute_ess_log_matches_linear(self):
+        """Test log-space ESS agrees with linear-space ESS."""
+        weights = np.random.dirichlet(np.ones(200), size=3)
+        ess = compute_ess_log(np.log(weights))
+
+        for i in range(3):
+            assert np.isclose(ess[i], compute_ess(weights[i]))
+
+    @pytest.mark.parametrize("method", ["systematic", "multinomial", "stratified"])
+    def test_batched_resampling_respects_weights(self, method):
+        """Test each row is resampled from its own weights."""
+        weights = np.zeros((3, 100))
+        weights[0, 5] = 1.0
+        weights[1, 99] = 1.0
+        weights[2, :] = 0.01
+
+        indices = batched_resampling(
+            weights, method=method, rng=np.random.default_rng(0)
+        )
+
+        assert indices.shape == (3, 100)
+        assert np.all(indices[0] == 5)
+        assert np.all(indices[1] == 99)
+        assert indices.min() >= 0 and indices.max() < 100
+
+    def test_batched_resampling_invalid_method(self):
+        """Test invalid resampling method raises error."""
+        with pytest.raises(ValueError, match="Unknown resampling_method"):
+            batched_resampling(np.ones((1, 100)) / 100, method="invalid")
+
+    def test_initialization_errors(self):
+        """Test invalid configuration raises errors."""
+        with pytest.raises(ValueError, match="n_entities"):
+            BatchedParticleFilter(n_entities=0)
+        with pytest.raises(ValueError, match="at least 100"):
+            BatchedParticleFilter(n_entities=2, n_particles=50)
+        with pytest.raises(ValueError, match="Unknown resampling_method"):
+            BatchedParticleFilter(n_entities=2, resampling_method="invalid")
+
+    def test_filter_tracks_each_entity(self):
+        """Test independent entities are tracked in one batch."""
+        rng = np.random.default_rng(1)
+        T, E = 40, 4
+        levels = np.array([0.0, 5.0, 10.0, -3.0])
+        observations = levels + rng.normal(0, 0.5, size=(T, E))
+
+        pf = BatchedParticleFilter(
+            n_entities=E,
+            n_particles=500,
+            transition_fn=_random_walk_transition,
+            log_observation_fn=_gaussian_log_likelihood,
+            random_state=42,
+        )
+        result = pf.filter(observations, initial_states=levels[:, None])
+
+        assert isinstance(result, BatchedParticleFilterResult)
+        assert result.states.shape == (T, E, 1)
+        assert result.particles.shape == (E, 500, 1)
+        assert np.allclose(np.exp(result.log_weights).sum(axis=1), 1.0)
+        assert np.allclose(result.states[-1, :, 0], levels, atol=1.0)
+
+    def test_long_sequence_does_not_underflow(self):
+        """Test log-space weights survive thousands of sharp updates."""
+        T = 3000
+        observations = np.full((T, 2), 1.0)
+
+        pf = BatchedParticleFilter(
+            n_entities=2,
+            n_particles=200,
+            transition_fn=_random_walk_transition,
+            log_observation_fn=_gaussian_log_likelihood,
+            resampling_threshold=0.0,  # Never resample
+            random_state=0,
+        )
+        result = pf.filter(observations, initial_states=np.array([1.0]))
+
+        assert np.all(np.isfinite(result.log_likelihood))
+        assert np.all(np.isfinite(result.log_weights).any(axis=1))
+        assert np.all(result.ess_history >= 1.0 - 1e-9)
+
+    def test_masked_entities_are_frozen(self):
+        """Test entities without an observation are not propagated."""
+        pf = BatchedParticleFilter(
+            n_entities=2,
+            n_particles=100,
+            transition_fn=_random_walk_transition,
+            log_observation_fn=_gaussian_log_likelihood,
+            random_state=3,
+        )
+        pf.initialize_particles(np.zeros((2, 1)))
+        before = pf.particles.copy()
+        log_weights_before = pf.log_weights.copy()
+
+        mask = np.array([True, False])
+        pf.predict(mask=mask)
+        pf.update(np.array([0.5, 100.0]), mask=mask)
+
+        assert not np.allclose(pf.particles[0], before[0])
+        assert np.array_equal(pf.particles[1], before[1])
+        assert np.allclose(pf.log_weights[1], log_weights_before[1])
+        assert pf.log_likelihood[1] == 0.0
+
+    def test_entity_result_extraction(self):
+        """Test per-entity results keep only observed steps."""
+        observations = np.zeros((10, 2))
+        mask = np.ones((10, 2), dtype=bool)
+        mask[::2, 1] = False
+
+        pf = BatchedParticleFilter(
+            n_entities=2,
+            n_particles=100,
+            transition_fn=_random_walk_transition,
+            log_observation_fn=_gaussian_log_likelihood,
+            random_state=5,
+        )
+        result = pf.filter(
+            observations, np.zeros(1), mask=mask, entity_ids=["a", "b"]
+        )
+        single = result.entity_result("b")
+
+        assert isinstance(single, ParticleFilterResult)
+        assert single.states.shape == (5, 1)
+        assert np.isclose(single.weights.sum(), 1.0)
+
+
+class TestBatchedPlayerPerformanceFilter:
+    """Test league-wide batched player performance filter."""
+
+    def test_filter_league_season(self, league_game_logs):
+        """Test every player is filtered in a single pass."""
+        pf = BatchedPlayerPerformanceFilter(
+            n_entities=3, n_particles=300, random_state=11
+        )
+        result = pf.filter_league_season(league_game_logs)
+
+        assert isinstance(result, BatchedPlayerPerformanceResult)
+        assert result.entity_ids == ["p1", "p2", "p3"]
+        assert len(result.form_states) == len(league_game_logs)
+        assert np.all(np.isfinite(result.log_likelihood))
+
+        final_skill = (
+            result.form_states.groupby("player_id")["skill_mean"].last().to_numpy()
+        )
+        assert final_skill[0] > final_skill[1] > final_skill[2]
+
+    def test_filter_league_season_with_covariates(self, league_game_logs):
+        """Test time-varying covariates are aligned per game day."""
+        pf = BatchedPlayerPerformanceFilter(
+            n_entities=3, n_particles=200, random_state=12
+        )
+        result = pf.filter_league_season(
+            league_game_logs,
+            covariate_cols=["minutes"],
+            coefficients=np.array([0.0]),
+        )
+
+        assert len(result.form_states) == len(league_game_logs)
+
+    def test_entity_count_mismatch(self, league_game_logs):
+        """Test mismatched player count raises error."""
+        pf = BatchedPlayerPerformanceFilter(n_entities=5, n_particles=100)
+
+        with pytest.raises(ValueError, match="players"):
+            pf.filter_league_season(league_game_logs)
+
+    def test_log_likelihood_matches_poisson(self):
+        """Test log-likelihood agrees with scipy Poisson log-pmf."""
+        from scipy import stats
+
+        pf = BatchedPlayerPerformanceFilter(n_entities=2, n_particles=100)
+        particles = np.zeros((2, 100, 2))
+        particles[0, :, 0] = np.log(20)
+        particles[1, :, 0] = np.log(5)
+
+        log_lik = pf._log_observation_likelihood(particles, np.array([18, 7]))
+
+        assert np.allclose(log_lik[0], stats.poisson.logpmf(18, 20))
+        assert np.allclose(log_lik[1], stats.poisson.logpmf(7, 5))
+
+
 # ==============================================================================
 # Edge Cases
 # ==============================================================================
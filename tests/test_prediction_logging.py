@@ -0,0 +1,133 @@
+"""
+Tests for prediction_logging.py module
+
+Tests JSONL buffering, Parquet compaction with catalog statistics, and
+filter/aggregation pushdown against the uncompacted logs.
+"""
+
+import json
+import shutil
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_server.prediction_logging import (
+    PredictionLog,
+    PredictionLogger,
+    PARQUET_AVAILABLE,
+)
+
+requires_parquet = pytest.mark.skipif(
+    not PARQUET_AVAILABLE, reason="pyarrow not installed"
+)
+
+
+@pytest.fixture
+def temp_log_path():
+    """Create a temporary directory for prediction logs"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def history_logger(temp_log_path):
+    """Logger with three past days of JSONL logs"""
+    start = datetime(2024, 1, 1)
+    for day in range(3):
+        date = start + timedelta(days=day)
+        log_file = f"{temp_log_path}/predictions_{date:%Y%m%d}.jsonl"
+        with open(log_file, "w") as f:
+            for i in range(30):
+                entry = PredictionLog(
+                    prediction_id=f"pred_{day}_{i}",
+                    model_id=f"model_{i % 3}",
+                    model_version="1.0.0",
+                    inputs={"x": [i, day]},
+                    prediction=i % 2 == 0,
+                    confidence=0.5 + i / 100,
+                    latency_ms=None if i == 7 else float(i),
+                    user_id=f"user_{i % 4}",
+                    timestamp=(date + timedelta(minutes=i)).isoformat(),
+                )
+                f.write(json.dumps(asdict(entry)) + "\n")
+    return PredictionLogger(storage_path=temp_log_path)
+
+
+def test_log_and_query_from_jsonl(temp_log_path):
+    """Test flushed predictions are queryable"""
+    pred_logger = PredictionLogger(storage_path=temp_log_path)
+    pred_logger.log_prediction("p1", "model_a", "1.0", [1, 2], 0.7, confidence=0.9)
+    pred_logger.log_prediction("p2", "model_b", "1.0", [3, 4], 0.2)
+    pred_logger.flush()
+
+    results = pred_logger.query_predictions(model_id="model_a")
+
+    assert [r.prediction_id for r in results] == ["p1"]
+    assert results[0].inputs == [1, 2]
+
+
+@requires_parquet
+def test_compact_writes_partitions_and_catalog(history_logger):
+    """Test compaction replaces JSONL with indexed Parquet partitions"""
+    compacted = history_logger.compact(before_date="2024-01-03")
+
+    assert compacted == 60
+    remaining = sorted(p.name for p in history_logger.storage_path.glob("*.jsonl"))
+    assert remaining == ["predictions_20240103.jsonl"]
+
+    stats = list(history_logger.file_index.values())
+    assert sorted(s["date"] for s in stats) == ["2024-01-01", "2024-01-02"]
+    assert stats[0]["models"] == {"model_0": 10, "model_1": 10, "model_2": 10}
+    assert stats[0]["latency_ms"] == [0.0, 29.0]
+
+    reloaded = PredictionLogger(storage_path=str(history_logger.storage_path))
+    assert reloaded.file_index == history_logger.file_index
+
+
+@requires_parquet
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"model_id": "model_1"},
+        {"model_id": "model_2", "user_id": "user_1"},
+        {"start_date": "2024-01-01T00:20", "end_date": "2024-01-02T00:05"},
+        {"model_id": "missing"},
+    ],
+)
+def test_query_matches_uncompacted_logs(history_logger, filters):
+    """Test pushdown queries return the same entries as the JSONL scan"""
+    expected = history_logger.query_predictions(limit=1000, **filters)
+
+    history_logger.compact(before_date="2024-01-03")
+    actual = history_logger.query_predictions(limit=1000, **filters)
+
+    assert actual == expected
+    assert history_logger.query_predictions(limit=5, **filters) == expected[:5]
+
+
+@requires_parquet
+def test_aggregate_matches_uncompacted_logs(history_logger):
+    """Test pushed-down aggregations equal the JSONL aggregation"""
+    expected = history_logger.aggregate_predictions(
+        group_by="user_id", start_date="2024-01-01T00:10"
+    )
+
+    history_logger.compact(before_date="2024-01-03")
+    actual = history_logger.aggregate_predictions(
+        group_by="user_id", start_date="2024-01-01T00:10"
+    )
+
+    assert actual.keys() == expected.keys()
+    for group, values in expected.items():
+        assert actual[group] == pytest.approx(values)
+    assert sum(v["count"] for v in actual.values()) == 80
+
+
+def test_aggregate_rejects_unknown_group(history_logger):
+    """Test invalid grouping column raises"""
+    with pytest.raises(ValueError):
+        history_logger.aggregate_predictions(group_by="prediction")
@@ -0,0 +1,129 @@
+"""
+Tests for LoopStallDetector
+
+Tests loop lag measurement, stall stack capture, attribution to the active
+tool and the exported summaries.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from mcp_server.profiling.loop_monitor import (
+    UNATTRIBUTED_SITE,
+    LoopStallDetector,
+    _StallCapture,
+)
+from mcp_server.profiling.performance import PerformanceProfiler
+from mcp_server.profiling.tool_metrics import ToolMetrics
+
+
+def _block_the_loop(seconds):
+    time.sleep(seconds)
+
+
+@pytest.fixture
+def tool_metrics():
+    """ToolMetrics with its own profiler"""
+    return ToolMetrics(profiler=PerformanceProfiler())
+
+
+@pytest.mark.asyncio
+async def test_stall_attributed_to_tool_and_site(tool_metrics):
+    """Test a blocking tool step is captured with its call site and tool"""
+    detector = LoopStallDetector(
+        interval_ms=10, stall_threshold_ms=40, tool_metrics=tool_metrics
+    )
+
+    async def rebuild_cache():
+        _block_the_loop(0.2)
+        return "ok"
+
+    tool = tool_metrics.instrument(rebuild_cache)
+
+    detector.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert await tool() == "ok"
+        await asyncio.sleep(0.05)
+    finally:
+        await detector.stop()
+
+    assert detector.stall_count == 1
+    [site] = detector.top_blocking_sites()
+    assert site["site"].endswith("in _block_the_loop")
+    assert site["site"].startswith("tests")
+    assert site["tools"] == {"rebuild_cache": 1}
+    assert site["max_ms"] >= 150
+    assert any("rebuild_cache" in frame for frame in site["stack"])
+    assert detector.get_tool_stalls()["rebuild_cache"] >= 150
+
+
+@pytest.mark.asyncio
+async def test_lag_stats_without_stalls():
+    """Test lag is sampled every beat and stays below the threshold"""
+    detector = LoopStallDetector(interval_ms=5, stall_threshold_ms=200)
+
+    detector.start()
+    await asyncio.sleep(0.1)
+    await detector.stop()
+
+    stats = detector.get_lag_stats()
+    assert stats["samples"] >= 5
+    assert stats["stall_count"] == 0
+    assert stats["p50_lag_ms"] <= stats["p99_lag_ms"] < 200
+    assert not stats["running"]
+
+
+def test_short_stall_without_capture_is_unattributed():
+    """Test stalls the watchdog missed are still counted"""
+    detector = LoopStallDetector(stall_threshold_ms=10)
+
+    detector._record_stall(beat_ns=1, lag_ns=25_000_000)
+
+    [site] = detector.top_blocking_sites()
+    assert site["site"] == UNATTRIBUTED_SITE
+    assert site["tools"] == {"<none>": 1}
+    text = detector.export_prometheus()
+    assert 'nba_mcp_event_loop_stall_seconds_total{tool="<none>"} 0.025' in text
+    assert "# TYPE nba_mcp_event_loop_lag_seconds histogram" in text
+
+
+def test_sites_are_bounded():
+    """Test the site table evicts the least total stall time"""
+    detector = LoopStallDetector(max_sites=2)
+
+    for beat, lag_ms in enumerate([300, 100, 200]):
+        detector._capture = _StallCapture(
+            beat_ns=beat, site=f"site_{beat}", stack=[], tool="tool"
+        )
+        detector._record_stall(beat_ns=beat, lag_ns=lag_ms * 1_000_000)
+
+    assert [s["site"] for s in detector.top_blocking_sites()] == ["site_0", "site_2"]
+    assert detector.stall_count == 3
+
+
+def test_invalid_threshold_raises():
+    """Test non-positive settings are rejected"""
+    with pytest.raises(ValueError):
+        LoopStallDetector(stall_threshold_ms=0)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_sessions_share_detector():
+    """Test one session stopping leaves the detector running for others"""
+    detector = LoopStallDetector(interval_ms=5, stall_threshold_ms=200)
+
+    detector.start()  # session A
+    detector.start()  # session B
+    await detector.stop()  # session A closes
+    assert detector.running
+
+    await asyncio.sleep(0.03)
+    await detector.stop()  # session B closes
+    assert not detector.running
+
+    detector.start()
+    await detector.stop(force=True)
+    assert not detector.running
@@ -279,3 +279,23 @@ class TestMetricsReporter:
 
         finally:
             Path(output_path).unlink()
+
+    def test_export_prometheus_histograms(self):
+        """Test Prometheus text contains cumulative buckets per kind"""
+        profiler = PerformanceProfiler()
+        profiler.observe("test.func", 2_000_000)
+        profiler.observe("test.func", 30_000_000)
+        profiler.observe("get_player_stats", 500_000, kind="tool")
+        reporter = MetricsReporter(profiler)
+
+        text = reporter.export_prometheus(buckets=(0.001, 0.01, 0.1))
+
+        metric = "nba_mcp_profile_duration_seconds"
+        assert f"# TYPE {metric} histogram" in text
+        assert (
+            f'{metric}_bucket{{kind="function",name="test.func",le="0.01"}} 1' in text
+        )
+        assert (
+            f'{metric}_bucket{{kind="function",name="test.func",le="+Inf"}} 2' in text
+        )
+        assert f'{metric}_count{{kind="tool",name="get_player_stats"}} 1' in text
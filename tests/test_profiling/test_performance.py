@@ -7,7 +7,10 @@ Tests profiling decorators, metrics tracking, and bottleneck identification.
 import pytest
 import time
 import asyncio
+import threading
+import numpy as np
 from mcp_server.profiling.performance import (
+    LatencyHistogram,
     PerformanceProfiler,
     profile,
     profile_async,
@@ -358,3 +361,140 @@ class TestGlobalProfiler:
         test_function()
 
         assert len(profiler.profiles) > 0
+
+
+class TestLatencyHistograms:
+    """Test bounded histograms and sampled profiling"""
+
+    def test_histogram_percentiles_within_one_percent(self):
+        """Test HDR buckets keep percentile error under 1%"""
+        values = np.random.default_rng(0).lognormal(13, 1.5, 50_000).astype(np.int64)
+        histogram = LatencyHistogram()
+        histogram.add_many(values)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = np.percentile(values, q * 100)
+            assert histogram.percentile_ns(q) == pytest.approx(exact, rel=0.01)
+        assert histogram.count == len(values)
+        assert histogram.total_ns == values.sum()
+
+    def test_sampling_bounds_retained_results(self):
+        """Test only 1-in-N calls keep a ProfileResult, all calls are counted"""
+        profiler = PerformanceProfiler(sample_every=10, max_samples=5)
+
+        @profile(profiler=profiler, name="tools.fast")
+        def fast():
+            return 1
+
+        for _ in range(500):
+            fast()
+
+        stats = profiler.get_function_stats("tools.fast")
+        assert stats["call_count"] == 500
+        assert len(profiler.profiles["tools.fast"]) == 5
+        assert stats["median_time_ms"] <= stats["p99_time_ms"]
+        assert LatencyHistogram().percentile_ns(0.99) == 0.0
+
+    def test_sampling_rate_spans_buffer_folds(self):
+        """Test 1-in-N sampling holds when N exceeds the fold size"""
+        profiler = PerformanceProfiler(sample_every=2000, max_samples=100)
+
+        @profile(profiler=profiler, name="tools.sync")
+        def sync_call():
+            return 1
+
+        @profile_async(profiler=profiler, name="tools.async")
+        async def async_call():
+            return 1
+
+        async def run_async():
+            for _ in range(10_000):
+                await async_call()
+
+        for _ in range(10_000):
+            sync_call()
+        asyncio.run(run_async())
+
+        assert len(profiler.profiles["tools.sync"]) == 5
+        assert len(profiler.profiles["tools.async"]) == 5
+        assert profiler.get_function_stats("tools.sync")["call_count"] == 10_000
+
+        # Reset restarts the sampling cycle
+        profiler.reset()
+        sync_call()
+        assert len(profiler.profiles["tools.sync"]) == 1
+
+    def test_concurrent_calls_are_all_counted(self):
+        """Test per-thread buffers merge to exact totals"""
+        profiler = PerformanceProfiler(sample_every=100)
+
+        @profile(profiler=profiler, name="tools.shared")
+        def shared():
+            return None
+
+        def worker():
+            for _ in range(2000):
+                shared()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert profiler.get_function_stats("tools.shared")["call_count"] == 16000
+        assert profiler.total_calls == 16000
+        # Exited threads' shards are folded into the shared retired shard
+        assert profiler._shards == [profiler._retired]
+
+    def test_tool_kind_is_separate(self):
+        """Test tool timings are reported apart from function timings"""
+        profiler = PerformanceProfiler()
+
+        @profile(profiler=profiler, name="get_player_stats", kind="tool")
+        def tool():
+            return None
+
+        tool()
+        tool()
+
+        assert profiler.get_all_stats() == {}
+        assert profiler.get_tool_stats()["get_player_stats"]["call_count"] == 2
+        assert profiler.get_summary()["total_tools_profiled"] == 1
+
+    def test_nested_memory_tracking(self):
+        """Test inner tracked calls do not stop tracing for the outer call"""
+        profiler = PerformanceProfiler(track_memory=True)
+
+        @profile(profiler=profiler, name="inner")
+        def inner():
+            return [0] * 1000
+
+        @profile(profiler=profiler, name="outer")
+        def outer():
+            inner()
+            return [0] * 100_000
+
+        outer()
+
+        assert profiler.profiles["outer"][0].memory_peak_mb > 0.5
+        assert profiler.profiles["inner"][0].memory_peak_mb is not None
+
+    def test_production_profile_counts_slow_calls(self):
+        """Test production settings sample sparsely but count every slow call"""
+        profiler = PerformanceProfiler.production()
+        # Wide margins either side so scheduler jitter cannot flip a call
+        profiler.slow_threshold_ms = 50.0
+
+        @profile(profiler=profiler, name="sometimes_slow")
+        def sometimes_slow(delay):
+            time.sleep(delay)
+
+        sometimes_slow(0.001)
+        for _ in range(20):
+            sometimes_slow(0.001)
+        sometimes_slow(0.1)
+
+        assert len(profiler.profiles["sometimes_slow"]) == 1
+        assert profiler.profiles["sometimes_slow"][0].stack
+        assert profiler.get_function_stats("sometimes_slow")["slow_calls"] == 1
@@ -0,0 +1,209 @@
+"""
+Tests for ToolMetrics
+
+Tests per-tool instrumentation at registration, event-loop blocking and CPU
+attribution, payload sizing, errors, concurrency and Prometheus export.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+
+import pytest
+
+from mcp_server.profiling.performance import PerformanceProfiler
+from mcp_server.profiling.tool_metrics import ToolMetrics, instrument_tools
+
+
+class Context:
+    """Stand-in for the FastMCP context type (matched by name)"""
+
+
+class ToolServer:
+    """Minimal server with FastMCP's tool()/add_tool() registration shape"""
+
+    def __init__(self):
+        self.tools = {}
+
+    def add_tool(self, fn, name=None, description=None):
+        self.tools[name or fn.__name__] = fn
+
+    def tool(self, name=None):
+        def decorator(fn):
+            self.add_tool(fn, name=name)
+            return fn
+
+        return decorator
+
+
+@pytest.fixture
+def metrics():
+    """ToolMetrics with its own profiler, sizing every call"""
+    return ToolMetrics(profiler=PerformanceProfiler(), size_sample_every=1)
+
+
+@pytest.fixture
+def server(metrics):
+    """Server instrumented before any tool is registered"""
+    server = ToolServer()
+    instrument_tools(server, metrics)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_tools_instrumented_at_registration(server, metrics):
+    """Test @tool() registers a wrapper that keeps the signature"""
+
+    @server.tool()
+    async def get_player(player_id: int, ctx: Context) -> dict:
+        return {"player_id": player_id, "name": "x" * 100}
+
+    registered = server.tools["get_player"]
+    assert registered is not get_player
+    assert list(inspect.signature(registered).parameters) == ["player_id", "ctx"]
+
+    assert await registered(player_id=23, ctx=Context()) == {
+        "player_id": 23,
+        "name": "x" * 100,
+    }
+    stats = metrics.get_tool_stats()["get_player"]
+    assert stats["call_count"] == 1
+    assert stats["avg_request_bytes"] == 2
+    assert stats["avg_response_bytes"] > 100
+
+
+@pytest.mark.asyncio
+async def test_blocking_time_excludes_awaits(server, metrics):
+    """Test awaited time counts as latency but not loop blocking"""
+
+    @server.tool()
+    async def mixed(ctx: Context) -> str:
+        await asyncio.sleep(0.05)
+        time.sleep(0.02)  # blocks the loop
+        return "done"
+
+    await server.tools["mixed"](ctx=Context())
+
+    stats = metrics.get_tool_stats()["mixed"]
+    assert stats["total_time_ms"] >= 70
+    assert 20 <= stats["blocking_total_ms"] < 45
+    assert stats["cpu_total_ms"] < 15  # sleeping is not CPU
+
+
+def test_sync_tool_blocks_for_whole_call(server, metrics):
+    """Test sync tools count their full duration as blocking"""
+
+    @server.tool(name="busy")
+    def busy_tool() -> int:
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            pass
+        return 1
+
+    server.tools["busy"]()
+
+    stats = metrics.get_tool_stats()["busy"]
+    assert stats["blocking_total_ms"] == pytest.approx(stats["total_time_ms"])
+    # A spinning thread may still be descheduled, so only bound CPU by wall time
+    assert 0 < stats["cpu_total_ms"] <= stats["total_time_ms"] + 1
+
+
+@pytest.mark.asyncio
+async def test_errors_and_concurrency(server, metrics):
+    """Test errors are counted by class and peak concurrency is tracked"""
+
+    @server.tool()
+    async def flaky(fail: bool) -> str:
+        await asyncio.sleep(0.01)
+        if fail:
+            raise KeyError("missing")
+        return "ok"
+
+    results = await asyncio.gather(
+        *(server.tools["flaky"](fail=i % 2 == 0) for i in range(6)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, KeyError) for r in results) == 3
+    stats = metrics.get_tool_stats()["flaky"]
+    assert stats["errors"] == {"KeyError": 3}
+    assert stats["peak_in_flight"] == 6
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancellation_propagates(server, metrics):
+    """Test cancelled tools are recorded and re-raise CancelledError"""
+
+    @server.tool()
+    async def slow() -> None:
+        await asyncio.sleep(10)
+
+    task = asyncio.ensure_future(server.tools["slow"]())
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert metrics.get_tool_stats()["slow"]["errors"] == {"CancelledError": 1}
+
+
+@pytest.mark.asyncio
+async def test_top_slow_tools_and_prometheus(server, metrics):
+    """Test slow-tool ranking and Prometheus exposition"""
+
+    @server.tool()
+    async def fast() -> int:
+        return 1
+
+    @server.tool()
+    async def slow() -> int:
+        await asyncio.sleep(0.02)
+        return 2
+
+    for _ in range(3):
+        await server.tools["fast"]()
+        await server.tools["slow"]()
+
+    top = metrics.top_slow_tools(n=1)
+    assert [t["tool_name"] for t in top] == ["slow"]
+    with pytest.raises(ValueError):
+        metrics.top_slow_tools(by="median")
+
+    text = metrics.export_prometheus()
+    assert 'nba_mcp_tool_duration_seconds_count{kind="tool",name="slow"} 3' in text
+    assert "# TYPE nba_mcp_tool_loop_blocking_seconds histogram" in text
+    assert 'nba_mcp_tool_peak_in_flight{name="fast"} 1' in text
+
+
+def test_instrument_tools_is_idempotent(server, metrics):
+    """Test a second instrument_tools call does not double-wrap"""
+    assert instrument_tools(server) is metrics
+
+    @server.tool()
+    def once() -> int:
+        return 1
+
+    server.tools["once"]()
+    assert metrics.get_tool_stats()["once"]["call_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_step_listener_runs_per_blocking_step(server, metrics):
+    """Test the slow-step hook fires only for steps over the threshold"""
+    slow_steps = []
+    metrics.slow_step_ns = 10_000_000
+    metrics.on_slow_step = lambda tool, ns: slow_steps.append((tool, ns))
+
+    @server.tool()
+    async def two_steps() -> None:
+        time.sleep(0.02)
+        await asyncio.sleep(0)
+        assert metrics.active_tool(threading.get_ident()) == "two_steps"
+
+    await server.tools["two_steps"]()
+
+    assert [tool for tool, _ in slow_steps] == ["two_steps"]
+    assert slow_steps[0][1] >= 20_000_000
+    assert metrics.active_tool(threading.get_ident()) is None
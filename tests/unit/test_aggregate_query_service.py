@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Shared Aggregate Query Service
+
+Tests result caching across formatting differences, single-flight coalescing
+of concurrent identical queries, watermark and explicit invalidation, LRU
+eviction and async access.
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.aggregate_query_service import (
+    AggregateQueryService,
+    normalize_sql,
+    referenced_tables,
+)
+
+TEAM_QUERY = """
+    SELECT team_id, AVG(team_score) AS ppg
+    FROM hoopr_team_box
+    WHERE season = %s
+    GROUP BY team_id
+"""
+
+
+class FakeConnection:
+    """DB-API connection returning tuple rows and counting executions"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.executed = []
+        self.table_changes = {"hoopr_team_box": 100}
+        self._lock = threading.Lock()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, params=None):
+        if "pg_stat_clear_snapshot" in query:
+            return
+        if "pg_stat_user_tables" in query:
+            self.description = [("schemaname",), ("relname",), ("changes",)]
+            self._rows = [
+                ("public", name, count)
+                for name, count in self.conn.table_changes.items()
+                if name in params[0]
+            ]
+            return
+
+        with self.conn._lock:
+            self.conn.executed.append((query, params))
+        time.sleep(self.conn.delay)
+        self.description = [("team_id",), ("ppg",)]
+        self._rows = [(1, 110.5), (2, 104.0)]
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class TestAggregateQueryService(unittest.TestCase):
+    """Test cases for AggregateQueryService"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.conn = FakeConnection()
+        self.service = AggregateQueryService(self.conn, watermark_ttl=0.0)
+
+    def test_normalization_and_table_parsing(self):
+        """Test SQL keys ignore formatting and tables come from FROM/JOIN"""
+        self.assertEqual(normalize_sql("SELECT  1\n FROM t ;"), "SELECT 1 FROM t")
+        self.assertEqual(
+            referenced_tables(
+                "SELECT * FROM games g JOIN odds.events e ON 1=1 "
+                "JOIN unnest(%s) AS k ON 1=1"
+            ),
+            ("games", "odds.events"),
+        )
+        self.assertEqual(
+            referenced_tables(
+                "SELECT EXTRACT(YEAR FROM s.date), "
+                "EXTRACT(EPOCH FROM (NOW() - MAX(s.fetched_at))), "
+                "SUBSTRING(s.name FROM 1 FOR 3), TRIM(BOTH ' ' FROM s.team) "
+                "FROM hoopr_schedule s JOIN (SELECT * FROM odds) o ON 1=1 "
+                "WHERE s.home IS DISTINCT FROM s.away"
+            ),
+            ("hoopr_schedule", "odds"),
+        )
+
+    def test_repeated_query_is_cached(self):
+        """Test identical queries and params execute once, as dict rows"""
+        first = self.service.fetch(TEAM_QUERY, (2024,))
+        second = self.service.fetch(" ".join(TEAM_QUERY.split()), [2024])
+        self.service.fetch(TEAM_QUERY, (2023,))
+
+        self.assertEqual(
+            first, [{"team_id": 1, "ppg": 110.5}, {"team_id": 2, "ppg": 104.0}]
+        )
+        self.assertIs(first, second)
+        self.assertEqual(len(self.conn.executed), 2)
+        stats = self.service.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_concurrent_identical_queries_coalesce(self):
+        """Test single-flight: concurrent callers share one execution"""
+        self.conn.delay = 0.2
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: self.service.fetch(TEAM_QUERY, (2024,)), range(8))
+            )
+
+        self.assertEqual(len(self.conn.executed), 1)
+        self.assertEqual(len({id(rows) for rows in results}), 1)
+        stats = self.service.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"] + stats["coalesced"], 7)
+
+    def test_table_changes_invalidate(self):
+        """Test a moved watermark or explicit invalidation re-executes"""
+        self.service.fetch(TEAM_QUERY, (2024,))
+        self.conn.table_changes["hoopr_team_box"] += 5
+        self.service.fetch(TEAM_QUERY, (2024,))
+        self.assertEqual(len(self.conn.executed), 2)
+
+        self.service.invalidate(["hoopr_team_box"])
+        self.assertEqual(self.service.stats()["size"], 0)
+        self.service.fetch(TEAM_QUERY, (2024,))
+        self.assertEqual(len(self.conn.executed), 3)
+
+        self.service.invalidate(["games"])  # unrelated table
+        self.service.fetch(TEAM_QUERY, (2024,))
+        self.assertEqual(len(self.conn.executed), 3)
+
+    def test_watermarks_reused_within_ttl(self):
+        """Test watermarks are not re-read on every lookup"""
+        service = AggregateQueryService(self.conn, watermark_ttl=60.0)
+        for _ in range(5):
+            service.fetch(TEAM_QUERY, (2024,))
+        self.conn.table_changes["hoopr_team_box"] += 1
+        service.fetch(TEAM_QUERY, (2024,))  # change not seen until TTL expires
+
+        self.assertEqual(service.stats()["watermark_reads"], 1)
+        self.assertEqual(len(self.conn.executed), 1)
+
+    def test_errors_propagate_and_are_not_cached(self):
+        """Test a failed query raises for the caller and is retried later"""
+        conn = FakeConnection()
+        service = AggregateQueryService(conn, watermark_ttl=0.0)
+        original = FakeCursor.execute
+
+        def failing(cursor, query, params=None):
+            if "team_score" in query:
+                raise RuntimeError("connection lost")
+            return original(cursor, query, params)
+
+        FakeCursor.execute = failing
+        try:
+            with self.assertRaises(RuntimeError):
+                service.fetch(TEAM_QUERY, (2024,))
+        finally:
+            FakeCursor.execute = original
+
+        self.assertEqual(service.fetch(TEAM_QUERY, (2024,))[0]["team_id"], 1)
+        self.assertEqual(service.stats()["size"], 1)
+
+    def test_lru_eviction_and_async(self):
+        """Test bounded size and the async entry point"""
+        service = AggregateQueryService(self.conn, max_entries=2, watermark_ttl=0.0)
+        for season in (2022, 2023, 2024):
+            asyncio.run(service.afetch(TEAM_QUERY, (season,)))
+
+        stats = service.stats()
+        self.assertEqual((stats["size"], stats["evictions"]), (2, 1))
+        with self.assertRaises(ValueError):
+            AggregateQueryService(self.conn, max_entries=0)
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Compiled-Expression Formula Cache
+
+Tests normalized-text keying, bounded LRU eviction, lambdified callables per
+argument ordering, thread safety and hit-rate metrics.
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import sympy as sp
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.tools.formula_cache import (
+    FormulaCache,
+    normalize_formula,
+)
+
+
+class TestFormulaCache(unittest.TestCase):
+    """Test cases for FormulaCache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = FormulaCache(max_size=3)
+        self.true_shooting = "PTS / (2 * (FGA + 0.44 * FTA))"
+
+    def test_normalized_text_shares_entry(self):
+        """Test whitespace variants hit the same compiled formula"""
+        first = self.cache.compile(self.true_shooting)
+        second = self.cache.compile("  PTS / (2 *  (FGA + 0.44 * FTA)) ")
+
+        self.assertIs(first, second)
+        self.assertEqual(normalize_formula(" a  +\tb "), "a + b")
+        self.assertEqual(first.variables, ["FGA", "FTA", "PTS"])
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_parser_and_evaluate_are_part_of_key(self):
+        """Test parse_expr and sympify entries stay separate"""
+        sympified = self.cache.compile("x^2", parser="sympify")
+        with self.assertRaises(TypeError):  # parse_expr reads ^ as XOR
+            self.cache.compile("x^2")
+        unevaluated = self.cache.compile("x + x", evaluate=False)
+
+        self.assertEqual(sympified.expr, sp.Symbol("x") ** 2)
+        self.assertNotEqual(unevaluated.expr, 2 * sp.Symbol("x"))
+        with self.assertRaises(ValueError):
+            self.cache.compile("x", parser="eval")
+
+    def test_function_per_argument_ordering(self):
+        """Test lambdified callables are generated once per ordering"""
+        compiled = self.cache.compile("a - b")
+
+        forward = compiled.function(["a", "b"])
+        self.assertIs(compiled.function(["a", "b"]), forward)
+        backward = compiled.function(["b", "a"])
+
+        values = np.array([1.0, 2.0, 3.0])
+        np.testing.assert_allclose(forward(values, 1.0), values - 1)
+        np.testing.assert_allclose(backward(values, 1.0), 1 - values)
+        self.assertEqual(self.cache.stats()["function_hits"], 1)
+
+    def test_evaluate_vectorized_and_missing(self):
+        """Test evaluation over arrays and missing-variable errors"""
+        compiled = self.cache.compile(self.true_shooting)
+        result = compiled.evaluate(
+            {"PTS": np.array([30, 20]), "FGA": np.array([20, 15]), "FTA": 5}
+        )
+
+        np.testing.assert_allclose(result, [30 / 44.4, 20 / 34.4])
+        with self.assertRaises(ValueError):
+            compiled.evaluate({"PTS": 1})
+
+    def test_forced_symbols(self):
+        """Test names like E parse as variables when requested"""
+        constant = self.cache.compile("E * 2")
+        variable = self.cache.compile("E * 2", symbols=["E"])
+
+        self.assertEqual(constant.variables, [])
+        self.assertEqual(variable.evaluate({"E": 1.5}), 3.0)
+
+    def test_lru_eviction(self):
+        """Test the least recently used formula is evicted"""
+        first = self.cache.compile("a + 1")
+        self.cache.compile("a + 2")
+        self.cache.compile("a + 3")
+        self.cache.compile("a + 1")  # refresh
+        self.cache.compile("a + 4")
+
+        self.assertEqual(self.cache.stats()["size"], 3)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.assertIs(self.cache.compile("a + 1"), first)
+
+    def test_expression_keys_and_derived_forms(self):
+        """Test parsed expressions can be compiled and reuse simplify"""
+        x = sp.Symbol("x")
+        expr = (x**2 - 1) / (x - 1)
+
+        compiled = self.cache.compile(expr)
+        self.assertIs(self.cache.compile(expr), compiled)
+        self.assertEqual(compiled.simplified, x + 1)
+        self.assertIs(compiled.simplified, compiled.simplified)
+        self.assertEqual(compiled.latex, sp.latex(expr))
+
+    def test_concurrent_compiles_share_one_entry(self):
+        """Test concurrent misses converge on one compiled formula"""
+        cache = FormulaCache()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            compiled = list(
+                pool.map(lambda _: cache.compile(self.true_shooting), range(64))
+            )
+
+        self.assertEqual(len({id(c) for c in compiled}), 1)
+        self.assertEqual(cache.stats()["size"], 1)
+        self.assertEqual(cache.stats()["hits"] + cache.stats()["misses"], 64)
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
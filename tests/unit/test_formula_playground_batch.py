@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Formula Playground Batch Evaluation
+
+Tests vectorized evaluation over data columns and what-if grids, dependency
+ordering between named formulas, and dataset loading.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.exceptions import ValidationError
+from mcp_server.tools.formula_dependency_graph import resolve_evaluation_order
+from mcp_server.tools.formula_playground import (
+    PlaygroundMode,
+    get_formula_playground,
+)
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    """Test cases for InteractiveFormulaPlayground.evaluate_batch"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.playground = get_formula_playground()
+        self.session_id = self.playground.create_session(
+            "batch_test", PlaygroundMode.EXPLORE
+        ).session_id
+        self.games = {
+            "PTS": [30, 20, 0],
+            "FGA": [20, 15, 0],
+            "FTA": [5, 5, 0],
+            "3PM": [4, 1, 0],
+        }
+
+    def tearDown(self):
+        """Drop the test session from the shared playground"""
+        self.playground.sessions.pop(self.session_id, None)
+
+    def _add(self, formula, name=""):
+        self.playground.add_formula_to_session(self.session_id, formula, name=name)
+
+    def test_columns_evaluated_in_dependency_order(self):
+        """Test named formulas feed later formulas regardless of add order"""
+        self._add("TS * 100", name="TS_PCT")
+        self._add("PTS / (2 * TSA)", name="TS")
+        self._add("FGA + 0.44 * FTA", name="TSA")
+        self._add("3PM * 3 / PTS", name="THREE_SHARE")
+
+        result = self.playground.evaluate_batch(self.session_id, data=self.games)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["rows"], 3)
+        order = result["order"]
+        self.assertLess(order.index("TSA"), order.index("TS"))
+        self.assertLess(order.index("TS"), order.index("TS_PCT"))
+        np.testing.assert_allclose(
+            result["columns"]["TS_PCT"][:2], [100 * 30 / 44.4, 100 * 20 / 34.4]
+        )
+        self.assertIsNone(result["columns"]["TS_PCT"][2])  # 0 / 0
+        np.testing.assert_allclose(result["columns"]["THREE_SHARE"][:2], [0.4, 0.15])
+        self.assertEqual(result["errors"], {})
+
+    def test_grid_with_session_scalars(self):
+        """Test what-if grids cover every combination and use scalars"""
+        self.playground.sessions[self.session_id].variables["pace"] = 2.0
+        self._add("a * b * pace", name="product")
+
+        result = self.playground.evaluate_batch(
+            self.session_id, grid={"a": [1, 2], "b": [10, 20, 30]}, as_frame=True
+        )
+
+        frame = result["columns"]
+        self.assertIsInstance(frame, pd.DataFrame)
+        self.assertEqual(
+            frame["product"].tolist(), [20.0, 40.0, 60.0, 40.0, 80.0, 120.0]
+        )
+
+    def test_missing_values_and_failed_dependencies(self):
+        """Test missing inputs fail a formula and its dependents only"""
+        self._add("PTS + REB", name="PR")
+        self._add("PR * 2", name="PR2")
+        self._add("PTS * 2", name="DOUBLE")
+
+        result = self.playground.evaluate_batch(
+            self.session_id, data=self.games, formula_ids=["PR2", "DOUBLE"]
+        )
+
+        self.assertEqual(list(result["columns"]), ["DOUBLE"])
+        self.assertIn("PR", result["errors"]["PR2"])
+
+    def test_dataset_path_and_cycles(self):
+        """Test CSV datasets load and circular formulas are reported"""
+        self._add("PTS / FGA", name="PPS")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "games.csv")
+            pd.DataFrame({**self.games, "TEAM": ["A", "B", "C"]}).to_csv(
+                path, index=False
+            )
+            result = self.playground.evaluate_batch(self.session_id, data=path)
+        np.testing.assert_allclose(result["columns"]["PPS"][:2], [1.5, 20 / 15])
+
+        self._add("y + 1", name="x")
+        self._add("x + 1", name="y")
+        result = self.playground.evaluate_batch(self.session_id, data=self.games)
+        self.assertFalse(result["success"])
+        self.assertIn("Circular", result["error"])
+
+        with self.assertRaises(ValueError):
+            self.playground.evaluate_batch(
+                self.session_id, data=self.games, grid={"PTS": [1]}
+            )
+
+    def test_session_shared_across_calls(self):
+        """Test a session created in one tool call is evaluated in the next"""
+        self._add("PTS / FGA", name="PPS")
+
+        playground = get_formula_playground()
+        self.assertIs(playground, self.playground)
+        result = playground.evaluate_batch(self.session_id, data=self.games)
+        self.assertTrue(result["success"])
+        self.assertIn("PPS", result["columns"])
+
+
+class TestResolveEvaluationOrder(unittest.TestCase):
+    """Test cases for resolve_evaluation_order"""
+
+    def test_order_and_cycles(self):
+        """Test dependencies come first and cycles raise"""
+        order = resolve_evaluation_order({"c": ["b"], "a": [], "b": ["a"], "d": []})
+        self.assertEqual(order, ["a", "d", "b", "c"])
+
+        with self.assertRaises(ValidationError):
+            resolve_evaluation_order({"a": ["b"], "b": ["a"]})
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Genetic Programming Symbolic Regression Engine
+
+Tests formula recovery, determinism across worker processes, sub-expression
+caching, parsimony and the discover_formula_from_data integration.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.tools.genetic_programming import (
+    SymbolicRegressor,
+    tree_depth,
+    tree_size,
+)
+from mcp_server.tools.symbolic_regression import discover_formula_from_data
+
+
+def _player_games(n=3000, seed=0):
+    """Synthetic box scores with a true-shooting target"""
+    rng = np.random.default_rng(seed)
+    data = {
+        "PTS": rng.uniform(0, 40, n),
+        "FGA": rng.uniform(1, 30, n),
+        "FTA": rng.uniform(0, 12, n),
+        "AST": rng.uniform(0, 12, n),
+    }
+    data["TS"] = data["PTS"] / (2 * (data["FGA"] + 0.44 * data["FTA"]))
+    return data
+
+
+class TestSymbolicRegressor(unittest.TestCase):
+    """Test cases for SymbolicRegressor"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        data = _player_games()
+        self.names = ["PTS", "FGA", "FTA", "AST"]
+        self.X = np.column_stack([data[name] for name in self.names])
+        self.y = data["TS"]
+
+    def test_recovers_formula_shape(self):
+        """Test evolution finds a near-exact true shooting formula"""
+        model = SymbolicRegressor(
+            population_size=300, generations=15, random_state=0
+        ).fit(self.X, self.y, feature_names=self.names)
+
+        self.assertGreater(model.program_.r_squared, 0.99)
+        self.assertEqual(
+            {str(s) for s in model.to_sympy().free_symbols}, {"PTS", "FGA", "FTA"}
+        )
+        prediction = model.predict(self.X[:10])
+        np.testing.assert_allclose(prediction, self.y[:10], atol=0.1)
+
+    def test_history_tracks_cache_and_depth_limit(self):
+        """Test per-generation history, cache reuse and depth bound"""
+        model = SymbolicRegressor(
+            population_size=100, generations=5, max_depth=3, random_state=1
+        ).fit(self.X, self.y)
+
+        self.assertEqual(len(model.history_), 5)
+        self.assertGreater(model.history_[-1]["cache_hit_rate"], 0)
+        self.assertLessEqual(tree_depth(model.program_.tree), 3)
+        self.assertEqual(model.program_.size, tree_size(model.program_.tree))
+        self.assertEqual(model.feature_names_, ["x0", "x1", "x2", "x3"])
+
+    def test_worker_processes_match_in_process_scoring(self):
+        """Test parallel scoring gives the same evolution as serial"""
+        kwargs = dict(population_size=60, generations=3, random_state=2)
+        serial = SymbolicRegressor(**kwargs).fit(self.X, self.y)
+        parallel = SymbolicRegressor(n_jobs=2, **kwargs).fit(self.X, self.y)
+
+        self.assertEqual(serial.program_, parallel.program_)
+        self.assertEqual(
+            [h["best_r_squared"] for h in serial.history_],
+            [h["best_r_squared"] for h in parallel.history_],
+        )
+
+    def test_parsimony_prefers_smaller_programs(self):
+        """Test a large parsimony coefficient collapses programs"""
+        model = SymbolicRegressor(
+            population_size=100,
+            generations=5,
+            parsimony_coefficient=1.0,
+            random_state=3,
+        ).fit(self.X, self.y)
+
+        self.assertEqual(model.program_.size, 1)
+
+    def test_invalid_settings_and_data(self):
+        """Test bad settings and inputs raise ValueError"""
+        with self.assertRaises(ValueError):
+            SymbolicRegressor(function_set=["exp"])
+        with self.assertRaises(ValueError):
+            SymbolicRegressor(n_jobs=0)
+        with self.assertRaises(ValueError):
+            SymbolicRegressor().fit(self.X, np.ones(len(self.X)))
+        with self.assertRaises(ValueError):
+            SymbolicRegressor().predict(self.X)
+
+
+class TestDiscoverFormulaGenetic(unittest.TestCase):
+    """Test cases for discover_formula_from_data with genetic programming"""
+
+    def test_genetic_algorithm_discovery(self):
+        """Test the genetic_algorithm method evolves and validates a formula"""
+        data = {k: v.tolist() for k, v in _player_games(n=1000).items()}
+
+        result = discover_formula_from_data(
+            data,
+            target_variable="TS",
+            input_variables=["PTS", "FGA", "FTA"],
+            optimization_method="genetic_algorithm",
+            generations=10,
+            population_size=200,
+            random_state=0,
+        )
+
+        self.assertGreater(result["r_squared"], 0.9)
+        self.assertEqual(result["regression_type"], "symbolic")
+        self.assertEqual(len(result["history"]), result["generations_run"])
+        self.assertIn("PTS", result["formula_string"])
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
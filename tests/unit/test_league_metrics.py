@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for League-Wide Advanced Metrics
+
+Tests vectorized rate metrics against the single-player helpers, PER league
+normalization, the BPM team adjustment and opponent handling.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.exceptions import ValidationError
+from mcp_server.tools import nba_metrics_helper
+from mcp_server.tools.league_metrics import compute_league_metrics
+
+
+def _player_games(games=40, seed=0):
+    """Synthetic player-game box scores for four teams, ten players each"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for game in range(games):
+        home, away = rng.choice(["ATL", "BOS", "CHI", "DAL"], size=2, replace=False)
+        for team in (home, away):
+            for slot, minutes in enumerate([36, 34, 32, 30, 28, 24, 20, 16, 12, 8]):
+                fga = rng.poisson(minutes * 0.35)
+                fgm = rng.binomial(fga, 0.47)
+                three_pa = rng.binomial(fga, 0.4)
+                three_pm = min(rng.binomial(three_pa, 0.36), fgm)
+                fta = rng.poisson(minutes * 0.1)
+                ftm = rng.binomial(fta, 0.78)
+                rows.append(
+                    {
+                        "GAME_ID": game,
+                        "team": team,
+                        "player_id": f"{team}{slot}",
+                        "MIN": float(minutes),
+                        "PTS": 2 * fgm + three_pm + ftm,
+                        "FGM": fgm,
+                        "FGA": fga,
+                        "FG3M": three_pm,
+                        "FG3A": three_pa,
+                        "FTM": ftm,
+                        "FTA": fta,
+                        "OREB": rng.poisson(minutes * 0.03),
+                        "DREB": rng.poisson(minutes * 0.1),
+                        "AST": rng.poisson(minutes * 0.07),
+                        "STL": rng.poisson(minutes * 0.02),
+                        "BLK": rng.poisson(minutes * 0.015),
+                        "TOV": rng.poisson(minutes * 0.04),
+                        "PF": rng.poisson(minutes * 0.05),
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+class TestLeagueMetrics(unittest.TestCase):
+    """Test cases for compute_league_metrics"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.games = _player_games()
+        self.result = compute_league_metrics(self.games, game_col="GAME_ID")
+        self.players = self.result.players
+
+    def test_rate_metrics_match_single_player_helpers(self):
+        """Test vectorized rates agree with nba_metrics_helper per row"""
+        row = self.players.iloc[3]
+        team = self.games[
+            (self.games.GAME_ID == row.GAME_ID) & (self.games.team == row.team)
+        ]
+
+        self.assertAlmostEqual(
+            row.ts_pct,
+            nba_metrics_helper.calculate_true_shooting(row.PTS, row.FGA, row.FTA),
+            places=3,
+        )
+        self.assertAlmostEqual(
+            row.usg_pct,
+            nba_metrics_helper.calculate_usage_rate(
+                row.FGA,
+                row.FTA,
+                row.TOV,
+                row.MIN,
+                team.MIN.sum(),
+                team.FGA.sum(),
+                team.FTA.sum(),
+                team.TOV.sum(),
+            ),
+            places=2,
+        )
+        self.assertAlmostEqual(
+            row.tov_pct,
+            nba_metrics_helper.calculate_turnover_percentage(row.TOV, row.FGA, row.FTA),
+            places=2,
+        )
+
+    def test_per_is_normalized_to_league_average(self):
+        """Test minute-weighted league PER is 15.0"""
+        self.assertAlmostEqual(
+            np.average(self.players.per, weights=self.players.MIN), 15.0
+        )
+        self.assertGreater(self.result.league["pace"], 0)
+
+    def test_bpm_team_adjustment_matches_net_rating(self):
+        """Test minute-weighted team BPM sums to team net rating"""
+        teams = self.result.teams
+        minute_share = self.players.MIN / (
+            teams.minutes.reindex(self.players.team).to_numpy() / 5
+        )
+        team_bpm = (self.players.bpm * minute_share).groupby(self.players.team).sum()
+
+        np.testing.assert_allclose(team_bpm.loc[teams.index], teams.net_rtg)
+
+    def test_season_table_with_default_opponent(self):
+        """Test player-season tables use a league-average opponent"""
+        season = (
+            self.games.drop(columns="GAME_ID")
+            .groupby(["player_id", "team"], as_index=False)
+            .sum()
+        )
+        result = compute_league_metrics(season)
+
+        self.assertEqual(len(result.players), 40)
+        self.assertEqual(list(result.players.player_id), list(season.player_id))
+        self.assertAlmostEqual(
+            np.average(result.players.per, weights=result.players.MIN), 15.0
+        )
+
+    def test_zero_minutes_and_validation(self):
+        """Test zero-minute rows score 0.0 and bad tables raise"""
+        games = self.games.copy()
+        games.loc[0, ["MIN", "FGA", "FTA", "TOV"]] = 0
+        players = compute_league_metrics(games, game_col="GAME_ID").players
+        self.assertEqual(players.loc[0, "usg_pct"], 0.0)
+        self.assertEqual(players.loc[0, "per"], 0.0)
+
+        with self.assertRaises(ValidationError):
+            compute_league_metrics(self.games.drop(columns="PF"))
+        with self.assertRaises(ValidationError):
+            compute_league_metrics(
+                self.games[self.games.team != "ATL"].assign(GAME_ID=0),
+                game_col="GAME_ID",
+            )
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Shot Zone Rollups
+
+Tests incremental rollup refresh against a fake connection (pending game
+selection, season and defense key rebuilds, per-batch rollback), the
+in-process league baseline cache and player-vs-league comparisons.
+"""
+
+import unittest
+import sys
+import os
+from decimal import Decimal
+from unittest.mock import patch
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.analytics import shot_zones
+from mcp_server.analytics.shot_zones import (
+    BASELINE_TTL_SECONDS,
+    ROLLUP_TABLES,
+    ShotZoneAnalytics,
+    clear_baseline_cache,
+)
+
+
+class FakeConnection:
+    """DB-API connection recording statements, commits and rollbacks"""
+
+    def __init__(self):
+        self.pending = []
+        # game_id -> [(season, team_id, player_id, defense_team_id)]
+        self.old_keys = {}
+        self.new_keys = {}
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def statements(self, marker):
+        return [params for query, params in self.executed if marker in query]
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if self.conn.fail_on is not None and self.conn.fail_on(query, params):
+            raise RuntimeError("deadlock detected")
+
+        if "LEFT JOIN shot_zone_rollup_games" in query:
+            self._rows = list(self.conn.pending)
+        elif "DELETE FROM shot_zone_game_rollup" in query:
+            self._rows = self._keys(self.conn.old_keys, params["games"])
+        elif "INSERT INTO shot_zone_game_rollup" in query:
+            self._rows = self._keys(self.conn.new_keys, params["games"])
+        else:
+            self._rows = []
+
+    @staticmethod
+    def _keys(keys_by_game, games):
+        return [
+            dict(zip(("season", "team_id", "player_id", "defense_team_id"), key))
+            for game in games
+            for key in keys_by_game.get(game, [])
+        ]
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class FakeQueryService:
+    """Aggregate query service returning canned league and player rows"""
+
+    def __init__(self):
+        self.league_rows = [
+            {
+                "shot_zone": "restricted_area",
+                "attempts": 1000,
+                "made": 640,
+                "fg_pct": Decimal("64.00"),
+                "points_per_shot": Decimal("1.280"),
+                "expected_value": Decimal("1.280"),
+            },
+            {
+                "shot_zone": "corner_3",
+                "attempts": 500,
+                "made": 190,
+                "fg_pct": Decimal("38.00"),
+                "points_per_shot": Decimal("1.140"),
+                "expected_value": Decimal("1.140"),
+            },
+        ]
+        self.player_rows = [
+            {
+                "shot_zone": "restricted_area",
+                "attempts": 120,
+                "fg_pct": Decimal("70.50"),
+            },
+            {"shot_zone": "corner_3", "attempts": 40, "fg_pct": Decimal("35.00")},
+            {"shot_zone": "mid_range", "attempts": 5, "fg_pct": Decimal("40.00")},
+        ]
+        self.fetches = []
+        self.invalidated = []
+
+    def fetch(self, query, params=None, tables=None):
+        self.fetches.append((query, params))
+        if "player_id = %(player_id)s" in query:
+            return self.player_rows
+        return self.league_rows
+
+    def invalidate(self, tables=None):
+        self.invalidated.append(tuple(tables))
+
+
+def pending(*games):
+    return [{"game_id": game, "classified_shots": 80} for game in games]
+
+
+class TestRefreshRollups(unittest.TestCase):
+    """Test cases for incremental rollup refresh"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        clear_baseline_cache()
+        self.conn = FakeConnection()
+        self.queries = FakeQueryService()
+        self.analytics = ShotZoneAnalytics(self.conn, query_service=self.queries)
+
+    def tearDown(self):
+        clear_baseline_cache()
+
+    def test_pending_game_selection(self):
+        """Test changed-count filtering, game filters and force"""
+        self.assertEqual(self.analytics.refresh_rollups(), 0)
+        query, params = self.conn.executed[-1]
+        self.assertIn("IS DISTINCT FROM COUNT(*)", query)
+        self.assertNotIn("ANY(%(games)s)", query)
+        self.assertEqual(self.queries.invalidated, [])
+
+        self.analytics.refresh_rollups(["g1", "g2"])
+        query, params = self.conn.executed[-1]
+        self.assertIn("IS DISTINCT FROM COUNT(*)", query)
+        self.assertIn("p.game_id = ANY(%(games)s)", query)
+        self.assertEqual(params, {"games": ["g1", "g2"]})
+
+        self.analytics.refresh_rollups(["g1"], force=True)
+        query, _ = self.conn.executed[-1]
+        self.assertNotIn("IS DISTINCT FROM", query)
+
+        with self.assertRaises(ValueError):
+            self.analytics.refresh_rollups(force=True)
+
+    def test_rebuilds_season_and_defense_keys(self):
+        """Test keys from the replaced and the new game rows are rebuilt"""
+        self.conn.pending = pending("g1", "g2")
+        # g1 was credited to player 7 before a correction moved it to 9
+        self.conn.old_keys = {"g1": [(2023, 1, 7, 2)]}
+        self.conn.new_keys = {
+            "g1": [(2023, 1, 9, 2)],
+            "g2": [(2023, 3, 11, 4), (2023, 3, 0, None)],
+        }
+
+        self.assertEqual(self.analytics.refresh_rollups(), 2)
+
+        (season,) = self.conn.statements("INSERT INTO shot_zone_season_rollup")
+        self.assertEqual(
+            list(zip(season["seasons"], season["teams"], season["players"])),
+            [(2023, 1, 7), (2023, 1, 9), (2023, 3, 0), (2023, 3, 11)],
+        )
+        (defense,) = self.conn.statements("INSERT INTO shot_zone_defense_rollup")
+        self.assertEqual(
+            list(zip(defense["seasons"], defense["teams"])), [(2023, 2), (2023, 4)]
+        )
+        (marked,) = self.conn.statements("INTO shot_zone_rollup_games")
+        self.assertEqual(marked, {"games": ["g1", "g2"], "counts": [80, 80]})
+
+        self.assertEqual((self.conn.commits, self.conn.rollbacks), (1, 0))
+        self.assertEqual(self.queries.invalidated, [ROLLUP_TABLES])
+
+    def test_failed_batch_rolls_back(self):
+        """Test a failing batch is rolled back and earlier batches stay visible"""
+        self.conn.pending = pending("g1", "g2", "g3")
+        self.conn.new_keys = {g: [(2024, 1, 5, 2)] for g in ("g1", "g2", "g3")}
+        self.conn.fail_on = lambda query, params: (
+            "INTO shot_zone_rollup_games" in query and params["games"] == ["g2"]
+        )
+
+        with patch.object(shot_zones, "REFRESH_BATCH_GAMES", 1):
+            with self.assertRaises(RuntimeError):
+                self.analytics.refresh_rollups()
+
+        self.assertEqual((self.conn.commits, self.conn.rollbacks), (1, 1))
+        self.assertEqual(
+            len(self.conn.statements("DELETE FROM shot_zone_game_rollup")), 2
+        )
+        # g1 committed, so cached reads must not outlive it
+        self.assertEqual(self.queries.invalidated, [ROLLUP_TABLES])
+
+
+class TestLeagueBaseline(unittest.TestCase):
+    """Test cases for the cached league baseline and player comparisons"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        clear_baseline_cache()
+        self.conn = FakeConnection()
+        self.queries = FakeQueryService()
+        self.analytics = ShotZoneAnalytics(self.conn, query_service=self.queries)
+        self.clock = 1000.0
+        patcher = patch.object(shot_zones.time, "monotonic", lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        clear_baseline_cache()
+
+    def test_baseline_cached_until_ttl(self):
+        """Test the baseline is shared across instances until it expires"""
+        other = ShotZoneAnalytics(self.conn, query_service=self.queries)
+
+        first = self.analytics.league_average_by_zone(2024)
+        self.clock += BASELINE_TTL_SECONDS - 1
+        self.assertIs(other.league_average_by_zone(2024), first)
+        self.analytics.league_average_by_zone(2023)
+        self.assertEqual(len(self.queries.fetches), 2)
+
+        self.clock += 1
+        self.analytics.league_average_by_zone(2024)
+        self.assertEqual(len(self.queries.fetches), 3)
+        self.assertEqual(
+            first["corner_3"],
+            {"fg_pct": Decimal("38.00"), "expected_value": Decimal("1.140")},
+        )
+
+    def test_refresh_clears_baseline(self):
+        """Test rolling up games drops cached baselines"""
+        self.analytics.league_average_by_zone()
+        self.analytics.refresh_rollups()  # nothing pending: cache kept
+        self.analytics.league_average_by_zone()
+        self.assertEqual(len(self.queries.fetches), 1)
+
+        self.conn.pending = pending("g1")
+        self.analytics.refresh_rollups()
+        self.analytics.league_average_by_zone()
+        self.assertEqual(len(self.queries.fetches), 2)
+
+    def test_zone_vs_league(self):
+        """Test player FG% is compared against the league baseline per zone"""
+        profile = self.analytics.player_shot_profile(2544, season=2024)
+
+        self.assertEqual(
+            profile.zone_vs_league, {"restricted_area": 6.5, "corner_3": -3.0}
+        )
+        self.assertEqual(profile.favorite_zones[0], "restricted_area")
+        self.assertEqual(profile.weak_zones, ["corner_3", "restricted_area"])
+
+        self.queries.player_rows = []
+        self.assertIsNone(self.analytics.player_shot_profile(1))
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for StreamBuffer Sliding-Window Indexes
+
+Tests that the time-bucketed WindowIndex matches a rescan of the buffer for
+windowed counts, sums and moments under out-of-order arrival and size- and
+age-based eviction, and that StreamingAnalyzer live stats and anomaly
+detection read from it.
+"""
+
+import unittest
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from mcp_server.streaming_analytics import (
+    ALL_EVENTS,
+    StreamBuffer,
+    StreamEvent,
+    StreamEventType,
+    StreamingAnalyzer,
+    WindowIndex,
+    game_key,
+    player_key,
+)
+
+
+def make_event(seconds_ago, game_id="game_1", event_type=None, **data):
+    """Event stamped seconds_ago before now"""
+    return StreamEvent(
+        event_type=event_type or StreamEventType.PLAYER_STAT,
+        timestamp=datetime.now() - timedelta(seconds=seconds_ago),
+        game_id=game_id,
+        data=data,
+    )
+
+
+class TestWindowIndex(unittest.TestCase):
+    """Test cases for WindowIndex and StreamBuffer integration"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = random.Random(7)
+
+    def random_events(self, n):
+        events = []
+        for _ in range(n):
+            event_type = self.rng.choice(
+                [StreamEventType.PLAYER_STAT, StreamEventType.SCORE_UPDATE]
+            )
+            events.append(
+                make_event(
+                    self.rng.uniform(0, 600),  # arrival order is not time order
+                    game_id=self.rng.choice(["game_1", "game_2"]),
+                    event_type=event_type,
+                    player_id=self.rng.choice(["p1", "p2", "p3"]),
+                    points=self.rng.choice([0, 1, 2, 3]),
+                    rebounds=self.rng.random(),
+                )
+            )
+        return events
+
+    def assert_matches_rescan(self, buffer, window_seconds):
+        cutoff = datetime.now().timestamp() - window_seconds
+        held = [e for e in buffer.buffer if e.timestamp.timestamp() >= cutoff]
+        for key, members in [
+            (ALL_EVENTS, held),
+            (game_key("game_2"), [e for e in held if e.game_id == "game_2"]),
+            (
+                player_key("p1"),
+                [
+                    e
+                    for e in held
+                    if e.event_type == StreamEventType.PLAYER_STAT
+                    and e.data["player_id"] == "p1"
+                ],
+            ),
+        ]:
+            window, time_range = buffer.get_window_stats(window_seconds, key)
+            self.assertEqual(window.count, len(members))
+            self.assertAlmostEqual(
+                window.total("rebounds"), sum(e.data["rebounds"] for e in members)
+            )
+            self.assertEqual(
+                window.total("points"), sum(e.data["points"] for e in members)
+            )
+            if members:
+                self.assertEqual(time_range[0], min(e.timestamp for e in members))
+                self.assertEqual(time_range[1], max(e.timestamp for e in members))
+        self.assertCountEqual(
+            [e.sequence_id for e in buffer.get_window(window_seconds)],
+            [e.sequence_id for e in held],
+        )
+
+    def test_matches_rescan_with_size_eviction(self):
+        """Test windowed aggregates equal a rescan after the deque overflows"""
+        buffer = StreamBuffer(max_size=200, bucket_seconds=10.0)
+        buffer.add_batch(self.random_events(500))
+
+        self.assertEqual(len(buffer.buffer), 200)
+        for window_seconds in (30.0, 125.0, 599.0, 10_000.0):
+            self.assert_matches_rescan(buffer, window_seconds)
+
+    def test_matches_rescan_with_age_eviction(self):
+        """Test age-based cleanup evicts from the index too"""
+        buffer = StreamBuffer(max_size=1000, max_age_seconds=300.0)
+        for event in self.random_events(400):
+            buffer.add(event)
+
+        self.assertLess(len(buffer.buffer), 400)
+        self.assertEqual(buffer.get_window_stats(None)[0].count, len(buffer.buffer))
+        self.assert_matches_rescan(buffer, 300.0)
+        self.assert_matches_rescan(buffer, 42.0)
+
+        buffer.clear()
+        self.assertEqual(buffer.get_window_stats(None)[0].count, 0)
+
+    def test_moments_and_type_counts(self):
+        """Test running moments match NumPy and type counts drop evicted events"""
+        index = WindowIndex(bucket_seconds=5.0)
+        events = self.random_events(100)
+        for event in events:
+            index.add(event)
+        for event in events[:40]:
+            index.remove(event)
+
+        kept = [e.data["points"] for e in events[40:]]
+        n, mean, std = index.aggregate(ALL_EVENTS).mean_std("points")
+        self.assertEqual(n, 60)
+        self.assertAlmostEqual(mean, np.mean(kept))
+        self.assertAlmostEqual(std, np.std(kept))
+        self.assertEqual(
+            sum(index.aggregate(ALL_EVENTS).type_counts.values()), len(kept)
+        )
+        with self.assertRaises(ValueError):
+            WindowIndex(bucket_seconds=0)
+
+
+class TestStreamingAnalyzerWindows(unittest.TestCase):
+    """Test cases for StreamingAnalyzer queries backed by the index"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.analyzer = StreamingAnalyzer(buffer_size=1000, window_seconds=300.0)
+
+    def test_player_and_game_live_stats(self):
+        """Test live stats per player and per game"""
+        self.analyzer.process_batch(
+            [
+                make_event(10, player_id="lebron", points=2, rebounds=1),
+                make_event(20, player_id="lebron", points=3, assists=2),
+                make_event(30, player_id="tatum", points=3, game_id="game_2"),
+                make_event(
+                    40,
+                    event_type=StreamEventType.SCORE_UPDATE,
+                    player_id="lebron",
+                    points=99,
+                ),
+            ]
+        )
+
+        lebron = self.analyzer.get_player_live_stats("lebron")
+        self.assertEqual(
+            (lebron["events"], lebron["points"], lebron["rebounds"]), (2, 5, 1)
+        )
+        self.assertEqual(lebron["assists"], 2)
+        for stat in ("points", "rebounds", "assists"):
+            self.assertIs(type(lebron[stat]), int)
+        self.assertEqual(self.analyzer.get_player_live_stats("lebron", 15)["points"], 2)
+        self.assertEqual(self.analyzer.get_player_live_stats("nobody")["events"], 0)
+
+        game = self.analyzer.get_live_stats("game_1")
+        self.assertEqual(game["event_count"], 3)
+        self.assertEqual(game["event_types"], {"player_stat": 2, "score_update": 1})
+        self.assertEqual(self.analyzer.get_live_stats()["event_count"], 4)
+        self.assertEqual(self.analyzer.get_live_stats("game_9"), {"event_count": 0})
+
+    def test_integer_totals_stay_int(self):
+        """Test totals are int unless a non-integer value is in the window"""
+        buffer = StreamBuffer(max_size=2)
+        buffer.add(make_event(30, player_id="p", points=np.int64(3)))
+        buffer.add(make_event(20, player_id="p", points=1.5))
+        window, _ = buffer.get_window_stats(None)
+        self.assertEqual(window.total("points"), 4.5)
+
+        buffer.add(make_event(10, player_id="p", points=2))  # evicts the int64
+        buffer.add(make_event(5, player_id="p", points=2))  # evicts the float
+        window, _ = buffer.get_window_stats(None)
+        self.assertEqual(window.total("points"), 4)
+        self.assertIs(type(window.total("points")), int)
+
+    def test_anomalies_use_metric_events_only(self):
+        """Test anomaly scores line up with the events carrying the metric"""
+        events = [make_event(i, player_id="p", points=10) for i in range(1, 30)]
+        events.append(make_event(0.5, player_id="p", points=60))
+        events += [
+            make_event(i, event_type=StreamEventType.TIMEOUT, team="LAL")
+            for i in range(1, 5)
+        ]
+        self.analyzer.process_batch(events)
+
+        anomalies = self.analyzer.detect_anomalies("points", threshold_std=3.0)
+
+        self.assertEqual(len(anomalies), 1)
+        self.assertEqual(anomalies[0]["value"], 60)
+        self.assertEqual(self.analyzer.detect_anomalies("missing"), [])
+
+
+if __name__ == "__main__":
+    # Run the tests
+    unittest.main(verbosity=2)
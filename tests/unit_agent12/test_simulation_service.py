@@ -18,6 +18,7 @@ from mcp_server.simulations.deployment.simulation_service import (
     SimulationResult,
     SimulationService,
     BatchSimulator,
+    MonteCarloEngine,
 )
 from mcp_server.simulations.deployment.model_persistence import (
     ModelSerializer,
@@ -102,6 +103,13 @@ class TestSimulationRequest:
         hash2 = request2.get_hash()
         assert hash1 == hash2
 
+        # Simulation count and seed always change the key
+        request2.num_simulations = 1000
+        assert request2.get_hash() != hash1
+        request2.num_simulations = 1
+        request2.random_seed = 7
+        assert request2.get_hash() != hash1
+
 
 class TestSimulationResult:
     """Test SimulationResult dataclass"""
@@ -367,3 +375,206 @@ class TestBatchSimulator:
         assert stats["batches_processed"] == 1
         assert stats["max_workers"] == 2
         assert "service_stats" in stats
+
+
+class TestMonteCarloEngine:
+    """Test vectorized MonteCarloEngine"""
+
+    class CountingModel:
+        """Linear model that counts predict calls"""
+
+        def __init__(self, n_features=4):
+            self.coef = np.linspace(1.0, 2.0, n_features)
+            self.calls = 0
+
+        def predict(self, X):
+            self.calls += 1
+            return np.asarray(X) @ self.coef
+
+    def test_single_batched_predict_call(self):
+        """Feature perturbations are predicted in one call"""
+        model = self.CountingModel()
+        engine = MonteCarloEngine(feature_noise_std=0.5)
+        summary = engine.simulate(model, np.ones(4), 5000, rng=1)
+
+        assert model.calls == 1
+        assert summary.margins.shape == (5000,)
+
+    def test_seeded_reproducibility(self):
+        """Same seed gives identical draws, different seed does not"""
+        engine = MonteCarloEngine(feature_noise_std=0.2, total_std=10.0)
+        a = engine.simulate(self.CountingModel(), np.ones(4), 1000, rng=7)
+        b = engine.simulate(self.CountingModel(), np.ones(4), 1000, rng=7)
+        c = engine.simulate(self.CountingModel(), np.ones(4), 1000, rng=8)
+
+        np.testing.assert_array_equal(a.margins, b.margins)
+        assert not np.array_equal(a.margins, c.margins)
+
+    def test_win_probability_matches_normal_theory(self):
+        """Win probability approaches Phi(mean / residual_std)"""
+        from scipy.stats import norm
+
+        model = self.CountingModel()
+        features = np.full(4, 1.0)  # expected margin = sum(coef) = 6
+        engine = MonteCarloEngine(residual_std=12.0)
+        summary = engine.simulate(model, features, 200_000, rng=0)
+
+        assert summary.home_win_probability == pytest.approx(
+            norm.cdf(6.0 / 12.0), abs=0.005
+        )
+        assert summary.margin_quantiles["q50"] == pytest.approx(6.0, abs=0.2)
+
+    def test_scores_sum_to_total(self):
+        """Home and away scores reconstruct margin and total"""
+        engine = MonteCarloEngine(league_total=220.0)
+        summary = engine.simulate(self.CountingModel(), np.ones(4), 100, rng=3)
+
+        np.testing.assert_allclose(summary.home_scores + summary.away_scores, 220.0)
+        np.testing.assert_allclose(
+            summary.home_scores - summary.away_scores, summary.margins
+        )
+
+    def test_service_request_seed_is_reproducible(self):
+        """Requests with a random_seed reproduce exactly"""
+        registry = Mock()
+        registry.get_model.return_value = self.CountingModel(n_features=2)
+        service = SimulationService(registry, cache_enabled=False)
+
+        request = SimulationRequest(
+            request_id="req_seed",
+            home_team_id="LAL",
+            away_team_id="BOS",
+            home_features={"ortg": 1.0},
+            away_features={"ortg": 2.0},
+            model_id="m",
+            num_simulations=500,
+            random_seed=42,
+        )
+        r1 = service.simulate(request)
+        r2 = service.simulate(request)
+
+        assert r1.predictions == r2.predictions
+        assert 0.0 < r1.home_win_probability < 1.0
+        assert "q50" in r1.metadata["margin_quantiles"]
+
+
+class TestRequestCoalescing:
+    """Test matrix batching and micro-batching in BatchSimulator"""
+
+    @pytest.fixture
+    def model(self):
+        return TestMonteCarloEngine.CountingModel(n_features=2)
+
+    @pytest.fixture
+    def service(self, model):
+        registry = Mock()
+        registry.get_model.return_value = model
+        return SimulationService(registry, cache_enabled=False)
+
+    @staticmethod
+    def make_request(i, model_id="m", seed=None):
+        return SimulationRequest(
+            request_id=f"req_{i:03d}",
+            home_team_id=f"H{i}",
+            away_team_id=f"A{i}",
+            home_features={"ortg": float(i)},
+            away_features={"ortg": float(i % 3)},
+            model_id=model_id,
+            num_simulations=200,
+            random_seed=seed if seed is not None else i,
+        )
+
+    def test_one_predict_per_model_group(self, service, model):
+        """A slate sharing one model runs as a single predict call"""
+        requests = [self.make_request(i) for i in range(15)]
+        results = BatchSimulator(service).simulate_batch(requests, parallel=True)
+
+        assert model.calls == 1
+        assert service.predict_calls == 1
+        assert [r.request_id for r in results] == [r.request_id for r in requests]
+
+    def test_batched_results_match_individual(self, service, model):
+        """Scattered results equal per-request simulation with same seeds"""
+        requests = [self.make_request(i) for i in range(5)]
+        batched = BatchSimulator(service).simulate_batch(requests, parallel=True)
+        single = [service.simulate(r) for r in requests]
+
+        for b, s in zip(batched, single):
+            assert b.predictions == s.predictions
+
+    def test_groups_by_model(self, model):
+        """Distinct models are predicted separately"""
+        other = TestMonteCarloEngine.CountingModel(n_features=2)
+        registry = Mock()
+        registry.get_model.side_effect = lambda model_id, version: (
+            model if model_id == "m" else other
+        )
+        service = SimulationService(registry, cache_enabled=False)
+
+        requests = [
+            self.make_request(i, model_id="m" if i % 2 else "n") for i in range(6)
+        ]
+        BatchSimulator(service).simulate_batch(requests, parallel=True)
+
+        assert model.calls == 1
+        assert other.calls == 1
+
+    def test_failed_group_returns_error_results(self, service):
+        """A failing model yields error results instead of raising"""
+        service.model_registry.get_model.side_effect = KeyError("missing")
+        results = BatchSimulator(service).simulate_batch(
+            [self.make_request(i) for i in range(3)], parallel=True
+        )
+        assert all("error" in r.metadata for r in results)
+
+    def test_invalid_request_is_excluded_from_batch(self, service, model):
+        """A malformed request fails alone; the rest share one predict"""
+        requests = [self.make_request(i) for i in range(4)]
+        requests[1].home_features = {"ortg": "fast"}
+        requests[2].num_simulations = 0
+
+        results = BatchSimulator(service).simulate_batch(requests, parallel=True)
+
+        assert ["error" in r.metadata for r in results] == [False, True, True, False]
+        assert model.calls == 1
+        assert service.get_statistics()["requests_processed"] == 2
+        with pytest.raises(ValueError):
+            service.simulate_many(requests[:3])
+
+    def test_failed_batch_retries_each_request(self, service, model):
+        """When the stacked predict fails, requests are retried one by one"""
+        requests = [self.make_request(i) for i in range(4)]
+        # Three features cannot be stacked with the others or predicted
+        requests[2].home_features = {"ortg": 1.0, "pace": 99.0}
+
+        results = BatchSimulator(service).simulate_batch(requests, parallel=True)
+
+        assert ["error" in r.metadata for r in results] == [False, False, True, False]
+        assert service.predict_calls == 5  # failed batch + 4 retries
+        for i in (0, 1, 3):
+            single = service.simulate(self.make_request(i))
+            assert results[i].predictions == single.predictions
+
+    def test_micro_batching_window(self, service, model):
+        """Concurrent submit() callers share one batch"""
+        with BatchSimulator(service, max_wait_ms=200) as simulator:
+            futures = [simulator.submit(self.make_request(i)) for i in range(8)]
+            results = [f.result(timeout=5) for f in futures]
+
+        assert [r.request_id for r in results] == [f"req_{i:03d}" for i in range(8)]
+        assert model.calls == 1
+        assert simulator.batches_processed == 1
+
+    def test_cancelled_future_does_not_stall_dispatcher(self, service, model):
+        """A cancelled submit is skipped and later submits still complete"""
+        with BatchSimulator(service, max_wait_ms=100) as simulator:
+            cancelled = simulator.submit(self.make_request(0))
+            kept = simulator.submit(self.make_request(1))
+            assert cancelled.cancel()
+
+            assert kept.result(timeout=5).request_id == "req_001"
+            assert simulator.simulate(self.make_request(2), timeout=5)
+            assert simulator._dispatcher.is_alive()
+
+        assert cancelled.cancelled()
+        assert model.calls == 2
@@ -0,0 +1,5 @@
+"""
+Unit Tests for Season Simulation
+
+Tests vectorized season, tiebreaker and playoff simulation.
+"""
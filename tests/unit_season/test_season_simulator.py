@@ -0,0 +1,221 @@
+"""
+Unit Tests for Season Simulator
+
+Tests possession-level game simulation, standings/tiebreakers,
+playoff brackets, parallel chunking and convergence reporting.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from mcp_server.simulations.season import (
+    SeasonSimulator,
+    TeamStrength,
+    convergence_table,
+    strengths_from_model,
+    strengths_from_ratings,
+)
+from mcp_server.simulations.season.season_simulator import (
+    CHAMPION,
+    FINALS,
+    FIRST_ROUND,
+    _bracket_order,
+    load_schedule,
+)
+
+
+def round_robin(teams, rounds=2):
+    """Each pair meets `rounds` times, alternating home court."""
+    games = []
+    for r in range(rounds):
+        for i, a in enumerate(teams):
+            for b in teams[i + 1 :]:
+                games.append((a, b) if r % 2 == 0 else (b, a))
+    return pd.DataFrame(games, columns=["home_team_id", "away_team_id"])
+
+
+@pytest.fixture
+def league():
+    """Two 10-team conferences with a clear strength gradient."""
+    teams = [f"T{i:02d}" for i in range(20)]
+    net = np.linspace(-8, 8, 20)
+    ratings = pd.DataFrame(
+        {
+            "team_id": teams,
+            "ortg": 114 + net / 2,
+            "drtg": 114 - net / 2,
+            "conference": ["East" if i % 2 else "West" for i in range(20)],
+        }
+    )
+    return strengths_from_ratings(ratings), round_robin(teams, rounds=4)
+
+
+class TestBracket:
+    def test_bracket_order(self):
+        assert _bracket_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+        assert _bracket_order(16)[:4] == [1, 16, 8, 9]
+
+
+class TestSeasonSimulator:
+    def test_outcome_accounting(self, league):
+        strengths, schedule = league
+        result = SeasonSimulator(strengths, schedule).simulate(
+            2000, n_jobs=1, random_seed=1
+        )
+
+        # Every game has one winner
+        assert (result.wins.sum(axis=1) == len(schedule)).all()
+        # 8 playoff teams per conference, one finalist each, one champion
+        assert ((result.playoff_round >= FIRST_ROUND).sum(axis=1) == 16).all()
+        assert ((result.playoff_round >= FINALS).sum(axis=1) == 2).all()
+        assert ((result.playoff_round == CHAMPION).sum(axis=1) == 1).all()
+        # Play-in: ranks 7-10 in each conference
+        assert (result.play_in.sum(axis=1) == 8).all()
+        seeds = result.seed_probabilities()
+        np.testing.assert_allclose(seeds.sum(axis=1), 1.0)
+
+    def test_stronger_teams_do_better(self, league):
+        strengths, schedule = league
+        standings = (
+            SeasonSimulator(strengths, schedule)
+            .simulate(2000, n_jobs=1, random_seed=2)
+            .standings()
+            .set_index("team_id")
+        )
+        assert standings.loc["T19", "mean_wins"] > standings.loc["T00", "mean_wins"]
+        assert standings.loc["T19", "title_prob"] > standings.loc["T00", "title_prob"]
+        assert standings["title_prob"].sum() == pytest.approx(1.0)
+
+    def test_ranks_follow_win_percentage(self, league):
+        strengths, schedule = league
+        result = SeasonSimulator(strengths, schedule).simulate(
+            500, n_jobs=1, random_seed=3
+        )
+        east = [i for i, c in enumerate(result.conferences) if c == "East"]
+        wins = result.wins[:, east]
+        ranks = result.regular_season_rank[:, east]
+
+        # A better rank never has fewer wins (equal schedules per team)
+        order = np.argsort(ranks, axis=1)
+        sorted_wins = np.take_along_axis(wins, order, axis=1)
+        assert (np.diff(sorted_wins, axis=1) <= 0).all()
+
+    def test_reproducible_and_independent_of_n_jobs(self, league):
+        strengths, schedule = league
+        sim = SeasonSimulator(strengths, schedule)
+        a = sim.simulate(1000, chunk_size=250, n_jobs=1, random_seed=7)
+        b = sim.simulate(1000, chunk_size=250, n_jobs=2, random_seed=7)
+
+        np.testing.assert_array_equal(a.wins, b.wins)
+        np.testing.assert_array_equal(a.playoff_round, b.playoff_round)
+
+    def test_played_games_are_fixed(self, league):
+        strengths, schedule = league
+        schedule = schedule.copy()
+        schedule["home_score"] = np.nan
+        schedule["away_score"] = np.nan
+        t00_home = schedule.index[schedule["home_team_id"] == "T00"]
+        schedule.loc[t00_home, ["home_score", "away_score"]] = [120, 90]
+
+        result = SeasonSimulator(strengths, schedule).simulate(
+            500, n_jobs=1, random_seed=4
+        )
+        assert result.wins[:, 0].min() >= len(t00_home)
+        assert result.metadata["n_played"] == len(t00_home)
+
+    def test_exact_possessions_agree_with_fast_path(self, league):
+        strengths, schedule = league
+        fast = SeasonSimulator(strengths, schedule).simulate(
+            1000, n_jobs=1, random_seed=5
+        )
+        exact = SeasonSimulator(strengths, schedule, exact_possessions=True).simulate(
+            1000, n_jobs=1, random_seed=5
+        )
+        np.testing.assert_allclose(
+            fast.wins.mean(axis=0), exact.wins.mean(axis=0), atol=1.0
+        )
+
+    def test_single_league_bracket(self):
+        teams = [f"T{i}" for i in range(16)]
+        strengths = [TeamStrength(team_id=t) for t in teams]
+        result = SeasonSimulator(strengths, round_robin(teams)).simulate(
+            200, n_jobs=1, random_seed=6
+        )
+        assert (result.playoff_seed > 0).all()
+        assert not result.play_in.any()
+
+    def test_unknown_schedule_team_raises(self, league):
+        strengths, schedule = league
+        bad = pd.concat(
+            [schedule, pd.DataFrame({"home_team_id": ["XXX"], "away_team_id": ["T00"]})]
+        )
+        with pytest.raises(ValueError, match="without strengths"):
+            SeasonSimulator(strengths, bad)
+
+    def test_convergence_table(self, league):
+        strengths, schedule = league
+        result = SeasonSimulator(strengths, schedule).simulate(
+            2000, n_jobs=1, random_seed=8
+        )
+        conv = result.convergence
+        assert conv["n_simulations"].iloc[-1] == 2000
+        assert conv["max_title_std_error"].is_monotonic_decreasing
+        assert conv["max_title_change"].iloc[-1] == 0.0
+
+
+class FakeCursor:
+    description = [("game_id",), ("home_team_id",), ("away_team_id",)]
+
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, query, params):
+        self.executed.append((query, params))
+
+    def fetchall(self):
+        return [(1, "BOS", "MIA")]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self.executed)
+
+
+class TestLoadSchedule:
+    def test_regular_season_only(self):
+        conn = FakeConnection()
+        schedule = load_schedule(conn, "2024-10-01", "2025-06-30")
+
+        ((query, params),) = conn.executed
+        assert "season_type = 2" in query
+        assert params == ("2024-10-01", "2025-06-30")
+        assert list(schedule.columns) == ["game_id", "home_team_id", "away_team_id"]
+
+
+class TestStrengths:
+    def test_strengths_from_model(self):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(500, 2))
+        y = 10 * X[:, 0] - 10 * X[:, 1]  # home net - away net
+        model = LinearRegression().fit(X, y)
+
+        features = {"A": {"net": 1.0}, "B": {"net": 0.0}, "C": {"net": -1.0}}
+        strengths = strengths_from_model(model, features)
+
+        nets = [s.net_rating for s in strengths]
+        assert nets[0] > nets[1] > nets[2]
+        assert nets[1] == pytest.approx(0.0, abs=0.1)
+
+    def test_convergence_table_shapes(self):
+        title = np.zeros((1000, 3), dtype=bool)
+        title[:, 0] = True
+        conv = convergence_table(title, np.ones((1000, 3)))
+        assert conv["max_title_std_error"].max() == 0.0